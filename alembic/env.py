@@ -25,6 +25,9 @@ from app.db.models import (
     harvesting_error,
     issue,
     journal,
+    job_checkpoint,
+    reference_events_rollup,
+    references_rollup,
 )
 from app.db.session import Base
 
@@ -53,6 +56,9 @@ def _register_models_for_migrations():
         reference_identifier,
         issue,
         journal,
+        job_checkpoint,
+        reference_events_rollup,
+        references_rollup,
     )
 
 
@@ -0,0 +1,53 @@
+"""add_text_search_indexes
+
+Revision ID: c9f1a6e3d5b8
+Revises: b7e2d4c9a1f3
+Create Date: 2026-10-19 14:21:09.734105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f1a6e3d5b8'
+down_revision: Union[str, None] = 'b7e2d4c9a1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram indexes serve the LIKE '%term%' filters of the summaries.
+# They depend on the pg_trgm extension and are therefore only declared here,
+# not on the models.
+TRIGRAM_INDEXES = [
+    ("ix_titles_value_trgm", "titles", "value"),
+    ("ix_entities_name_trgm", "entities", "name"),
+    ("ix_identifiers_value_trgm", "identifiers", "value"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+        )
+    op.create_index(
+        'ix_titles_value_tsvector',
+        'titles',
+        [sa.text("to_tsvector('simple', value)")],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_titles_value_tsvector', table_name='titles')
+    for index_name, table_name, _ in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from app.config import get_app_settings
+from app.services.entities.entity_snapshot import EntitySnapshot
 
 
 class AbstractAMQPMessageFactory(ABC):
@@ -8,6 +9,10 @@ class AbstractAMQPMessageFactory(ABC):
     def __init__(self, content):
         self.content = content
         self.settings = get_app_settings()
+        # snapshot of the entity of the running retrieval, if still cached
+        self.entity: EntitySnapshot | None = EntitySnapshot.cached(
+            content.get("entity_id")
+        )
 
     async def build_message(self) -> tuple[str, str]:
         """Build the message routing key and payload."""
@@ -19,13 +19,19 @@ class AMQPHarvestingMessageFactory(AbstractAMQPMessageFactory):
         async with async_session() as session:
             harvesting: DbHarvesting = await HarvestingDAO(
                 session
-            ).get_harvesting_extended_info_by_id(self.content.get("id"))
+            ).get_harvesting_extended_info_by_id(
+                self.content.get("id"), with_entity=self.entity is None
+            )
             harvesting_representation: HarvestingModel = HarvestingModel.model_validate(
                 harvesting
             )
-            entity_representation: EntityModel = EntityModel.model_validate(
-                harvesting.retrieval.entity
+            entity_representation: dict[str, Any] = (
+                self.entity.to_dict()
+                if self.entity is not None
+                else EntityModel.model_validate(harvesting.retrieval.entity).model_dump(
+                    exclude={"id": True}
+                )
             )
         return harvesting_representation.model_dump(
             exclude={"id": True, "reference_events": True}
-        ) | {"entity": entity_representation.model_dump(exclude={"id": True})}
+        ) | {"entity": entity_representation}
@@ -6,8 +6,10 @@ import aio_pika
 from aio_pika import ExchangeType
 from loguru import logger
 
+from app.amqp.amqp_lanes import AMQPLanes
 from app.amqp.amqp_message_processor import AMQPMessageProcessor
 from app.amqp.amqp_message_publisher import AMQPMessagePublisher
+from app.amqp.amqp_retry_scheduler import AMQPRetryScheduler
 from app.settings.app_settings import AppSettings
 
 DEFAULT_RESULT_TIMEOUT = 600
@@ -32,21 +34,25 @@ class AMQPInterface:
         """
         self.settings = settings
         self.pika_queue: aio_pika.Queue | None = None
+        self.pika_interactive_queue: aio_pika.Queue | None = None
         self.pika_channel: aio_pika.Channel | None = None
         self.pika_exchange: aio_pika.Exchange | None = None
         self.result_queue: asyncio.Queue | None = None
         self.publisher: AMQPMessagePublisher | None = None
         self.result_publisher_task: asyncio.Task | None = None
         self.pika_connexion: aio_pika.abc.AbstractRobustConnection | None = None
-        self.task_queue: asyncio.Queue | None = None
+        self.task_queue: AMQPLanes | None = None
+        self.retry_scheduler: AMQPRetryScheduler | None = None
         self.message_processing_workers: list[asyncio.Task] | None = None
         self.keys = [self.settings.amqp_retrieval_routing_key]
+        self.interactive_keys = [self.settings.amqp_interactive_retrieval_routing_key]
 
     async def connect(self):
         """Connect to AMQP queue"""
         await self._connect()
         await self._declare_exchange()
         await self._declare_publisher()
+        await self._declare_retry_scheduler()
         await self._attach_message_processing_workers()
         await self._bind_queue()
         await sleep(0)
@@ -80,7 +86,10 @@ class AMQPInterface:
 
     async def _attach_message_processing_workers(self):
         self.message_processing_workers = []
-        self.task_queue = asyncio.Queue(maxsize=self.INNER_TASKS_QUEUE_LENGTH)
+        self.task_queue = AMQPLanes(
+            maxsize=self.INNER_TASKS_QUEUE_LENGTH,
+            interactive_weight=self.settings.amqp_interactive_lane_weight,
+        )
         for worker_id in range(self.settings.inner_task_parallelism_limit):
             processor = await self._message_processor()
             self.message_processing_workers.append(
@@ -95,27 +104,51 @@ class AMQPInterface:
             task_queue=self.task_queue,
             result_queue=self.result_queue,
             settings=self.settings,
+            retry_scheduler=self.retry_scheduler,
         )
 
     async def listen(self):
-        """Listen to AMQP queue using prefetch-based flow control."""
-        if not self.pika_queue:
+        """
+        Listen to the AMQP queues of the bulk and interactive lanes
+        using prefetch-based flow control, the prefetch count applying to each queue.
+        """
+        if not self.pika_queue or not self.pika_interactive_queue:
             logger.error("Cannot listen: pika_queue is not initialized.")
             return
 
         logger.info("Starting AMQP listening loop (prefetch-controlled)")
 
+        await asyncio.gather(
+            self._listen_to(self.pika_queue, AMQPLanes.Lane.BULK),
+            self._listen_to(self.pika_interactive_queue, AMQPLanes.Lane.INTERACTIVE),
+        )
+
+    async def _listen_to(self, queue: aio_pika.Queue, lane: AMQPLanes.Lane) -> None:
         try:
-            async with self.pika_queue.iterator() as queue_iter:
+            async with queue.iterator() as queue_iter:
                 async for message in queue_iter:
-                    logger.debug(f"Received message: {message.body}")
-                    await self.task_queue.put(message)
+                    logger.debug(
+                        f"Received message in {lane.value} lane: {message.body}"
+                    )
+                    await self.task_queue.put(lane, message)
                     logger.debug(
                         f"Message queued. Inner queue size: {self.task_queue.qsize()}"
                     )
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error(f"Exception during AMQP listening: {e}", exc_info=True)
 
+    async def _declare_retry_scheduler(self) -> None:
+        """
+        Declare the waiting and dead letters queues of the delayed retries
+        :return: None
+        """
+        self.retry_scheduler = AMQPRetryScheduler(self.pika_channel, self.settings)
+        for queue_name in [
+            self.settings.amqp_queue_name,
+            self.settings.amqp_interactive_queue_name,
+        ]:
+            await self.retry_scheduler.declare(queue_name)
+
     async def _declare_exchange(self) -> None:
         """
         Declare the publication exchange
@@ -164,6 +197,13 @@ class AMQPInterface:
         )
         for key in self.keys:
             await self.pika_queue.bind(self.pika_exchange, routing_key=key)
+        self.pika_interactive_queue = await self.pika_channel.declare_queue(
+            self.settings.amqp_interactive_queue_name,
+            durable=True,
+            arguments={"x-consumer-timeout": self.settings.amqp_consumer_ack_timeout},
+        )
+        for key in self.interactive_keys:
+            await self.pika_interactive_queue.bind(self.pika_exchange, routing_key=key)
 
     async def _connect(self) -> None:
         user = quote(self.settings.amqp_user)
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from enum import Enum
+
+from aio_pika import IncomingMessage
+
+
+class AMQPLanes:
+    """
+    Inner queues of the messages received from the AMQP interface,
+    one per priority lane.
+
+    The workers take the messages of the interactive lane first,
+    but no more than interactive_weight of them in a row while bulk messages
+    are waiting, so that the bulk lane is never starved.
+    """
+
+    class Lane(Enum):
+        """
+        Priority lanes of the AMQP messages
+        """
+
+        INTERACTIVE = "interactive"
+        BULK = "bulk"
+
+    def __init__(self, maxsize: int, interactive_weight: int):
+        """
+        :param maxsize: maximum number of messages waiting in each lane
+        :param interactive_weight: number of interactive messages taken
+            for each bulk message when both lanes are waiting
+        """
+        self.interactive_weight = interactive_weight
+        self._queues: dict[AMQPLanes.Lane, asyncio.Queue] = {
+            lane: asyncio.Queue(maxsize=maxsize) for lane in self.Lane
+        }
+        self._waiting = asyncio.Semaphore(0)
+        self._interactive_streak = 0
+        self._stats = {
+            lane: {
+                "in_progress": 0,
+                "processed": 0,
+                "wait_time": 0.0,
+                "max_wait_time": 0.0,
+                "processing_time": 0.0,
+            }
+            for lane in self.Lane
+        }
+
+    async def put(self, lane: Lane, message: IncomingMessage) -> None:
+        """
+        Queue a message in a lane, waiting if the lane is full
+
+        :param lane: lane of the message
+        :param message: message received from the AMQP interface
+        :return: None
+        """
+        await self._queues[lane].put((time.monotonic(), message))
+        self._waiting.release()
+
+    async def get(self) -> tuple[Lane, IncomingMessage]:
+        """
+        Wait for the next message to process
+
+        :return: lane of the message and message
+        """
+        await self._waiting.acquire()
+        lane = self._next_lane()
+        queued_at, message = self._queues[lane].get_nowait()
+        stats = self._stats[lane]
+        wait_time = time.monotonic() - queued_at
+        stats["in_progress"] += 1
+        stats["wait_time"] += wait_time
+        stats["max_wait_time"] = max(stats["max_wait_time"], wait_time)
+        return lane, message
+
+    def task_done(self, lane: Lane, processing_time: float) -> None:
+        """
+        Signal the end of the processing of a message
+
+        :param lane: lane of the message
+        :param processing_time: seconds spent processing the message
+        :return: None
+        """
+        self._queues[lane].task_done()
+        stats = self._stats[lane]
+        stats["in_progress"] -= 1
+        stats["processed"] += 1
+        stats["processing_time"] += processing_time
+
+    async def join(self) -> None:
+        """
+        Wait for all the messages of all lanes to be processed
+
+        :return: None
+        """
+        for queue in self._queues.values():
+            await queue.join()
+
+    def qsize(self) -> int:
+        """
+        :return: number of messages waiting in all lanes
+        """
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Depth and latencies of the lanes, in seconds
+
+        :return: statistics by lane
+        """
+        snapshot = {}
+        for lane, stats in self._stats.items():
+            taken = stats["processed"] + stats["in_progress"]
+            snapshot[lane.value] = {
+                "depth": self._queues[lane].qsize(),
+                "in_progress": stats["in_progress"],
+                "processed": stats["processed"],
+                "average_wait_time": stats["wait_time"] / taken if taken else 0.0,
+                "max_wait_time": stats["max_wait_time"],
+                "average_processing_time": (
+                    stats["processing_time"] / stats["processed"]
+                    if stats["processed"]
+                    else 0.0
+                ),
+            }
+        return snapshot
+
+    def _next_lane(self) -> Lane:
+        interactive = self._queues[self.Lane.INTERACTIVE]
+        bulk = self._queues[self.Lane.BULK]
+        if not interactive.empty() and (
+            bulk.empty() or self._interactive_streak < self.interactive_weight
+        ):
+            self._interactive_streak += 1
+            return self.Lane.INTERACTIVE
+        self._interactive_streak = 0
+        return self.Lane.BULK
@@ -6,11 +6,15 @@ from datetime import datetime
 from aio_pika import IncomingMessage
 from aiormq import ChannelInvalidStateError, AMQPError
 from asyncpg import PostgresConnectionError
+from fastapi import HTTPException
 from loguru import logger
 from pydantic import ValidationError
 
+from app.amqp.amqp_lanes import AMQPLanes
+from app.amqp.amqp_retry_scheduler import AMQPRetryScheduler
 from app.harvesters.exceptions.invalid_entity_error import InvalidEntityError
 from app.models.people import Person
+from app.services.retrieval.retrieval_batch_service import RetrievalBatchService
 from app.services.retrieval.retrieval_service import RetrievalService
 from app.settings.app_settings import AppSettings
 
@@ -22,13 +26,22 @@ class AMQPMessageProcessor:
 
     def __init__(
         self,
-        task_queue: asyncio.Queue,
+        task_queue: AMQPLanes,
         result_queue: asyncio.Queue,
         settings: AppSettings,
+        retry_scheduler: AMQPRetryScheduler | None = None,
     ):
+        """
+        :param task_queue: priority lanes of the messages to process
+        :param result_queue: queue of the messages to publish
+        :param settings: AppSettings
+        :param retry_scheduler: scheduler of the delayed retries of the failed
+            messages, failed messages are requeued immediately if None
+        """
         self.task_queue = task_queue
         self.result_queue = result_queue
         self.settings = settings
+        self.retry_scheduler = retry_scheduler
 
     async def wait_for_message(self, worker_id: int) -> None:
         """
@@ -41,7 +54,8 @@ class AMQPMessageProcessor:
 
         while True:
             requeue = False
-            message = await self.task_queue.get()
+            retry = False
+            lane, message = await self.task_queue.get()
             start_time = datetime.now()
             async with message.process(ignore_processed=True):
                 payload = message.body
@@ -64,22 +78,54 @@ class AMQPMessageProcessor:
                     )
                 except InvalidEntityError as invalid_entity_error:
                     await self._handle_invalid_entity(invalid_entity_error)
-                    requeue = False  # except if we implement dead letter queue
+                    requeue = False  # invalid messages are not worth a retry
                 except (ConnectionError, PostgresConnectionError) as connection_error:
                     await self._handle_database_error(connection_error, worker_id)
-                    requeue = True
+                    retry = True
                 except Exception as exception:  # pylint: disable=broad-exception-caught
                     await self._handle_unexpected_error(exception, worker_id)
-                    requeue = True
+                    retry = True
                 finally:
+                    if retry:
+                        requeue = not await self._schedule_retry(
+                            message, lane, worker_id
+                        )
                     await self._post_process_message(message, requeue, worker_id)
-                    self.task_queue.task_done()
                     end_time = datetime.now()
+                    self.task_queue.task_done(
+                        lane, (end_time - start_time).total_seconds()
+                    )
                     logger.warning(
                         f"Performance : Message  processed by {worker_id} "
                         f"in {end_time - start_time} for payload {payload if payload else 'None'}"
                     )
 
+    async def _schedule_retry(
+        self, message: IncomingMessage, lane: AMQPLanes.Lane, worker_id: int
+    ) -> bool:
+        """
+        Schedule a delayed retry of a failed message and acknowledge it
+
+        :return: True if the message was handed over to the retry scheduler,
+            False if it has to be requeued
+        """
+        if self.retry_scheduler is None:
+            return False
+        queue_name = (
+            self.settings.amqp_interactive_queue_name
+            if lane == AMQPLanes.Lane.INTERACTIVE
+            else self.settings.amqp_queue_name
+        )
+        try:
+            await self.retry_scheduler.retry(message, queue_name)
+            await message.ack()
+        except (ChannelInvalidStateError, AMQPError) as retry_error:
+            logger.error(
+                f"Error during message retry scheduling for {worker_id} : {retry_error}"
+            )
+            return False
+        return True
+
     async def _post_process_message(self, message, requeue, worker_id):
         if message is not None and not message.processed:
             try:
@@ -173,6 +219,7 @@ class AMQPMessageProcessor:
                 nullify=json_payload.get("nullify", False),
                 harvesters=json_payload.get("harvesters", []),
                 events=json_payload.get("events", []),
+                incremental=json_payload.get("incremental", False),
             )
             # Resister a new retrieval in DB
             retrieval = await service.register(entity=person)
@@ -191,3 +238,70 @@ class AMQPMessageProcessor:
                 await service.run(result_queue=self.result_queue)
             else:
                 await service.run()
+        elif json_payload["type"] == "person_batch":
+            await self._process_person_batch(json_payload, reply_expected)
+
+    async def _process_person_batch(self, json_payload: dict, reply_expected: bool):
+        """
+        Register the retrievals of a batch of persons at once, then run them.
+        Invalid persons are reported and skipped, the others are still processed.
+
+        :param json_payload: message with the fields of the persons under "persons"
+        :param reply_expected: if True, the ids of the retrievals and their results
+            are published
+        :return: None
+        """
+        persons = []
+        accepted = []
+        for fields in json_payload.get("persons", []):
+            error_message = None
+            try:
+                person = Person(**fields)
+                if person.has_no_bibliographic_identifiers():
+                    error_message = "No identifiers provided, retrieval aborted"
+            except ValidationError as validation_error:
+                error_message = (
+                    f"Entity validation error, retrieval aborted: {validation_error}"
+                )
+            if error_message is not None:
+                await self.result_queue.put(
+                    {
+                        "type": "Retrieval",
+                        "error": True,
+                        "message": error_message,
+                        "parameters": fields,
+                    }
+                )
+                await asyncio.sleep(0)  # force context switch
+                accepted.append(False)
+                continue
+            persons.append(person)
+            accepted.append(True)
+        if not persons:
+            raise InvalidEntityError(f"No valid person in batch {json_payload}")
+        service = RetrievalBatchService(
+            identifiers_safe_mode=json_payload.get("identifiers_safe_mode", False),
+            nullify=json_payload.get("nullify", False),
+            harvesters=json_payload.get("harvesters", []),
+            events=json_payload.get("events", []),
+            incremental=json_payload.get("incremental", False),
+        )
+        try:
+            retrieval_ids = iter(
+                retrieval.id for retrieval in await service.register(entities=persons)
+            )
+        except HTTPException as error:
+            raise InvalidEntityError(f"Invalid batch: {error.detail}") from error
+        if reply_expected:
+            await self.result_queue.put(
+                {
+                    "type": "RetrievalBatch",
+                    "ids": [
+                        next(retrieval_ids) if is_accepted else None
+                        for is_accepted in accepted
+                    ],
+                    "message": "Retrievals started",
+                }
+            )
+            await asyncio.sleep(0)  # force context switch
+        await service.run(result_queue=self.result_queue if reply_expected else None)
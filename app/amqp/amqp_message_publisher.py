@@ -8,6 +8,9 @@ from app.amqp.amqp_harvesting_message_factory import AMQPHarvestingMessageFactor
 from app.amqp.amqp_reference_event_message_factory import (
     AMQPReferenceEventMessageFactory,
 )
+from app.amqp.amqp_retrieval_batch_message_factory import (
+    AMQPRetrievalBatchMessageFactory,
+)
 from app.amqp.amqp_retrieval_message_factory import AMQPRetrievalMessageFactory
 
 DEFAULT_RESULT_TIMEOUT = 600
@@ -58,6 +61,7 @@ class AMQPMessagePublisher:
     async def _build_message(content) -> tuple[str | None, str | None]:
         factory_map = {
             "Retrieval": AMQPRetrievalMessageFactory,
+            "RetrievalBatch": AMQPRetrievalBatchMessageFactory,
             "Harvesting": AMQPHarvestingMessageFactory,
             "ReferenceEvent": AMQPReferenceEventMessageFactory,
         }
@@ -27,9 +27,10 @@ class AMQPReferenceEventMessageFactory(AbstractAMQPMessageFactory):
         async with async_session() as session:
             reference_event: DbReferenceEvent = await ReferenceEventDAO(
                 session
-            ).get_detailed_reference_event_by_id(self.content.get("id"))
+            ).get_detailed_reference_event_by_id(
+                self.content.get("id"), with_entity=self.entity is None
+            )
             self.reference_event_type = reference_event.type
-            entity: DbEntity = reference_event.harvesting.retrieval.entity
             harvesting = reference_event.harvesting
             reference_event_representation: ReferenceEventModel = (
                 ReferenceEventModel.model_validate(reference_event)
@@ -52,12 +53,18 @@ class AMQPReferenceEventMessageFactory(AbstractAMQPMessageFactory):
                     }
                 )
             } | {
-                "entity": EntityModel.model_validate(entity).model_dump(
-                    exclude={"id": True}
-                )
+                "entity": self._entity_representation(reference_event)
             } | {
                 "harvesting": {
                     "identifier_used_type": harvesting.identifier_used_type,
                     "identifier_used_value": harvesting.identifier_used_value,
                 }
             }
+
+    def _entity_representation(
+        self, reference_event: DbReferenceEvent
+    ) -> dict[str, Any]:
+        if self.entity is not None:
+            return self.entity.to_dict()
+        entity: DbEntity = reference_event.harvesting.retrieval.entity
+        return EntityModel.model_validate(entity).model_dump(exclude={"id": True})
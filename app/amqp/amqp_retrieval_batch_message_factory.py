@@ -0,0 +1,20 @@
+from typing import Any
+
+from app.amqp.abstract_amqp_message_factory import AbstractAMQPMessageFactory
+
+
+class AMQPRetrievalBatchMessageFactory(AbstractAMQPMessageFactory):
+    """Factory for building AMQP messages related to batches of retrievals."""
+
+    def _build_routing_key(self) -> str:
+        return self.settings.amqp_retrieval_batch_event_routing_key
+
+    async def _build_payload(self) -> dict[str, Any]:
+        assert "ids" in self.content, "Retrieval ids are required"
+        # the retrievals are listed in the same order as the submitted entities,
+        # None for the entities that were rejected
+        return {
+            "type": self.content.get("type"),
+            "retrieval_ids": self.content.get("ids"),
+            "message": self.content.get("message"),
+        }
@@ -0,0 +1,106 @@
+import aio_pika
+from aio_pika import DeliveryMode, IncomingMessage
+from loguru import logger
+
+from app.settings.app_settings import AppSettings
+
+
+class AMQPRetryScheduler:
+    """
+    Delayed retries of the messages whose processing failed.
+
+    A failed message is published to a waiting queue whose TTL is the delay
+    of its attempt (amqp_retry_base_delay seconds, doubled at each attempt):
+    RabbitMQ dead-letters it back to the queue it came from when the delay expires.
+    After amqp_retry_max_attempts attempts, the message is parked
+    in the dead letters queue of its queue instead.
+    """
+
+    ATTEMPT_HEADER = "x-svp-attempt"
+
+    def __init__(self, channel: aio_pika.abc.AbstractChannel, settings: AppSettings):
+        """
+        :param channel: channel to declare the queues and publish the retries on
+        :param settings: AppSettings
+        """
+        self.channel = channel
+        self.base_delay = settings.amqp_retry_base_delay
+        self.max_attempts = settings.amqp_retry_max_attempts
+
+    async def declare(self, queue_name: str) -> None:
+        """
+        Declare the waiting queues and the dead letters queue of a queue
+
+        :param queue_name: name of the queue the messages are retried on
+        :return: None
+        """
+        for attempt in range(1, self.max_attempts):
+            await self.channel.declare_queue(
+                self._waiting_queue_name(queue_name, attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": self.delay(attempt) * 1000,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": queue_name,
+                },
+            )
+        await self.channel.declare_queue(
+            self._dead_letters_queue_name(queue_name), durable=True
+        )
+
+    def delay(self, attempt: int) -> int:
+        """
+        :param attempt: number of the failed attempt, from 1
+        :return: seconds to wait before the next attempt
+        """
+        return self.base_delay * 2 ** (attempt - 1)
+
+    @classmethod
+    def attempt(cls, message: IncomingMessage) -> int:
+        """
+        :param message: message received from a queue
+        :return: number of the current processing attempt of the message, from 1
+        """
+        return int((message.headers or {}).get(cls.ATTEMPT_HEADER, 1))
+
+    async def retry(self, message: IncomingMessage, queue_name: str) -> bool:
+        """
+        Schedule a new attempt of a failed message, or park it if it has
+        been attempted too many times. The message must be acknowledged afterwards.
+
+        :param message: failed message
+        :param queue_name: name of the queue the message came from
+        :return: True if a new attempt was scheduled, False if the message was parked
+        """
+        attempt = self.attempt(message)
+        if attempt >= self.max_attempts:
+            logger.error(
+                f"Message {message.message_id} failed {attempt} times, "
+                f"parked in {self._dead_letters_queue_name(queue_name)}"
+            )
+            routing_key = self._dead_letters_queue_name(queue_name)
+        else:
+            logger.warning(
+                f"Message {message.message_id} failed at attempt {attempt}, "
+                f"retried in {self.delay(attempt)} seconds"
+            )
+            routing_key = self._waiting_queue_name(queue_name, attempt)
+        await self.channel.default_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers={**(message.headers or {}), self.ATTEMPT_HEADER: attempt + 1},
+                content_type=message.content_type,
+                message_id=message.message_id,
+                delivery_mode=DeliveryMode.PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+        return attempt < self.max_attempts
+
+    def _waiting_queue_name(self, queue_name: str, attempt: int) -> str:
+        # the delay is part of the name, as the TTL of a queue cannot be changed
+        return f"{queue_name}.retry.{self.delay(attempt)}s"
+
+    @staticmethod
+    def _dead_letters_queue_name(queue_name: str) -> str:
+        return f"{queue_name}.dead"
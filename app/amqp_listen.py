@@ -8,6 +8,8 @@ from app.config import get_app_settings
 from app.configure_logger import configure_logger
 from app.http.aio_http_client_manager import AioHttpClientManager
 from app.models.custom_medatata import register_custom_metadata_schemas
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.tracing import Tracer
 
 
 async def main():
@@ -17,7 +19,13 @@ async def main():
     """
     configure_logger()
     register_custom_metadata_schemas()
-    await _listen_to_rabbitmq()
+    EventLoopMonitor.start_monitoring()
+    await Tracer.start()
+    try:
+        await _listen_to_rabbitmq()
+    finally:
+        await Tracer.stop()
+        EventLoopMonitor.stop_monitoring()
 
 
 async def _listen_to_rabbitmq():
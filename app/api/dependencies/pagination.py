@@ -0,0 +1,36 @@
+"""Keyset pagination dependencies."""
+
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+from starlette.status import HTTP_422_UNPROCESSABLE_CONTENT
+
+from app.config import get_app_settings
+from app.services.summary.summary_cursor import decode_cursor
+
+# response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def summary_page_parameters(
+    cursor: Annotated[str | None, Query()] = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+) -> dict:
+    """
+    Page parameters for summary requests.
+    The page size is capped by the summary_max_page_size setting.
+    """
+    settings = get_app_settings()
+    try:
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+    except ValueError as error:
+        raise HTTPException(
+            status_code=HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error)
+        ) from error
+    return {
+        "cursor": decoded_cursor,
+        "limit": min(
+            limit or settings.summary_page_size, settings.summary_max_page_size
+        ),
+    }
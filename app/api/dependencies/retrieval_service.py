@@ -1,4 +1,5 @@
 """References dependencies."""
+
 from typing import Annotated, List
 
 from fastapi import Query
@@ -8,12 +9,13 @@ from app.models.reference_events import ReferenceEvent
 from app.services.retrieval.retrieval_service import RetrievalService
 
 
-def build_retrieval_service_from_fields(
+def build_retrieval_service_from_fields(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     identifiers_safe_mode: Annotated[bool, Query()] = False,
     harvesters: Annotated[List[str], Query()] = None,
     nullify: Annotated[List[str], Query()] = None,
     events: Annotated[List[ReferenceEvent.Type], Query()] = None,
     fetch_enhancements: Annotated[bool, Query()] = True,
+    incremental: Annotated[bool, Query()] = False,
 ) -> RetrievalService:
     """
     Build a retrieval service from the provided fields.
@@ -21,6 +23,8 @@ def build_retrieval_service_from_fields(
     :param harvesters:   list of harvesters to fetch (default : None, all harvesters)
     :param nullify:   list of identifiers to nullify for the person
     :param events:   list of event types to fetch (default : "created", "updated", "deleted")
+    :param fetch_enhancements: if True, fetch the enhanced references
+    :param incremental: if True, only fetch the references modified since the last harvesting
     :return:
     """
 
@@ -30,4 +34,5 @@ def build_retrieval_service_from_fields(
         events=event_types_or_default(events),
         harvesters=harvesters,
         fetch_enhancements=fetch_enhancements,
+        incremental=incremental,
     )
@@ -0,0 +1,43 @@
+"""Admin routes, always requiring authentication"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.task_introspection import live_tasks
+
+router = APIRouter()
+
+tags_metadata = [
+    {
+        "name": "admin",
+        "description": "Inspect the internals of the running process",
+    }
+]
+
+
+@router.get("/tasks")
+async def tasks(name: Annotated[str | None, Query()] = None) -> list[dict]:
+    """
+    Get the live asyncio tasks of the process,
+    e.g. the harvesters named {harvester}_harvester_retrieval_{retrieval id}
+
+    :param name: only get the tasks whose name contains it
+    :return: name, coroutine, age and current await point of the tasks, the oldest first
+    """
+    return live_tasks(name)
+
+
+@router.get("/event_loop/slow_callbacks")
+async def slow_callbacks() -> list[dict]:
+    """
+    Get the last callbacks detected blocking the event loop
+    longer than the event_loop_slow_callback_threshold setting
+
+    :return: task, coroutine, stack and duration of the slow callbacks, the latest first
+    """
+    monitor = EventLoopMonitor.running()
+    if monitor is None:
+        return []
+    return list(reversed(monitor.slow_callbacks))
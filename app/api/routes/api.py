@@ -2,9 +2,17 @@
 API redirection router
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.api.routes import references, retrieval, metrics, reference_events, jobs
+from app.api.routes import (
+    admin,
+    references,
+    retrieval,
+    metrics,
+    reference_events,
+    jobs,
+)
+from app.auth.basic import require_basic_user
 
 router = APIRouter()
 router.include_router(references.router, tags=["references"], prefix="/references")
@@ -14,3 +22,11 @@ router.include_router(
 router.include_router(retrieval.router, tags=["retrievals"], prefix="/retrievals")
 router.include_router(metrics.router, tags=["metrics"], prefix="/metrics")
 router.include_router(jobs.router, tags=["jobs"], prefix="/jobs")
+# the admin routes expose the internals of the process : authenticated
+# even if the basic authentication of the API is disabled
+router.include_router(
+    admin.router,
+    tags=["admin"],
+    prefix="/admin",
+    dependencies=[Depends(require_basic_user)],
+)
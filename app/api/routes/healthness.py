@@ -3,11 +3,15 @@ from pydantic import BaseModel
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.http.circuit_breaker import CircuitBreakerRegistry
+
 
 class HealthCheck(BaseModel):
     """Response model to validate and return when performing a health check."""
 
     status: str = "OK"
+    # states of the circuit breakers of the external endpoints, by endpoint name
+    circuit_breakers: dict[str, dict] = {}
 
 
 router = APIRouter()
@@ -25,8 +29,10 @@ async def get_health(_request: Request, _response: Response) -> HealthCheck:
     """
     ## Perform a Health Check
     Endpoint to perform a healthcheck on.
+    The states of the circuit breakers of the external endpoints
+    called by this process are reported along with the health status.
 
     Returns:
         HealthCheck: Returns a JSON response with the health status
     """
-    return HealthCheck(status="OK")
+    return HealthCheck(status="OK", circuit_breakers=CircuitBreakerRegistry.snapshot())
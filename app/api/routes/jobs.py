@@ -5,9 +5,9 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.services.jobs.concept_dereferencing_job import ConceptDereferencingJob
+from app.services.jobs.metrics_rollup_job import MetricsRollupJob
 from app.config import get_app_settings
 
-
 router = APIRouter()
 
 
@@ -20,6 +20,15 @@ async def create_concept_dereferencing(background_tasks: BackgroundTasks):
     return {"message": "Concept dereferencing job launched"}
 
 
+@router.post("/metrics_rollup")
+async def create_metrics_rollup(background_tasks: BackgroundTasks):
+    """
+    Post a metrics rollup job
+    """
+    background_tasks.add_task(MetricsRollupJob().run)
+    return {"message": "Metrics rollup job launched"}
+
+
 # CRON JOBS
 
 
@@ -42,6 +51,25 @@ async def start_concept_dereferencing_cron():
     scheduler.start()
 
 
+@router.on_event("startup")
+async def start_metrics_rollup_cron():
+    """
+    Schedule the metrics rollup job
+    """
+    conf = _get_job_conf("metrics_rollup")
+    if conf is None:
+        return
+    if conf["enabled"] is False:
+        logger.info("Metrics rollup job is disabled")
+        return
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(
+        MetricsRollupJob().run,
+        CronTrigger.from_crontab(conf["schedule"]),
+    )
+    scheduler.start()
+
+
 def _get_job_conf(job_name: str) -> dict:
     """
     Check if a job is configured in the settings
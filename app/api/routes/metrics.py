@@ -1,10 +1,17 @@
-""" Metrics routes"""
+"""Metrics routes"""
 
-from fastapi import APIRouter
+from datetime import datetime, time, timedelta
+from typing import Annotated
 
-from app.db.daos.reference_dao import ReferenceDAO
-from app.db.daos.reference_event_dao import ReferenceEventDAO
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from app.db.daos.harvesting_dao import HarvestingDAO
+from app.db.daos.metrics_rollup_dao import MetricsRollupDAO
 from app.db.session import async_session
+from app.monitoring import runtime_collectors
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.runtime_metrics import RuntimeMetrics
 
 router = APIRouter()
 
@@ -24,21 +31,24 @@ async def references_by_harvester() -> dict:
     :return: json representation of the references by harvester
     """
     async with async_session() as session:
-        metrics = await ReferenceDAO(session).get_references_by_harvester()
+        metrics = await MetricsRollupDAO(session).get_references_by_harvester()
     return dict(list(metrics))
 
 
 @router.get("/reference_events/by_day_and_type")
-async def references_by_day_and_type() -> dict:
+async def references_by_day_and_type(
+    past_days: Annotated[int, Query(ge=1, le=366)] = 7,
+) -> dict:
     """
     Get reference events by day and type
 
+    :param past_days: number of past days to get the reference events of
     :return: json representation of the reference events by day and type
     """
     async with async_session() as session:
-        metrics = await ReferenceEventDAO(
-            session
-        ).get_reference_events_by_day_and_type()
+        metrics = await MetricsRollupDAO(session).get_reference_events_by_day_and_type(
+            past_days
+        )
     dict_tree = {}
     for date_time, event_type, value in metrics:
         # Convert datetime object to string for JSON serialization
@@ -49,3 +59,86 @@ async def references_by_day_and_type() -> dict:
             dict_tree[date_str][event_type] = {}
         dict_tree[date_str][event_type] = value
     return dict_tree
+
+
+@router.get("/harvestings/timings_by_harvester")
+async def harvesting_timings_by_harvester(
+    past_days: Annotated[int, Query(ge=1, le=366)] = 7,
+) -> dict:
+    """
+    Get the time spent in each phase by the harvestings and the counters
+    of their results, summed and averaged by harvester
+
+    :param past_days: number of past days to get the harvestings of
+    :return: json representation of the timings by harvester
+    """
+    # the harvesting timestamps are recorded in UTC
+    since = datetime.combine(
+        datetime.utcnow().date() - timedelta(days=past_days), time.min
+    )
+    async with async_session() as session:
+        timings = await HarvestingDAO(session).get_timings_by_harvester(since)
+    dict_tree = {}
+    for harvester, section, name, total, harvestings in timings:
+        harvester_timings = dict_tree.setdefault(harvester, {"harvestings": 0})
+        measure = {"sum": total, "average": total / harvestings}
+        if section == "total":
+            harvester_timings["harvestings"] = harvestings
+            harvester_timings["total"] = measure
+        else:
+            harvester_timings.setdefault(section, {})[name] = measure
+    return dict_tree
+
+
+@router.get("/amqp/lanes")
+async def amqp_lanes(request: Request) -> dict:
+    """
+    Get the depth and latencies of the priority lanes
+    of the AMQP messages processed by this process
+
+    :return: statistics by lane, empty if AMQP is disabled
+    """
+    amqp_interface = getattr(request.app, "amqp_interface", None)
+    if amqp_interface is None or amqp_interface.task_queue is None:
+        return {}
+    return amqp_interface.task_queue.snapshot()
+
+
+@router.get("/event_loop/lag")
+async def event_loop_lag() -> dict:
+    """
+    Get the percentiles of the event loop lag of this process, in seconds,
+    over the last event_loop_lag_window samples
+
+    :return: lag percentiles and number of slow callbacks, empty if the monitor is disabled
+    """
+    monitor = EventLoopMonitor.running()
+    if monitor is None:
+        return {}
+    return monitor.snapshot()
+
+
+@router.get("/runtime", response_class=PlainTextResponse)
+async def runtime_metrics(request: Request) -> PlainTextResponse:
+    """
+    Get the runtime internals of this process in the Prometheus text format :
+    database, HTTP client and Redis pools, AMQP queues, event loop lag,
+    latencies and errors of the requests to the upstream hosts
+    and lookups of the third party API cache
+
+    :return: the metrics as text, 404 if the runtime_metrics_enabled setting is off
+    """
+    if not RuntimeMetrics.enabled():
+        raise HTTPException(status_code=404, detail="Runtime metrics are disabled")
+    return PlainTextResponse(
+        RuntimeMetrics.render(
+            runtime_collectors.database_pool,
+            runtime_collectors.http_client,
+            runtime_collectors.redis_pool,
+            runtime_collectors.event_loop,
+            lambda: runtime_collectors.amqp_queues(
+                getattr(request.app, "amqp_interface", None)
+            ),
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -1,12 +1,17 @@
-""" References routes"""
+"""References routes"""
 
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query
 from starlette import status
 from starlette.datastructures import URL
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 
 from app.api.dependencies.references import (
     build_person_from_fields,
@@ -22,10 +27,17 @@ from app.models.people import Person
 from app.models.reference_summary import ReferenceSummary
 from app.models.references import Reference
 from app.models.retrieval import Retrieval as RetrievalModel
+from app.services.retrieval.retrieval_batch_service import RetrievalBatchService
+from app.services.retrieval.retrieval_progress import RetrievalProgress
 from app.services.retrieval.retrieval_service import RetrievalService
-from app.services.summary.fetch_summary import fetch_summary
+from app.services.summary.fetch_summary import fetch_summary, stream_summary
 from app.settings.app_settings import AppSettings
 from app.api.dependencies.common_parameters import common_parameters
+from app.api.dependencies.pagination import (
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
+    summary_page_parameters,
+)
 
 router = APIRouter()
 
@@ -61,6 +73,8 @@ async def create_retrieval_sync(
     - **events**: list of event types to fetch (default : "created", "updated", "deleted")
     - **fetch_enhancements**: if True, this retrieval will fetch enhanced references
                     even if the event type is not among the requested ones
+    - **incremental**: if True, the harvesters supporting it will only fetch the references
+                    modified since their last completed harvesting
     - **name**: name of the entity to fetch references for (optional, for lisibility only)
     - **idref**: idref of the entity
     - **orcid**: orcid of the entity
@@ -113,6 +127,42 @@ async def create_retrieval_async(
     )
 
 
+@router.post(
+    "/retrievals:batch",
+    name="references:create-retrievals-for-entities-async",
+)
+async def create_retrievals_batch_async(
+    settings: Annotated[AppSettings, Depends(get_app_settings)],
+    batch_service: Annotated[RetrievalBatchService, Depends(RetrievalBatchService)],
+    persons: Annotated[List[Person], Body()],
+) -> JSONResponse:
+    """
+    Fetch references for many persons in an in_background way,
+    with the same retrieval parameters for all of them
+
+    \f
+    :param settings: app settings
+    :param batch_service: retrieval batch service
+    :param persons: entities built from fields
+    :return: json response listing the retrievals, in the same order as the persons
+    """
+    retrievals = await batch_service.register(entities=persons)
+    await batch_service.run(in_background=True)
+    return JSONResponse(
+        {
+            "retrievals": [
+                {
+                    "retrieval_id": retrieval.id,
+                    "retrieval_url": f"{settings.api_host}"
+                    f"{settings.api_prefix}/{settings.api_version}"
+                    f"/references/retrieval/{retrieval.id}",
+                }
+                for retrieval in retrievals
+            ]
+        }
+    )
+
+
 @router.get(
     "/retrieval/{retrieval_id}",
     response_model=RetrievalModel,
@@ -133,28 +183,135 @@ async def get_retrieval_result(
     return RetrievalModel.model_validate(retrieval)
 
 
+@router.get(
+    "/retrieval/{retrieval_id}/events",
+    response_class=StreamingResponse,
+)
+async def stream_retrieval_events(
+    retrieval_id: int,
+    since: Annotated[int, Query(ge=0)] = 0,
+    stream_format: Annotated[
+        RetrievalProgress.StreamFormat, Query(alias="format")
+    ] = RetrievalProgress.StreamFormat.SSE,
+    last_event_id: Annotated[int | None, Header(ge=0)] = None,
+) -> StreamingResponse:
+    """
+    Follow the progress of a retrieval run by this instance as a stream of events
+    (harvesting states and reference events), ended by a "Retrieval" event
+    when all the harvesters have finished.
+
+    Events are numbered : reconnecting clients only get the events following
+    the Last-Event-ID header or the "since" parameter.
+    Keepalives are sent as SSE comments or empty NDJSON lines.
+
+    :param retrieval_id: id of the retrieval
+    :param since: id of the last event already received, 0 for all the events
+    :param stream_format: "sse" for server-sent events, "ndjson" for newline delimited JSON
+    :param last_event_id: id of the last event received before a reconnection
+    :return: stream of events
+    """
+    progress = RetrievalProgress.get(retrieval_id)
+    if progress is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No progress events for retrieval {retrieval_id} on this instance",
+        )
+    return StreamingResponse(
+        progress.stream(
+            last_event_id if last_event_id is not None else since, stream_format
+        ),
+        media_type=(
+            NDJSON_MEDIA_TYPE
+            if stream_format == RetrievalProgress.StreamFormat.NDJSON
+            else "text/event-stream"
+        ),
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/summary")
-async def get_references(
+async def get_references(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    response: Response,
     params: Annotated[dict, Depends(common_parameters)],
+    page: Annotated[dict, Depends(summary_page_parameters)],
     text_search: Annotated[str, Query()] = "",
+    search_mode: Annotated[
+        ReferenceSummary.SearchMode, Query()
+    ] = ReferenceSummary.SearchMode.SUBSTRING,
     entity: Person = Depends(build_person_from_fields_optional),
 ) -> List[ReferenceSummary]:
     """
-    Get references by parameters
+    Get references by parameters, by pages ordered by decreasing date,
+    or by decreasing relevance for ranked text searches.
+    The cursor of the next page, if any, is returned in the X-Next-Cursor header.
+
     :param name: name of the entity
     :param events: list of event types to fetch
     :param nullify: list of source to nullify
     :param harvester: harvester to fetch
     :param date_start: date interval start
     :param date_end: date interval end
+    :param cursor: cursor of the page to fetch (X-Next-Cursor header of the previous page)
+    :param limit: number of references per page
+    :param text_search: text to search
+    :param search_mode: "substring" search on titles, entity names and identifiers
+        or "ranked" full-text search on titles (web search engines syntax)
 
     :return: References
     """
 
     async with async_session() as session:
-        return await fetch_summary(
-            ReferenceDAO, session, params, entity, {"text_search": text_search}
-        )
+        try:
+            references, next_cursor = await fetch_summary(
+                ReferenceDAO,
+                session,
+                params,
+                entity,
+                {"text_search": text_search, "search_mode": search_mode},
+                page,
+            )
+        except ValueError as error:
+            # cursor of a page of another search mode
+            raise HTTPException(status_code=422, detail=str(error)) from error
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return references
+
+
+@router.get("/summary/export", response_class=StreamingResponse)
+async def export_references(
+    params: Annotated[dict, Depends(common_parameters)],
+    text_search: Annotated[str, Query()] = "",
+    search_mode: Annotated[
+        ReferenceSummary.SearchMode, Query()
+    ] = ReferenceSummary.SearchMode.SUBSTRING,
+    entity: Person = Depends(build_person_from_fields_optional),
+) -> StreamingResponse:
+    """
+    Export all the references matching the parameters as newline delimited JSON
+
+    :param name: name of the entity
+    :param events: list of event types to fetch
+    :param nullify: list of source to nullify
+    :param harvester: harvester to fetch
+    :param date_start: date interval start
+    :param date_end: date interval end
+    :param text_search: text to search
+    :param search_mode: "substring" search on titles, entity names and identifiers
+        or "ranked" full-text search on titles (web search engines syntax)
+
+    :return: References, one JSON object per line
+    """
+    return StreamingResponse(
+        stream_summary(
+            ReferenceDAO,
+            ReferenceSummary,
+            params,
+            entity,
+            {"text_search": text_search, "search_mode": search_mode},
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
 
 @router.get("/by_id_and_version")
@@ -1,6 +1,13 @@
 from typing import Annotated, List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.responses import Response, StreamingResponse
+
 from app.api.dependencies.common_parameters import common_parameters
+from app.api.dependencies.pagination import (
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
+    summary_page_parameters,
+)
 from app.api.dependencies.references import build_person_from_fields_optional
 from app.db.daos.retrieval_dao import RetrievalDAO
 from app.db.models.retrieval import Retrieval as RetrievalDB
@@ -9,30 +16,67 @@ from app.models.retrieval import Retrieval as RetrievalModel
 
 from app.db.session import async_session
 from app.models.retrieval_summary import RetrievalSummary
-from app.services.summary.fetch_summary import fetch_summary
+from app.services.summary.fetch_summary import fetch_summary, stream_summary
 
 router = APIRouter()
 
 
 @router.get("/summary")
 async def get_retrievals(
+    response: Response,
     params: Annotated[dict, Depends(common_parameters)],
+    page: Annotated[dict, Depends(summary_page_parameters)],
     entity: Person = Depends(build_person_from_fields_optional),
 ) -> List[RetrievalSummary]:
     """
-    Get retrieval summary for a given entity
+    Get retrieval summary for a given entity, by pages ordered by decreasing date.
+    The cursor of the next page, if any, is returned in the X-Next-Cursor header.
     :param name: name of the entity
     :param events: list of event types to fetch (default : "created", "updated", "deleted")
     :param nullify: list of identifiers to nullify for the person
     :param date_interval: date interval to fetch
     :param harvester: harvester to fetch
+    :param cursor: cursor of the page to fetch (X-Next-Cursor header of the previous page)
+    :param limit: number of retrievals per page
 
     \f
     :param entity: entity to search
     :return: Retrieval history
     """
     async with async_session() as session:
-        return await fetch_summary(RetrievalDAO, session, params, entity)
+        try:
+            retrievals, next_cursor = await fetch_summary(
+                RetrievalDAO, session, params, entity, page=page
+            )
+        except ValueError as error:
+            # cursor of a page of another summary
+            raise HTTPException(status_code=422, detail=str(error)) from error
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return retrievals
+
+
+@router.get("/summary/export", response_class=StreamingResponse)
+async def export_retrievals(
+    params: Annotated[dict, Depends(common_parameters)],
+    entity: Person = Depends(build_person_from_fields_optional),
+) -> StreamingResponse:
+    """
+    Export the whole retrieval summary for a given entity as newline delimited JSON
+    :param name: name of the entity
+    :param events: list of event types to fetch (default : "created", "updated", "deleted")
+    :param nullify: list of identifiers to nullify for the person
+    :param date_interval: date interval to fetch
+    :param harvester: harvester to fetch
+
+    \f
+    :param entity: entity to search
+    :return: Retrieval history, one JSON object per line
+    """
+    return StreamingResponse(
+        stream_summary(RetrievalDAO, RetrievalSummary, params, entity),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
 
 @router.get("/{retrieval_id}")
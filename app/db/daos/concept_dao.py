@@ -1,6 +1,7 @@
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import Row, and_, delete, insert, or_, select, update
 from sqlalchemy.orm import raiseload, selectinload
-from sqlalchemy.sql.expression import func
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.models.concept import Concept
@@ -58,27 +59,76 @@ class ConceptDAO(AbstractDAO):
         return (await self.db_session.execute(query)).unique().scalars().all()
 
     # pylint: disable=singleton-comparison
-    async def get_random_concept_not_dereferenced(
-        self, exclude_ids: list[int] = None
-    ) -> Concept | None:
+    async def get_concepts_to_dereference(
+        self,
+        after_id: int | None,
+        limit: int,
+        expired_before: dict[str, datetime] = None,
+    ) -> list[Row[tuple[int, str]]]:
         """
-        Get a random concept that has not been dereferenced yet
-        It need to have an uri to be dereferenced
-
-        :param exclude_ids: We can provide a list of ids to exclude
+        Get a page of concepts that need to be dereferenced, in increasing id order :
+        concepts that have never been dereferenced and concepts whose last
+        dereferencing is older than the expiration date of their source.
 
-        :return: the Concept or None if not found
+        :param after_id: keyset cursor, only concepts with a greater id are returned
+        :param limit: maximum number of concepts to return
+        :param expired_before: expiration date by uri regular expression of the source
+        :return: list of (id, uri) rows
         """
-        if exclude_ids is None:
-            exclude_ids = []
-
+        expired_conditions = [
+            and_(
+                Concept.uri.regexp_match(uri_pattern),
+                or_(
+                    Concept.last_dereferencing_date_time == None,
+                    Concept.last_dereferencing_date_time < expiration_date,
+                ),
+            )
+            for uri_pattern, expiration_date in (expired_before or {}).items()
+        ]
         query = (
-            select(Concept)
-            .where(Concept.dereferenced == False)
+            select(Concept.id, Concept.uri)
             .where(Concept.uri != None)
-            .where(~Concept.id.in_(exclude_ids))
-            .order_by(func.random())  # pylint: disable=not-callable
-            .limit(1)
+            .where(or_(Concept.dereferenced == False, *expired_conditions))
+            .order_by(Concept.id)
+            .limit(limit)
         )
+        if after_id is not None:
+            query = query.where(Concept.id > after_id)
+        return list((await self.db_session.execute(query)).all())
 
-        return await self.db_session.scalar(query)
+    async def update_dereferenced_concepts(self, concepts: list[Concept]) -> None:
+        """
+        Replace the labels and dereferencing status of existing concepts
+        with freshly dereferenced ones, in bulk
+
+        :param concepts: dereferenced concepts, with the id of the existing concept set
+        :return: None
+        """
+        if not concepts:
+            return
+        await self.db_session.execute(
+            delete(Label).where(Label.concept_id.in_([c.id for c in concepts]))
+        )
+        labels = [
+            {
+                "concept_id": concept.id,
+                "value": label.value,
+                "language": label.language,
+                "preferred": label.preferred is not False,
+            }
+            for concept in concepts
+            for label in concept.labels
+        ]
+        if labels:
+            await self.db_session.execute(insert(Label), labels)
+        await self.db_session.execute(
+            update(Concept),
+            [
+                {
+                    "id": concept.id,
+                    "dereferenced": True,
+                    "last_dereferencing_date_time": concept.last_dereferencing_date_time,
+                }
+                for concept in concepts
+            ],
+        )
@@ -1,4 +1,18 @@
-from sqlalchemy import func, or_, update, select
+from datetime import datetime
+
+from sqlalchemy import (
+    Float,
+    Result,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
 from sqlalchemy.orm import raiseload, noload, selectinload
 
 from app.db.abstract_dao import AbstractDAO
@@ -32,6 +46,48 @@ class HarvestingDAO(AbstractDAO):
         self.db_session.add(harvesting)
         return harvesting
 
+    async def create_harvestings(
+        self,
+        retrieval_id: int,
+        harvesters: list[str],
+        state: DbHarvesting.State,
+        identifiers_used: dict[str, tuple[str, str] | None] | None = None,
+    ) -> dict[str, int]:
+        """
+        Create in a single statement the harvestings of a retrieval
+
+        :param retrieval_id: id of the retrieval to which the harvestings belong
+        :param harvesters: types of harvesters (idref, orcid, etc.)
+        :param state: initial state of the harvestings
+        :param identifiers_used: entity identifier (type, value) selected
+            by each harvester, if any
+        :return: ids of the created harvestings by harvester
+        """
+        if not harvesters:
+            return {}
+        identifiers_used = identifiers_used or {}
+        rows = []
+        for harvester in harvesters:
+            identifier_type, identifier_value = identifiers_used.get(harvester) or (
+                None,
+                None,
+            )
+            rows.append(
+                {
+                    "retrieval_id": retrieval_id,
+                    "harvester": harvester,
+                    "state": state.value,
+                    "identifier_used_type": identifier_type,
+                    "identifier_used_value": identifier_value,
+                }
+            )
+        stmt = (
+            insert(DbHarvesting)
+            .values(rows)
+            .returning(DbHarvesting.harvester, DbHarvesting.id)
+        )
+        return dict((await self.db_session.execute(stmt)).tuples().all())
+
     async def get_harvesting_by_id(self, harvesting_id) -> DbHarvesting | None:
         """
         Get a harvesting by its id
@@ -44,38 +100,53 @@ class HarvestingDAO(AbstractDAO):
         )
 
     async def get_harvesting_extended_info_by_id(
-        self, harvesting_id
+        self, harvesting_id, with_entity: bool = True
     ) -> DbHarvesting | None:
         """
         Get a harvesting without reference events but with retrieval and associated entity
 
         :param harvesting_id: id of the harvesting
+        :param with_entity: if False, the retrieval and its entity are not loaded
         :return: the harvesting or None if not found
         """
         stmt = (
             select(DbHarvesting)
-            .options(selectinload(DbHarvesting.retrieval))
+            .options(
+                selectinload(DbHarvesting.retrieval)
+                if with_entity
+                else noload(DbHarvesting.retrieval)
+            )
             .options(noload(DbHarvesting.reference_events))
             .where(DbHarvesting.id == harvesting_id)
         )
         return (await self.db_session.execute(stmt)).unique().scalar_one_or_none()
 
     async def update_harvesting_state(
-        self, harvesting_id: int, state: DbHarvesting.State
-    ):
+        self,
+        harvesting_id: int,
+        state: DbHarvesting.State,
+        timings: dict | None = None,
+    ) -> str | None:
         """
-        Update the state of a harvesting
+        Update the state of a harvesting, unless it has been resumed by another one
 
         :param harvesting_id: id of the harvesting
         :param state: new state
-        :return: None
+        :param timings: timings of the harvesting to store with the state, if any
+        :return: the state stored in database, None if the harvesting does not exist
+            or has been resumed by another harvesting
         """
+        values = {"state": state.value}
+        if timings is not None:
+            values["timings"] = timings
         stmt = (
             update(DbHarvesting)
             .where(DbHarvesting.id == harvesting_id)
-            .values({"state": state.value})
+            .where(DbHarvesting.resumed_by_id.is_(None))
+            .values(values)
+            .returning(DbHarvesting.state)
         )
-        await self.db_session.execute(stmt)
+        return (await self.db_session.execute(stmt)).scalar_one_or_none()
 
     async def update_harvesting_identifier(
         self,
@@ -101,6 +172,192 @@ class HarvestingDAO(AbstractDAO):
         )
         await self.db_session.execute(stmt)
 
+    async def get_last_completed_harvesting_timestamp(
+        self,
+        entity_id: int,
+        harvester: str,
+        identifier_used: tuple[str, str],
+        harvesting_id: int,
+    ) -> datetime | None:
+        """
+        Get the start time of the last completed harvesting
+        for an entity and a harvester, with the same entity identifier,
+        among the harvestings that fetched the records and recorded
+        their creations and updates (retrievals requesting the default event types
+        or at least the created and updated events)
+
+        :param entity_id: id of the entity
+        :param harvester: harvester name of the harvesting
+        :param identifier_used: entity identifier (type, value) of the current harvesting
+        :param harvesting_id: id of the current harvesting, excluded
+        :return: the UTC start time of the harvesting, None if there is none
+        """
+        identifier_type, identifier_value = identifier_used
+        stmt = (
+            select(func.max(DbHarvesting.timestamp))
+            .join(DbRetrieval)
+            .where(DbRetrieval.entity_id == entity_id)
+            .where(DbHarvesting.harvester == harvester)
+            .where(DbHarvesting.id != harvesting_id)
+            .where(DbHarvesting.state == DbHarvesting.State.COMPLETED.value)
+            .where(DbHarvesting.identifier_used_type == identifier_type)
+            .where(DbHarvesting.identifier_used_value == identifier_value)
+            .where(
+                or_(
+                    func.cardinality(DbRetrieval.event_types) == 0,
+                    DbRetrieval.event_types.contains(
+                        [
+                            ReferenceEvent.Type.CREATED.value,
+                            ReferenceEvent.Type.UPDATED.value,
+                        ]
+                    ),
+                )
+            )
+        )
+        return await self.db_session.scalar(stmt)
+
+    async def update_harvesting_checkpoint(
+        self, harvesting_id: int, checkpoint: dict | None
+    ) -> bool:
+        """
+        Persist the progress of a running harvesting,
+        unless it has been resumed by another one
+
+        :param harvesting_id: id of the harvesting
+        :param checkpoint: progress of the harvesting, None to clear it
+        :return: False if the harvesting has been resumed by another harvesting
+        """
+        stmt = (
+            update(DbHarvesting)
+            .where(DbHarvesting.id == harvesting_id)
+            .where(DbHarvesting.resumed_by_id.is_(None))
+            .values(
+                checkpoint=checkpoint,
+                checkpoint_timestamp=(
+                    datetime.utcnow() if checkpoint is not None else None
+                ),
+            )
+            .returning(DbHarvesting.id)
+        )
+        return (await self.db_session.execute(stmt)).scalar_one_or_none() is not None
+
+    async def refresh_harvesting_checkpoint_timestamp(self, harvesting_id: int) -> bool:
+        """
+        Record that a running harvesting is still alive, without changing its progress,
+        unless it has been resumed by another one
+
+        :param harvesting_id: id of the harvesting
+        :return: False if the harvesting has been resumed by another harvesting
+        """
+        stmt = (
+            update(DbHarvesting)
+            .where(DbHarvesting.id == harvesting_id)
+            .where(DbHarvesting.resumed_by_id.is_(None))
+            .values(checkpoint_timestamp=datetime.utcnow())
+            .returning(DbHarvesting.id)
+        )
+        return (await self.db_session.execute(stmt)).scalar_one_or_none() is not None
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def take_over_stale_harvesting(
+        self,
+        entity_id: int,
+        harvester: str,
+        identifier_used: tuple[str, str] | None,
+        event_types: list[str],
+        stale_before: datetime,
+        harvesting_id: int,
+    ) -> tuple[int, dict | None] | None:
+        """
+        Mark as failed the last harvesting interrupted while running,
+        for an entity and a harvester with the same entity identifier and event types,
+        so that its progress can be resumed by a new harvesting.
+        A harvesting is considered interrupted if it has not been checkpointed
+        (or started, if it has never been checkpointed) since stale_before.
+        The interrupted harvesting records the id of the harvesting resuming it,
+        which stops its own updates if it was still alive.
+
+        :param entity_id: id of the entity
+        :param harvester: harvester name of the harvesting
+        :param identifier_used: entity identifier (type, value) of the current harvesting
+        :param event_types: event types of the current retrieval
+        :param stale_before: UTC time before which running harvestings are interrupted
+        :param harvesting_id: id of the current harvesting, excluded
+        :return: id and checkpoint of the interrupted harvesting, None if there is none
+        """
+        identifier_type, identifier_value = identifier_used or (None, None)
+        stale_harvesting_id = (
+            select(DbHarvesting.id)
+            .join(DbRetrieval)
+            .where(DbRetrieval.entity_id == entity_id)
+            .where(DbRetrieval.event_types == event_types)
+            .where(DbHarvesting.harvester == harvester)
+            .where(DbHarvesting.id != harvesting_id)
+            .where(DbHarvesting.state == DbHarvesting.State.RUNNING.value)
+            .where(DbHarvesting.identifier_used_type == identifier_type)
+            .where(DbHarvesting.identifier_used_value == identifier_value)
+            .where(
+                func.coalesce(DbHarvesting.checkpoint_timestamp, DbHarvesting.timestamp)
+                < stale_before
+            )
+            .order_by(DbHarvesting.timestamp.desc())
+            .limit(1)
+            # concurrent redeliveries must not resume the same harvesting
+            .with_for_update(of=DbHarvesting, skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(DbHarvesting)
+            .where(DbHarvesting.id == stale_harvesting_id)
+            .values(state=DbHarvesting.State.FAILED.value, resumed_by_id=harvesting_id)
+            .returning(DbHarvesting.id, DbHarvesting.checkpoint)
+        )
+        row = (await self.db_session.execute(stmt)).one_or_none()
+        return None if row is None else tuple(row)
+
+    async def get_timings_by_harvester(self, since: datetime) -> Result:
+        """
+        Sum the timings of the harvestings started since a date, by harvester
+
+        :param since: UTC time since which the harvestings were started
+        :return: (harvester, section, name, sum, harvestings) rows ordered by harvester,
+            section being "total" (named "total"), "phases" or "counters"
+        """
+        # pylint: disable=not-callable
+        total = select(
+            DbHarvesting.harvester.label("harvester"),
+            literal("total").label("section"),
+            literal("total").label("name"),
+            func.sum(cast(DbHarvesting.timings["total"].astext, Float)).label("sum"),
+            func.count(DbHarvesting.id).label("harvestings"),
+        ).group_by(DbHarvesting.harvester)
+        queries = [total.where(DbHarvesting.timings.has_key("total"))]
+        for section in ("phases", "counters"):
+            entries = (
+                func.jsonb_each_text(DbHarvesting.timings[section])
+                .table_valued("key", "value")
+                .alias(section)
+            )
+            queries.append(
+                select(
+                    DbHarvesting.harvester.label("harvester"),
+                    literal(section).label("section"),
+                    entries.c.key.label("name"),
+                    func.sum(cast(entries.c.value, Float)).label("sum"),
+                    func.count(DbHarvesting.id).label("harvestings"),
+                )
+                .join(entries, true())
+                .group_by(DbHarvesting.harvester, entries.c.key)
+            )
+        timings = union_all(
+            *(query.where(DbHarvesting.timestamp >= since) for query in queries)
+        ).subquery()
+        return await self.db_session.execute(
+            select(timings).order_by(
+                timings.c.harvester, timings.c.section, timings.c.name
+            )
+        )
+
     def harvesting_event_count_subquery(self, event_types, nullify):
         """
         Get a subquery for the count of events for each harvesting grouped by event type
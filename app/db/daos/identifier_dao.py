@@ -1,4 +1,4 @@
-from sqlalchemy import select, Row
+from sqlalchemy import select, Row, tuple_
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.models.entity import Entity
@@ -11,7 +11,7 @@ class IdentifierDAO(AbstractDAO):
     """
 
     async def get_identifier_and_entity_by_type_and_value(
-            self, identifier_type: str, identifier_value: str
+        self, identifier_type: str, identifier_value: str
     ) -> Row[Identifier, Entity] | None:
         """
         Get an identifier (along with the associated entity) by its type and value
@@ -44,3 +44,30 @@ class IdentifierDAO(AbstractDAO):
             .where(Identifier.value.in_(identifier.value for identifier in identifiers))
         )
         return (await self.db_session.scalars(query)).unique()
+
+    async def get_entities_by_types_and_values(
+        self, types_and_values: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], Entity]:
+        """
+        Get the entities owning any of the given identifiers, in a single query
+
+        :param types_and_values: (type, value) pairs of the identifiers
+        :return: entities by (type, value) of their matching identifier
+        """
+        if not types_and_values:
+            return {}
+        query = (
+            select(Identifier.type, Identifier.value, Entity)
+            .join(Entity)
+            .where(
+                tuple_(Identifier.type, Identifier.value).in_(
+                    list(dict.fromkeys(types_and_values))
+                )
+            )
+        )
+        return {
+            (identifier_type, identifier_value): entity
+            for identifier_type, identifier_value, entity in (
+                await self.db_session.execute(query)
+            ).unique()
+        }
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.abstract_dao import AbstractDAO
+from app.db.models.job_checkpoint import JobCheckpoint
+
+
+class JobCheckpointDAO(AbstractDAO):
+    """
+    Data access object for offline jobs checkpoints
+    """
+
+    async def get_checkpoint(self, job_name: str) -> int | None:
+        """
+        Get the last saved cursor of a job
+
+        :param job_name: name of the job
+        :return: the cursor or None if the job has no checkpoint
+        """
+        query = select(JobCheckpoint.cursor).where(JobCheckpoint.job_name == job_name)
+        return await self.db_session.scalar(query)
+
+    async def save_checkpoint(self, job_name: str, cursor: int) -> None:
+        """
+        Create or update the checkpoint of a job
+
+        :param job_name: name of the job
+        :param cursor: id of the last record processed by the job
+        :return: None
+        """
+        stmt = insert(JobCheckpoint).values(
+            job_name=job_name, cursor=cursor, timestamp=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobCheckpoint.job_name],
+            set_={"cursor": stmt.excluded.cursor, "timestamp": stmt.excluded.timestamp},
+        )
+        await self.db_session.execute(stmt)
+
+    async def delete_checkpoint(self, job_name: str) -> None:
+        """
+        Delete the checkpoint of a job, so that its next run starts from scratch
+
+        :param job_name: name of the job
+        :return: None
+        """
+        await self.db_session.execute(
+            delete(JobCheckpoint).where(JobCheckpoint.job_name == job_name)
+        )
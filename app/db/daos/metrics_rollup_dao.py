@@ -0,0 +1,194 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, Integer, Result, cast, func, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.abstract_dao import AbstractDAO
+from app.db.daos.job_checkpoint_dao import JobCheckpointDAO
+from app.db.models.harvesting import Harvesting
+from app.db.models.reference import Reference
+from app.db.models.reference_event import ReferenceEvent
+from app.db.models.reference_events_rollup import ReferenceEventsRollup
+from app.db.models.references_rollup import ReferencesRollup
+
+
+class MetricsRollupDAO(AbstractDAO):
+    """
+    Data access object for the metrics, computed from pre-aggregated rollups
+    completed by the live aggregation of the records that are not rolled up yet
+    """
+
+    # checkpoint of the last reference id counted in the references rollup
+    REFERENCES_ROLLUP_CHECKPOINT = "metrics_rollup_references"
+    # checkpoint of the last reference id seen by the previous rollup
+    REFERENCES_OBSERVED_CHECKPOINT = "metrics_rollup_references_observed"
+
+    async def get_references_by_harvester(self) -> Result:
+        """
+        Count the number of references by harvester
+
+        :return: (harvester, count) rows ordered by harvester
+        """
+        rolled_up_until = await self._references_rolled_up_until()
+        live = (
+            select(
+                Reference.harvester.label("harvester"),
+                # pylint: disable=not-callable
+                func.count(Reference.id).label("count"),
+            )
+            .where(Reference.id > rolled_up_until)
+            .group_by(Reference.harvester)
+        )
+        rolled_up = select(ReferencesRollup.harvester, ReferencesRollup.count)
+        counts = union_all(rolled_up, live).subquery()
+        query = (
+            select(
+                counts.c.harvester,
+                cast(func.sum(counts.c.count), Integer).label("count"),
+            )
+            .group_by(counts.c.harvester)
+            .order_by(counts.c.harvester)
+        )
+        return await self.db_session.execute(query)
+
+    async def get_reference_events_by_day_and_type(self, past_days: int = 7) -> Result:
+        """
+        Count the reference events by harvesting day and event type
+
+        :param past_days: number of past days to count the events of
+        :return: (day, event type, count) rows ordered by day
+        """
+        # the harvesting timestamps are recorded in UTC
+        start_day = datetime.utcnow().date() - timedelta(days=past_days)
+        horizon = await self._reference_events_rolled_up_until()
+        live_day = cast(Harvesting.timestamp, Date)
+        live = (
+            select(
+                live_day.label("day"),
+                ReferenceEvent.type.label("event_type"),
+                # pylint: disable=not-callable
+                func.count(ReferenceEvent.id).label("count"),
+            )
+            .join(Harvesting)
+            .where(
+                Harvesting.timestamp
+                >= self._start_of(
+                    max(start_day, horizon + timedelta(days=1))
+                    if horizon
+                    else start_day
+                )
+            )
+            .group_by(live_day, ReferenceEvent.type)
+        )
+        rolled_up = select(
+            ReferenceEventsRollup.day,
+            ReferenceEventsRollup.event_type,
+            ReferenceEventsRollup.count,
+        ).where(ReferenceEventsRollup.day >= start_day)
+        counts = union_all(rolled_up, live).subquery()
+        query = (
+            select(
+                counts.c.day,
+                counts.c.event_type,
+                cast(func.sum(counts.c.count), Integer).label("count"),
+            )
+            .group_by(counts.c.day, counts.c.event_type)
+            .order_by(counts.c.day)
+        )
+        return await self.db_session.execute(query)
+
+    async def roll_up_reference_events(self, before_day: date) -> None:
+        """
+        Aggregate the reference events of the days following the last rolled up day
+        into the rollup, up to a given day (excluded)
+
+        :param before_day: first day not to roll up,
+            as its harvestings may still be running
+        :return: None
+        """
+        horizon = await self._reference_events_rolled_up_until()
+        day = cast(Harvesting.timestamp, Date)
+        aggregation = (
+            select(
+                day,
+                Harvesting.harvester,
+                ReferenceEvent.type,
+                # pylint: disable=not-callable
+                func.count(ReferenceEvent.id),
+            )
+            .join(Harvesting)
+            .where(Harvesting.timestamp < self._start_of(before_day))
+            .group_by(day, Harvesting.harvester, ReferenceEvent.type)
+        )
+        if horizon:
+            aggregation = aggregation.where(
+                Harvesting.timestamp >= self._start_of(horizon + timedelta(days=1))
+            )
+        stmt = insert(ReferenceEventsRollup).from_select(
+            ["day", "harvester", "event_type", "count"], aggregation
+        )
+        # the days are aggregated as a whole : rolling them up again is idempotent
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                ReferenceEventsRollup.day,
+                ReferenceEventsRollup.harvester,
+                ReferenceEventsRollup.event_type,
+            ],
+            set_={"count": stmt.excluded.count},
+        )
+        await self.db_session.execute(stmt)
+
+    async def roll_up_references(self) -> None:
+        """
+        Add the references created since the last rollup to the rollup.
+
+        Reference ids are not committed in order : only the references up to the
+        last id seen by the previous rollup are counted, the ones above
+        remain counted live until the next rollup.
+
+        :return: None
+        """
+        checkpoints = JobCheckpointDAO(self.db_session)
+        rolled_up_until = await self._references_rolled_up_until()
+        observed = await checkpoints.get_checkpoint(self.REFERENCES_OBSERVED_CHECKPOINT)
+        if observed is not None and observed > rolled_up_until:
+            aggregation = (
+                select(
+                    Reference.harvester,
+                    # pylint: disable=not-callable
+                    func.count(Reference.id),
+                )
+                .where(Reference.id > rolled_up_until, Reference.id <= observed)
+                .group_by(Reference.harvester)
+            )
+            stmt = insert(ReferencesRollup).from_select(
+                ["harvester", "count"], aggregation
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ReferencesRollup.harvester],
+                set_={"count": ReferencesRollup.count + stmt.excluded.count},
+            )
+            await self.db_session.execute(stmt)
+            await checkpoints.save_checkpoint(
+                self.REFERENCES_ROLLUP_CHECKPOINT, observed
+            )
+        last_id = await self.db_session.scalar(select(func.max(Reference.id)))
+        if last_id is not None:
+            await checkpoints.save_checkpoint(
+                self.REFERENCES_OBSERVED_CHECKPOINT, last_id
+            )
+
+    async def _references_rolled_up_until(self) -> int:
+        return (
+            await JobCheckpointDAO(self.db_session).get_checkpoint(
+                self.REFERENCES_ROLLUP_CHECKPOINT
+            )
+            or 0
+        )
+
+    async def _reference_events_rolled_up_until(self) -> date | None:
+        return await self.db_session.scalar(select(func.max(ReferenceEventsRollup.day)))
+
+    @staticmethod
+    def _start_of(day: date) -> datetime:
+        return datetime.combine(day, time.min)
@@ -21,6 +21,19 @@ class OrganizationDAO(AbstractDAO):
         query = select(Organization).where(Organization.source_identifier == identifier)
         return await self.db_session.scalar(query)
 
+    async def get_existing_source_identifiers(self, identifiers: list[str]) -> set[str]:
+        """
+        Get, among a list of source identifiers, those of the organizations
+        already registered in the database
+
+        :param identifiers: source identifiers of the organizations
+        :return: the source identifiers found in the database
+        """
+        query = select(Organization.source_identifier).where(
+            Organization.source_identifier.in_(identifiers)
+        )
+        return set((await self.db_session.scalars(query)).all())
+
     async def get_organization_by_identifiers(
         self, identifiers: list[OrganizationIdentifier]
     ) -> Organization | None:
@@ -1,20 +1,30 @@
 import datetime
 from typing import List, Tuple
 
-from sqlalchemy import and_, or_, select, func
-from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy import (
+    Row,
+    Select,
+    and_,
+    or_,
+    select,
+    func,
+    tuple_,
+    literal_column,
+    ColumnElement,
+)
+from sqlalchemy.ext.asyncio import AsyncResult
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.daos.entity_dao import EntityDAO
 from app.db.models.entity import Entity
 from app.db.models.harvesting import Harvesting
 from app.db.models.identifier import Identifier
-from app.db.models.issue import Issue
 from app.db.models.person import Person
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
 from app.db.models.retrieval import Retrieval
-from app.db.models.title import Title
+from app.db.models.title import Title, TITLES_TEXT_SEARCH_CONFIGURATION
+from app.db.references.reference_loader_profiles import ReferenceLoaderProfile
 from app.models.reference_summary import ReferenceSummary
 from app.utilities.string_utilities import split_string
 
@@ -76,6 +86,7 @@ class ReferenceDAO(AbstractDAO):
         """
         query = (
             select(Reference)
+            .options(*ReferenceLoaderProfile.DISPLAY.options())
             .where(Reference.source_identifier == source_identifier)
             .where(Reference.harvester == harvester)
             .order_by(Reference.version.asc())
@@ -95,29 +106,106 @@ class ReferenceDAO(AbstractDAO):
         """
         query = (
             select(Reference)
-            .options(raiseload("*"))
+            .options(*ReferenceLoaderProfile.CHANGE_DETECTION.options())
             .where(Reference.source_identifier == source_identifier)
             .where(Reference.harvester == harvester)
             .order_by(Reference.version.desc())
         )
         return (await self.db_session.execute(query)).scalars().first()
 
+    async def get_last_reference_ids_by_source_identifiers(
+        self, source_identifiers: set[str], harvester: str
+    ) -> List[int]:
+        """
+        Get the ids of the references with the highest version number
+        for each of the given source identifiers and a harvester
+
+        :param source_identifiers: source identifiers of the references
+        :param harvester: harvester name of the harvesting they come from
+        :return: ids of the references found
+        """
+        query = (
+            select(Reference.id)
+            .distinct(Reference.source_identifier)
+            .where(Reference.source_identifier.in_(source_identifiers))
+            .where(Reference.harvester == harvester)
+            .order_by(Reference.source_identifier, Reference.version.desc())
+        )
+        return list((await self.db_session.execute(query)).scalars().all())
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
     async def get_references_summary(
         self,
         text_search: str,
         filter_harvester: dict[List, List],
         date_interval: tuple[datetime.date, datetime.date],
         entity: Person,
-    ) -> List[ReferenceSummary]:
+        search_mode: ReferenceSummary.SearchMode = ReferenceSummary.SearchMode.SUBSTRING,
+        cursor: tuple | None = None,
+        limit: int | None = None,
+    ) -> List[Row]:
         """
-        Get references sumaru by parameters
+        Get references summary by parameters, by pages ordered
+        by decreasing (harvesting timestamp, reference id, event type),
+        preceded by decreasing rank for ranked text searches
         :param text_search: text to search
         :param filter_harvester: filter for the harvester (event_types, nullify, harvester)
         :param date_interval: date interval to fetch
         :param entity: entity to search
+        :param search_mode: substring or ranked full-text search
+        :param cursor: sort key of the last row of the previous page
+        :param limit: maximum number of rows to return
 
         :return: References
         """
+        query, sort_key = self._references_summary_query(
+            text_search, filter_harvester, date_interval, entity, search_mode
+        )
+        if cursor is not None:
+            if len(cursor) != len(sort_key):
+                raise ValueError("Cursor does not match the search mode")
+            query = query.where(tuple_(*sort_key) < tuple_(*cursor))
+        if limit is not None:
+            query = query.limit(limit)
+        return list((await self.db_session.execute(query)).all())
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def stream_references_summary(
+        self,
+        text_search: str,
+        filter_harvester: dict[List, List],
+        date_interval: tuple[datetime.date, datetime.date],
+        entity: Person,
+        batch_size: int,
+        search_mode: ReferenceSummary.SearchMode = ReferenceSummary.SearchMode.SUBSTRING,
+    ) -> AsyncResult:
+        """
+        Stream the whole references summary through a server-side cursor
+        :param text_search: text to search
+        :param filter_harvester: filter for the harvester (event_types, nullify, harvester)
+        :param date_interval: date interval to fetch
+        :param entity: entity to search
+        :param batch_size: number of rows fetched at once from the database
+        :param search_mode: substring or ranked full-text search
+
+        :return: asynchronous result over the references summary rows
+        """
+        query, _ = self._references_summary_query(
+            text_search, filter_harvester, date_interval, entity, search_mode
+        )
+        return await self.db_session.stream(
+            query.execution_options(yield_per=batch_size)
+        )
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _references_summary_query(
+        self,
+        text_search: str,
+        filter_harvester: dict[List, List],
+        date_interval: tuple[datetime.date, datetime.date],
+        entity: Person,
+        search_mode: ReferenceSummary.SearchMode,
+    ) -> tuple[Select, tuple[ColumnElement, ...]]:
         date_start, date_end = date_interval
         if entity:
             entity_id = EntityDAO(self.db_session).entity_filter_subquery(entity)
@@ -147,11 +235,12 @@ class ReferenceDAO(AbstractDAO):
             .filter(
                 ReferenceEvent.type.in_(filter_harvester["event_types"]),
                 Identifier.type.not_in(filter_harvester["nullify"]),
-                func.lower(Reference.harvester).in_(
-                    [func.lower(h) for h in filter_harvester["harvester"]]
+                # harvester names are stored in lower case :
+                # compare them without lower() to use the index
+                Reference.harvester.in_(
+                    [h.lower() for h in filter_harvester["harvester"]]
                 ),
             )
-            .order_by(Harvesting.timestamp.desc())
             .group_by(Harvesting.timestamp, Reference.id, ReferenceEvent.type)
         )
 
@@ -165,8 +254,15 @@ class ReferenceDAO(AbstractDAO):
         if date_end:
             query = query.where(Harvesting.timestamp <= date_end)
 
-        query = self._filter_text_search(query, text_search)
-        return await self.db_session.execute(query)
+        # a reference may have events of several types at the same timestamp :
+        # the event type completes the key of the grouped rows
+        sort_key = (Harvesting.timestamp, Reference.id, ReferenceEvent.type)
+        if search_mode == ReferenceSummary.SearchMode.RANKED and text_search:
+            query, rank = self._filter_ranked_text_search(query, text_search)
+            sort_key = (rank, *sort_key)
+        else:
+            query = self._filter_text_search(query, text_search)
+        return query.order_by(*[column.desc() for column in sort_key]), sort_key
 
     async def get_complete_reference_by_id(self, reference_id: int) -> Reference | None:
         """
@@ -177,11 +273,11 @@ class ReferenceDAO(AbstractDAO):
         """
         stmt = (
             select(Reference)
-            .options(selectinload(Reference.contributions))
+            .options(*ReferenceLoaderProfile.DISPLAY.options())
             .where(Reference.id == reference_id)
         )
 
-        return (await self.db_session.execute(stmt)).unique().scalar_one_or_none()
+        return (await self.db_session.execute(stmt)).scalar_one_or_none()
 
     async def get_complete_reference_by_harvester_source_identifier_version(
         self, harvester: str, source_identifier: str, version: str
@@ -196,16 +292,12 @@ class ReferenceDAO(AbstractDAO):
         """
         query = (
             select(Reference)
-            .options(selectinload(Reference.contributions))
-            .options(selectinload(Reference.abstracts))
-            .options(selectinload(Reference.subjects))
-            .options(joinedload(Reference.issue).joinedload(Issue.journal))
-            .options(joinedload(Reference.book))
+            .options(*ReferenceLoaderProfile.DISPLAY.options())
             .where(Reference.harvester == harvester)
             .where(Reference.source_identifier == source_identifier)
             .where(Reference.version == version)
         )
-        return (await self.db_session.execute(query)).unique().scalar_one_or_none()
+        return (await self.db_session.execute(query)).scalar_one_or_none()
 
     def _filter_text_search(self, query, text_search: str):
         """
@@ -225,18 +317,36 @@ class ReferenceDAO(AbstractDAO):
             )
         )
 
-    async def get_references_by_harvester(self) -> dict:
+    def _filter_ranked_text_search(
+        self, query: Select, text_search: str
+    ) -> tuple[Select, ColumnElement]:
         """
-        Count the number of references  by harvester
+        Filter the query by full-text search on the titles
+        and add the relevance of the reference as "rank" column
 
-        :return:
+        :param query: query to filter
+        :param text_search: text to search, in web search engines syntax
+        :return: the filtered query and the rank expression
         """
-        query = (
-            select(
-                Reference.harvester,
-                func.count(Reference.id).label("count"),
-            )
-            .group_by(Reference.harvester)
-            .order_by(Reference.harvester)
+        ts_query = func.websearch_to_tsquery(
+            literal_column(f"'{TITLES_TEXT_SEARCH_CONFIGURATION}'"), text_search
+        )
+        # literal configuration, so that the expression matches the title index
+        search_vector = func.to_tsvector(
+            literal_column(f"'{TITLES_TEXT_SEARCH_CONFIGURATION}'"), Title.value
+        )
+        matching_titles = select(Title.reference_id).where(
+            search_vector.op("@@")(ts_query)
+        )
+        rank = (
+            select(func.max(func.ts_rank(search_vector, ts_query)))
+            .where(Title.reference_id == Reference.id)
+            .correlate(Reference)
+            .scalar_subquery()
+        )
+        return (
+            query.filter(Reference.id.in_(matching_titles)).add_columns(
+                rank.label("rank")
+            ),
+            rank,
         )
-        return await self.db_session.execute(query)
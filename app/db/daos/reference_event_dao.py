@@ -1,15 +1,11 @@
-from datetime import datetime, timedelta
-
-import sqlalchemy
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.models.harvesting import Harvesting
-from app.db.models.issue import Issue
-from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
 from app.db.models.retrieval import Retrieval
+from app.db.references.reference_loader_profiles import ReferenceLoaderProfile
 
 
 # pylint: disable=duplicate-code
@@ -54,52 +50,30 @@ class ReferenceEventDAO(AbstractDAO):
         return await self.db_session.get(ReferenceEvent, reference_event_id)
 
     async def get_detailed_reference_event_by_id(
-        self, reference_event_id: int
+        self, reference_event_id: int, with_entity: bool = True
     ) -> ReferenceEvent | None:
         """
         Get a reference event by its id with reference, harvesting and entity
         :param reference_event_id:  id of the reference event
+        :param with_entity: if False, the retrieval and its entity are not loaded
         :return:   the reference event or None if not found
         """
+        harvesting_loader = selectinload(ReferenceEvent.harvesting)
         stmt = (
             select(ReferenceEvent)
             .options(
                 selectinload(ReferenceEvent.reference).options(
-                    selectinload(Reference.contributions),
-                    selectinload(Reference.subjects),
-                    selectinload(Reference.abstracts),
-                    selectinload(Reference.issue).selectinload(Issue.journal),
-                    selectinload(Reference.book),
+                    *ReferenceLoaderProfile.PUBLISH.options()
+                ),
+                (
+                    harvesting_loader.selectinload(Harvesting.retrieval).selectinload(
+                        Retrieval.entity
+                    )
+                    if with_entity
+                    else harvesting_loader.noload(Harvesting.retrieval)
                 ),
-                selectinload(ReferenceEvent.harvesting)
-                .selectinload(Harvesting.retrieval)
-                .selectinload(Retrieval.entity),
             )
             .where(ReferenceEvent.id == reference_event_id)
         )
 
         return (await self.db_session.execute(stmt)).unique().scalar_one_or_none()
-
-    async def get_reference_events_by_day_and_type(self, past_days: int = 7) -> dict:
-        """
-        Get reference events count by day and type
-
-        :return: json representation of the reference events by day and type
-        """
-        start_time = datetime.today() - timedelta(days=past_days)
-        query = (
-            select(
-                sqlalchemy.cast(Harvesting.timestamp, sqlalchemy.Date),
-                ReferenceEvent.type,
-                # pylint: disable=not-callable
-                func.count(ReferenceEvent.id).label("count"),
-            )
-            .join(Harvesting)
-            .where(Harvesting.timestamp > start_time)
-            .order_by(sqlalchemy.cast(Harvesting.timestamp, sqlalchemy.Date))
-            .group_by(
-                sqlalchemy.cast(Harvesting.timestamp, sqlalchemy.Date),
-                ReferenceEvent.type,
-            )
-        )
-        return await self.db_session.execute(query)
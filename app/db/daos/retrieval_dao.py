@@ -1,8 +1,9 @@
 import datetime
 from typing import List, Tuple
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import Row, Select, and_, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.orm import selectinload
 
 from app.db.abstract_dao import AbstractDAO
 from app.db.daos.entity_dao import EntityDAO
@@ -11,11 +12,11 @@ from app.db.models.document_type import DocumentType
 from app.db.models.entity import Entity
 from app.db.models.harvesting import Harvesting
 from app.db.models.identifier import Identifier
-from app.db.models.issue import Issue
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
 from app.db.models.references_document_type import references_document_type_table
 from app.db.models.retrieval import Retrieval
+from app.db.references.reference_loader_profiles import ReferenceLoaderProfile
 from app.models.people import Person
 from app.utilities.string_utilities import split_string
 
@@ -41,6 +42,41 @@ class RetrievalDAO(AbstractDAO):
         self.db_session.add(retrieval)
         return retrieval
 
+    async def create_retrievals(
+        self, entities: List[Entity], event_types: List[ReferenceEvent.Type] = None
+    ) -> List[Retrieval]:
+        """
+        Create the retrievals of several entities, with the same event types
+
+        :param entities: the entities we want to fetch references for
+        :param event_types: event types of the retrievals
+        :return: the created retrievals, in the same order as the entities
+        """
+        retrievals = [
+            Retrieval(entity=entity, event_types=event_types or [])
+            for entity in entities
+        ]
+        self.db_session.add_all(retrievals)
+        return retrievals
+
+    async def update_time_to_first_request(
+        self, retrieval_id: int, time_to_first_request: float
+    ) -> None:
+        """
+        Record the delay between the launch of the harvesters of a retrieval
+        and the first request sent by one of them
+
+        :param retrieval_id: id of the retrieval
+        :param time_to_first_request: delay in seconds
+        :return: None
+        """
+        stmt = (
+            update(Retrieval)
+            .where(Retrieval.id == retrieval_id)
+            .values(time_to_first_request=time_to_first_request)
+        )
+        await self.db_session.execute(stmt)
+
     async def get_retrieval_by_id(self, retrieval_id: int) -> Retrieval | None:
         """
         Get a retrieval by its id
@@ -62,26 +98,8 @@ class RetrievalDAO(AbstractDAO):
             .options(
                 selectinload(Retrieval.harvestings)
                 .selectinload(Harvesting.reference_events)
-                .options(
-                    joinedload(ReferenceEvent.reference).selectinload(
-                        Reference.contributions, innerjoin=False
-                    )
-                )
-                .options(
-                    joinedload(ReferenceEvent.reference).selectinload(
-                        Reference.abstracts, innerjoin=False
-                    )
-                )
-                .options(
-                    joinedload(ReferenceEvent.reference).selectinload(
-                        Reference.subjects, innerjoin=False
-                    )
-                )
-                .options(
-                    joinedload(ReferenceEvent.reference)
-                    .joinedload(Reference.issue, innerjoin=False)
-                    .options(joinedload(Issue.journal, innerjoin=False))
-                )
+                .selectinload(ReferenceEvent.reference)
+                .options(*ReferenceLoaderProfile.DISPLAY.options())
             )
             .where(Retrieval.id == retrieval_id)
         )
@@ -102,44 +120,70 @@ class RetrievalDAO(AbstractDAO):
                 selectinload(Retrieval.harvestings)
                 .selectinload(Harvesting.reference_events)
                 .selectinload(ReferenceEvent.reference)
-            )
-            .options(
-                selectinload(Retrieval.harvestings)
-                .selectinload(Harvesting.reference_events)
-                .selectinload(ReferenceEvent.reference)
-                .selectinload(Reference.contributions)
-            )
-            .options(
-                selectinload(Retrieval.harvestings)
-                .selectinload(Harvesting.reference_events)
-                .selectinload(ReferenceEvent.reference)
-                .selectinload(Reference.issue)
-            )
-            .options(
-                selectinload(Retrieval.harvestings)
-                .selectinload(Harvesting.reference_events)
-                .selectinload(ReferenceEvent.reference)
-                .selectinload(Reference.issue)
-                .selectinload(Issue.journal)
+                .options(*ReferenceLoaderProfile.DISPLAY.options())
             )
             .where(Retrieval.id == retrieval_id)
         )
         return (await self.db_session.execute(stmt)).unique().scalar_one_or_none()
 
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
     async def get_retrievals_summary(
         self,
         filter_harvester: dict[List],
         date_interval: Tuple[datetime.date, datetime.date],
         entity: Person,
-    ) -> List[Retrieval]:
+        cursor: Tuple[datetime.datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> List[Row]:
         """
-        Get retrieval history for a given entity
+        Get retrieval history for a given entity, by pages ordered
+        by decreasing (retrieval timestamp, retrieval id)
         :param filter_harvester: filter for the harvester (event_types, nullify, harvester)
         :param date_interval: date interval to fetch
         :param entity: entity to search
+        :param cursor: (timestamp, id) of the last row of the previous page
+        :param limit: maximum number of rows to return
 
         :return: Retrieval history
         """
+        stmt = self._retrievals_summary_query(filter_harvester, date_interval, entity)
+        if cursor is not None:
+            if len(cursor) != 2:
+                raise ValueError("Cursor does not match the retrievals summary")
+            stmt = stmt.where(
+                tuple_(Retrieval.timestamp, Retrieval.id) < tuple_(*cursor)
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list((await self.db_session.execute(stmt)).all())
+
+    async def stream_retrievals_summary(
+        self,
+        filter_harvester: dict[List],
+        date_interval: Tuple[datetime.date, datetime.date],
+        entity: Person,
+        batch_size: int,
+    ) -> AsyncResult:
+        """
+        Stream the whole retrieval history through a server-side cursor
+        :param filter_harvester: filter for the harvester (event_types, nullify, harvester)
+        :param date_interval: date interval to fetch
+        :param entity: entity to search
+        :param batch_size: number of rows fetched at once from the database
+
+        :return: asynchronous result over the retrieval history rows
+        """
+        stmt = self._retrievals_summary_query(filter_harvester, date_interval, entity)
+        return await self.db_session.stream(
+            stmt.execution_options(yield_per=batch_size)
+        )
+
+    def _retrievals_summary_query(
+        self,
+        filter_harvester: dict[List],
+        date_interval: Tuple[datetime.date, datetime.date],
+        entity: Person,
+    ) -> Select:
         date_start, date_end = date_interval
 
         harvesting_event_count = HarvestingDAO(
@@ -195,11 +239,13 @@ class RetrievalDAO(AbstractDAO):
                 == references_document_type_table.c.document_type_id,
             )
             .where(
-                func.lower(Reference.harvester).in_(
-                    [func.lower(h) for h in filter_harvester["harvester"]]
+                # harvester names are stored in lower case :
+                # compare them without lower() to use the index
+                Reference.harvester.in_(
+                    [h.lower() for h in filter_harvester["harvester"]]
                 )
             )
-            .order_by(Retrieval.timestamp.desc())
+            .order_by(Retrieval.timestamp.desc(), Retrieval.id.desc())
             .group_by(Retrieval.id, entity_id.c.name)
         )
 
@@ -212,4 +258,4 @@ class RetrievalDAO(AbstractDAO):
             stmt = stmt.where(Harvesting.timestamp >= date_start)
         if date_end:
             stmt = stmt.where(Harvesting.timestamp <= date_end)
-        return await self.db_session.execute(stmt)
+        return stmt
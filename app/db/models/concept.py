@@ -27,5 +27,5 @@ class Concept(Base):
     dereferenced: Mapped[bool] = mapped_column(nullable=False, default=False)
     # timestamp of last successful dereferencing
     last_dereferencing_date_time: Mapped[datetime.datetime] = mapped_column(
-        nullable=True, default=None
+        nullable=True, default=None, index=True
     )
@@ -5,6 +5,7 @@ from typing import List
 
 from dataclasses_json import dataclass_json
 from sqlalchemy import Column, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -52,7 +53,21 @@ class Harvesting(Base):
         lazy="joined",
     )
 
-    timestamp: Mapped[datetime] = Column(DateTime, default=datetime.utcnow)
+    timestamp: Mapped[datetime] = Column(DateTime, default=datetime.utcnow, index=True)
+
+    # progress of a running harvesting, to resume it if it is interrupted :
+    # {"processed": {raw result source identifier: reference source identifier}}
+    checkpoint: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    checkpoint_timestamp: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+    # id of the harvesting that resumed this one after its interruption :
+    # the interrupted harvesting no longer updates its state nor its checkpoint
+    resumed_by_id: Mapped[int | None] = mapped_column(nullable=True)
+
+    # time spent by phase of the harvesting and counters of its results :
+    # {"total": seconds, "phases": {phase: seconds}, "counters": {counter: count}}
+    timings: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     error: Mapped[
         List["app.db.models.harvesting_error.HarvestingError"]
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class JobCheckpoint(Base):
+    """
+    Model for persistence of offline jobs progress
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    job_name: Mapped[str] = mapped_column(primary_key=True)
+
+    # id of the last record processed by the job
+    cursor: Mapped[int] = mapped_column(nullable=False)
+
+    timestamp: Mapped[datetime] = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
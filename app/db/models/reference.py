@@ -56,7 +56,7 @@ class Reference(Base, VersionedRecord):
         "app.db.models.reference_identifier.ReferenceIdentifier",
         back_populates="reference",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="selectin",
     )
 
     manifestations: Mapped[
@@ -65,20 +65,20 @@ class Reference(Base, VersionedRecord):
         "app.db.models.reference_manifestation.ReferenceManifestation",
         back_populates="reference",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="selectin",
     )
 
     titles: Mapped[List["app.db.models.title.Title"]] = relationship(
         "app.db.models.title.Title",
         back_populates="reference",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="selectin",
     )
     subtitles: Mapped[List["app.db.models.subtitle.Subtitle"]] = relationship(
         "app.db.models.subtitle.Subtitle",
         back_populates="reference",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="selectin",
     )
     abstracts: Mapped[List[Abstract]] = relationship(
         "app.db.models.abstract.Abstract",
@@ -98,7 +98,7 @@ class Reference(Base, VersionedRecord):
     ] = relationship(
         "app.db.models.document_type.DocumentType",
         secondary=references_document_type_table,
-        lazy="joined",
+        lazy="selectin",
     )
 
     reference_events: Mapped[
@@ -0,0 +1,20 @@
+from datetime import date
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ReferenceEventsRollup(Base):
+    """
+    Model for persistence of the number of reference events
+    by harvesting day, harvester and event type, for the metrics
+    """
+
+    __tablename__ = "reference_events_rollups"
+
+    day: Mapped[date] = mapped_column(primary_key=True)
+    harvester: Mapped[str] = mapped_column(primary_key=True)
+    event_type: Mapped[str] = mapped_column(primary_key=True)
+
+    count: Mapped[int] = mapped_column(nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ReferencesRollup(Base):
+    """
+    Model for persistence of the number of references by harvester, for the metrics
+    """
+
+    __tablename__ = "references_rollups"
+
+    harvester: Mapped[str] = mapped_column(primary_key=True)
+
+    count: Mapped[int] = mapped_column(nullable=False)
@@ -33,3 +33,7 @@ class Retrieval(Base):
     )
 
     timestamp: Mapped[datetime] = Column(DateTime, default=datetime.utcnow)
+
+    # seconds elapsed between the launch of the harvesters
+    # and the first request sent by one of them
+    time_to_first_request: Mapped[float | None] = mapped_column(nullable=True)
@@ -1,14 +1,25 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
 from app.db.models.reference_literal_field import ReferenceLiteralField
 
+# Text search configuration of the full-text index on titles :
+# no stemming, as titles are written in many languages
+TITLES_TEXT_SEARCH_CONFIGURATION = "simple"
+
 
 class Title(ReferenceLiteralField):
     """Model for persistence of titles"""
 
     __tablename__ = "titles"
     __mapper_args__ = {"concrete": True}
+    __table_args__ = (
+        Index(
+            "ix_titles_value_tsvector",
+            text(f"to_tsvector('{TITLES_TEXT_SEARCH_CONFIGURATION}', value)"),
+            postgresql_using="gin",
+        ),
+    )
 
     reference_id: Mapped[int] = mapped_column(ForeignKey("references.id"), index=True)
 
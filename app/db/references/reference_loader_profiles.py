@@ -0,0 +1,70 @@
+from enum import Enum
+
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.db.models.issue import Issue
+from app.db.models.reference import Reference
+
+
+class ReferenceLoaderProfile(Enum):
+    """
+    Named strategies to load references and their relationships,
+    to be applied by the DAO methods according to the use of the references.
+
+    Collections are loaded with one "SELECT ... IN" query each,
+    never joined, so that a reference is always fetched as a single row.
+    """
+
+    # columns of the reference only, relationships raise if accessed
+    MINIMAL = "minimal"
+    # columns needed to compare a harvested reference with the stored one
+    CHANGE_DETECTION = "change_detection"
+    # every relationship serialized in the AMQP messages
+    PUBLISH = "publish"
+    # every relationship displayed by the API and the GUI
+    DISPLAY = "display"
+
+    def options(self) -> tuple[ORMOption, ...]:
+        """
+        Loader options of the profile, relative to the Reference entity.
+
+        They can be passed to select(Reference).options()
+        or to the loader of a relationship to references,
+        e.g. selectinload(ReferenceEvent.reference).options()
+
+        :return: loader options
+        """
+        if self == ReferenceLoaderProfile.MINIMAL:
+            return (raiseload("*"),)
+        if self == ReferenceLoaderProfile.CHANGE_DETECTION:
+            return (
+                load_only(
+                    Reference.id,
+                    Reference.source_identifier,
+                    Reference.harvester,
+                    Reference.harvester_version,
+                    Reference.hash,
+                    Reference.version,
+                ),
+                raiseload("*"),
+            )
+        # the published and displayed representations are the same
+        # pydantic Reference model
+        return _complete_reference_options()
+
+
+def _complete_reference_options() -> tuple[ORMOption, ...]:
+    return (
+        selectinload(Reference.identifiers),
+        selectinload(Reference.manifestations),
+        selectinload(Reference.titles),
+        selectinload(Reference.subtitles),
+        selectinload(Reference.abstracts),
+        selectinload(Reference.subjects),
+        selectinload(Reference.document_type),
+        selectinload(Reference.contributions),
+        # many-to-one relationships do not multiply the rows
+        joinedload(Reference.issue).joinedload(Issue.journal),
+        joinedload(Reference.book),
+    )
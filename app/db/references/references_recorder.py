@@ -98,6 +98,38 @@ class ReferencesRecorder:
             )
             return ref
 
+    async def register_unchanged_by_id(self, old_ref_id: int) -> ReferenceEvent:
+        """
+        Register an event for a reference known to be unchanged
+        without having been compared with the source data
+
+        :param old_ref_id: id of the last version of the reference
+        :return: the reference event
+        """
+        async with async_session() as session:
+            async with session.begin():
+                return await ReferenceEventDAO(session).create_reference_event(
+                    harvesting_id=self.harvesting.id,
+                    reference_id=old_ref_id,
+                    event_type=ReferenceEvent.Type.UNCHANGED,
+                )
+
+    async def get_last_reference_ids(self, source_identifiers: set[str]) -> List[int]:
+        """
+        Get the ids of the last versions of the references
+        with the given source identifiers for the harvester
+
+        :param source_identifiers: source identifiers of the references
+        :return: ids of the references found
+        """
+        async with async_session() as session:
+            return await ReferenceDAO(
+                session
+            ).get_last_reference_ids_by_source_identifiers(
+                source_identifiers=source_identifiers,
+                harvester=self.harvesting.harvester,
+            )
+
     async def register_deletion(self, old_ref_id: int) -> ReferenceEvent:
         """
         Register an event for a deleted reference
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import declarative_base
 
 from app.config import get_app_settings
+from app.db.timed_queue_pool import TimedQueuePool
 from app.settings.app_env_types import AppEnvTypes
 
 settings = get_app_settings()
@@ -26,6 +27,7 @@ else:  # pragma: no cover
         SQLALCHEMY_DATABASE_URL,
         future=True,
         echo=False,
+        poolclass=TimedQueuePool,
         pool_size=settings.db_pool_size,
         max_overflow=settings.max_overflow,
         pool_timeout=60,
@@ -0,0 +1,23 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.monitoring.runtime_metrics import RuntimeMetrics
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool of the async engine measuring the time spent
+    getting a connection when the runtime metrics are enabled.
+    It includes the opening of a new connection when the pool is not full,
+    not only the wait for a connection released by another task.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if not RuntimeMetrics.enabled():
+            return super()._do_get()
+        start = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            RuntimeMetrics.DB_POOL_WAIT.observe(value=time.monotonic() - start)
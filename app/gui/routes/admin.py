@@ -4,6 +4,7 @@ from fastapi.responses import RedirectResponse
 from app.config import get_app_settings
 from app.gui.routes.templating import get_templating_engine
 from app.i18n.get_request_locale import get_request_locale
+from app.monitoring.tracing import MemorySpanExporter, Tracer
 
 I18N_DOMAIN = "admin"
 HISTORY_SUBPAGES = ["collection", "publication"]  # Update this list as you add subpages
@@ -111,6 +112,27 @@ async def get_settings(request: Request):
     )
 
 
+@router.get("/traces")
+async def get_traces(request: Request):
+    """Return the page of the last traces kept by the memory exporter in the admin gui"""
+    exporter = Tracer.exporter
+    return get_templating_engine(
+        I18N_DOMAIN, get_request_locale(request)
+    ).TemplateResponse(
+        "traces.html.jinja",
+        {
+            "request": request,
+            "page": "traces",
+            "tracing_exporter": exporter,
+            "traces": (
+                exporter.traces() if isinstance(exporter, MemorySpanExporter) else None
+            ),
+        }
+        | with_locale(request)
+        | with_api_informations(),
+    )
+
+
 @router.get("/list_endpoints/")
 def list_endpoints(request: Request):  # pragma: no cover
     """Convenience function to list all endpoints"""
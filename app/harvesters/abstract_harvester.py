@@ -3,7 +3,8 @@ import gc
 import traceback
 from abc import ABC, abstractmethod
 from asyncio import Queue
-from typing import Optional, AsyncGenerator, List, Tuple
+from datetime import datetime, timedelta
+from typing import Optional, AsyncGenerator, Callable, List, Tuple
 
 from asyncpg import PostgresConnectionError
 from loguru import logger
@@ -11,10 +12,10 @@ from semver import Version, VersionInfo
 from sqlalchemy.exc import TimeoutError as SqlTimeoutError
 
 from app.api.dependencies.event_types import event_types_or_default
+from app.config import get_app_settings
 from app.db.daos.entity_dao import EntityDAO
 from app.db.daos.harvesting_dao import HarvestingDAO
 from app.db.daos.harvesting_error_dao import HarvestingErrorDAO
-from app.db.models.entity import Entity as DbEntity
 from app.db.models.harvesting import Harvesting
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
@@ -23,9 +24,16 @@ from app.db.session import async_session
 from app.harvesters.abstract_harvester_raw_result import AbstractHarvesterRawResult
 from app.harvesters.abstract_references_converter import AbstractReferencesConverter
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.harvesting_interrupted_error import (
+    HarvestingInterruptedError,
+)
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.harvesters.harvesting_timings import HarvestingTimings, current_timings
+from app.monitoring.tracing import Tracer
+from app.services.entities.entity_snapshot import EntitySnapshot
+from app.services.retrieval.retrieval_progress import RetrievalProgress
 
 
 class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
@@ -35,22 +43,38 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
 
     VERSION: Version | None = None
     IDENTIFIERS_BY_ENTITIES: dict = {}
+    # True if the harvester implements list_source_identifiers
+    SUPPORTS_SOURCE_IDENTIFIERS_LISTING: bool = False
+    # True if the harvester can fetch only the records modified since a date,
+    # requires the listing of the source identifiers to detect deleted references
+    SUPPORTS_INCREMENTAL_HARVESTING: bool = False
 
     def __init__(self, converter: AbstractReferencesConverter):
         self.converter = converter
-        self.result_queue: Optional[Queue] = None
+        self.result_queue: Optional[Queue | RetrievalProgress] = None
         self.harvesting_id: Optional[int] = None
         self.harvesting: Optional[Harvesting] = None
         self.entity_id: Optional[int] = None
-        self.entity: Optional[DbEntity] = None
+        self.entity: Optional[EntitySnapshot] = None
         self.entity_identifier_used: Optional[tuple[str, str]] = None
         self.event_types: list[ReferenceEvent.Type] = []
         self.fetch_enhancements: bool = True
+        self.incremental: bool = False
+        self.timings: HarvestingTimings = HarvestingTimings()
+        self.modified_since: Optional[datetime] = None
+        self.first_request_callback: Optional[Callable[[], None]] = None
+        # reference source identifiers by raw result source identifier,
+        # for the results already processed by this harvesting
+        # or by the interrupted harvesting it resumes
+        self.processed: dict[str, Optional[str]] = {}
+        # True once another harvesting has resumed this one, considering it interrupted
+        self.taken_over: bool = False
 
-    def set_result_queue(self, result_queue: Queue):
+    def set_result_queue(self, result_queue: Queue | RetrievalProgress):
         """
         Set the result queue to allow the harvester to push the results back to the caller
-        :param result_queue: The queue to push the results to
+        :param result_queue: The queue to push the results to,
+            or the progress log of the retrieval feeding the result queue
         :return: None
         """
         self.result_queue = result_queue
@@ -65,6 +89,20 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         self.entity_id = entity_id
         await self._select_entity_identifier_used()
 
+    def set_entity(self, entity: EntitySnapshot) -> None:
+        """
+        Set the snapshot of the entity for which to harvest references,
+        shared by the harvesters of the retrieval,
+        and select the identifier that will be used for this harvesting.
+        Unlike set_entity_id, the selected identifier is not persisted:
+        the caller is expected to store it when creating the harvesting.
+        :param entity: The entity for which to harvest references, person or organisation
+        :return: None
+        """
+        self.entity_id = entity.id
+        self.entity = entity
+        self.entity_identifier_used = self._select_identifier(entity)
+
     def set_harvesting_id(self, harvesting_id: int):
         """
         Set the id of the harvesting db entry representing the harvesting operation
@@ -81,6 +119,14 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         """
         self.event_types = event_types
 
+    def set_first_request_callback(self, callback: Callable[[], None]):
+        """
+        Set a callback to be called when the harvester is about to send its first request
+        :param callback: The callback to call
+        :return: None
+        """
+        self.first_request_callback = callback
+
     def set_fetch_enhancements(self, fetch_enhancements: bool):
         """
         Set if the harvesting should include enhancements
@@ -89,6 +135,15 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         """
         self.fetch_enhancements = fetch_enhancements
 
+    def set_incremental(self, incremental: bool):
+        """
+        Set if the harvesting should only fetch the records modified
+        since the last completed harvesting
+        :param incremental: True if the harvesting should be incremental
+        :return: None
+        """
+        self.incremental = incremental
+
     @property
     def supported_identifier_types(self) -> list[str]:
         """Return identifier types supported by this harvester,
@@ -114,15 +169,9 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         """
         if not self.IDENTIFIERS_BY_ENTITIES:
             return
-        entity = await self._get_entity()
-        identifier_entries = self.IDENTIFIERS_BY_ENTITIES.get(entity.__class__.__name__)
-        if not identifier_entries:
-            return
-        for identifier_key, _ in identifier_entries:
-            identifier_value = entity.get_identifier(identifier_key)
-            if identifier_value is not None:
-                self.entity_identifier_used = (identifier_key, identifier_value)
-                break
+        self.entity_identifier_used = self._select_identifier(
+            EntitySnapshot.of(await self._get_entity())
+        )
         if self.entity_identifier_used is not None and self.harvesting_id is not None:
             async with async_session() as session:
                 async with session.begin():
@@ -132,6 +181,19 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
                         self.entity_identifier_used[1],
                     )
 
+    def _select_identifier(self, entity: EntitySnapshot) -> Optional[tuple[str, str]]:
+        """
+        Find the first identifier of the entity matching IDENTIFIERS_BY_ENTITIES
+        :param entity: The entity for which to harvest references
+        :return: The identifier type and value, or None if no identifier matches
+        """
+        identifier_entries = self.IDENTIFIERS_BY_ENTITIES.get(entity.class_name)
+        for identifier_key, _ in identifier_entries or []:
+            identifier_value = entity.get_identifier(identifier_key)
+            if identifier_value is not None:
+                return identifier_key, identifier_value
+        return None
+
     @abstractmethod
     async def fetch_results(
         self,
@@ -141,14 +203,41 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         :return: A generator of results
         """
 
-    # pylint: disable=too-many-branches,too-many-statements
+    async def list_source_identifiers(self) -> AsyncGenerator[str, None]:
+        """
+        List the source identifiers of all the records of the entity,
+        without their payloads, by large pages.
+        Deleted and unchanged references are detected against this listing
+        when the harvesting is incremental or only detects deleted references.
+        Must be implemented by the harvesters supporting the listing.
+        :return: A generator of source identifiers
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not list source identifiers"
+        )
+
     async def run(self) -> None:
         """
         Run the harvester asynchronously
         :return: None
         """
-        await self._update_harvesting_state(Harvesting.State.RUNNING)
-        await self._notify_harvesting_state()
+        self.timings = HarvestingTimings()
+        token = current_timings.set(self.timings)
+        try:
+            with Tracer.span(
+                "harvesting",
+                harvester=self.__class__.__name__,
+                harvesting_id=self.harvesting_id,
+            ):
+                await self._harvest()
+        finally:
+            current_timings.reset(token)
+
+    # pylint: disable=too-many-branches,too-many-statements
+    async def _harvest(self) -> None:
+        await self._notify_harvesting_state(
+            await self._update_harvesting_state(Harvesting.State.RUNNING)
+        )
         references_recorder = ReferencesRecorder(
             harvesting=(await self.get_harvesting())
         )
@@ -158,86 +247,70 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             )
             or []
         )
-        existing_reference_identifiers: list[str] = []
+        existing_reference_identifiers: set[str] = set()
+        heartbeat = asyncio.create_task(
+            self._heartbeat(), name=f"harvesting_{self.harvesting_id}_heartbeat"
+        )
         try:
+            await self._resume_interrupted_harvesting()
+            existing_reference_identifiers.update(
+                source_identifier
+                for source_identifier in self.processed.values()
+                if source_identifier is not None
+            )
+            self.modified_since = await self._get_modified_since()
+            if self.first_request_callback is not None:
+                self.first_request_callback()
             raw_data: AbstractHarvesterRawResult
-            async for raw_data in self.fetch_results():
-                old_ref: Optional[Reference] = None
+            async for raw_data in self._timed_results(self._fetch_results_to_compare()):
                 if raw_data in (None, "end"):
                     break
+                if self.taken_over:
+                    raise self._taken_over_error()
+                self.timings.count(HarvestingTimings.Counter.RESULTS)
+                if str(raw_data.source_identifier) in self.processed:
+                    # already recorded before the interruption
+                    continue
                 try:
-                    new_ref = self.converter.build(
-                        raw_data=raw_data, harvester_version=self.get_version()
+                    await self._process_result(
+                        raw_data=raw_data,
+                        references_recorder=references_recorder,
+                        existing_reference_identifiers=existing_reference_identifiers,
                     )
-                    if new_ref is None:
-                        continue
-                    old_ref = await references_recorder.exists(new_ref=new_ref)
-                    comparaison_hash = new_ref.hash
-                    new_ref_is_enhanced = False
-                    if old_ref is not None:
-                        existing_reference_identifiers.append(old_ref.source_identifier)
-                        new_ref_is_enhanced = VersionInfo.parse(
-                            new_ref.harvester_version
-                        ) > VersionInfo.parse(old_ref.harvester_version)
-                        if new_ref_is_enhanced:
-                            # If the version of the harvester has changed, we need to use a
-                            # comparaison hash computed with the old version of the harvester
-                            # to track changes
-                            comparaison_hash = self.converter.compute_hash(
-                                raw_data=raw_data,
-                                harvester_version=VersionInfo.parse(
-                                    old_ref.harvester_version
-                                ),
-                            )
-
-                    assert old_ref is None or comparaison_hash is not None
-                    # Compute the new reference fields only
-                    # 1. if the reference is new,
-                    # or 2. if source data have changed
-                    # or 3. if the harvester version has changed and fetch enhancements is True
-                    if (
-                        (old_ref is None)
-                        or (comparaison_hash != old_ref.hash)
-                        or (new_ref_is_enhanced and self.fetch_enhancements)
-                    ):
-                        await self.converter.convert(raw_data=raw_data, new_ref=new_ref)
-                    reference_event_id_and_type: Optional[Tuple[int, str]] = (
-                        await self._handle_converted_result(
-                            new_ref=new_ref,
-                            old_ref=old_ref,
-                            comparaison_hash=comparaison_hash,
-                            references_recorder=references_recorder,
-                        )
-                    )
-                    if reference_event_id_and_type is not None:
-                        await self._put_in_queue(
-                            {
-                                "type": "ReferenceEvent",
-                                "id": reference_event_id_and_type[0],
-                                "change": reference_event_id_and_type[1],
-                            }
-                        )
-                except UnexpectedFormatException as error:
-                    # If an UnexpectedFormatException bubbles up to this point
-                    # it means that one of the references could not be converted
-                    # but the harvester can continue to deliver results
-                    # so we handle and continue
-                    await self.handle_error(error, with_stack=True)
-                    continue
                 finally:
                     # Free memory before next iteration
-                    del new_ref, raw_data
-                    if old_ref is not None:
-                        del old_ref
+                    del raw_data
                     await asyncio.sleep(0)
                     gc.collect()
+            if self._uses_source_identifiers_listing():
+                # the records not modified since the last harvesting were not fetched
+                listed_reference_identifiers = {
+                    source_identifier
+                    async for source_identifier in self.list_source_identifiers()
+                }
+                await self._register_unchanged_references(
+                    unmodified_reference_identifiers=listed_reference_identifiers
+                    - existing_reference_identifiers,
+                    references_recorder=references_recorder,
+                )
+                existing_reference_identifiers = listed_reference_identifiers
             await self._register_deleted_references(
                 existing_reference_identifiers=existing_reference_identifiers,
                 previous_reference_ids_and_source_ids=previous_reference_ids_and_source_ids,
                 references_recorder=references_recorder,
             )
-            await self._update_harvesting_state(Harvesting.State.COMPLETED)
-            await self._notify_harvesting_state()
+            await self._save_checkpoint(None)
+            state = await self._update_harvesting_state(
+                Harvesting.State.COMPLETED, timings=self.timings.to_dict()
+            )
+            if state is None:
+                raise self._taken_over_error()
+            await self._notify_harvesting_state(state)
+        # another harvesting resumed this one, considering it interrupted,
+        # and has already recorded its failure
+        except HarvestingInterruptedError as error:
+            logger.warning(str(error))
+            await self._notify_harvesting_state(Harvesting.State.FAILED.value)
         # main point to handle all errors related to external endpoints unavailability
         # harvester should let external ExternalEndpointFailure bubble up to this point
         # because the harvesting cant recover from them
@@ -260,14 +333,105 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error(f"Unexpected exception during harvester run : {e}")
             await self.handle_error(e, with_stack=True)
+        finally:
+            heartbeat.cancel()
+
+    async def _process_result(
+        self,
+        raw_data: AbstractHarvesterRawResult,
+        references_recorder: ReferencesRecorder,
+        existing_reference_identifiers: set[str],
+    ) -> None:
+        """
+        Convert a harvested result, compare it with the recorded reference,
+        record and notify the change, then checkpoint the result
+        :param raw_data: The result fetched from the external API
+        :param references_recorder: The recorder of the harvesting references
+        :param existing_reference_identifiers: The source identifiers harvested so far,
+            completed with the one of the result
+        :return: None
+        """
+        span = Tracer.start_span(
+            "reference", source_identifier=str(raw_data.source_identifier)
+        )
+        try:
+            with self.timings.measure(HarvestingTimings.Phase.CONVERT):
+                new_ref = self.converter.build(
+                    raw_data=raw_data, harvester_version=self.get_version()
+                )
+            if new_ref is None:
+                await self._checkpoint(raw_data, None)
+                return
+            existing_reference_identifiers.add(new_ref.source_identifier)
+            with self.timings.measure(HarvestingTimings.Phase.DB):
+                old_ref: Optional[Reference] = await references_recorder.exists(
+                    new_ref=new_ref
+                )
+            comparaison_hash = new_ref.hash
+            new_ref_is_enhanced = False
+            if old_ref is not None:
+                new_ref_is_enhanced = VersionInfo.parse(
+                    new_ref.harvester_version
+                ) > VersionInfo.parse(old_ref.harvester_version)
+                if new_ref_is_enhanced:
+                    # If the version of the harvester has changed, we need to use a
+                    # comparaison hash computed with the old version of the harvester
+                    # to track changes
+                    with self.timings.measure(HarvestingTimings.Phase.CONVERT):
+                        comparaison_hash = self.converter.compute_hash(
+                            raw_data=raw_data,
+                            harvester_version=VersionInfo.parse(
+                                old_ref.harvester_version
+                            ),
+                        )
+
+            assert old_ref is None or comparaison_hash is not None
+            # Compute the new reference fields only
+            # 1. if the reference is new,
+            # or 2. if source data have changed
+            # or 3. if the harvester version has changed and fetch enhancements is True
+            if (
+                (old_ref is None)
+                or (comparaison_hash != old_ref.hash)
+                or (new_ref_is_enhanced and self.fetch_enhancements)
+            ):
+                with self.timings.measure(HarvestingTimings.Phase.CONVERT):
+                    await self.converter.convert(raw_data=raw_data, new_ref=new_ref)
+            with self.timings.measure(HarvestingTimings.Phase.DB):
+                reference_event_id_and_type: Optional[Tuple[int, str]] = (
+                    await self._handle_converted_result(
+                        new_ref=new_ref,
+                        old_ref=old_ref,
+                        comparaison_hash=comparaison_hash,
+                        references_recorder=references_recorder,
+                    )
+                )
+            if reference_event_id_and_type is not None:
+                await self._put_in_queue(
+                    {
+                        "type": "ReferenceEvent",
+                        "id": reference_event_id_and_type[0],
+                        "change": reference_event_id_and_type[1],
+                    }
+                )
+            await self._checkpoint(raw_data, new_ref.source_identifier)
+        except UnexpectedFormatException as error:
+            # If an UnexpectedFormatException bubbles up to this point
+            # it means that one of the references could not be converted
+            # but the harvester can continue to deliver results
+            # so we handle and continue
+            await self.handle_error(error, with_stack=True)
+        finally:
+            Tracer.end_span(span)
 
     async def skip(self):
         """
         Skip the harvester execution
         :return: None
         """
-        await self._update_harvesting_state(Harvesting.State.NOT_APPLICABLE)
-        await self._notify_harvesting_state()
+        await self._notify_harvesting_state(
+            await self._update_harvesting_state(Harvesting.State.NOT_APPLICABLE)
+        )
 
     async def _handle_converted_result(
         self,
@@ -294,6 +458,7 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
                     old_ref=old_ref,
                     enhanced=enhanced,
                 )
+                self.timings.count(HarvestingTimings.Counter.UPDATED)
             if comparaison_hash == old_ref.hash and (
                 ReferenceEvent.Type.UNCHANGED.value
                 in event_types_or_default(self.event_types)
@@ -304,6 +469,7 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
                     new_ref=new_ref if enhanced else None,
                     enhanced=enhanced,
                 )
+                self.timings.count(HarvestingTimings.Counter.UNCHANGED)
         # a created reference cannot be enhanced
         # as there is no previous version to compare with
         if (
@@ -314,13 +480,223 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             reference_event = await references_recorder.register_creation(
                 new_ref=new_ref,
             )
+            self.timings.count(HarvestingTimings.Counter.CREATED)
         if reference_event is None:
             return None
         return reference_event.id, reference_event.type
 
+    def _detects_deleted_references_only(self) -> bool:
+        """
+        :return: True if the payloads of the records are not needed
+            as the harvesting only detects deleted references
+        """
+        return self.SUPPORTS_SOURCE_IDENTIFIERS_LISTING and all(
+            event_type == ReferenceEvent.Type.DELETED.value
+            for event_type in event_types_or_default(self.event_types)
+        )
+
+    def _uses_source_identifiers_listing(self) -> bool:
+        """
+        :return: True if the deleted and unchanged references are detected
+            against the listing of the source identifiers
+        """
+        if self._detects_deleted_references_only():
+            return True
+        return self.modified_since is not None and any(
+            event_type
+            in (ReferenceEvent.Type.DELETED.value, ReferenceEvent.Type.UNCHANGED.value)
+            for event_type in event_types_or_default(self.event_types)
+        )
+
+    async def _fetch_results_to_compare(
+        self,
+    ) -> AsyncGenerator[AbstractHarvesterRawResult, None]:
+        """
+        Fetch the results to compare with the stored references,
+        none if the harvesting only detects deleted references
+        :return: A generator of results
+        """
+        if self._detects_deleted_references_only():
+            logger.info(
+                f"Harvesting {self.harvesting_id} only lists source identifiers"
+            )
+            return
+        async for raw_data in self.fetch_results():
+            yield raw_data
+
+    async def _timed_results(
+        self, results: AsyncGenerator[AbstractHarvesterRawResult, None]
+    ) -> AsyncGenerator[AbstractHarvesterRawResult, None]:
+        """
+        Count the time spent waiting for each result in the fetch phase
+        :param results: A generator of results
+        :return: The same generator of results
+        """
+        while True:
+            with self.timings.measure(HarvestingTimings.Phase.FETCH):
+                try:
+                    raw_data = await anext(results)
+                except StopAsyncIteration:
+                    return
+            yield raw_data
+
+    async def _resume_interrupted_harvesting(self) -> None:
+        """
+        Take over the last harvesting of the entity interrupted while running,
+        so that the results it already processed are not processed again
+        :return: None
+        """
+        self.processed = {}
+        harvester = (await self.get_harvesting()).harvester
+        async with async_session() as session:
+            async with session.begin():
+                interrupted = await HarvestingDAO(session).take_over_stale_harvesting(
+                    entity_id=self.entity_id,
+                    harvester=harvester,
+                    identifier_used=self.entity_identifier_used,
+                    event_types=self.event_types,
+                    stale_before=datetime.utcnow()
+                    - timedelta(seconds=get_app_settings().harvesting_stale_after),
+                    harvesting_id=self.harvesting_id,
+                )
+                if interrupted is None:
+                    return
+                interrupted_id, checkpoint = interrupted
+                await HarvestingErrorDAO(session).add_harvesting_error(
+                    interrupted_id,
+                    HarvestingInterruptedError(
+                        f"Harvesting interrupted, resumed by harvesting {self.harvesting_id}"
+                    ),
+                )
+        self.processed = dict((checkpoint or {}).get("processed", {}))
+        logger.info(
+            f"{harvester} harvesting {self.harvesting_id} resumes interrupted harvesting "
+            f"{interrupted_id} after {len(self.processed)} results"
+        )
+        if self.processed:
+            await self._save_checkpoint({"processed": self.processed})
+
+    async def _checkpoint(
+        self, raw_data: AbstractHarvesterRawResult, source_identifier: Optional[str]
+    ) -> None:
+        """
+        Record a result as processed,
+        and persist the progress every harvesting_checkpoint_interval results
+        :param raw_data: the result
+        :param source_identifier: source identifier of the reference built from it
+        :return: None
+        """
+        self.processed[str(raw_data.source_identifier)] = source_identifier
+        if len(self.processed) % get_app_settings().harvesting_checkpoint_interval == 0:
+            await self._save_checkpoint({"processed": self.processed})
+
+    async def _save_checkpoint(self, checkpoint: Optional[dict]) -> None:
+        with self.timings.measure(HarvestingTimings.Phase.DB):
+            async with async_session() as session:
+                async with session.begin():
+                    saved = await HarvestingDAO(session).update_harvesting_checkpoint(
+                        self.harvesting_id, checkpoint
+                    )
+        if not saved:
+            raise self._taken_over_error()
+
+    async def _heartbeat(self) -> None:
+        """
+        Refresh the checkpoint timestamp every harvesting_heartbeat_interval seconds,
+        so that a harvesting waiting for slow results is not considered interrupted,
+        until the harvesting ends or is resumed by another one
+        :return: None
+        """
+        interval = get_app_settings().harvesting_heartbeat_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with async_session() as session:
+                    async with session.begin():
+                        alive = await HarvestingDAO(
+                            session
+                        ).refresh_harvesting_checkpoint_timestamp(self.harvesting_id)
+            except (
+                ConnectionError,
+                PostgresConnectionError,
+                SqlTimeoutError,
+            ) as error:
+                logger.warning(
+                    "Cannot refresh the checkpoint timestamp "
+                    f"of harvesting {self.harvesting_id}: {error}"
+                )
+                continue
+            if not alive:
+                self.taken_over = True
+                return
+
+    def _taken_over_error(self) -> HarvestingInterruptedError:
+        return HarvestingInterruptedError(
+            f"Harvesting {self.harvesting_id} stopped, "
+            "as another harvesting resumed it after considering it interrupted"
+        )
+
+    async def _get_modified_since(self) -> Optional[datetime]:
+        """
+        Compute the date since which the records have to be fetched
+        if the harvesting is incremental
+        :return: the start time of the last completed harvesting,
+            None if all the records have to be fetched
+        """
+        if not self.incremental:
+            return None
+        harvester = (await self.get_harvesting()).harvester
+        if not self.SUPPORTS_INCREMENTAL_HARVESTING:
+            logger.info(f"Incremental harvesting not supported by {harvester}")
+            return None
+        async with async_session() as session:
+            modified_since = await HarvestingDAO(
+                session
+            ).get_last_completed_harvesting_timestamp(
+                entity_id=self.entity_id,
+                harvester=harvester,
+                identifier_used=self.entity_identifier_used,
+                harvesting_id=self.harvesting_id,
+            )
+        if modified_since is not None:
+            logger.info(
+                f"Incremental {harvester} harvesting {self.harvesting_id}"
+                f" of records modified since {modified_since}"
+            )
+        return modified_since
+
+    async def _register_unchanged_references(
+        self,
+        unmodified_reference_identifiers: set[str],
+        references_recorder: ReferencesRecorder,
+    ):
+        # only the records not fetched by an incremental harvesting
+        # are known to be unchanged without comparing them
+        if self.modified_since is None or not unmodified_reference_identifiers:
+            return
+        if ReferenceEvent.Type.UNCHANGED.value not in event_types_or_default(
+            self.event_types
+        ):
+            return
+        for reference_id in await references_recorder.get_last_reference_ids(
+            source_identifiers=unmodified_reference_identifiers
+        ):
+            with self.timings.measure(HarvestingTimings.Phase.DB):
+                reference_event = await references_recorder.register_unchanged_by_id(
+                    old_ref_id=reference_id
+                )
+            self.timings.count(HarvestingTimings.Counter.UNCHANGED)
+            await self._put_in_queue(
+                {
+                    "type": "ReferenceEvent",
+                    "id": reference_event.id,
+                    "change": ReferenceEvent.Type.UNCHANGED.value,
+                }
+            )
+
     async def _register_deleted_references(
         self,
-        existing_reference_identifiers: List[str],
+        existing_reference_identifiers: set[str],
         previous_reference_ids_and_source_ids: List[Tuple[int, str]],
         references_recorder: ReferencesRecorder,
     ):
@@ -332,9 +708,11 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
             if source_id not in existing_reference_identifiers
         ]
         for reference_id in deleted_references_ids:
-            reference_event = await references_recorder.register_deletion(
-                old_ref_id=reference_id
-            )
+            with self.timings.measure(HarvestingTimings.Phase.DB):
+                reference_event = await references_recorder.register_deletion(
+                    old_ref_id=reference_id
+                )
+            self.timings.count(HarvestingTimings.Counter.DELETED)
             await self._put_in_queue(
                 {
                     "type": "ReferenceEvent",
@@ -343,28 +721,45 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
                 }
             )
 
-    async def _notify_harvesting_state(self):
+    async def _notify_harvesting_state(self, state: str):
         await self._put_in_queue(
             {
                 "type": "Harvesting",
                 "id": self.harvesting_id,
-                "state": (await self.get_harvesting(refresh=True)).state,
+                "state": state,
             }
         )
 
-    async def _update_harvesting_state(self, state: Harvesting.State):
+    async def _update_harvesting_state(
+        self, state: Harvesting.State, timings: Optional[dict] = None
+    ) -> str:
         async with async_session() as session:
             async with session.begin():
-                await HarvestingDAO(session).update_harvesting_state(
-                    self.harvesting_id, state
+                stored_state = await HarvestingDAO(session).update_harvesting_state(
+                    self.harvesting_id, state, timings=timings
                 )
+        self._sync_harvesting_state(stored_state)
+        return stored_state
 
-    async def _add_error_to_harvesting(self, error: Exception):
+    async def _fail_harvesting(self, error: Exception) -> str:
         async with async_session() as session:
             async with session.begin():
+                stored_state = await HarvestingDAO(session).update_harvesting_state(
+                    self.harvesting_id,
+                    Harvesting.State.FAILED,
+                    timings=self.timings.to_dict(),
+                )
                 await HarvestingErrorDAO(session).add_harvesting_error(
                     self.harvesting_id, error
                 )
+        self._sync_harvesting_state(stored_state)
+        return stored_state
+
+    def _sync_harvesting_state(self, state: Optional[str]) -> None:
+        # keep the already loaded harvesting consistent with the database
+        # without reloading it
+        if self.harvesting is not None and state is not None:
+            self.harvesting.state = state
 
     async def handle_error(self, error: Exception, with_stack: bool = True) -> None:
         """
@@ -375,13 +770,12 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         logger.error(error)
         if with_stack:
             logger.error(traceback.format_exc())
-        await self._update_harvesting_state(Harvesting.State.FAILED)
-        await self._add_error_to_harvesting(error)
+        state = await self._fail_harvesting(error)
         await self._put_in_queue(
             {
                 "type": "Harvesting",
                 "id": self.harvesting_id,
-                "status": (await self.get_harvesting()).state,
+                "status": state,
                 "message": str(error),
             }
         )
@@ -394,18 +788,23 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         """
         if self.result_queue is None:
             return
-        await self.result_queue.put(message)
+        # the entity id lets the message factories use the entity snapshot
+        # shared by the harvesters of the retrieval
+        with self.timings.measure(HarvestingTimings.Phase.QUEUE):
+            await self.result_queue.put(message | {"entity_id": self.entity_id})
         await asyncio.sleep(0)  # force context switch
 
-    async def _get_entity(self) -> DbEntity:
+    async def _get_entity(self) -> EntitySnapshot:
         """
         Retrieve the entity for which to harvest references
-        from the database if not already done
+        from the database if it has not been provided by the retrieval
         :return: The entity for which to harvest references
         """
         if self.entity is None:
             async with async_session() as session:
-                self.entity = await EntityDAO(session).get_entity_by_id(self.entity_id)
+                self.entity = EntitySnapshot.of(
+                    await EntityDAO(session).get_entity_by_id(self.entity_id)
+                )
         return self.entity
 
     async def _get_entity_class_name(self) -> str:
@@ -414,8 +813,7 @@ class AbstractHarvester(ABC):  # pylint: disable=too-many-instance-attributes
         from the database if not already done
         :return: The entity class name for which to harvest references
         """
-        entity = await self._get_entity()
-        return entity.__class__.__name__
+        return EntitySnapshot.of(await self._get_entity()).class_name
 
     async def get_harvesting(self, refresh=False) -> Harvesting:
         """
@@ -27,6 +27,8 @@ from app.db.models.organization import Organization
 from app.db.models.reference import Reference
 from app.db.session import async_session
 from app.harvesters.abstract_harvester_raw_result import AbstractHarvesterRawResult
+from app.harvesters.harvesting_timings import HarvestingTimings, timed
+from app.monitoring.tracing import Tracer, traced
 from app.services.book.book_data_class import BookInformations
 from app.services.concepts.concept_factory import ConceptFactory
 from app.services.concepts.concept_informations import ConceptInformations
@@ -39,7 +41,6 @@ from app.services.organizations.organization_factory import OrganizationFactory
 from app.services.organizations.organization_informations import (
     OrganizationInformations,
 )
-from app.utilities.execution_timer_wrapper import execution_timer
 
 
 class AbstractReferencesConverter(ABC):
@@ -56,6 +57,9 @@ class AbstractReferencesConverter(ABC):
         "document_type",
         "contributions",
     ]
+    # fields of the source records read by the converter, including the hashed ones,
+    # to restrict the fields requested to the source, None to request all of them
+    CONSUMED_FIELDS: list[str] | None = None
 
     @dataclass
     class ContributionInformations:
@@ -364,7 +368,7 @@ class AbstractReferencesConverter(ABC):
                         )
         return concept
 
-    @execution_timer
+    @traced()
     async def _get_or_create_concept_by_uri(
         self,
         concept_informations: ConceptInformations,
@@ -383,7 +387,10 @@ class AbstractReferencesConverter(ABC):
 
             # try to dereference (concept is either missing or not dereferenced)
             try:
-                fresh_concept = await ConceptFactory.solve(concept_informations)
+                with timed(HarvestingTimings.Phase.DEREFERENCE), Tracer.span(
+                    "dereference", concept=concept_informations.uri
+                ):
+                    fresh_concept = await ConceptFactory.solve(concept_informations)
             except DereferencingError as error:
                 logger.error(
                     "Dereferencing failure for concept "
@@ -593,11 +600,25 @@ class AbstractReferencesConverter(ABC):
     async def _add_organization(self, raw_data: dict, new_ref: Reference) -> None:
         # For each contribution, get the organizations of the contributor
         # and add them to the contribution
-        for contribution in new_ref.contributions:
-            organizations = self._organizations_from_contributor(
-                raw_data, contribution.contributor.source_identifier
+        contributions_organizations = [
+            (
+                contribution,
+                self._organizations_from_contributor(
+                    raw_data, contribution.contributor.source_identifier
+                ),
             )
-            async for org in self._organizations(organizations):
+            for contribution in new_ref.contributions
+        ]
+        # dereference the organizations unknown from the database in a single batch
+        solved_organizations = await self._solve_unknown_organizations(
+            [
+                organization
+                for _, organizations in contributions_organizations
+                for organization in organizations
+            ]
+        )
+        for contribution, organizations in contributions_organizations:
+            async for org in self._organizations(organizations, solved_organizations):
                 contribution.affiliations.append(org)
 
     def _organizations_from_contributor(
@@ -606,8 +627,17 @@ class AbstractReferencesConverter(ABC):
         raise NotImplementedError("Subclass must implement this method")
 
     async def _organizations(
-        self, organization_informations: List[OrganizationInformations]
+        self,
+        organization_informations: List[OrganizationInformations],
+        solved_organizations: (
+            dict[str, Organization | DereferencingError] | None
+        ) = None,
     ) -> AsyncGenerator[Organization, None]:
+        if solved_organizations is None:
+            organization_informations = list(organization_informations)
+            solved_organizations = await self._solve_unknown_organizations(
+                organization_informations
+            )
         # Get all the organizations from the database, or create if they do not exist
         organizations_identifiers_cache = {}
         for organization_information in organization_informations:
@@ -616,16 +646,59 @@ class AbstractReferencesConverter(ABC):
             db_organization = organizations_identifiers_cache.get(identifier)
             if db_organization is None:
                 db_organization = await self._get_or_create_organization_by_identifier(
-                    organization_informations=organization_information
+                    organization_informations=organization_information,
+                    solved_organization=solved_organizations.pop(identifier, None),
                 )
                 organizations_identifiers_cache[identifier] = db_organization
 
             yield db_organization
 
+    async def _solve_unknown_organizations(
+        self, organization_informations: List[OrganizationInformations]
+    ) -> dict[str, Organization | DereferencingError]:
+        """
+        Dereference in a single batch the organizations
+        that are not registered in the database yet
+
+        :param organization_informations: informations about the organizations
+        :return: solved organizations or dereferencing errors by identifier
+        """
+        informations_by_identifier = {
+            organization_information.identifier: organization_information
+            for organization_information in organization_informations
+            if organization_information.identifier is not None
+        }
+        if not informations_by_identifier:
+            return {}
+        async with async_session() as session:
+            existing_identifiers = await OrganizationDAO(
+                session
+            ).get_existing_source_identifiers(list(informations_by_identifier))
+        unknown_organizations = [
+            organization_information
+            for identifier, organization_information in informations_by_identifier.items()
+            if identifier not in existing_identifiers
+        ]
+        if not unknown_organizations:
+            return {}
+        with timed(HarvestingTimings.Phase.DEREFERENCE), Tracer.span(
+            "dereference", organizations=len(unknown_organizations)
+        ):
+            results = await OrganizationFactory.solve_many(unknown_organizations)
+        solved_organizations = {}
+        for organization_information, result in zip(unknown_organizations, results):
+            if isinstance(result, Exception) and not isinstance(
+                result, DereferencingError
+            ):
+                raise result
+            solved_organizations[organization_information.identifier] = result
+        return solved_organizations
+
     async def _get_or_create_organization_by_identifier(
         self,
         organization_informations: OrganizationInformations,
         new_attempt: bool = False,
+        solved_organization: Organization | DereferencingError | None = None,
     ):
         async with async_session() as session:
             async with session.begin_nested():
@@ -637,9 +710,19 @@ class AbstractReferencesConverter(ABC):
 
                 if organization is None:
                     try:
-                        organization = await OrganizationFactory.solve(
-                            organization_informations
-                        )
+                        if isinstance(solved_organization, DereferencingError):
+                            raise solved_organization
+                        if solved_organization is None:
+                            with timed(
+                                HarvestingTimings.Phase.DEREFERENCE
+                            ), Tracer.span(
+                                "dereference",
+                                organization=organization_informations.identifier,
+                            ):
+                                solved_organization = await OrganizationFactory.solve(
+                                    organization_informations
+                                )
+                        organization = solved_organization
                     except DereferencingError:
                         organization = Organization(
                             source=organization_informations.source,
@@ -1,22 +1,46 @@
+import asyncio
 import inspect
 import traceback
 from functools import wraps
 from typing import Callable
+from urllib.parse import urlparse
 
+import aiohttp
 from loguru import logger
 
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.http.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
 
 class ExternalEndpointFailure(Exception):
     """Exception raised when an external API call fails."""
 
-    def __init__(self, message: str) -> None:
+    def __init__(
+        self, message: str, status: int | None = None, source: str | None = None
+    ) -> None:
+        """
+        :param message: error message
+        :param status: HTTP status returned by the endpoint, if any
+        :param source: source of the decorator that handled the failure, if any
+        """
         super().__init__(message)
+        self.status = status
+        self.source = source
 
 
-def handle_external_endpoint_failure(source: str):
+def handle_external_endpoint_failure(source: str, by_host: bool = False):
     """
     Decorator to handle exceptions raised by external API calls in harvesters.
-    :param source:
+
+    Calls are guarded by a process-wide circuit breaker : while the endpoint
+    is known to be failing, calls fail immediately instead of waiting for its timeout.
+    UnexpectedFormatException are raised unchanged, as the endpoint answered.
+
+    :param source: name of the external endpoint
+    :param by_host: use one circuit breaker per host of the "url" argument,
+        for clients of several endpoints
     :return:
     """
 
@@ -25,23 +49,97 @@ def handle_external_endpoint_failure(source: str):
 
             @wraps(fn)
             async def asyncgen_wrapper(*args, **kwargs):
+                breaker = _circuit_breaker(source, by_host, args, kwargs)
+                _check_circuit(breaker, source)
+                responded = False
                 try:
                     async for item in fn(*args, **kwargs):
+                        if not responded:
+                            responded = True
+                            breaker.record_success()
                         yield item
+                except UnexpectedFormatException:
+                    breaker.record_success()
+                    raise
                 except Exception as e:
-                    raise ExternalEndpointFailure(f"{source} failure") from e
+                    if _handled_by(e, source):
+                        raise
+                    raise _failure(breaker, source, e) from e
+                if not responded:
+                    breaker.record_success()
 
             return asyncgen_wrapper
 
         @wraps(fn)
         async def asyncfunc_wrapper(*args, **kwargs):
+            breaker = _circuit_breaker(source, by_host, args, kwargs)
+            _check_circuit(breaker, source)
             try:
-                return await fn(*args, **kwargs)
+                result = await fn(*args, **kwargs)
+            except UnexpectedFormatException:
+                breaker.record_success()
+                raise
             except Exception as e:
-                logger.error("{source} failure: %s", e)
+                if _handled_by(e, source):
+                    raise
+                logger.error(f"{source} failure: {e}")
                 logger.error(traceback.format_exc())
-                raise ExternalEndpointFailure(f"{source} failure") from e
+                raise _failure(breaker, source, e) from e
+            breaker.record_success()
+            return result
 
         return asyncfunc_wrapper
 
     return decorator
+
+
+def _circuit_breaker(
+    source: str, by_host: bool, args: tuple, kwargs: dict
+) -> CircuitBreaker:
+    if not by_host:
+        return CircuitBreakerRegistry.get(source)
+    url = kwargs.get("url") or args[1]
+    return CircuitBreakerRegistry.get(f"{source}:{urlparse(url).netloc}")
+
+
+def _check_circuit(breaker: CircuitBreaker, source: str) -> None:
+    if not breaker.allow_request():
+        raise ExternalEndpointFailure(
+            f"{source} failure: circuit breaker of {breaker.name} is open",
+            source=source,
+        )
+
+
+def _handled_by(error: Exception, source: str) -> bool:
+    """
+    Whether the error was already handled by a nested call for the same source
+    """
+    return (
+        isinstance(error, ExternalEndpointFailure)
+        and getattr(error, "source", None) == source
+    )
+
+
+def _failure(
+    breaker: CircuitBreaker, source: str, error: Exception
+) -> ExternalEndpointFailure:
+    """
+    Record the failure in the circuit breaker if the endpoint is failing,
+    and build the exception to raise
+    """
+    status = getattr(error, "status", None)
+    if _is_endpoint_failure(error, status):
+        breaker.record_failure()
+    else:
+        # the endpoint answered, e.g. a 404 for an unknown resource
+        breaker.record_success()
+    return ExternalEndpointFailure(f"{source} failure", status=status, source=source)
+
+
+def _is_endpoint_failure(error: Exception, status: int | None) -> bool:
+    if status is not None:
+        return status >= 500 or status == 429
+    return isinstance(
+        error,
+        (ExternalEndpointFailure, aiohttp.ClientError, asyncio.TimeoutError, OSError),
+    )
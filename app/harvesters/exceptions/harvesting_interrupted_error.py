@@ -0,0 +1,9 @@
+class HarvestingInterruptedError(RuntimeError):
+    """
+    Error recorded on a harvesting interrupted while running,
+    e.g. by a restart of the process, when a new harvesting resumes it.
+    """
+
+    def __init__(self, message: str) -> None:
+        """Initialize the exception."""
+        super().__init__(message)
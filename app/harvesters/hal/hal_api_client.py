@@ -1,4 +1,5 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Generator
+from urllib.parse import urlencode
 
 from aiohttp import ClientTimeout
 from loguru import logger
@@ -11,6 +12,7 @@ from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 
 
 class HalApiClient:
@@ -34,6 +36,32 @@ class HalApiClient:
         :param url: the query string to send to the HAL API
         :return: A generator of results
         """
+        json_response = await self._get_response(url)
+        for doc in self._docs(json_response):
+            yield doc
+
+    @handle_external_endpoint_failure("hal")
+    async def fetch_all_pages(self, url: str) -> AsyncGenerator[dict, None]:
+        """
+        Fetch the results of all the pages from the HAL API, using cursor pagination.
+        The query must be sorted on the "docid" unique key.
+
+        :param url: the query string to send to the HAL API, without cursor mark
+        :return: A generator of results
+        """
+        cursor_mark = "*"
+        while True:
+            json_response = await self._get_response(
+                f"{url}&{urlencode({'cursorMark': cursor_mark})}"
+            )
+            for doc in self._docs(json_response):
+                yield doc
+            next_cursor_mark = json_response.get("nextCursorMark")
+            if next_cursor_mark in (None, cursor_mark):
+                break
+            cursor_mark = next_cursor_mark
+
+    async def _get_response(self, url: str) -> dict:
         session = await AioHttpClientManager.get_session()
         request_timeout = ClientTimeout(
             total=self.timeout,  # overall cap on the request lifecycle
@@ -43,7 +71,7 @@ class HalApiClient:
         )
 
         logger.info(f"Fetching HAL API with query: {self.HAL_API_URL}/?{url}")
-        async with session.get(
+        async with HostScheduler.slot(self.HAL_API_URL), session.get(
             f"{self.HAL_API_URL}/?{url}", timeout=request_timeout
         ) as resp:
             if resp.status == 200:
@@ -61,14 +89,18 @@ class HalApiClient:
                         f"Unexpected format in HAL response: {json_response}"
                         f"for request : {url}"
                     )
-                for doc in json_response["response"]["docs"]:
-                    if doc.get("halId_s") is None:
-                        logger.error(f"Missing halId_s in HAL response: {doc}")
-                        continue
-                    yield doc
-            else:
-                await resp.release()
-                raise ExternalEndpointFailure(
-                    f"Error code from HAL API for request : {url} "
-                    f"with code {resp.status}"
-                )
+                return json_response
+            await resp.release()
+            raise ExternalEndpointFailure(
+                f"Error code from HAL API for request : {url} "
+                f"with code {resp.status}",
+                status=resp.status,
+            )
+
+    @staticmethod
+    def _docs(json_response: dict) -> Generator[dict, None, None]:
+        for doc in json_response["response"]["docs"]:
+            if doc.get("halId_s") is None:
+                logger.error(f"Missing halId_s in HAL response: {doc}")
+                continue
+            yield doc
@@ -1,8 +1,9 @@
+from datetime import datetime
 from enum import Enum
 from urllib.parse import urlencode
 
 
-class HalApiQueryBuilder:
+class HalApiQueryBuilder:  # pylint: disable=too-many-instance-attributes
     """
     This class provides an abstraction to build a query for the HAL API.
     """
@@ -65,6 +66,8 @@ class HalApiQueryBuilder:
     DEFAULT_SORT_PARAMETER = "halId_s"
     DEFAULT_SORT_DIRECTION = "asc"
     DEFAULT_ROWS = 1000
+    # maximum number of documents by page accepted by the HAL API
+    MAX_ROWS = 10000
 
     def __init__(self) -> None:
         self.identifier_type = None
@@ -73,6 +76,8 @@ class HalApiQueryBuilder:
         self.doc_types = self.DEFAULT_DOC_TYPES
         self.sort_parameter = self.DEFAULT_SORT_PARAMETER
         self.sort_direction = self.DEFAULT_SORT_DIRECTION
+        self.rows = self.DEFAULT_ROWS
+        self.modified_since: datetime | None = None
 
     def set_query(
         self, identifier_type: QueryParameters, identifier_value: str
@@ -89,6 +94,44 @@ class HalApiQueryBuilder:
         self.identifier_type = identifier_type
         self.identifier_value = identifier_value
 
+    def set_fields(self, fields: list[str]) -> None:
+        """
+        Set the fields to return for each document
+
+        :param fields: list of HAL fields
+        :return: None
+        """
+        self.fields = fields
+
+    def set_sort(self, sort_parameter: str, sort_direction: str = "asc") -> None:
+        """
+        Set the sort order of the documents
+
+        :param sort_parameter: HAL field to sort on
+        :param sort_direction: "asc" or "desc"
+        :return: None
+        """
+        self.sort_parameter = sort_parameter
+        self.sort_direction = sort_direction
+
+    def set_rows(self, rows: int) -> None:
+        """
+        Set the number of documents by page
+
+        :param rows: number of documents, up to 10000
+        :return: None
+        """
+        self.rows = rows
+
+    def set_modified_since(self, modified_since: datetime) -> None:
+        """
+        Restrict the query to the documents modified since a given date
+
+        :param modified_since: UTC date of the oldest modification to fetch
+        :return: None
+        """
+        self.modified_since = modified_since
+
     def build(self) -> str:
         """
         Main building method, returns a query string for the HAL API.
@@ -121,10 +164,16 @@ class HalApiQueryBuilder:
         return {"sort": f"{self.sort_parameter} {self.sort_direction}"}
 
     def _filter_param(self):
-        return {"fq": f"docType_s:({' OR '.join(self.doc_types)})"}
+        filter_query = f"docType_s:({' OR '.join(self.doc_types)})"
+        if self.modified_since is not None:
+            filter_query += (
+                " AND modifiedDate_tdate:"
+                f"[{self.modified_since.strftime('%Y-%m-%dT%H:%M:%SZ')} TO *]"
+            )
+        return {"fq": filter_query}
 
     def _fields_param(self):
         return {"fl": ",".join(self.fields)}
 
     def _rows_param(self):
-        return {"rows": self.DEFAULT_ROWS}
+        return {"rows": self.rows}
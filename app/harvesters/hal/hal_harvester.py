@@ -37,6 +37,10 @@ class HalHarvester(AbstractHarvester):
 
     VERSION: Version = VersionInfo.parse("2.2.0")
 
+    SUPPORTS_SOURCE_IDENTIFIERS_LISTING = True
+
+    SUPPORTS_INCREMENTAL_HARVESTING = True
+
     async def _get_hal_query_parameters(self, entity_class: str):
         """
         Return the HAL query parameters using the pre-selected entity identifier.
@@ -57,6 +61,30 @@ class HalHarvester(AbstractHarvester):
         Fetch results from the HAL API.
         It is an asynchronous generator that yields JsonRawResult objects.
         """
+        builder = await self._get_query_builder()
+        if self.modified_since is not None:
+            builder.set_modified_since(self.modified_since)
+        async for doc in HalApiClient().fetch(builder.build()):
+            yield JsonRawResult(
+                payload=doc,
+                source_identifier=doc.get("halId_s"),
+                formatter_name=HalHarvester.FORMATTER_NAME,
+            )
+
+    async def list_source_identifiers(self) -> AsyncGenerator[str, None]:
+        """
+        List the HAL identifiers of all the documents of the entity,
+        by pages of the maximum size.
+        """
+        builder = await self._get_query_builder()
+        builder.set_fields(["halId_s"])
+        # cursor pagination requires sorting on the unique key
+        builder.set_sort("docid")
+        builder.set_rows(HalApiQueryBuilder.MAX_ROWS)
+        async for doc in HalApiClient().fetch_all_pages(builder.build()):
+            yield doc["halId_s"]
+
+    async def _get_query_builder(self) -> HalApiQueryBuilder:
         builder = HalApiQueryBuilder()
 
         identifier_type, identifier_value = await self._get_hal_query_parameters(
@@ -67,9 +95,4 @@ class HalHarvester(AbstractHarvester):
             identifier_type=identifier_type,
             identifier_value=identifier_value,
         )
-        async for doc in HalApiClient().fetch(builder.build()):
-            yield JsonRawResult(
-                payload=doc,
-                source_identifier=doc.get("halId_s"),
-                formatter_name=HalHarvester.FORMATTER_NAME,
-            )
+        return builder
@@ -0,0 +1,125 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator
+
+# time spent by the sub-phases of the running phase, to exclude it from the latter
+_children_duration: ContextVar[list[float] | None] = ContextVar(
+    "children_duration", default=None
+)
+
+
+class HarvestingTimings:
+    """
+    Time spent by a harvesting in each of its phases and counters of its results,
+    measured with the monotonic clock.
+
+    Phases may be nested, e.g. the dereferencing of a concept during the conversion
+    of a reference : the time of a nested phase is not counted in the enclosing one.
+    """
+
+    class Phase(Enum):
+        """
+        Phases of a harvesting
+        """
+
+        # waiting for the results of the source
+        FETCH = "fetch"
+        # building and converting the references
+        CONVERT = "convert"
+        # solving concepts and organizations against their own sources
+        DEREFERENCE = "dereference"
+        # comparing and recording the references
+        DB = "db"
+        # notifying the events
+        QUEUE = "queue"
+
+    class Counter(Enum):
+        """
+        Counters of the results of a harvesting
+        """
+
+        RESULTS = "results"
+        CREATED = "created"
+        UPDATED = "updated"
+        UNCHANGED = "unchanged"
+        DELETED = "deleted"
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.phases: dict[HarvestingTimings.Phase, float] = dict.fromkeys(
+            HarvestingTimings.Phase, 0.0
+        )
+        self.counters: dict[HarvestingTimings.Counter, int] = dict.fromkeys(
+            HarvestingTimings.Counter, 0
+        )
+
+    @contextmanager
+    def measure(self, phase: "HarvestingTimings.Phase") -> Iterator[None]:
+        """
+        Add the time spent in the block to a phase
+
+        :param phase: phase of the block
+        :return: None
+        """
+        enclosing = _children_duration.get()
+        children: list[float] = [0.0]
+        token = _children_duration.set(children)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start
+            _children_duration.reset(token)
+            # concurrent sub-phases may last longer than the block altogether
+            self.phases[phase] += max(0.0, duration - children[0])
+            if enclosing is not None:
+                enclosing[0] += duration
+
+    def count(self, counter: "HarvestingTimings.Counter", increment: int = 1) -> None:
+        """
+        Increment a counter
+
+        :param counter: counter to increment
+        :param increment: value to add to the counter
+        :return: None
+        """
+        self.counters[counter] += increment
+
+    def to_dict(self) -> dict:
+        """
+        :return: total duration and durations by phase in seconds, and counters
+        """
+        return {
+            "total": round(time.monotonic() - self.started_at, 6),
+            "phases": {
+                phase.value: round(duration, 6)
+                for phase, duration in self.phases.items()
+            },
+            "counters": {
+                counter.value: value for counter, value in self.counters.items()
+            },
+        }
+
+
+# timings of the harvesting run by the current task
+current_timings: ContextVar[HarvestingTimings | None] = ContextVar(
+    "current_timings", default=None
+)
+
+
+@contextmanager
+def timed(phase: HarvestingTimings.Phase) -> Iterator[None]:
+    """
+    Add the time spent in the block to a phase of the current harvesting, if any
+
+    :param phase: phase of the block
+    :return: None
+    """
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(phase):
+        yield
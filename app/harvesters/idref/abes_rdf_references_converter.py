@@ -2,7 +2,7 @@ from abc import abstractmethod
 
 import rdflib
 from loguru import logger
-from rdflib import FOAF, Graph, Literal, DCTERMS, Namespace
+from rdflib import FOAF, Literal, DCTERMS, Namespace
 
 from app.db.models.abstract import Abstract
 from app.db.models.book import Book
@@ -10,6 +10,7 @@ from app.db.models.reference import Reference
 from app.db.models.reference_identifier import ReferenceIdentifier
 from app.harvesters.abstract_references_converter import AbstractReferencesConverter
 from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.rdf_harvester_raw_result import (
     RdfHarvesterRawResult as RdfRawResult,
 )
@@ -20,8 +21,10 @@ class AbesRDFReferencesConverter(AbstractReferencesConverter):
     Converts raw data from ABES RDF to a normalised Reference object
     """
 
+    MARCREL = Namespace("http://id.loc.gov/vocabulary/relators/")
+
     async def convert(self, raw_data: RdfRawResult, new_ref: Reference) -> None:
-        pub_graph: Graph = raw_data.payload
+        pub_graph: RdfTripleIndex = raw_data.payload
         uri = raw_data.source_identifier
 
         [  # pylint: disable=expression-not-assigned
@@ -103,22 +106,24 @@ class AbesRDFReferencesConverter(AbstractReferencesConverter):
     def _resolve_contributor(self, identifier):
         raise NotImplementedError()
 
+    def _marcrel_triples(self, pub_graph: RdfTripleIndex):
+        """
+        Triples whose predicate is a role of the MARC relators vocabulary
+
+        :param pub_graph: the triples of the publication
+        :return: generator of (subject, role, contributor) triples
+        """
+        for subject, predicate, obj in pub_graph.triples((None, None, None)):
+            if str(predicate).startswith(str(self.MARCREL)):
+                yield subject, predicate, obj
+
     # overriden from AbstractReferencesConverter : force child class to implement source
     def _get_source(self):
         raise NotImplementedError()
 
     async def _add_contributions(self, pub_graph, uri):
         contribution_informations = []
-        marcrel = Namespace("http://id.loc.gov/vocabulary/relators/")
-        query = f"""
-                        SELECT ?predicate ?object 
-                        WHERE {{
-                            ?subject ?predicate ?object .
-                            FILTER(STRSTARTS(STR(?predicate), "{str(marcrel)}")).
-                        }}
-                    """
-        results = pub_graph.query(query)
-        for role, identifier in results:
+        for _, role, identifier in self._marcrel_triples(pub_graph):
             try:
                 role = role.split("/")[-1]
                 graph = await RdfResolver().fetch(self._resolve_contributor(identifier))
@@ -2,7 +2,7 @@ import asyncio
 import re
 import urllib
 from enum import Enum
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable
 
 import uritools
 from loguru import logger
@@ -12,6 +12,7 @@ from semver import VersionInfo, Version
 from app.config import get_app_settings
 from app.db.models.contributor_identifier import ContributorIdentifier
 from app.harvesters.abstract_harvester import AbstractHarvester
+from app.harvesters.abstract_references_converter import AbstractReferencesConverter
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
@@ -32,8 +33,8 @@ from app.harvesters.sparql_harvester_raw_result import (
 from app.harvesters.xml_harvester_raw_result import (
     XMLHarvesterRawResult as XmlResult,
 )
+from app.monitoring.tracing import traced
 from app.services.cache.third_api_cache import ThirdApiCache
-from app.utilities.execution_timer_wrapper import execution_timer
 
 
 class IdrefHarvester(AbstractHarvester):
@@ -78,6 +79,11 @@ class IdrefHarvester(AbstractHarvester):
         OPEN_EDITION = "openedition"
         PERSEE_RDF = "persee"
 
+    def __init__(self, converter: AbstractReferencesConverter):
+        super().__init__(converter)
+        # documents of the listed publications found in the third party API cache
+        self.cached_pubs: dict[tuple[str, str], Any] = {}
+
     async def _get_idref_query_parameters(self, entity_class: str):
         """
         Return the Idref SPARQL query parameters using the pre-selected entity identifier.
@@ -94,7 +100,7 @@ class IdrefHarvester(AbstractHarvester):
         assert False, f"Unable to map '{identifier_key}' to Idref query parameter"
 
     async def fetch_results(self) -> AsyncGenerator[RawResult, None]:
-        # pylint: disable=too-many-branches, too-many-statements
+        # pylint: disable=too-many-branches
         settings = get_app_settings()
         builder = QueryBuilder()
         if (await self._get_entity_class_name()) == "Person":
@@ -107,11 +113,25 @@ class IdrefHarvester(AbstractHarvester):
             builder.set_query(idref_query_parameter, identifier_value)
         pending_queries = set()
         num_sudoc_waiting_queries = 0
-
-        if self.SUDOC_ENABLED:
+        docs = [
+            doc
             async for doc in IdrefSparqlClient(
                 timeout=settings.idref_sparql_timeout
-            ).fetch_publications(builder.build()):
+            ).fetch_publications(builder.build())
+            if self.SUDOC_ENABLED
+            or doc["secondary_source"] != IdrefSparqlClient.DataSources.SUDOC.value
+        ]
+        # documents found in the cache do not wait for the rate-limited endpoints
+        await self._prefetch_cached_publications(docs)
+        cached_docs = [doc for doc in docs if self._cache_key(doc) in self.cached_pubs]
+        docs = [doc for doc in docs if self._cache_key(doc) not in self.cached_pubs]
+        for doc in cached_docs:
+            pub = await self._run_secondary_query(self._secondary_query_process(doc))
+            if pub:
+                yield pub
+
+        if self.SUDOC_ENABLED:
+            for doc in docs:
                 if doc["secondary_source"] is None:
                     continue
                 coro = self._secondary_query_process(doc)
@@ -128,68 +148,114 @@ class IdrefHarvester(AbstractHarvester):
                     num_sudoc_waiting_queries += 1
                 if num_sudoc_waiting_queries >= self.MAX_SUDOC_PARALLELISM:
                     num_sudoc_waiting_queries = 0
-                    while pending_queries:
-                        done_queries, pending_queries = await asyncio.wait(
-                            pending_queries, return_when=asyncio.ALL_COMPLETED
-                        )
-                        for query in done_queries:
-                            pub = None
-                            exception = query.exception()
-                            if isinstance(
-                                exception,
-                                (ExternalEndpointFailure, UnexpectedFormatException),
-                            ):
-                                await self.handle_error(exception)
-                            else:
-                                pub = query.result()
-                            if pub:
-                                yield pub
-            # process remaining queries
-            while pending_queries:
-                pub = None
-                done_queries, pending_queries = await asyncio.wait(
-                    pending_queries, return_when=asyncio.FIRST_COMPLETED
-                )
-                for query in done_queries:
-                    exception = query.exception()
-                    if isinstance(
-                        exception,
-                        (ExternalEndpointFailure, UnexpectedFormatException),
+                    async for pub in self._completed_queries_results(
+                        pending_queries, asyncio.ALL_COMPLETED
                     ):
-                        await self.handle_error(exception)
-                    else:
-                        pub = query.result()
-                    if pub:
                         yield pub
+                    pending_queries = set()
+            # process remaining queries
+            async for pub in self._completed_queries_results(
+                pending_queries, asyncio.FIRST_COMPLETED
+            ):
+                yield pub
         else:
-            async for doc in IdrefSparqlClient(
-                timeout=settings.idref_sparql_timeout
-            ).fetch_publications(builder.build()):
-                if doc["secondary_source"] == IdrefSparqlClient.DataSources.SUDOC.value:
-                    continue
+            for doc in docs:
                 coro = self._secondary_query_process(doc)
                 if coro is None:
                     logger.error(
                         f"No harvester available for source {doc['secondary_source']}"
                     )
                     continue
-                pending_queries.add(asyncio.create_task(coro))
-                while pending_queries:
-                    pub = None
-                    done_queries, pending_queries = await asyncio.wait(
-                        pending_queries, return_when=asyncio.FIRST_COMPLETED
-                    )
-                    for query in done_queries:
-                        exception = query.exception()
-                        if isinstance(
-                            exception,
-                            (ExternalEndpointFailure, UnexpectedFormatException),
-                        ):
-                            await self.handle_error(exception)
-                        else:
-                            pub = query.result()
-                        if pub:
-                            yield pub
+                pub = await self._run_secondary_query(coro)
+                if pub:
+                    yield pub
+
+    async def _completed_queries_results(
+        self, pending_queries: set[asyncio.Task], return_when: str
+    ) -> AsyncGenerator[RawResult, None]:
+        """
+        Wait for the secondary queries to complete and yield their results
+
+        :param pending_queries: tasks of the secondary queries
+        :param return_when: asyncio.wait condition to yield the completed results
+        :return: generator of publications
+        """
+        while pending_queries:
+            done_queries, pending_queries = await asyncio.wait(
+                pending_queries, return_when=return_when
+            )
+            for query in done_queries:
+                pub = await self._run_secondary_query(query)
+                if pub:
+                    yield pub
+
+    async def _run_secondary_query(self, query: Awaitable) -> RawResult | None:
+        """
+        Await a secondary query, or get the result of its completed task
+
+        :param query: secondary query coroutine or task
+        :return: the publication, None if the query failed with a handled error
+        """
+        try:
+            return await query
+        except (ExternalEndpointFailure, UnexpectedFormatException) as exception:
+            await self.handle_error(exception)
+            return None
+
+    def _cache_key(self, doc: dict) -> tuple[str, str] | None:
+        """
+        Third party API cache entry of the document fetched for a listed publication
+
+        :param doc: the publication doc as result of the SPARQL query to data.idref.fr
+        :return: (api name, key) of the cache entry, None if the document is not cached
+        """
+        uri = doc.get("uri", "")
+        if not uritools.isuri(uri):
+            return None
+        source = doc["secondary_source"]
+        if source == IdrefSparqlClient.DataSources.SUDOC.value:
+            return "sudoc_publications", self._sudoc_document_uri(uri)
+        if source == IdrefSparqlClient.DataSources.PERSEE.value:
+            return "persee_publications", self._persee_document_uri(uri)
+        if source == IdrefSparqlClient.DataSources.SCIENCEPLUS.value:
+            return "scienceplus_publications", self._science_plus_query_uri(uri)
+        if source == IdrefSparqlClient.DataSources.OPENEDITION.value:
+            return "open_edition_publications", uri
+        return None
+
+    async def _prefetch_cached_publications(self, docs: list[dict]) -> None:
+        """
+        Get the cached documents of the listed publications,
+        with one request to the cache by third party API
+
+        :param docs: the publication docs as results of the SPARQL query
+        :return: None
+        """
+        keys_by_api: dict[str, list[str]] = {}
+        for cache_key in filter(None, map(self._cache_key, docs)):
+            api_name, key = cache_key
+            keys_by_api.setdefault(api_name, []).append(key)
+        for api_name, keys in keys_by_api.items():
+            for key, pub in (await ThirdApiCache.get_many(api_name, keys)).items():
+                self.cached_pubs[(api_name, key)] = pub
+
+    async def _cached_or_fetched(
+        self, api_name: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get a document prefetched from the cache, or fetch it and store it
+        in the cache right away, not to lose it if the harvesting is interrupted
+
+        :param api_name: name of the third party API
+        :param key: cache key of the document
+        :param fetch: function fetching the document from the third party API
+        :return: the document
+        """
+        pub = self.cached_pubs.pop((api_name, key), None)
+        if pub is None:
+            pub = await fetch()
+            await ThirdApiCache.set(api_name, key, pub)
+        return pub
 
     def _secondary_query_process(self, doc: dict):
         coro = None
@@ -209,7 +275,7 @@ class IdrefHarvester(AbstractHarvester):
             logger.error(f"Unknown source {doc['secondary_source']}")
         return coro
 
-    @execution_timer
+    @traced()
     async def _query_publication_from_persee_endpoint(self, doc: dict) -> RdfResult:
         uri: str | None = doc.get("uri", "")
         if not uritools.isuri(uri):
@@ -219,19 +285,19 @@ class IdrefHarvester(AbstractHarvester):
         assert uri.startswith(self.PERSEE_URL_SUFFIX), "Invalid Persee Id"
         assert uri.endswith("#Web"), "Provided Persee URI should end with #Web"
 
-        document_uri = re.sub(r"#Web$", "", uri)
-        document_uri = re.sub(r"^http://", "https://", document_uri)
-        pub = await ThirdApiCache.get("persee_publications", document_uri)
-        if pub is None:
-            pub = await RdfResolver().fetch(document_uri, output_format="xml")
-            await ThirdApiCache.set("persee_publications", uri, pub)
+        document_uri = self._persee_document_uri(uri)
+        pub = await self._cached_or_fetched(
+            "persee_publications",
+            document_uri,
+            lambda: RdfResolver().fetch(document_uri, output_format="xml"),
+        )
         return RdfResult(
             payload=pub,
             source_identifier=URIRef(uri),
             formatter_name=self.Formatters.PERSEE_RDF.value,
         )
 
-    @execution_timer
+    @traced()
     async def _query_publication_from_openedition_endpoint(self, doc: dict):
         """
         Query the publications from the OpenEdition API
@@ -245,17 +311,16 @@ class IdrefHarvester(AbstractHarvester):
                 f"Invalid OpenEdition URI from Idref SPARQL endpoint: {uri}"
             )
         assert self.OPEN_EDITION_SUFFIX.match(uri), f"Invalid OpenEdition Id {uri}"
-        pub = await ThirdApiCache.get("open_edition_publications", uri)
-        if pub is None:
-            pub = await OpenEditionResolver().fetch(uri)
-            await ThirdApiCache.set("open_edition_publications", uri, pub)
+        pub = await self._cached_or_fetched(
+            "open_edition_publications", uri, lambda: OpenEditionResolver().fetch(uri)
+        )
         return XmlResult(
             payload=pub,
             source_identifier=URIRef(uri),
             formatter_name=self.Formatters.OPEN_EDITION.value,
         )
 
-    @execution_timer
+    @traced()
     async def _query_publication_from_sudoc_endpoint(self, doc: dict) -> RdfResult:
         """
         Query the details of a publication from the SUDOC API
@@ -270,24 +335,22 @@ class IdrefHarvester(AbstractHarvester):
             )
         assert uri.startswith(self.SUDOC_URL_SUFFIX), "Invalid Sudoc Id"
         assert uri.endswith("/id"), "Provided Sudoc URI should end with /id"
-        # with regular expression, replace trailing "/id" by '.rdf' in document_uri
-        document_uri = re.sub(r"/id$", ".rdf", uri)
-        # with regular expression, replace "http://" by "https://" in document_uri
-        document_uri = re.sub(r"^http://", "https://", document_uri)
+        document_uri = self._sudoc_document_uri(uri)
         settings = get_app_settings()
-        pub = await ThirdApiCache.get("sudoc_publications", document_uri)
-        if pub is None:
-            pub = await RdfResolver(timeout=settings.idref_sudoc_timeout).fetch(
+        pub = await self._cached_or_fetched(
+            "sudoc_publications",
+            document_uri,
+            lambda: RdfResolver(timeout=settings.idref_sudoc_timeout).fetch(
                 document_uri, output_format="xml"
-            )
-            await ThirdApiCache.set("sudoc_publications", document_uri, pub)
+            ),
+        )
         return RdfResult(
             payload=pub,
             source_identifier=URIRef(uri),
             formatter_name=self.Formatters.SUDOC_RDF.value,
         )
 
-    @execution_timer
+    @traced()
     async def _convert_publication_from_idref_endpoint(self, doc: dict) -> SparqlResult:
         """
         Query the details of a publication from the IDREF API
@@ -301,7 +364,7 @@ class IdrefHarvester(AbstractHarvester):
             formatter_name=self.Formatters.IDREF_SPARQL.value,
         )
 
-    @execution_timer
+    @traced()
     async def _query_publication_from_hal_endpoint(
         self, doc: dict  # pylint: disable=unused-argument
     ) -> RawResult:
@@ -313,7 +376,7 @@ class IdrefHarvester(AbstractHarvester):
         """
         return {}
 
-    @execution_timer
+    @traced()
     async def _query_publication_from_science_plus_endpoint(
         self, doc: dict  # pylint: disable=unused-argument
     ) -> RawResult:
@@ -329,20 +392,15 @@ class IdrefHarvester(AbstractHarvester):
             raise UnexpectedFormatException(
                 f"Invalid SUDOC URI from Idref SPARQL endpoint: {uri}"
             )
-        params = {
-            "query": f'define sql:describe-mode "CBD"  DESCRIBE <{uri}>',
-            "output": "application/rdf+xml",
-        }
-        # concatenate encoded params to query suffix
-        query_uri = f"{self.SCIENCE_PLUS_QUERY_SUFFIX}?{urllib.parse.urlencode(params)}"
-        pub = None
+        query_uri = self._science_plus_query_uri(uri)
         settings = get_app_settings()
-        if settings.third_api_caching_enabled:
-            pub = await ThirdApiCache.get("scienceplus_publications", query_uri)
-        if pub is None:
-            client = RdfResolver(timeout=settings.idref_science_plus_timeout)
-            pub = await client.fetch(query_uri, output_format="xml")
-            await ThirdApiCache.set("scienceplus_publications", query_uri, pub)
+        pub = await self._cached_or_fetched(
+            "scienceplus_publications",
+            query_uri,
+            lambda: RdfResolver(timeout=settings.idref_science_plus_timeout).fetch(
+                query_uri, output_format="xml"
+            ),
+        )
 
         doi = doc.get("doi", None)
         return RdfResult(
@@ -351,3 +409,23 @@ class IdrefHarvester(AbstractHarvester):
             formatter_name=self.Formatters.SCIENCE_PLUS_RDF.value,
             doi=doi,
         )
+
+    @staticmethod
+    def _sudoc_document_uri(uri: str) -> str:
+        # with regular expression, replace trailing "/id" by '.rdf' in document_uri
+        document_uri = re.sub(r"/id$", ".rdf", uri)
+        # with regular expression, replace "http://" by "https://" in document_uri
+        return re.sub(r"^http://", "https://", document_uri)
+
+    @staticmethod
+    def _persee_document_uri(uri: str) -> str:
+        document_uri = re.sub(r"#Web$", "", uri)
+        return re.sub(r"^http://", "https://", document_uri)
+
+    def _science_plus_query_uri(self, uri: str) -> str:
+        params = {
+            "query": f'define sql:describe-mode "CBD"  DESCRIBE <{uri}>',
+            "output": "application/rdf+xml",
+        }
+        # concatenate encoded params to query suffix
+        return f"{self.SCIENCE_PLUS_QUERY_SUFFIX}?{urllib.parse.urlencode(params)}"
@@ -7,7 +7,8 @@ from loguru import logger
 
 from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
 from app.http.aio_http_client_manager import AioHttpClientManager
-from app.utilities.execution_timer_wrapper import execution_timer
+from app.http.host_scheduler import HostScheduler
+from app.monitoring.tracing import Tracer, traced
 
 DATA_IDREF_FR_URL = "https://data.idref.fr/sparql"
 
@@ -83,7 +84,6 @@ class IdrefSparqlClient:
         ],
     }
 
-    @execution_timer
     async def fetch_publications(self, query: str) -> AsyncGenerator[dict, None]:
         """
         Fetch publications list for a given author from the Idref sparql endpoint.
@@ -93,7 +93,9 @@ class IdrefSparqlClient:
         """
         client: SPARQLClient = await self._get_client()
         try:
-            response = await client.query(query)
+            with Tracer.span("IdrefSparqlClient.query"):
+                async with HostScheduler.slot(DATA_IDREF_FR_URL):
+                    response = await client.query(query)
             # Aggregate results
             publications = {}
             for result in response.get("results", {}).get("bindings", []):
@@ -178,7 +180,7 @@ class IdrefSparqlClient:
         finally:
             await client.close()
 
-    @execution_timer
+    @traced()
     async def fetch_publication(self, query: str) -> dict:
         """
         Fetch data for a single publication from the Idref sparql endpoint
@@ -187,7 +189,8 @@ class IdrefSparqlClient:
         """
         client: SPARQLClient = await self._get_client()
         try:
-            response = await client.query(query)
+            async with HostScheduler.slot(DATA_IDREF_FR_URL):
+                response = await client.query(query)
             print(query)
             pub_raw_data: dict = response.get("results", {}).get("bindings", [])
             # simplify the data structure by removing the first level of keys
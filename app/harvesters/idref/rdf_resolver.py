@@ -7,6 +7,7 @@ from rdflib.exceptions import ParserError
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.idref.resolver_http_client import ResolverHTTPClient
 
 DEFAULT_RDF_TIMEOUT = 30
@@ -20,20 +21,26 @@ class RdfResolver:
     def __init__(self, timeout: int = DEFAULT_RDF_TIMEOUT):
         self.http_client = ResolverHTTPClient(timeout=timeout)
 
-    async def fetch(self, document_uri: str, output_format: str = "xml") -> Graph:
+    async def fetch(
+        self, document_uri: str, output_format: str = "xml"
+    ) -> RdfTripleIndex:
         """
-        Fetch the results from the HAL API
+        Fetch the RDF of a document as a read-only triple index
 
         :param document_uri: the document URI for which to fetch the RDF
-        :return: A generator of results
+        :param output_format: the RDF serialization of the document
+        :return: the triples of the document
         """
         response_text = await self.http_client.get(document_uri)
         if response_text:
             clean_response_text = self._clean_response_text(response_text)
 
             try:
-                graph = Graph().parse(data=clean_response_text, format=output_format)
-                return graph
+                if output_format == "xml":
+                    return RdfTripleIndex.parse(clean_response_text)
+                return RdfTripleIndex.from_triples(
+                    Graph().parse(data=clean_response_text, format=output_format)
+                )
             except (ParserError, SAXParseException) as error:
                 raise UnexpectedFormatException(
                     f"Error while parsing the RDF from {document_uri} : {clean_response_text}"
@@ -0,0 +1,195 @@
+from typing import Generator, Iterable
+
+from rdflib.parser import create_input_source
+from rdflib.plugins.parsers.rdfxml import create_parser
+from rdflib.term import Node
+
+Triple = tuple[Node, Node, Node]
+TriplePattern = tuple[Node | None, Node | None, Node | None]
+
+
+class RdfTripleIndex:
+    """
+    Compact read-only subject -> predicate -> objects index of an RDF document.
+
+    Implements the subset of the rdflib Graph API used by the RDF references
+    converters (objects, subjects, triples and triple membership),
+    without the cost of the rdflib Memory store that maintains
+    three permutation indexes, contexts and namespace bindings
+    for each graph.
+    """
+
+    __slots__ = ("_index", "_length")
+
+    def __init__(self, index: dict[Node, dict[Node, tuple[Node, ...]]] = None):
+        """
+        :param index: objects by predicate by subject, not to be modified afterward
+        """
+        self._index = index or {}
+        self._length = sum(
+            len(objects)
+            for predicates in self._index.values()
+            for objects in predicates.values()
+        )
+
+    @classmethod
+    def parse(cls, data: str) -> "RdfTripleIndex":
+        """
+        Build the index from an RDF/XML document
+
+        :param data: RDF/XML document
+        :return: the triple index
+        :raises ParserError: if the document is not valid RDF/XML
+        :raises SAXParseException: if the document is not valid XML
+        """
+        builder = _RdfTripleIndexBuilder()
+        source = create_input_source(data=data, format="xml")
+        # rdflib RDF/XML parser only calls add and bind on its target graph
+        create_parser(source, builder).parse(source)
+        return builder.build()
+
+    @classmethod
+    def from_triples(cls, triples: Iterable[Triple]) -> "RdfTripleIndex":
+        """
+        Build the index from triples, e.g. from an rdflib Graph
+
+        :param triples: triples to index
+        :return: the triple index
+        """
+        builder = _RdfTripleIndexBuilder()
+        for triple in triples:
+            builder.add(triple)
+        return builder.build()
+
+    def triples(self, pattern: TriplePattern) -> Generator[Triple, None, None]:
+        """
+        Triples matching a pattern, None matching any term
+
+        :param pattern: (subject, predicate, object) pattern
+        :return: generator of matching triples
+        """
+        subject, predicate, obj = pattern
+        if subject is None:
+            subjects = self._index.items()
+        elif subject in self._index:
+            subjects = ((subject, self._index[subject]),)
+        else:
+            return
+        for current_subject, predicates in subjects:
+            if predicate is None:
+                objects_by_predicate = predicates.items()
+            elif predicate in predicates:
+                objects_by_predicate = ((predicate, predicates[predicate]),)
+            else:
+                continue
+            for current_predicate, objects in objects_by_predicate:
+                if obj is None:
+                    for current_object in objects:
+                        yield current_subject, current_predicate, current_object
+                elif obj in objects:
+                    yield current_subject, current_predicate, obj
+
+    def objects(
+        self, subject: Node = None, predicate: Node = None, unique: bool = False
+    ) -> Generator[Node, None, None]:
+        """
+        Objects of the triples with a given subject and predicate
+
+        :param subject: subject of the triples, None for any subject
+        :param predicate: predicate of the triples, None for any predicate
+        :param unique: whether to yield each object only once
+        :return: generator of objects
+        """
+        return self._unique(
+            (obj for _, _, obj in self.triples((subject, predicate, None))), unique
+        )
+
+    def subjects(
+        self,
+        predicate: Node = None,
+        object: Node = None,  # pylint: disable=redefined-builtin
+        unique: bool = False,
+    ) -> Generator[Node, None, None]:
+        """
+        Subjects of the triples with a given predicate and object
+
+        :param predicate: predicate of the triples, None for any predicate
+        :param object: object of the triples, None for any object
+        :param unique: whether to yield each subject only once
+        :return: generator of subjects
+        """
+        return self._unique(
+            (subject for subject, _, _ in self.triples((None, predicate, object))),
+            unique,
+        )
+
+    def __contains__(self, pattern: TriplePattern) -> bool:
+        return next(self.triples(pattern), None) is not None
+
+    def __iter__(self) -> Generator[Triple, None, None]:
+        return self.triples((None, None, None))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reduce__(self):
+        return RdfTripleIndex, (self._index,)
+
+    @staticmethod
+    def _unique(terms: Iterable[Node], unique: bool) -> Generator[Node, None, None]:
+        if not unique:
+            yield from terms
+            return
+        seen = set()
+        for term in terms:
+            if term not in seen:
+                seen.add(term)
+                yield term
+
+
+class _RdfTripleIndexBuilder:
+    """
+    Parser target collecting the triples, with their terms interned
+    so that a term repeated in the document is stored once
+    """
+
+    def __init__(self):
+        self._terms: dict[Node, Node] = {}
+        # objects are kept in dict keys to remove duplicates in document order
+        self._index: dict[Node, dict[Node, dict[Node, None]]] = {}
+
+    def add(self, triple: Triple) -> None:
+        """
+        Add a triple to the index
+
+        :param triple: (subject, predicate, object)
+        :return: None
+        """
+        subject, predicate, obj = (self._intern(term) for term in triple)
+        self._index.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+
+    def bind(self, *_args, **_kwargs) -> None:
+        """
+        Namespace prefixes are not needed by the index
+
+        :return: None
+        """
+
+    def build(self) -> RdfTripleIndex:
+        """
+        Freeze the collected triples into a triple index
+
+        :return: the triple index
+        """
+        return RdfTripleIndex(
+            {
+                subject: {
+                    predicate: tuple(objects)
+                    for predicate, objects in predicates.items()
+                }
+                for subject, predicates in self._index.items()
+            }
+        )
+
+    def _intern(self, term: Node) -> Node:
+        return self._terms.setdefault(term, term)
@@ -5,6 +5,7 @@ from app.harvesters.exceptions.external_endpoint_failure import (
     handle_external_endpoint_failure,
 )
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 
 
 class ResolverHTTPClient:
@@ -15,7 +16,7 @@ class ResolverHTTPClient:
     def __init__(self, timeout: int = 7):
         self.timeout = timeout
 
-    @handle_external_endpoint_failure("external resolver")
+    @handle_external_endpoint_failure("external resolver", by_host=True)
     async def get(self, url: str) -> str:
         """
         Get any document from remote URL as text
@@ -25,10 +26,13 @@ class ResolverHTTPClient:
         """
         session = await AioHttpClientManager.get_session()
         request_timeout = ClientTimeout(total=float(self.timeout))
-        async with session.get(url, timeout=request_timeout) as resp:
+        async with HostScheduler.slot(url), session.get(
+            url, timeout=request_timeout
+        ) as resp:
             if resp.status == 200:
                 return await resp.text()
             await resp.release()
             raise ExternalEndpointFailure(
-                f"Error code while resolving URI : {url} with code {resp.status}"
+                f"Error code while resolving URI : {url} with code {resp.status}",
+                status=resp.status,
             )
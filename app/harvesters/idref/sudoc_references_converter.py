@@ -2,7 +2,7 @@ import re
 
 import rdflib
 from loguru import logger
-from rdflib import DC, DCTERMS, Graph, Literal, Namespace, URIRef
+from rdflib import DC, DCTERMS, FOAF, Literal, Namespace, URIRef
 from semver import Version
 
 from app.db.models.book import Book
@@ -20,19 +20,20 @@ from app.harvesters.idref.abes_rdf_references_converter import (
     AbesRDFReferencesConverter,
 )
 from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.idref.sudoc_document_type_converter import (
     SudocDocumentTypeConverter,
 )
 from app.harvesters.idref.sudoc_roles_converter import SudocRolesConverter
 from app.harvesters.idref.utils import filter_idref_identifiers
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult
+from app.monitoring.tracing import traced
 from app.services.book.book_data_class import BookInformations
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.hash.hash_key import HashKey
 from app.services.issue.issue_data_class import IssueInformations
 from app.services.journal.journal_data_class import JournalInformations
 from app.utilities.date_utilities import check_valid_iso8601_date
-from app.utilities.execution_timer_wrapper import execution_timer
 from app.utilities.isbn_utilities import get_isbns
 from app.utilities.string_utilities import remove_after_separator
 
@@ -78,7 +79,7 @@ class SudocReferencesConverter(AbesRDFReferencesConverter):
                 )
                 new_ref.issue = issue
 
-    @execution_timer
+    @traced()
     async def _get_subjects(self, pub_graph, uri, new_ref):
         for subject in pub_graph.objects(rdflib.term.URIRef(uri), DCTERMS.subject):
             concept_uri = str(subject)
@@ -149,7 +150,7 @@ class SudocReferencesConverter(AbesRDFReferencesConverter):
             )
         )
 
-    async def _get_bibliographic_resource(self, pub_graph, uri) -> Graph:
+    async def _get_bibliographic_resource(self, pub_graph, uri) -> RdfTripleIndex:
         document: Literal
         for document in pub_graph.objects(rdflib.term.URIRef(uri), DCTERMS.isPartOf):
             document_uri = str(document)
@@ -251,21 +252,7 @@ class SudocReferencesConverter(AbesRDFReferencesConverter):
 
     async def _add_contributions(self, pub_graph, uri):
         contribution_informations = []
-        query = """
-                    PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-                    PREFIX marcrel: <http://id.loc.gov/vocabulary/relators/>
-
-                    SELECT DISTINCT ?role ?person ?name
-                    WHERE {
-                        ?work ?role ?person .
-                        ?person a foaf:Person .
-                        ?person foaf:name ?name .
-                        FILTER(STRSTARTS(STR(?role), STR(marcrel:)))
-                    }
-                """
-
-        results = pub_graph.query(query)
-        for role, identifier, name in results:
+        for role, identifier, name in self._person_roles(pub_graph):
             role = role.split("/")[-1]
             contribution_informations.append(
                 AbstractReferencesConverter.ContributionInformations(
@@ -283,6 +270,22 @@ class SudocReferencesConverter(AbesRDFReferencesConverter):
         ):
             yield contribution
 
+    def _person_roles(self, pub_graph: RdfTripleIndex):
+        """
+        Distinct roles held by the persons of the publication graph
+
+        :param pub_graph: the triples of the publication
+        :return: generator of (role, person, name) tuples
+        """
+        seen = set()
+        for _, role, person in self._marcrel_triples(pub_graph):
+            if (person, rdflib.RDF.type, FOAF.Person) not in pub_graph:
+                continue
+            for name in pub_graph.objects(person, FOAF.name):
+                if (role, person, name) not in seen:
+                    seen.add((role, person, name))
+                    yield role, person, name
+
     def _extract_nnt_from_url(self, url: str, new_ref) -> bool:
         """
         Try to extract NNT from a theses.fr URL.
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from urllib.parse import urlencode
 
@@ -28,6 +29,8 @@ class OpenAlexQueryBuilder:
         self.identifier_type = None
         self.identifier_value = None
         self.subject_type = None
+        self.modified_since: datetime | None = None
+        self.fields: list[str] | None = None
 
     def set_query(
         self, identifier_type: QueryParameters, identifier_value: str
@@ -44,6 +47,25 @@ class OpenAlexQueryBuilder:
         self.identifier_type = identifier_type
         self.identifier_value = identifier_value
 
+    def set_modified_since(self, modified_since: datetime) -> None:
+        """
+        Restrict the query to the works updated since a given date.
+        The from_updated_date filter requires an OpenAlex premium API key.
+
+        :param modified_since: UTC date of the oldest update to fetch
+        :return: None
+        """
+        self.modified_since = modified_since
+
+    def set_fields(self, fields: list[str] | None) -> None:
+        """
+        Set the root fields to return for each work
+
+        :param fields: list of OpenAlex work fields, all the fields if None
+        :return: None
+        """
+        self.fields = fields
+
     def build(self) -> str:
         """
         Main building method, returns a query string for the OpenAlex API.
@@ -60,6 +82,8 @@ class OpenAlexQueryBuilder:
             )
 
         params["api_key"] = api_key
+        if self.fields:
+            params["select"] = ",".join(self.fields)
 
         return urlencode(params)
 
@@ -72,9 +96,13 @@ class OpenAlexQueryBuilder:
         raise NotImplementedError()
 
     def _person_queries(self):
-        return {
-            "filter": f"author.{self.identifier_type.value}:{self.identifier_value}"
-        }
+        filters = [f"author.{self.identifier_type.value}:{self.identifier_value}"]
+        if self.modified_since is not None:
+            # the filter is inclusive and has a daily granularity
+            filters.append(
+                f"from_updated_date:{self.modified_since.strftime('%Y-%m-%d')}"
+            )
+        return {"filter": ",".join(filters)}
 
     def set_subject_type(self, subject_type: SubjectType):
         """
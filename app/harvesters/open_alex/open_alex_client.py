@@ -8,6 +8,7 @@ from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 
 
 class OpenAlexClient:
@@ -16,42 +17,51 @@ class OpenAlexClient:
     OPEN_ALEX_URL = "https://api.openalex.org/works"
 
     PER_PAGE = 25
+    # maximum number of results by page accepted by the OpenAlex API
+    MAX_PER_PAGE = 200
 
     @handle_external_endpoint_failure("openalex")
-    async def fetch(self, url: str) -> AsyncGenerator[dict, None]:
+    async def fetch(
+        self, url: str, per_page: int = PER_PAGE
+    ) -> AsyncGenerator[dict, None]:
         """
         Fetch the results from the OpenAlex API
 
         :param url: the query string to send to the OpenAlex API
+        :param per_page: number of results by page
         :return: An async generator of results
         """
         page_number = 1
         session = await AioHttpClientManager.get_session()
 
         while True:
-            paginated_query = f"{url}&page={page_number}&per_page={self.PER_PAGE}"
-            async with session.get(f"{self.OPEN_ALEX_URL}?{paginated_query}") as resp:
-                if resp.status == 200:
-                    json_response = await resp.json()
-                    if "results" not in json_response.keys():
-                        raise UnexpectedFormatException(
-                            f"Unexpected format in OpenAlex response: {json_response} "
-                            f"for request : {url}"
-                        )
-                    if "error" in json_response.keys():
-                        raise ExternalEndpointFailure(
-                            f"Error from OpenAlex API for request : {url} "
-                            f"with error {json_response['error']}"
-                        )
-                    for doc in json_response["results"]:
-                        yield doc
-                    meta = json_response.get("meta", {})
-                    if meta.get("count", 0) < meta.get("per_page", 0) * page_number:
-                        break
-                    page_number += 1
-                else:
+            paginated_query = f"{url}&page={page_number}&per_page={per_page}"
+            async with HostScheduler.slot(self.OPEN_ALEX_URL), session.get(
+                f"{self.OPEN_ALEX_URL}?{paginated_query}"
+            ) as resp:
+                if resp.status != 200:
                     await resp.release()
                     raise ExternalEndpointFailure(
                         f"Error code from OpenAlex API for request : {url} "
-                        f"with code {resp.status}"
+                        f"with code {resp.status}",
+                        status=resp.status,
                     )
+                json_response = await resp.json()
+            # the slot is released before the results are consumed,
+            # as the consumer may send requests to the same host
+            if "results" not in json_response.keys():
+                raise UnexpectedFormatException(
+                    f"Unexpected format in OpenAlex response: {json_response} "
+                    f"for request : {url}"
+                )
+            if "error" in json_response.keys():
+                raise ExternalEndpointFailure(
+                    f"Error from OpenAlex API for request : {url} "
+                    f"with error {json_response['error']}"
+                )
+            for doc in json_response["results"]:
+                yield doc
+            meta = json_response.get("meta", {})
+            if meta.get("count", 0) < meta.get("per_page", 0) * page_number:
+                break
+            page_number += 1
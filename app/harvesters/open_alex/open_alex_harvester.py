@@ -1,7 +1,10 @@
-from typing import AsyncGenerator
+from datetime import datetime
+from typing import AsyncGenerator, Optional
 
+from loguru import logger
 from semver import VersionInfo, Version
 
+from app.config import get_app_settings
 from app.db.models.contributor_identifier import ContributorIdentifier
 from app.harvesters.abstract_harvester import AbstractHarvester
 from app.harvesters.json_harvester_raw_result import JsonHarvesterRawResult
@@ -27,6 +30,10 @@ class OpenAlexHarvester(AbstractHarvester):
 
     SUBJECT_BY_ENTITIES = {"Person": OpenAlexQueryBuilder.SubjectType.PERSON}
 
+    SUPPORTS_SOURCE_IDENTIFIERS_LISTING = True
+
+    SUPPORTS_INCREMENTAL_HARVESTING = True
+
     VERSION: Version = VersionInfo.parse("2.2.0")
 
     async def _get_open_alex_query_parameters(self, entity_class: str):
@@ -44,11 +51,51 @@ class OpenAlexHarvester(AbstractHarvester):
                 return open_alex_query_parameter, identifier_value
         assert False, f"Unable to map '{identifier_key}' to OpenAlex query parameter"
 
+    async def _get_modified_since(self) -> Optional[datetime]:
+        """
+        Fall back to a full harvesting if the OpenAlex API key is not a premium one,
+        as the from_updated_date filter is reserved to premium keys
+        :return: the start time of the last completed harvesting,
+            None if all the records have to be fetched
+        """
+        if self.incremental and not get_app_settings().openalex_premium_api_key:
+            logger.info(
+                f"Incremental OpenAlex harvesting {self.harvesting_id} requires"
+                " a premium API key, fetching all the records"
+            )
+            return None
+        return await super()._get_modified_since()
+
     async def fetch_results(self) -> AsyncGenerator[JsonHarvesterRawResult, None]:
         """
         Fetch results from the OpenAlex API.
         It is an asynchronous generator that yields JsonHarvesterRawResult objects.
         """
+        builder = await self._get_query_builder()
+        builder.set_fields(self.converter.CONSUMED_FIELDS)
+        if self.modified_since is not None:
+            builder.set_modified_since(self.modified_since)
+
+        async for doc in OpenAlexClient().fetch(builder.build()):
+            yield JsonHarvesterRawResult(
+                payload=doc,
+                source_identifier=doc.get("id"),
+                formatter_name=OpenAlexHarvester.FORMATTER_NAME,
+            )
+
+    async def list_source_identifiers(self) -> AsyncGenerator[str, None]:
+        """
+        List the OpenAlex identifiers of all the works of the entity,
+        by pages of the maximum size.
+        """
+        builder = await self._get_query_builder()
+        builder.set_fields(["id"])
+        async for doc in OpenAlexClient().fetch(
+            builder.build(), per_page=OpenAlexClient.MAX_PER_PAGE
+        ):
+            yield doc.get("id")
+
+    async def _get_query_builder(self) -> OpenAlexQueryBuilder:
         builder = OpenAlexQueryBuilder()
 
         identifier_type, identifier_value = await self._get_open_alex_query_parameters(
@@ -62,10 +109,4 @@ class OpenAlexHarvester(AbstractHarvester):
         builder.set_query(
             identifier_type=identifier_type, identifier_value=identifier_value
         )
-
-        async for doc in OpenAlexClient().fetch(builder.build()):
-            yield JsonHarvesterRawResult(
-                payload=doc,
-                source_identifier=doc.get("id"),
-                formatter_name=OpenAlexHarvester.FORMATTER_NAME,
-            )
+        return builder
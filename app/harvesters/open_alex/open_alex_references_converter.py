@@ -43,6 +43,23 @@ class OpenAlexReferencesConverter(AbstractReferencesConverter):
 
     REFERENCE_IDENTIFIERS_IGNORE = {"mag"}
 
+    # root fields of the OpenAlex works, requested with the "select" parameter
+    CONSUMED_FIELDS = [
+        "id",
+        "ids",
+        "title",
+        "language",
+        "abstract_inverted_index",
+        "type",
+        "authorships",
+        "concepts",
+        "locations",
+        "primary_location",
+        "biblio",
+        "created_date",
+        "publication_date",
+    ]
+
     # OpenAlex "ids" keys -> DB identifier type strings
     FIElD_NAME_TO_IDENTIFIER_TYPE: dict[str, str] = {
         "doi": ReferenceIdentifier.IdentifierType.DOI.value,
@@ -1,14 +1,15 @@
 from dataclasses import dataclass
 
-from rdflib import Graph, URIRef
+from rdflib import URIRef
 
 from app.harvesters.abstract_harvester_raw_result import AbstractHarvesterRawResult
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 
 
 @dataclass(kw_only=True)
-class RdfHarvesterRawResult(AbstractHarvesterRawResult[URIRef, Graph]):
+class RdfHarvesterRawResult(AbstractHarvesterRawResult[URIRef, RdfTripleIndex]):
     """
-    Raw result of an Harvester with identifier as an URL and payload as a graph
+    Raw result of an Harvester with identifier as an URL and payload as a triple index
     """
 
     doi: str = None
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 import re
 
@@ -6,7 +7,7 @@ from app.harvesters.exceptions.unexpected_format_exception import (
 )
 
 
-class ScanRApiQueryBuilder:
+class ScanRApiQueryBuilder:  # pylint: disable=too-many-instance-attributes
     """
     This class provides an abstratction tu build a query for the ScanR elastic API
     """
@@ -46,6 +47,9 @@ class ScanRApiQueryBuilder:
         "source",
     ]
 
+    # date of the last update of a publication in the ScanR index
+    PUBLICATIONS_MODIFICATION_DATE_FIELD = "lastUpdated"
+
     def __init__(self):
         self.identifier_type = None
         self.identifier_value = None
@@ -53,6 +57,7 @@ class ScanRApiQueryBuilder:
         self.persons_fields = self.PERSON_DEFAULT_FIELDS
         self.publications_fields = self.PUBLICATIONS_DEFAULT_FIELDS
         self.subject_type: ScanRApiQueryBuilder.SubjectType | None = None
+        self.modified_since: datetime | None = None
         self.query = {}
 
     def set_publication_query(self, scanr_id: str):
@@ -83,6 +88,24 @@ class ScanRApiQueryBuilder:
         self.identifier_value = identifier_value
         self.subject_type = self.SubjectType.PERSON
 
+    def set_modified_since(self, modified_since: datetime) -> None:
+        """
+        Restrict the publication query to the publications updated since a given date
+
+        :param modified_since: UTC date of the oldest update to fetch
+        :return: None
+        """
+        self.modified_since = modified_since
+
+    def set_publications_fields(self, fields: list[str]) -> None:
+        """
+        Set the fields of the publications to return
+
+        :param fields: list of publication fields
+        :return: None
+        """
+        self.publications_fields = fields
+
     def build(self) -> dict:
         """
         Main building method, return a query DSL for the elastic ScanR API
@@ -147,16 +170,45 @@ class ScanRApiQueryBuilder:
                     ]
                 }
             }
+            if self.modified_since is not None:
+                query_param["bool"]["filter"] = [self._modified_since_filter()]
         else:
             raise NotImplementedError()
         return query_param
 
+    def _modified_since_filter(self):
+        # publications without update date are always returned
+        # so that they are never missed by incremental harvestings
+        return {
+            "bool": {
+                "should": [
+                    {
+                        "range": {
+                            self.PUBLICATIONS_MODIFICATION_DATE_FIELD: {
+                                "gte": self.modified_since.strftime("%Y-%m-%d")
+                            }
+                        }
+                    },
+                    {
+                        "bool": {
+                            "must_not": {
+                                "exists": {
+                                    "field": self.PUBLICATIONS_MODIFICATION_DATE_FIELD
+                                }
+                            }
+                        }
+                    },
+                ],
+                "minimum_should_match": 1,
+            }
+        }
+
     def _source_param(self):
         returned_fields = []
         if self.subject_type == self.SubjectType.PERSON:
-            returned_fields = self.PERSON_DEFAULT_FIELDS
+            returned_fields = self.persons_fields
         if self.subject_type == self.SubjectType.PUBLICATION:
-            returned_fields = self.PUBLICATIONS_DEFAULT_FIELDS
+            returned_fields = self.publications_fields
 
         self.query["_source"] = returned_fields
 
@@ -1,14 +1,19 @@
 from enum import Enum
 from typing import Dict, List
+from urllib.parse import urlparse
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import AuthenticationException, ElasticsearchException
 
 from app.config import get_app_settings
-from app.harvesters.exceptions.external_endpoint_failure import ExternalEndpointFailure
+from app.harvesters.exceptions.external_endpoint_failure import (
+    ExternalEndpointFailure,
+    handle_external_endpoint_failure,
+)
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
+from app.http.host_scheduler import HostScheduler
 
 
 class ScanRElasticClient:
@@ -28,12 +33,14 @@ class ScanRElasticClient:
         self.elastic = None
 
     async def __aenter__(self):
+        # TLS unless the host is explicitly an http url, e.g. a local stand-in
+        use_ssl = urlparse(self.settings.scanr_es_host).scheme != "http"
         self.elastic = AsyncElasticsearch(
             [self.settings.scanr_es_host],
             http_auth=(self.settings.scanr_es_user, self.settings.scanr_es_password),
-            use_ssl=True,
-            verify_certs=True,
-            scheme="https",
+            use_ssl=use_ssl,
+            verify_certs=use_ssl,
+            scheme="https" if use_ssl else "http",
         )
         return self
 
@@ -50,6 +57,7 @@ class ScanRElasticClient:
         """
         self.query = elastic_query
 
+    @handle_external_endpoint_failure("scanr")
     async def perform_search(self, selected_index: Indexes, base_size: int = 200):
         """
         Perform a search request on Scanr index and return the results
@@ -59,16 +67,17 @@ class ScanRElasticClient:
         async def search_and_yield(offset):
             nonlocal total_search_hits
             try:
-                # pylint: disable=unexpected-keyword-arg
-                resp = await self.elastic.search(
-                    # "size" belongs to method parameters
-                    # https://elasticsearch-py.readthedocs.io/en/v8.12.0/api/elasticsearch.html
-                    # "from" is listed in documentation but appears as "from_" in library code
-                    index=target_index,
-                    body=self.query,
-                    size=base_size,
-                    from_=offset,
-                )
+                async with HostScheduler.slot(self.settings.scanr_es_host):
+                    # pylint: disable=unexpected-keyword-arg
+                    resp = await self.elastic.search(
+                        # "size" belongs to method parameters
+                        # https://elasticsearch-py.readthedocs.io/en/v8.12.0/api/elasticsearch.html
+                        # "from" is listed in documentation but appears as "from_" in library code
+                        index=target_index,
+                        body=self.query,
+                        size=base_size,
+                        from_=offset,
+                    )
             except AuthenticationException as exc:
                 raise ExternalEndpointFailure(
                     "Invalid credentials for ScanR API"
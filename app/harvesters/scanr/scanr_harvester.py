@@ -37,6 +37,13 @@ class ScanrHarvester(AbstractHarvester):
 
     VERSION: Version = VersionInfo.parse("2.2.0")
 
+    SUPPORTS_SOURCE_IDENTIFIERS_LISTING = True
+
+    SUPPORTS_INCREMENTAL_HARVESTING = True
+
+    # number of publications by page when listing their identifiers
+    LISTING_PAGE_SIZE = 1000
+
     async def _get_scanr_query_parameters(self, entity_class: str):
         """
         Compute the ScanR person id using the pre-selected entity identifier.
@@ -60,14 +67,11 @@ class ScanrHarvester(AbstractHarvester):
 
     async def fetch_results(self) -> AsyncGenerator[RawResult, None]:
         async with ScanRElasticClient() as client:
-            builder = QueryBuilder()
-
-            scanr_id = await self._get_scanr_query_parameters(
-                await self._get_entity_class_name()
-            )
-            if scanr_id is None:
+            builder = await self._get_publication_query_builder()
+            if builder is None:
                 return
-            builder.set_publication_query(scanr_id=scanr_id)
+            if self.modified_since is not None:
+                builder.set_modified_since(self.modified_since)
 
             client.set_query(elastic_query=builder.build())
             async for doc in client.perform_search(client.Indexes.PUBLICATIONS):
@@ -77,6 +81,33 @@ class ScanrHarvester(AbstractHarvester):
                     formatter_name=ScanrHarvester.FORMATTER_NAME,
                 )
 
+    async def list_source_identifiers(self) -> AsyncGenerator[str, None]:
+        """
+        List the ScanR identifiers of all the publications of the entity,
+        by large pages.
+        """
+        async with ScanRElasticClient() as client:
+            builder = await self._get_publication_query_builder()
+            if builder is None:
+                return
+            builder.set_publications_fields(["id"])
+
+            client.set_query(elastic_query=builder.build())
+            async for doc in client.perform_search(
+                client.Indexes.PUBLICATIONS, base_size=self.LISTING_PAGE_SIZE
+            ):
+                yield doc["_source"].get("id")
+
+    async def _get_publication_query_builder(self) -> QueryBuilder | None:
+        scanr_id = await self._get_scanr_query_parameters(
+            await self._get_entity_class_name()
+        )
+        if scanr_id is None:
+            return None
+        builder = QueryBuilder()
+        builder.set_publication_query(scanr_id=scanr_id)
+        return builder
+
     @staticmethod
     async def _get_entity_scanr_id(identifier_type, identifier_value: str):
         async with ScanRElasticClient() as client:
@@ -26,6 +26,7 @@ class ScopusQueryBuilder:
         self.identifier_type = None
         self.identifier_value = None
         self.subject_type = None
+        self.fields: list[str] | None = None
 
     def set_query(
         self, identifier_type: QueryParameters, identifier_value: str
@@ -38,12 +39,20 @@ class ScopusQueryBuilder:
         self.identifier_type = identifier_type
         self.identifier_value = identifier_value
 
+    def set_fields(self, fields: list[str] | None) -> None:
+        """
+        Set the fields to return for each entry, all the fields of the view if None
+        """
+        self.fields = fields
+
     def build(self) -> str:
         """
         Main building method, returns a query string for the Scopus API
         """
 
         params = self._query_param()
+        if self.fields:
+            params["field"] = ",".join(self.fields)
         return urlencode(params)
 
     def _query_param(self):
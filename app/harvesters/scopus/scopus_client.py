@@ -9,6 +9,7 @@ from app.harvesters.exceptions.external_endpoint_failure import (
     handle_external_endpoint_failure,
 )
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 
 
 class ScopusClient:
@@ -39,31 +40,33 @@ class ScopusClient:
             f"{self.SCOPUS_URL}?{url}&apiKey={self.settings.scopus_api_key}"
             f"&insttoken={self.settings.scopus_inst_token}&view=COMPLETE&start={start}"
         )
-        async with session.get(
+        async with HostScheduler.slot(self.SCOPUS_URL), session.get(
             query,
             headers={"Accept": "application/xml"},
         ) as resp:
-            if resp.status == 200:
-                xml = await resp.text()
-                root = ET.fromstring(xml)
-
-                count_elem = root.find("opensearch:totalResults", self.NAMESPACE)
-                count = int(count_elem.text) if count_elem is not None else 0
-                if count == 0:
-                    return
-                entries = root.findall(".//default:entry", self.NAMESPACE)
-                del root, xml
-                for doc in entries:
-                    yield doc
-                    del doc
-                # If there are more than 25 results, fetch the next 25 asynchrounously
-                # as is the limit of the Scopus API
-                if int(count) > start + 25:
-                    async for doc in self.fetch(url, start=start + 25):
-                        yield doc
-            else:
+            if resp.status != 200:
                 await resp.release()
                 raise ExternalEndpointFailure(
                     f"Error code from Scopus API for request: {url} "
-                    f"With code {resp.status}"
+                    f"With code {resp.status}",
+                    status=resp.status,
                 )
+            xml = await resp.text()
+        # the slot is released before the entries are consumed
+        # and the next page is fetched
+        root = ET.fromstring(xml)
+
+        count_elem = root.find("opensearch:totalResults", self.NAMESPACE)
+        count = int(count_elem.text) if count_elem is not None else 0
+        if count == 0:
+            return
+        entries = root.findall(".//default:entry", self.NAMESPACE)
+        del root, xml
+        for doc in entries:
+            yield doc
+            del doc
+        # If there are more than 25 results, fetch the next 25 asynchrounously
+        # as is the limit of the Scopus API
+        if int(count) > start + 25:
+            async for doc in self.fetch(url, start=start + 25):
+                yield doc
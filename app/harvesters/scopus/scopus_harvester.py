@@ -59,6 +59,7 @@ class ScopusHarvester(AbstractHarvester):
         )
 
         builder.set_query(identifier_type, identifier_value)
+        builder.set_fields(self.converter.CONSUMED_FIELDS)
         async for doc in ScopusClient().fetch(builder.build()):
             if doc is None:
                 continue
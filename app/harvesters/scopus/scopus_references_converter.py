@@ -43,6 +43,37 @@ class ScopusReferencesConverter(AbstractReferencesConverter):
         "default:pubmed-id": ReferenceIdentifier.IdentifierType.PUBMEDCENTRAL.value,
     }
 
+    # fields of the Scopus Search API, requested with the "field" parameter,
+    # named after the XML tags of the entries without the default namespace prefix
+    CONSUMED_FIELDS = [
+        "prism:url",
+        "dc:identifier",
+        "dc:title",
+        "dc:description",
+        "subtype",
+        "prism:doi",
+        "pubmed-id",
+        "authkeywords",
+        "prism:coverDate",
+        "prism:pageRange",
+        "prism:publicationName",
+        "prism:issn",
+        "prism:eIssn",
+        "prism:isbn",
+        "prism:volume",
+        "prism:issueIdentifier",
+        "source-id",
+        "affiliation",
+        "afid",
+        "affilname",
+        "author",
+        "authid",
+        "authname",
+        "given-name",
+        "surname",
+        "orcid",
+    ]
+
     @AbstractReferencesConverter.validate_reference
     async def convert(
         self, raw_data: XMLHarvesterRawResult, new_ref: Reference
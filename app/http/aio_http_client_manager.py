@@ -1,11 +1,12 @@
 import asyncio
 import gc
-from typing import Optional
+from typing import Iterable, Optional
 
 import aiohttp
 from loguru import logger
 
 from app.config import get_app_settings
+from app.monitoring.runtime_metrics import RuntimeMetrics
 
 
 class AioHttpClientManager:
@@ -19,6 +20,7 @@ class AioHttpClientManager:
     _usage_counter = 0
     _renew_threshold = 1000
     _grace_period = 300  # seconds
+    _middlewares: tuple = ()
 
     @classmethod
     async def get_session(cls) -> aiohttp.ClientSession:
@@ -73,6 +75,19 @@ class AioHttpClientManager:
 
             return cls._connector
 
+    @classmethod
+    async def set_middlewares(cls, middlewares: Iterable) -> None:
+        """
+        Set the client middlewares of the sessions, e.g. to redirect the requests
+        to local stand-ins of the upstream hosts. The current session is closed,
+        so that the next one is created with the middlewares.
+
+        :param middlewares: aiohttp client middlewares
+        :return: None
+        """
+        cls._middlewares = tuple(middlewares)
+        await cls.close()
+
     @classmethod
     async def _init(cls):
         settings = get_app_settings()
@@ -85,6 +100,12 @@ class AioHttpClientManager:
             connector=cls._connector,
             timeout=aiohttp.ClientTimeout(total=settings.http_client_timeout_total),
             trust_env=True,
+            middlewares=cls._middlewares,
+            trace_configs=(
+                [RuntimeMetrics.http_trace_config()]
+                if RuntimeMetrics.enabled()
+                else None
+            ),
         )
 
     @classmethod
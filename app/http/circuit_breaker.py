@@ -0,0 +1,165 @@
+import time
+from enum import Enum
+
+from loguru import logger
+
+from app.config import get_app_settings
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of an external endpoint.
+
+    After a number of consecutive failures, the circuit opens and requests
+    to the endpoint are refused without waiting for its timeout.
+    Once the recovery timeout has elapsed, the circuit becomes half-open
+    and lets a single trial request through : its success closes the circuit,
+    its failure opens it again.
+    """
+
+    class State(Enum):
+        """
+        States of a circuit breaker
+        """
+
+        CLOSED = "closed"
+        OPEN = "open"
+        HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float):
+        """
+        :param name: name of the endpoint
+        :param failure_threshold: consecutive failures before the circuit opens
+        :param recovery_timeout: seconds before an open circuit lets a trial request through
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+
+    @property
+    def state(self) -> State:
+        """
+        Current state of the circuit
+
+        :return: closed, open or half-open
+        """
+        if self._opened_at is None:
+            return self.State.CLOSED
+        if time.monotonic() - self._opened_at < self.recovery_timeout:
+            return self.State.OPEN
+        return self.State.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """
+        Whether a request may be sent to the endpoint.
+        A half-open circuit lets one trial request through per recovery timeout,
+        so that a trial that never reports back cannot block the circuit.
+
+        :return: True if the request may be sent
+        """
+        state = self.state
+        if state == self.State.CLOSED:
+            return True
+        if state == self.State.OPEN:
+            return False
+        now = time.monotonic()
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self.recovery_timeout
+        ):
+            return False
+        self._trial_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        """
+        Record a response of the endpoint, closing the circuit
+
+        :return: None
+        """
+        if self._opened_at is not None:
+            logger.info(f"Circuit breaker of {self.name} closed")
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """
+        Record a failure of the endpoint, opening the circuit
+        if the threshold is reached or if the trial request failed
+
+        :return: None
+        """
+        self.consecutive_failures += 1
+        if (
+            self._opened_at is not None
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self._opened_at is None:
+                logger.warning(
+                    f"Circuit breaker of {self.name} opened "
+                    f"after {self.consecutive_failures} consecutive failures"
+                )
+            self._opened_at = time.monotonic()
+            self._trial_started_at = None
+
+    def snapshot(self) -> dict:
+        """
+        State of the circuit, for monitoring
+
+        :return: state and number of consecutive failures
+        """
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide circuit breakers, by endpoint name
+    """
+
+    _breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def get(cls, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of an endpoint, creating it if needed
+
+        :param name: name of the endpoint
+        :return: the circuit breaker
+        """
+        breaker = cls._breakers.get(name)
+        if breaker is None:
+            settings = get_app_settings()
+            breaker = CircuitBreaker(
+                name=name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                recovery_timeout=settings.circuit_breaker_recovery_timeout,
+            )
+            cls._breakers[name] = breaker
+        return breaker
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict]:
+        """
+        States of all the circuit breakers, for monitoring
+
+        :return: states by endpoint name
+        """
+        return {
+            name: breaker.snapshot() for name, breaker in sorted(cls._breakers.items())
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forget all the circuit breakers
+
+        :return: None
+        """
+        cls._breakers.clear()
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Hashable
+from urllib.parse import urlparse
+
+from app.config import get_app_settings
+
+# flow the outgoing requests are queued for, e.g. the id of the retrieval sending them
+request_flow: ContextVar[Hashable] = ContextVar("request_flow", default=None)
+
+
+class HostQuota:  # pylint: disable=too-many-instance-attributes
+    """
+    Token bucket and concurrency quota of an upstream host.
+
+    Requests exceeding the quota wait in one queue per flow, and the queues
+    are served round robin : a flow sending thousands of requests
+    does not delay the requests of the other flows.
+    """
+
+    def __init__(self, host: str, concurrency: int, rate: float | None = None):
+        """
+        :param host: host name, for the logs and snapshots
+        :param concurrency: maximum number of simultaneous requests
+        :param rate: maximum number of requests per second, None for no limit,
+            with bursts of up to one second of requests
+        """
+        self.host = host
+        self.concurrency = concurrency
+        self.rate = rate
+        self.tokens = self._capacity()
+        self.in_flight = 0
+        self._refilled_at = time.monotonic()
+        self._waiting: OrderedDict[Hashable, deque[asyncio.Future]] = OrderedDict()
+        self._refill_timer: asyncio.TimerHandle | None = None
+
+    async def acquire(self, flow: Hashable = None) -> None:
+        """
+        Wait for the permission to send a request
+
+        :param flow: flow the request belongs to
+        :return: None
+        """
+        if not self._waiting and self._can_start():
+            self._start()
+            return
+        grant = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(flow, deque()).append(grant)
+        try:
+            await grant
+        except asyncio.CancelledError:
+            if grant.done() and not grant.cancelled():
+                # permission granted just before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Signal the end of a request, letting the next waiting request start
+
+        :return: None
+        """
+        self.in_flight -= 1
+        self._dispatch()
+
+    def snapshot(self) -> dict:
+        """
+        :return: number of requests running and waiting for the quota
+        """
+        return {
+            "in_flight": self.in_flight,
+            "waiting": sum(
+                not grant.done()
+                for grants in self._waiting.values()
+                for grant in grants
+            ),
+        }
+
+    def _capacity(self) -> float:
+        return max(1.0, self.rate) if self.rate else 0.0
+
+    def _can_start(self) -> bool:
+        if self.in_flight >= self.concurrency:
+            return False
+        if self.rate is None:
+            return True
+        self._refill()
+        return self.tokens >= 1
+
+    def _start(self) -> None:
+        self.in_flight += 1
+        if self.rate is not None:
+            self.tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self._capacity(), self.tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        while self._waiting and self._can_start():
+            flow, grants = next(iter(self._waiting.items()))
+            grant = grants.popleft()
+            if grants:
+                # next request of this flow after the requests of the other flows
+                self._waiting.move_to_end(flow)
+            else:
+                del self._waiting[flow]
+            if grant.done():
+                # cancelled while waiting
+                continue
+            self._start()
+            grant.set_result(None)
+        if (
+            self._waiting
+            and self.in_flight < self.concurrency
+            and self._refill_timer is None
+        ):
+            # out of tokens : try again when the next token is available
+            self._refill_timer = asyncio.get_running_loop().call_later(
+                (1 - self.tokens) / self.rate, self._on_refill
+            )
+
+    def _on_refill(self) -> None:
+        self._refill_timer = None
+        self._dispatch()
+
+
+class HostScheduler:
+    """
+    Process-wide scheduler of the requests sent to the upstream hosts,
+    with one quota per host (http_host_concurrency and http_host_rate settings,
+    overridden per host by http_host_quotas)
+    """
+
+    _quotas: dict[str, HostQuota] = {}
+
+    @classmethod
+    def quota(cls, host: str) -> HostQuota:
+        """
+        Get the quota of a host, creating it from the settings if needed
+
+        :param host: host name
+        :return: the quota of the host
+        """
+        if host not in cls._quotas:
+            settings = get_app_settings()
+            overrides = settings.http_host_quotas.get(host, {})
+            cls._quotas[host] = HostQuota(
+                host,
+                concurrency=overrides.get(
+                    "concurrency", settings.http_host_concurrency
+                ),
+                rate=overrides.get("rate", settings.http_host_rate),
+            )
+        return cls._quotas[host]
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls, url: str) -> AsyncIterator[None]:
+        """
+        Hold a slot of the quota of the host of an url during a request,
+        on behalf of the current request flow
+
+        :param url: url of the request, or base url of the endpoint
+        :return: None
+        """
+        quota = cls.quota(urlparse(url).netloc or url)
+        await quota.acquire(request_flow.get())
+        try:
+            yield
+        finally:
+            quota.release()
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict]:
+        """
+        :return: state of the quotas by host
+        """
+        return {host: quota.snapshot() for host, quota in sorted(cls._quotas.items())}
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forget all quotas
+
+        :return: None
+        """
+        cls._quotas.clear()
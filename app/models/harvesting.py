@@ -17,6 +17,7 @@ class Harvesting(BaseModel):
     state: str
     identifier_used_type: str | None = None
     identifier_used_value: str | None = None
+    timings: dict | None = None
 
     reference_events: List[ReferenceEvent] = []
     error: List[HarvestingError] | None
@@ -1,4 +1,5 @@
 import datetime
+from enum import Enum
 from typing import List, Tuple
 from pydantic import BaseModel
 
@@ -14,3 +15,12 @@ class ReferenceSummary(BaseModel):
     harvester: str
     source_identifier: str
     event_type: str
+    rank: float | None = None
+
+    class SearchMode(str, Enum):
+        """Text search modes of the references summary"""
+
+        # substring search on titles, entity names and identifiers
+        SUBSTRING = "substring"
+        # full-text search on titles, ordered by decreasing relevance
+        RANKED = "ranked"
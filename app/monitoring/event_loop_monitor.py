@@ -0,0 +1,220 @@
+import asyncio
+import math
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from datetime import datetime, timezone
+
+from loguru import logger
+
+from app.config import get_app_settings
+
+
+class EventLoopMonitor:  # pylint: disable=too-many-instance-attributes
+    """
+    Watchdog of the event loop, running in its own thread.
+
+    At each interval, it schedules a callback on the loop and measures the delay
+    before the callback runs : the loop lag. When the callback does not run
+    within the slow callback threshold, the loop is blocked by the code running
+    on it : its task, coroutine and stack are recorded while it is still blocking.
+
+    The creation time of the tasks created while the monitor runs is recorded,
+    to give the age of the live tasks.
+    """
+
+    # number of slow callbacks kept, the oldest are forgotten
+    MAX_SLOW_CALLBACKS = 50
+    # number of frames kept in the stacks of the slow callbacks
+    STACK_LIMIT = 30
+
+    _running: "EventLoopMonitor | None" = None
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float,
+        slow_callback_threshold: float,
+        window: int,
+    ):
+        """
+        :param loop: monitored event loop, running in the current thread
+        :param interval: seconds between two lag samples
+        :param slow_callback_threshold: seconds after which the loop is considered
+            blocked by the running callback
+        :param window: number of lag samples the percentiles are computed on
+        """
+        self.loop = loop
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.lags: deque[float] = deque(maxlen=window)
+        self.slow_callbacks: deque[dict] = deque(maxlen=self.MAX_SLOW_CALLBACKS)
+        self.slow_callbacks_count = 0
+        self.task_created_at: weakref.WeakKeyDictionary[asyncio.Task, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop_thread_id = threading.get_ident()
+        self._task_factory = self._create_task
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def start_monitoring(cls) -> "EventLoopMonitor | None":
+        """
+        Start monitoring the running event loop with the settings
+        (event_loop_lag_sample_interval, event_loop_slow_callback_threshold
+        and event_loop_lag_window), unless already started or disabled
+
+        :return: the monitor, None if disabled
+        """
+        settings = get_app_settings()
+        if cls._running is not None or not settings.event_loop_lag_sample_interval:
+            return cls._running
+        monitor = cls(
+            asyncio.get_running_loop(),
+            interval=settings.event_loop_lag_sample_interval,
+            slow_callback_threshold=settings.event_loop_slow_callback_threshold,
+            window=settings.event_loop_lag_window,
+        )
+        monitor.start()
+        cls._running = monitor
+        return monitor
+
+    @classmethod
+    def stop_monitoring(cls) -> None:
+        """
+        Stop the running monitor, if any
+
+        :return: None
+        """
+        if cls._running is not None:
+            cls._running.stop()
+            cls._running = None
+
+    @classmethod
+    def running(cls) -> "EventLoopMonitor | None":
+        """
+        :return: the running monitor, None if not started
+        """
+        return cls._running
+
+    def start(self) -> None:
+        """
+        Start the watchdog thread and record the creation time of the new tasks
+
+        :return: None
+        """
+        if self.loop.get_task_factory() is None:
+            self.loop.set_task_factory(self._task_factory)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="event_loop_monitor", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Event loop monitor started, sampling the lag every {self.interval}s"
+        )
+
+    def stop(self) -> None:
+        """
+        Stop the watchdog thread
+
+        :return: None
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.loop.get_task_factory() is self._task_factory:
+            self.loop.set_task_factory(None)
+
+    def snapshot(self) -> dict:
+        """
+        Percentiles of the loop lag over the window, in seconds,
+        and number of slow callbacks detected
+
+        :return: statistics of the loop lag
+        """
+        lags = sorted(self.lags)
+        return {
+            "samples": len(lags),
+            "p50": self._percentile(lags, 50),
+            "p95": self._percentile(lags, 95),
+            "p99": self._percentile(lags, 99),
+            "max": lags[-1] if lags else 0.0,
+            "slow_callbacks": self.slow_callbacks_count,
+            "slow_callback_threshold": self.slow_callback_threshold,
+        }
+
+    def _create_task(self, loop, coro, **kwargs) -> asyncio.Task:
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        self.task_created_at[task] = time.monotonic()
+        return task
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            ran = threading.Event()
+            ran_at: list[float] = []
+            scheduled_at = time.monotonic()
+            try:
+                self.loop.call_soon_threadsafe(self._acknowledge, ran, ran_at)
+            except RuntimeError:
+                # the loop is closed
+                return
+            slow_callback = None
+            if not ran.wait(self.slow_callback_threshold):
+                slow_callback = self._blocking_callback()
+                while not ran.wait(self.interval):
+                    if self._stopped.is_set() or self.loop.is_closed():
+                        return
+            lag = ran_at[0] - scheduled_at
+            self.lags.append(lag)
+            if slow_callback is not None:
+                self._record_slow_callback(slow_callback, lag)
+
+    @staticmethod
+    def _acknowledge(ran: threading.Event, ran_at: list[float]) -> None:
+        # run by the loop : the delay since it was scheduled is the loop lag
+        ran_at.append(time.monotonic())
+        ran.set()
+
+    def _blocking_callback(self) -> dict:
+        """
+        Identify the code blocking the loop while it is running
+
+        :return: task, coroutine and stack of the blocking code
+        """
+        task = asyncio.current_task(self.loop)
+        # pylint: disable=protected-access
+        frame = sys._current_frames().get(self._loop_thread_id)
+        return {
+            "detected_at": datetime.now(timezone.utc).isoformat(),
+            "task": None if task is None else task.get_name(),
+            "coroutine": (
+                None if task is None else getattr(task.get_coro(), "__qualname__", None)
+            ),
+            "stack": (
+                []
+                if frame is None
+                else traceback.format_stack(frame, limit=self.STACK_LIMIT)
+            ),
+        }
+
+    def _record_slow_callback(self, slow_callback: dict, duration: float) -> None:
+        slow_callback["duration"] = duration
+        self.slow_callbacks.append(slow_callback)
+        self.slow_callbacks_count += 1
+        location = slow_callback["stack"][-1].strip() if slow_callback["stack"] else ""
+        logger.warning(
+            f"Event loop blocked for {duration:.3f}s by {slow_callback['coroutine']}"
+            f" in task {slow_callback['task']} : {location}"
+        )
+
+    @staticmethod
+    def _percentile(ordered: list[float], rank: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
@@ -0,0 +1,122 @@
+"""
+Metrics computed at scrape time from the state of the pools and queues
+"""
+
+from sqlalchemy.pool import QueuePool
+
+from app.amqp.amqp_interface import AMQPInterface
+from app.config import get_app_settings
+from app.db.session import engine
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.runtime_metrics import Counter, Gauge, Metric
+from app.redis.redis_pool import RedisPool
+
+
+def database_pool() -> list[Metric]:
+    """
+    :return: connections of the database pool by state, none without pooling
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return []
+    connections = Gauge(
+        "svp_db_pool_connections",
+        "Connections of the database pool by state",
+        ("state",),
+    )
+    connections.set("checked_out", value=pool.checkedout())
+    connections.set("idle", value=pool.checkedin())
+    # the overflow counter starts at minus the pool size
+    connections.set("overflow", value=max(0, pool.overflow()))
+    size = Gauge("svp_db_pool_size", "Connections kept open by the database pool")
+    size.set(value=pool.size())
+    return [connections, size]
+
+
+def http_client() -> list[Metric]:
+    """
+    :return: connection limit of the shared aiohttp connector
+    """
+    limit = Gauge(
+        "svp_http_client_connection_limit",
+        "Maximum number of connections of the shared aiohttp connector",
+    )
+    limit.set(value=get_app_settings().http_client_limit)
+    return [limit]
+
+
+def redis_pool() -> list[Metric]:
+    """
+    :return: connections of the Redis pool by state, none if it is not used
+    """
+    usage = RedisPool.usage()
+    if usage is None:
+        return []
+    connections = Gauge(
+        "svp_redis_pool_connections",
+        "Connections of the Redis pool by state",
+        ("state",),
+    )
+    connections.set("in_use", value=usage["in_use"])
+    connections.set("idle", value=usage["idle"])
+    limit = Gauge(
+        "svp_redis_pool_max_connections", "Maximum connections of the Redis pool"
+    )
+    limit.set(value=usage["max"])
+    return [connections, limit]
+
+
+def event_loop() -> list[Metric]:
+    """
+    :return: lag percentiles of the event loop and number of slow callbacks,
+        none if the event loop monitor is disabled
+    """
+    monitor = EventLoopMonitor.running()
+    if monitor is None:
+        return []
+    snapshot = monitor.snapshot()
+    lag = Gauge(
+        "svp_event_loop_lag_seconds",
+        "Percentiles of the event loop lag over the last samples",
+        ("quantile",),
+    )
+    for quantile, percentile in (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99")):
+        lag.set(quantile, value=snapshot[percentile])
+    lag.set("1", value=snapshot["max"])
+    slow_callbacks = Counter(
+        "svp_event_loop_slow_callbacks_total",
+        "Callbacks detected blocking the event loop",
+    )
+    slow_callbacks.inc(value=snapshot["slow_callbacks"])
+    return [lag, slow_callbacks]
+
+
+def amqp_queues(amqp_interface: AMQPInterface | None) -> list[Metric]:
+    """
+    :param amqp_interface: AMQP interface of the process, None if AMQP is disabled
+    :return: depths of the inner task lanes and result queue, none if AMQP is disabled
+    """
+    if amqp_interface is None or amqp_interface.task_queue is None:
+        return []
+    depth = Gauge(
+        "svp_amqp_task_queue_depth",
+        "Messages waiting for a worker in each lane of the inner task queue",
+        ("lane",),
+    )
+    in_progress = Gauge(
+        "svp_amqp_tasks_in_progress",
+        "Messages processed by the workers in each lane",
+        ("lane",),
+    )
+    for lane, stats in amqp_interface.task_queue.snapshot().items():
+        depth.set(lane, value=stats["depth"])
+        in_progress.set(lane, value=stats["in_progress"])
+    metrics = [depth, in_progress]
+    if amqp_interface.result_queue is not None:
+        result_depth = Gauge(
+            "svp_amqp_result_queue_depth",
+            "Results waiting to be published to the AMQP exchange",
+        )
+        result_depth.set(value=amqp_interface.result_queue.qsize())
+        metrics.append(result_depth)
+    return metrics
@@ -0,0 +1,320 @@
+import bisect
+import math
+import time
+from types import SimpleNamespace
+from typing import Callable, Iterable, Iterator
+
+import aiohttp
+
+from app.config import get_app_settings
+
+# upper bounds of the buckets of the duration histograms, in seconds
+DURATION_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    """
+    Metric with labels, exposed in the Prometheus text format
+    """
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = ()):
+        """
+        :param name: name of the metric
+        :param documentation: help text of the metric
+        :param label_names: names of the labels, whose values are given
+            in the same order when the metric is updated
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: dict[tuple, float] = {}
+
+    def samples(self) -> Iterator[tuple[str, dict, float]]:
+        """
+        :return: suffixed name, labels and value of the samples of the metric
+        """
+        for label_values, value in sorted(self.values.items()):
+            yield self.name, dict(zip(self.label_names, label_values)), value
+
+    def reset(self) -> None:
+        """
+        Forget all the values of the metric
+
+        :return: None
+        """
+        self.values.clear()
+
+
+class Counter(Metric):
+    """
+    Value that only increases
+    """
+
+    TYPE = "counter"
+
+    def inc(self, *label_values: str, value: float = 1.0) -> None:
+        """
+        :param label_values: values of the labels
+        :param value: increment
+        :return: None
+        """
+        self.values[label_values] = self.values.get(label_values, 0.0) + value
+
+
+class Gauge(Counter):
+    """
+    Value that increases and decreases
+    """
+
+    TYPE = "gauge"
+
+    def set(self, *label_values: str, value: float) -> None:
+        """
+        :param label_values: values of the labels
+        :param value: new value
+        :return: None
+        """
+        self.values[label_values] = value
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in cumulative buckets
+    """
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple = (),
+        buckets: tuple = DURATION_BUCKETS,
+    ):
+        """
+        :param name: name of the metric
+        :param documentation: help text of the metric
+        :param label_names: names of the labels
+        :param buckets: upper bounds of the buckets, in increasing order
+        """
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        self.observations: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, *label_values: str, value: float) -> None:
+        """
+        :param label_values: values of the labels
+        :param value: observed value
+        :return: None
+        """
+        if label_values not in self.observations:
+            self.observations[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = self.observations[label_values]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def samples(self) -> Iterator[tuple[str, dict, float]]:
+        for label_values, (counts, total) in sorted(self.observations.items()):
+            labels = dict(zip(self.label_names, label_values))
+            cumulated = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulated += count
+                yield f"{self.name}_bucket", labels | {"le": _number(bound)}, cumulated
+            yield f"{self.name}_sum", labels, total[0]
+            yield f"{self.name}_count", labels, cumulated
+
+    def reset(self) -> None:
+        self.observations.clear()
+
+
+class RuntimeMetrics:
+    """
+    Process-wide registry of the runtime metrics, updated by the instrumented
+    components while they run and completed at scrape time by collectors.
+
+    The instrumentation does nothing but check the runtime_metrics_enabled setting
+    while the scraping is disabled.
+    """
+
+    HTTP_CLIENT_REQUEST_DURATION = Histogram(
+        "svp_http_client_request_duration_seconds",
+        "Duration of the requests sent to the upstream hosts,"
+        " until their response headers are received",
+        ("host",),
+    )
+    HTTP_CLIENT_REQUEST_ERRORS = Counter(
+        "svp_http_client_request_errors_total",
+        "Requests to the upstream hosts failed with an HTTP error status or an exception",
+        ("host", "error"),
+    )
+    HTTP_CLIENT_REQUESTS_IN_FLIGHT = Gauge(
+        "svp_http_client_requests_in_flight",
+        "Requests sent to the upstream hosts and waiting for their response headers",
+        ("host",),
+    )
+    HTTP_CLIENT_CONNECTION_WAIT = Histogram(
+        "svp_http_client_connection_wait_seconds",
+        "Time spent waiting for a free connection of the shared connector",
+    )
+    DB_POOL_WAIT = Histogram(
+        "svp_db_pool_wait_seconds",
+        "Time spent getting a connection of the database pool,"
+        " including the opening of a new connection when the pool is not full",
+    )
+    CACHE_LOOKUPS = Counter(
+        "svp_cache_lookups_total",
+        "Lookups of the third party API cache",
+        ("cache", "result"),
+    )
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        :return: True if the runtime metrics are collected
+        """
+        return get_app_settings().runtime_metrics_enabled
+
+    @classmethod
+    def metrics(cls) -> list[Metric]:
+        """
+        :return: the metrics updated by the instrumented components
+        """
+        return [
+            cls.HTTP_CLIENT_REQUEST_DURATION,
+            cls.HTTP_CLIENT_REQUEST_ERRORS,
+            cls.HTTP_CLIENT_REQUESTS_IN_FLIGHT,
+            cls.HTTP_CLIENT_CONNECTION_WAIT,
+            cls.DB_POOL_WAIT,
+            cls.CACHE_LOOKUPS,
+        ]
+
+    @classmethod
+    def render(cls, *collectors: Callable[[], Iterable[Metric]]) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format
+
+        :param collectors: functions computing metrics at scrape time, e.g. pool usages
+        :return: the metrics as text
+        """
+        metrics = cls.metrics()
+        for collector in collectors:
+            metrics.extend(collector())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forget the values of the metrics updated by the instrumented components
+
+        :return: None
+        """
+        for metric in cls.metrics():
+            metric.reset()
+
+    @classmethod
+    def count_cache_lookups(cls, cache: str, hits: int, misses: int) -> None:
+        """
+        Count the hits and misses of lookups of the third party API cache
+
+        :param cache: name of the cached API
+        :param hits: number of keys found in the cache
+        :param misses: number of keys not found in the cache
+        :return: None
+        """
+        if not cls.enabled():
+            return
+        if hits:
+            cls.CACHE_LOOKUPS.inc(cache, "hit", value=hits)
+        if misses:
+            cls.CACHE_LOOKUPS.inc(cache, "miss", value=misses)
+
+    @classmethod
+    def http_trace_config(cls) -> aiohttp.TraceConfig:
+        """
+        :return: aiohttp trace configuration measuring the requests
+            of the sessions created with it
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(cls._on_request_start)
+        trace_config.on_request_end.append(cls._on_request_end)
+        trace_config.on_request_exception.append(cls._on_request_exception)
+        trace_config.on_connection_queued_start.append(cls._on_connection_queued)
+        trace_config.on_connection_queued_end.append(cls._on_connection_dequeued)
+        return trace_config
+
+    @classmethod
+    async def _on_request_start(
+        cls, _, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+    ) -> None:
+        context.host = params.url.host
+        context.started_at = time.monotonic()
+        cls.HTTP_CLIENT_REQUESTS_IN_FLIGHT.inc(context.host)
+
+    @classmethod
+    async def _on_request_end(
+        cls, _, context: SimpleNamespace, params: aiohttp.TraceRequestEndParams
+    ) -> None:
+        cls._end_request(context)
+        if params.response.status >= 400:
+            cls.HTTP_CLIENT_REQUEST_ERRORS.inc(
+                context.host, str(params.response.status)
+            )
+
+    @classmethod
+    async def _on_request_exception(
+        cls, _, context: SimpleNamespace, params: aiohttp.TraceRequestExceptionParams
+    ) -> None:
+        cls._end_request(context)
+        cls.HTTP_CLIENT_REQUEST_ERRORS.inc(
+            context.host, type(params.exception).__name__
+        )
+
+    @classmethod
+    def _end_request(cls, context: SimpleNamespace) -> None:
+        cls.HTTP_CLIENT_REQUESTS_IN_FLIGHT.inc(context.host, value=-1)
+        cls.HTTP_CLIENT_REQUEST_DURATION.observe(
+            context.host, value=time.monotonic() - context.started_at
+        )
+
+    @staticmethod
+    async def _on_connection_queued(_, context: SimpleNamespace, __) -> None:
+        context.queued_at = time.monotonic()
+
+    @classmethod
+    async def _on_connection_dequeued(cls, _, context: SimpleNamespace, __) -> None:
+        cls.HTTP_CLIENT_CONNECTION_WAIT.observe(
+            value=time.monotonic() - context.queued_at
+        )
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{name}="{_escape_label_value(str(value))}"' for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(documentation: str) -> str:
+    return documentation.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
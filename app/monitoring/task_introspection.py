@@ -0,0 +1,60 @@
+import asyncio
+import time
+from types import FrameType
+from typing import Iterator
+
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+
+
+def live_tasks(name: str | None = None) -> list[dict]:
+    """
+    Describe the live tasks of the running event loop, the oldest first
+
+    :param name: only describe the tasks whose name contains it, if any
+    :return: name, coroutine, age in seconds (None if created before the event loop
+        monitor started) and await chain, from the outer coroutine
+        to the current await point, of the tasks
+    """
+    monitor = EventLoopMonitor.running()
+    now = time.monotonic()
+    tasks = []
+    for task in asyncio.all_tasks():
+        if name is not None and name not in task.get_name():
+            continue
+        created_at = None if monitor is None else monitor.task_created_at.get(task)
+        await_chain = [
+            f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            for frame in _await_chain_frames(task.get_coro())
+        ]
+        tasks.append(
+            {
+                "name": task.get_name(),
+                "coroutine": getattr(task.get_coro(), "__qualname__", None),
+                "age": None if created_at is None else now - created_at,
+                "await_point": await_chain[-1] if await_chain else None,
+                "await_chain": await_chain,
+            }
+        )
+    return sorted(tasks, key=lambda task: -(task["age"] or 0))
+
+
+def _await_chain_frames(awaitable) -> Iterator[FrameType]:
+    """
+    Follow the chain of the coroutines awaiting each other
+
+    :param awaitable: outer coroutine or generator of a task
+    :return: the suspended frames, from the outer one
+    """
+    while awaitable is not None:
+        frame = (
+            getattr(awaitable, "cr_frame", None)
+            or getattr(awaitable, "gi_frame", None)
+            or getattr(awaitable, "ag_frame", None)
+        )
+        if frame is not None:
+            yield frame
+        awaitable = (
+            getattr(awaitable, "cr_await", None)
+            or getattr(awaitable, "gi_yieldfrom", None)
+            or getattr(awaitable, "ag_await", None)
+        )
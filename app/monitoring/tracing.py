@@ -0,0 +1,460 @@
+import asyncio
+import functools
+import inspect
+import random
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from typing import Callable, Iterator
+
+import aiohttp
+from loguru import logger
+
+from app.config import get_app_settings
+
+
+class Span:  # pylint: disable=too-many-instance-attributes
+    """
+    Timed operation of a trace, child of the span that was current when it started
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_time_ns",
+        "duration",
+        "error",
+        "sampled",
+        "_started_at",
+        "_token",
+    )
+
+    def __init__(
+        self, name: str, parent: "Span | None", attributes: dict, sampled: bool = True
+    ):
+        """
+        :param name: name of the operation
+        :param parent: parent span, None for the root span of a trace
+        :param attributes: attributes of the operation, e.g. identifiers
+        :param sampled: False if the trace is not recorded
+        """
+        self.name = name
+        self.trace_id = random.getrandbits(128) if parent is None else parent.trace_id
+        self.span_id = random.getrandbits(64)
+        self.parent_id = None if parent is None else parent.span_id
+        self.attributes = attributes
+        # wall clock time only to place the span in time, durations are monotonic
+        self.start_time_ns = time.time_ns()
+        self.duration: float | None = None
+        self.error: str | None = None
+        self.sampled = sampled
+        self._started_at = time.monotonic()
+        self._token: Token | None = None
+
+    def to_dict(self) -> dict:
+        """
+        :return: json representation of the span, with hexadecimal identifiers
+        """
+        return {
+            "name": self.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_id": None if self.parent_id is None else f"{self.parent_id:016x}",
+            "attributes": self.attributes,
+            "start_time_ns": self.start_time_ns,
+            "duration": self.duration,
+            "error": self.error,
+        }
+
+
+class SpanExporter:
+    """
+    Destination of the finished spans
+    """
+
+    def export(self, span: Span) -> None:
+        """
+        Receive a finished span, without blocking
+
+        :param span: the finished span
+        :return: None
+        """
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """
+        Start the background work of the exporter, if any
+
+        :return: None
+        """
+
+    async def stop(self) -> None:
+        """
+        Flush the spans not exported yet and stop the background work, if any
+
+        :return: None
+        """
+
+
+class MemorySpanExporter(SpanExporter):
+    """
+    Ring buffer of the last finished spans, viewable in the admin GUI
+    """
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: number of spans kept, the oldest are forgotten
+        """
+        self.spans: deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def traces(self, limit: int = 50) -> list[list[tuple[int, Span]]]:
+        """
+        Group the kept spans by trace, with their depth in the trace
+
+        :param limit: maximum number of traces, the latest first
+        :return: spans of the traces with their depth, each followed by its children
+        """
+        children: dict[tuple[int, int | None], list[Span]] = {}
+        span_ids: dict[int, set[int]] = {}
+        for span in self.spans:
+            children.setdefault((span.trace_id, span.parent_id), []).append(span)
+            span_ids.setdefault(span.trace_id, set()).add(span.span_id)
+        roots = sorted(
+            (
+                span
+                for span in self.spans
+                # the parents of the spans may have been forgotten
+                if span.parent_id not in span_ids[span.trace_id]
+            ),
+            key=lambda span: span.start_time_ns,
+            reverse=True,
+        )
+        traces = []
+        for root in roots[:limit]:
+            trace = []
+            stack = [(0, root)]
+            while stack:
+                depth, span = stack.pop()
+                trace.append((depth, span))
+                stack.extend(
+                    (depth + 1, child)
+                    for child in sorted(
+                        children.get((span.trace_id, span.span_id), []),
+                        key=lambda child: child.start_time_ns,
+                        reverse=True,
+                    )
+                )
+            traces.append(trace)
+        return traces
+
+
+class OtlpSpanExporter(SpanExporter):
+    """
+    Exporter of the spans to an OpenTelemetry collector,
+    sent by batches with the OTLP/HTTP JSON encoding
+    """
+
+    def __init__(self, endpoint: str, interval: float, max_batch_size: int = 512):
+        """
+        :param endpoint: url of the traces endpoint of the collector
+        :param interval: seconds between two exports
+        :param max_batch_size: maximum number of spans waiting for the next export,
+            the next ones are dropped
+        """
+        self.endpoint = endpoint
+        self.interval = interval
+        self.max_batch_size = max_batch_size
+        self.batch: list[Span] = []
+        self.dropped = 0
+        self._task: asyncio.Task | None = None
+        # own session, to export the spans until the shared one is closed
+        self._session: aiohttp.ClientSession | None = None
+
+    def export(self, span: Span) -> None:
+        if len(self.batch) >= self.max_batch_size:
+            self.dropped += 1
+            return
+        self.batch.append(span)
+
+    async def start(self) -> None:
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.interval)
+        )
+        self._task = asyncio.create_task(
+            self._export_periodically(), name="otlp_span_exporter"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def flush(self) -> None:
+        """
+        Send the waiting spans to the collector
+
+        :return: None
+        """
+        if not self.batch or self._session is None:
+            return
+        spans, self.batch = self.batch, []
+        try:
+            async with self._session.post(
+                self.endpoint, json=self.payload(spans)
+            ) as resp:
+                if resp.status >= 400:
+                    logger.warning(
+                        f"OTLP collector refused {len(spans)} spans: {resp.status}"
+                    )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                f"Cannot export {len(spans)} spans to {self.endpoint}: {error}"
+            )
+
+    @staticmethod
+    def payload(spans: list[Span]) -> dict:
+        """
+        :param spans: finished spans
+        :return: OTLP JSON encoding of the spans
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": "svp-harvester"},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app.monitoring.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": f"{span.trace_id:032x}",
+                                    "spanId": f"{span.span_id:016x}",
+                                    "parentSpanId": (
+                                        ""
+                                        if span.parent_id is None
+                                        else f"{span.parent_id:016x}"
+                                    ),
+                                    "name": span.name,
+                                    # internal
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(span.start_time_ns),
+                                    "endTimeUnixNano": str(
+                                        span.start_time_ns + int(span.duration * 1e9)
+                                    ),
+                                    "attributes": [
+                                        {
+                                            "key": key,
+                                            "value": {"stringValue": str(value)},
+                                        }
+                                        for key, value in span.attributes.items()
+                                    ],
+                                    # error or unset
+                                    "status": (
+                                        {"code": 2, "message": span.error}
+                                        if span.error
+                                        else {}
+                                    ),
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    async def _export_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+
+# span of the operation run by the current task
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+# returned instead of a span while the tracing is disabled
+_NO_SPAN = nullcontext()
+
+
+class Tracer:
+    """
+    Process-wide recorder of the spans, disabled unless configured :
+    a disabled span costs a single check of Tracer.enabled.
+
+    The spans started in a task are children of the span current
+    when the task was created, e.g. retrieval, harvesting, reference, dereferencing.
+    Whether a trace is recorded is decided once, when its root span starts.
+    """
+
+    enabled: bool = False
+    sample_rate: float = 1.0
+    exporter: SpanExporter | None = None
+
+    @classmethod
+    def configure(cls, exporter: SpanExporter | None, sample_rate: float = 1.0) -> None:
+        """
+        Enable the spans, or disable them without exporter
+
+        :param exporter: destination of the finished spans, None to disable the spans
+        :param sample_rate: proportion of the traces recorded
+        :return: None
+        """
+        cls.exporter = exporter
+        cls.sample_rate = sample_rate
+        cls.enabled = exporter is not None
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Configure the spans from the tracing_* settings and start their exporter
+
+        :return: None
+        """
+        settings = get_app_settings()
+        if not settings.tracing_enabled:
+            cls.configure(None)
+            return
+        if settings.tracing_exporter == "otlp":
+            exporter = OtlpSpanExporter(
+                settings.tracing_otlp_endpoint, settings.tracing_otlp_export_interval
+            )
+        else:
+            exporter = MemorySpanExporter(settings.tracing_memory_capacity)
+        cls.configure(exporter, settings.tracing_sample_rate)
+        await exporter.start()
+        logger.info(
+            f"Tracing enabled with the {settings.tracing_exporter} exporter, "
+            f"sampling {settings.tracing_sample_rate:.0%} of the traces"
+        )
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        Stop the exporter, flushing the spans not exported yet
+
+        :return: None
+        """
+        exporter = cls.exporter
+        cls.configure(None)
+        if exporter is not None:
+            await exporter.stop()
+
+    @classmethod
+    def start_span(cls, name: str, **attributes) -> Span | None:
+        """
+        Start a span and make it the current one, to be ended with end_span
+
+        :param name: name of the operation
+        :param attributes: attributes of the operation
+        :return: the span, None if disabled or in a trace not sampled
+        """
+        if not cls.enabled:
+            return None
+        parent = _current_span.get()
+        if parent is None:
+            # the children of the root span follow its sampling decision
+            sampled = random.random() < cls.sample_rate
+            span = Span(name, None, attributes, sampled=sampled)
+        elif not parent.sampled:
+            return None
+        else:
+            span = Span(name, parent, attributes)
+        span._token = _current_span.set(span)  # pylint: disable=protected-access
+        return span
+
+    @classmethod
+    def end_span(cls, span: Span | None, error: BaseException | None = None) -> None:
+        """
+        End a span started with start_span, making its parent the current span again
+
+        :param span: the span, None if not recorded
+        :param error: exception raised by the operation, if any
+        :return: None
+        """
+        if span is None:
+            return
+        # pylint: disable=protected-access
+        span.duration = time.monotonic() - span._started_at
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        _current_span.reset(span._token)
+        if span.sampled and cls.exporter is not None:
+            cls.exporter.export(span)
+
+    @classmethod
+    def span(cls, name: str, **attributes):
+        """
+        Context manager recording the block in a span
+
+        :param name: name of the operation
+        :param attributes: attributes of the operation
+        :return: the context manager, yielding the span or None if not recorded
+        """
+        if not cls.enabled:
+            return _NO_SPAN
+        return cls._recorded_span(name, attributes)
+
+    @classmethod
+    @contextmanager
+    def _recorded_span(cls, name: str, attributes: dict) -> Iterator[Span | None]:
+        span = cls.start_span(name, **attributes)
+        try:
+            yield span
+        except BaseException as error:
+            cls.end_span(span, error)
+            raise
+        cls.end_span(span)
+
+
+def traced(name: str | None = None) -> Callable:
+    """
+    Decorator recording each call of a function or coroutine function in a span
+
+    :param name: name of the span, the qualified name of the function by default
+    :return: the decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+        if inspect.isasyncgenfunction(function):
+            # the span would end before the first item is produced
+            raise TypeError(f"Cannot trace the async generator {span_name}")
+
+        if asyncio.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not Tracer.enabled:
+                    return await function(*args, **kwargs)
+                with Tracer.span(span_name):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def sync_wrapper(*args, **kwargs):
+            if not Tracer.enabled:
+                return function(*args, **kwargs)
+            with Tracer.span(span_name):
+                return function(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
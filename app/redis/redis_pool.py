@@ -44,6 +44,23 @@ class RedisPool:
                 decode_responses=False,
             )
 
+    @classmethod
+    def usage(cls) -> dict | None:
+        """
+        Get the usage of the connections of the pool
+        :return: number of connections in use, idle and maximum,
+            None if the pool has not been instantiated
+        """
+        if cls._instance is None:
+            return None
+        pool = cls._instance.pool
+        # pylint: disable=protected-access
+        return {
+            "in_use": len(pool._in_use_connections),
+            "idle": len(pool._available_connections),
+            "max": pool.max_connections,
+        }
+
     def get_connection(self) -> redis.Redis:
         """
         Get a Redis connection from the pool.
@@ -0,0 +1,63 @@
+from app.services.cache.third_api_cache import ThirdApiCache
+from app.services.errors.dereferencing_error import DereferencingError
+
+
+class DereferencingNegativeCache:
+    """
+    Short-lived memory of the concepts and organizations whose dereferencing
+    returned 404 or 410, so that known missing resources are not requested
+    again until the entry expires (dereferencing_negative_caching_duration)
+    """
+
+    API_NAME = "dereferencing_negative"
+
+    NEGATIVE_STATUSES = (404, 410)
+
+    @staticmethod
+    async def get(key: str) -> DereferencingError | None:
+        """
+        Get the error of a resource known to be missing
+
+        :param key: key of the resource, e.g. its URI
+        :return: an error to raise if the resource is known to be missing, None otherwise
+        """
+        cached = await ThirdApiCache.get(DereferencingNegativeCache.API_NAME, key)
+        return DereferencingNegativeCache._error(cached)
+
+    @staticmethod
+    async def get_many(keys: list[str]) -> dict[str, DereferencingError]:
+        """
+        Get the errors of the resources known to be missing in a single round trip
+
+        :param keys: keys of the resources
+        :return: errors to raise by key, for the resources known to be missing
+        """
+        cached = await ThirdApiCache.get_many(DereferencingNegativeCache.API_NAME, keys)
+        return {
+            key: DereferencingNegativeCache._error(value)
+            for key, value in cached.items()
+        }
+
+    @staticmethod
+    async def remember(key: str, error: BaseException) -> None:
+        """
+        Remember a resource as missing if its dereferencing returned 404 or 410
+
+        :param key: key of the resource, e.g. its URI
+        :param error: error raised while dereferencing the resource
+        :return: None
+        """
+        if (
+            isinstance(error, DereferencingError)
+            and error.status in DereferencingNegativeCache.NEGATIVE_STATUSES
+        ):
+            await ThirdApiCache.set(
+                DereferencingNegativeCache.API_NAME, key, (error.status, str(error))
+            )
+
+    @staticmethod
+    def _error(cached: tuple[int, str] | None) -> DereferencingError | None:
+        if cached is None:
+            return None
+        status, message = cached
+        return DereferencingError(f"Known missing resource: {message}", status=status)
@@ -4,6 +4,7 @@ from typing import Any
 from loguru import logger
 
 from app.config import get_app_settings
+from app.monitoring.runtime_metrics import RuntimeMetrics
 
 # from app.redis.fake_redis_pool import FakeRedisPool as RedisPool
 from app.redis.redis_pool import RedisPool
@@ -29,18 +30,48 @@ class ThirdApiCache:
         try:
             async with RedisPool().get_connection() as conn:
                 value = await conn.get(name=f"{api_name}:{key}")
+                RuntimeMetrics.count_cache_lookups(
+                    api_name, hits=int(bool(value)), misses=int(not value)
+                )
                 if value:
-                    try:
-                        return pickle.loads(value)
-                    except pickle.UnpicklingError:
-                        logger.error(
-                            f"Cannot unpickle value from Redis for {api_name}:{key}"
-                        )
-                        return None
+                    return ThirdApiCache._unpickle(api_name, key, value)
         except ConnectionError as e:
             logger.error(f"Cannot connect to Redis for {api_name}:{key}: {e}")
             return None
 
+    @staticmethod
+    async def get_many(api_name: str, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values from the cache in a single round trip (MGET)
+
+        :param api_name: name of the API, used as a prefix for the keys
+        :param keys: keys to retrieve the values from the cache
+        :return: unmarshalled values found in the cache by key,
+            keys not found in the cache are absent
+        """
+        settings = get_app_settings()
+        keys = list(dict.fromkeys(keys))
+        if not settings.third_api_caching_enabled or not keys:
+            return {}
+        try:
+            async with RedisPool().get_connection() as conn:
+                values = await conn.mget([f"{api_name}:{key}" for key in keys])
+        except ConnectionError as e:
+            logger.error(
+                f"Cannot connect to Redis for {len(keys)} {api_name} keys: {e}"
+            )
+            return {}
+        found = {}
+        for key, value in zip(keys, values):
+            if value:
+                unpickled_value = ThirdApiCache._unpickle(api_name, key, value)
+                if unpickled_value is not None:
+                    found[key] = unpickled_value
+        RuntimeMetrics.count_cache_lookups(
+            api_name, hits=len(found), misses=len(keys) - len(found)
+        )
+        return found
+
     @staticmethod
     async def set(api_name: str, key: str, value: Any) -> None:
         """
@@ -55,23 +86,44 @@ class ThirdApiCache:
         settings = get_app_settings()
         if not settings.third_api_caching_enabled:
             return
+        expiration_time = ThirdApiCache._expiration_time(api_name)
+        serialized_value = ThirdApiCache._pickle(api_name, key, value)
+        if serialized_value is None:
+            return
+
         try:
-            expiration_time = getattr(settings, f"{api_name}_caching_duration")
+            async with RedisPool().get_connection() as conn:
+                await conn.set(
+                    name=f"{api_name}:{key}", value=serialized_value, ex=expiration_time
+                )
+        except ConnectionError as e:
+            logger.error(f"Cannot connect to Redis for {api_name}:{key}: {e}")
+
+    @staticmethod
+    def _expiration_time(api_name: str) -> int:
+        settings = get_app_settings()
+        try:
+            return getattr(settings, f"{api_name}_caching_duration")
         except AttributeError:
             logger.error(
                 f"Cannot find caching duration for {api_name}, will use default value.\n"
                 f"Please set {api_name}_caching_duration in settings or "
                 f"{api_name.upper()}_CACHING_DURATION in env vars."
             )
-            expiration_time = settings.third_api_default_caching_duration
+            return settings.third_api_default_caching_duration
 
+    @staticmethod
+    def _pickle(api_name: str, key: str, value: Any) -> bytes | None:
         try:
-            serialized_value = pickle.dumps(value)
+            return pickle.dumps(value)
         except pickle.PicklingError:
             logger.error(f"Cannot pickle value for Redis cache {api_name}:{key}")
-            return
+            return None
 
-        async with RedisPool().get_connection() as conn:
-            await conn.set(
-                name=f"{api_name}:{key}", value=serialized_value, ex=expiration_time
-            )
+    @staticmethod
+    def _unpickle(api_name: str, key: str, value: bytes) -> Any:
+        try:
+            return pickle.loads(value)
+        except pickle.UnpicklingError:
+            logger.error(f"Cannot unpickle value from Redis for {api_name}:{key}")
+            return None
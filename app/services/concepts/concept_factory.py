@@ -3,6 +3,7 @@ from datetime import datetime
 
 from app.config import get_app_settings
 from app.db.models.concept import Concept as DbConcept
+from app.services.cache.dereferencing_negative_cache import DereferencingNegativeCache
 from app.services.concepts.abes_concept_solver import AbesConceptSolver
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.concept_solver import ConceptSolver
@@ -40,6 +41,10 @@ class ConceptFactory:
     async def solve(concept_informations: ConceptInformations) -> DbConcept:
         """
         Solves a concept from a concept id and an optional source
+
+        Concepts whose URI recently returned 404 or 410 are not requested again
+        until the negative cache entry expires.
+
         :param concept_informations: concept informations
         :return:
         """
@@ -50,8 +55,18 @@ class ConceptFactory:
         solver: ConceptSolver = ConceptFactory._create_solver(
             concept_informations.source
         )
+        uri = concept_informations.uri
+        if uri is not None and not isinstance(solver, DummyConceptSolver):
+            known_missing = await DereferencingNegativeCache.get(uri)
+            if known_missing is not None:
+                raise known_missing
         # solve the concept
-        concept = await solver.solve(concept_informations)
+        try:
+            concept = await solver.solve(concept_informations)
+        except DereferencingError as error:
+            if uri is not None:
+                await DereferencingNegativeCache.remember(uri, error)
+            raise
         if not concept.labels:
             raise DereferencingError(
                 f"Dereferencing returned no labels for concept {concept_informations.uri}"
@@ -110,6 +125,20 @@ class ConceptFactory:
                 concept_informations.code or concept_informations.label
             )
 
+    @classmethod
+    def uri_patterns(cls) -> dict[ConceptInformations.ConceptSources, re.Pattern]:
+        """
+        Uri patterns used to infer the source of a concept
+
+        :return: uri pattern by concept source
+        """
+        return {
+            ConceptInformations.ConceptSources.IDREF: cls._idref_pattern(),
+            ConceptInformations.ConceptSources.WIKIDATA: cls._wikidata_pattern(),
+            ConceptInformations.ConceptSources.JEL: cls._jel_pattern(),
+            ConceptInformations.ConceptSources.ABES: cls._abes_pattern(),
+        }
+
     @classmethod
     def _idref_pattern(cls):
         return re.compile(r"^https?://www\.idref\.fr")
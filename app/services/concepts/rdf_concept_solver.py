@@ -8,13 +8,14 @@ from rdflib.term import Node
 
 from app.db.models.concept import Concept as DbConcept
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
+from app.monitoring.tracing import traced
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.concept_solver import ConceptSolver
 from app.services.errors.dereferencing_error import (
     handle_concept_dereferencing_error,
     DereferencingError,
 )
-from app.utilities.execution_timer_wrapper import execution_timer
 
 
 class RdfConceptSolver(ConceptSolver, ABC):
@@ -23,7 +24,7 @@ class RdfConceptSolver(ConceptSolver, ABC):
     """
 
     # pylint: disable=duplicate-code
-    @execution_timer
+    @traced()
     @handle_concept_dereferencing_error
     async def solve(self, concept_informations: ConceptInformations) -> DbConcept:
         """
@@ -34,7 +35,7 @@ class RdfConceptSolver(ConceptSolver, ABC):
         session = await AioHttpClientManager.get_session()
         request_timeout = ClientTimeout(total=float(self.timeout))
 
-        async with session.get(
+        async with HostScheduler.slot(concept_informations.url), session.get(
             concept_informations.url, timeout=request_timeout
         ) as response:
             if not 200 <= response.status < 300:
@@ -42,7 +43,8 @@ class RdfConceptSolver(ConceptSolver, ABC):
                 raise DereferencingError(
                     f"Endpoint returned status {response.status}"
                     f" while dereferencing RDF concept {concept_informations.uri}"
-                    f" at url {concept_informations.url}"
+                    f" at url {concept_informations.url}",
+                    status=response.status,
                 )
 
             xml = (await response.text()).strip()
@@ -6,6 +6,7 @@ from rdflib import Literal
 from app.config import get_app_settings
 from app.db.models.concept import Concept as DbConcept
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.jel_concept_solver import JelConceptSolver
 from app.services.errors.dereferencing_error import DereferencingError
@@ -51,7 +52,8 @@ class SparqlJelConceptSolver(JelConceptSolver):
         query = self.QUERY_TEMPLATE.replace("URI", concept_informations.uri)
         client: SPARQLClient = await self._get_client()
         try:
-            sparql_response = await client.query(query)
+            async with HostScheduler.slot(get_app_settings().svp_jel_proxy_url):
+                sparql_response = await client.query(query)
             concept = DbConcept(uri=concept_informations.uri)
             labels = sparql_response["results"]["bindings"]
             pref_labels = [
@@ -8,6 +8,7 @@ from rdflib import Literal
 from app.db.models.concept import Concept as DbConcept
 from app.db.models.label import Label as DbLabel
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.concepts.concept_solver import ConceptSolver
 from app.services.errors.dereferencing_error import (
@@ -37,7 +38,7 @@ class WikidataConceptSolver(ConceptSolver):
             "Accept": "application/json",
         }
 
-        async with session.get(
+        async with HostScheduler.slot(concept_informations.url), session.get(
             concept_informations.url, timeout=request_timeout, headers=headers
         ) as response:
             if not 200 <= response.status < 300:
@@ -46,7 +47,8 @@ class WikidataConceptSolver(ConceptSolver):
                     f"Endpoint returned status {response.status} "
                     f"while dereferencing Wikidata concept "
                     f"{concept_informations.uri} "
-                    f"from url {concept_informations.url}"
+                    f"from url {concept_informations.url}",
+                    status=response.status,
                 )
             json_response = await response.json()
 
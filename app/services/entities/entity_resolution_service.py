@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Iterable, List, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -40,6 +40,84 @@ class EntityResolutionService:
         matching_entities = await identifier_dao.get_entities_by_identifiers(
             submitted_identifiers
         )
+        elected_entity = self._elect(matching_entities)
+        # if the list is empty, the entity does not exist yet
+        if elected_entity is None:
+            return None
+        # if the safe mode is enabled, don't update the identifiers
+        if identifiers_safe_mode:
+            return elected_entity
+        await self._update_elected_entity(
+            entity_dao, elected_entity, entity_to_resolve, nullify
+        )
+        return elected_entity
+
+    async def resolve_many(
+        self,
+        entities_to_resolve: List[DbEntity],
+        nullify: list[str] = None,
+        identifiers_safe_mode: bool = False,
+    ) -> List[DbEntity]:
+        """
+        Resolve several submitted entities, looking up the identifiers
+        of all of them with a single query.
+        Entities that do not exist yet are added to the session,
+        submitted entities sharing an identifier are resolved to the same entity.
+
+        :param entities_to_resolve: entities to resolve (non registered to database)
+        :param nullify: list of identifiers to set to null
+        :param identifiers_safe_mode: if True, do not update identifiers nor
+               update identifiers of existing entities
+        :return: resolved entities, in the same order as the submitted ones
+        """
+        entity_dao = EntityDAO(self.db_session)
+        entities_by_identifier = await IdentifierDAO(
+            self.db_session
+        ).get_entities_by_types_and_values(
+            [
+                (identifier.type, identifier.value)
+                for entity in entities_to_resolve
+                for identifier in entity.identifiers
+            ]
+        )
+        resolved_entities = []
+        for entity_to_resolve in entities_to_resolve:
+            # dont use db entities in loop as some of them will be modified
+            identifiers_type_and_values = [
+                (identifier.type, identifier.value)
+                for identifier in entity_to_resolve.identifiers
+            ]
+            elected_entity = self._elect(
+                {
+                    id(entity): entity
+                    for entity in (
+                        entities_by_identifier.get(type_and_value)
+                        for type_and_value in identifiers_type_and_values
+                    )
+                    if entity is not None
+                }.values()
+            )
+            if elected_entity is None:
+                elected_entity = entity_to_resolve
+                self.db_session.add(elected_entity)
+            elif not identifiers_safe_mode:
+                await self._update_elected_entity(
+                    entity_dao, elected_entity, entity_to_resolve, nullify
+                )
+            for type_and_value in identifiers_type_and_values:
+                entities_by_identifier[type_and_value] = elected_entity
+            resolved_entities.append(elected_entity)
+        return resolved_entities
+
+    @staticmethod
+    def _elect(matching_entities: Iterable[DbEntity]) -> DbEntity | None:
+        """
+        Elect the entity of the highest priority identifier among matching entities
+
+        :param matching_entities: existing entities sharing identifiers
+            with a submitted entity
+        :return: the elected entity, or None if there is no matching entity
+        """
         # order the list of existing entities
         # by the priority of the identifier that matches
         # one of the identifiers of the entity we want to resolve
@@ -52,27 +130,29 @@ class EntityResolutionService:
                 if settings.identifiers[i].get("key") == e.identifiers[0].type
             ),
         )
-        # if the list is empty, the entity does not exist yet
-        if not matching_entities:
-            return None
-        # if the list is not empty, the entity exists
         # the elected entity is the first one in the list
         # (the one with the highest priority identifier)
-        elected_entity: DbEntity = matching_entities[0]
-        # if the safe mode is enabled, don't update the identifiers
-        if identifiers_safe_mode:
-            return elected_entity
+        return matching_entities[0] if matching_entities else None
+
+    async def _update_elected_entity(
+        self,
+        entity_dao: EntityDAO,
+        elected_entity: DbEntity,
+        entity_to_resolve: DbEntity,
+        nullify: list[str] = None,
+    ) -> None:
         self._remove_nullified_identifiers(elected_entity, nullify)
         # override the name of the elected entity with the name of the entity to resolve
         elected_entity.name = entity_to_resolve.name
 
         # dont use db entities in loop as some of them will be deleted and the loop will break
-        identifiers_type_and_values = [(i.type, i.value) for i in submitted_identifiers]
+        identifiers_type_and_values = [
+            (i.type, i.value) for i in entity_to_resolve.identifiers
+        ]
         for identifier_type, identifier_value in identifiers_type_and_values:
             await entity_dao.take_or_create_identifier(
                 elected_entity, identifier_type, identifier_value
             )
-        return elected_entity
 
     @staticmethod
     def _remove_nullified_identifiers(existing_entity, nullify):
@@ -0,0 +1,128 @@
+from typing import Any, Union
+
+from app.db.models.entity import Entity as DbEntity
+
+
+class EntitySnapshot:
+    """
+    Read-only view of the entity (person, organization, etc.) of a retrieval,
+    detached from any database session.
+
+    It is loaded once per retrieval and shared by the harvesters
+    and the AMQP message factories. Snapshots of the running retrievals
+    are cached by entity id so that event publishing does not reload the entity.
+    """
+
+    __slots__ = ("id", "class_name", "name", "identifiers")
+
+    id: int
+    class_name: str
+    name: str | None
+    identifiers: tuple[tuple[str, str], ...]
+
+    # snapshots of the entities of the running retrievals, with the number of
+    # retrievals using each of them
+    _cache: dict[int, tuple["EntitySnapshot", int]] = {}
+
+    def __init__(
+        self,
+        entity_id: int,
+        class_name: str,
+        name: str | None,
+        identifiers: tuple[tuple[str, str], ...],
+    ):
+        object.__setattr__(self, "id", entity_id)
+        object.__setattr__(self, "class_name", class_name)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "identifiers", identifiers)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __repr__(self):
+        return f"<EntitySnapshot {self.class_name} id={self.id} name={self.name}>"
+
+    @classmethod
+    def of(cls, entity: Union[DbEntity, "EntitySnapshot"]) -> "EntitySnapshot":
+        """
+        Build a snapshot from an entity loaded from the database
+
+        :param entity: the entity or an already built snapshot
+        :return: the snapshot of the entity
+        """
+        if isinstance(entity, EntitySnapshot):
+            return entity
+        return cls(
+            entity_id=entity.id,
+            class_name=entity.__class__.__name__,
+            name=entity.name,
+            identifiers=tuple(
+                (identifier.type, identifier.value) for identifier in entity.identifiers
+            ),
+        )
+
+    def get_identifier(self, identifier_type: str) -> str | None:
+        """
+        Get identifier value for a given type
+
+        :param identifier_type: type of the identifier
+        :return: the identifier value or None if not found
+        """
+        for snapshot_identifier_type, identifier_value in self.identifiers:
+            if snapshot_identifier_type == identifier_type:
+                return identifier_value
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Representation of the entity for AMQP messages,
+        identical to the one of the Entity pydantic model without id
+
+        :return: entity name and identifiers
+        """
+        return {
+            "identifiers": [
+                {"type": identifier_type, "value": identifier_value}
+                for identifier_type, identifier_value in self.identifiers
+            ],
+            "name": self.name,
+        }
+
+    @classmethod
+    def retain(cls, snapshot: "EntitySnapshot") -> None:
+        """
+        Cache a snapshot for the duration of a retrieval
+
+        :param snapshot: the snapshot of the entity of the retrieval
+        :return: None
+        """
+        _, users = cls._cache.get(snapshot.id, (None, 0))
+        cls._cache[snapshot.id] = (snapshot, users + 1)
+
+    @classmethod
+    def release(cls, entity_id: int) -> None:
+        """
+        Release a snapshot at the end of a retrieval,
+        removing it from the cache if no other retrieval uses it
+
+        :param entity_id: id of the entity
+        :return: None
+        """
+        snapshot, users = cls._cache.get(entity_id, (None, 0))
+        if users <= 1:
+            cls._cache.pop(entity_id, None)
+        else:
+            cls._cache[entity_id] = (snapshot, users - 1)
+
+    @classmethod
+    def cached(cls, entity_id: int | None) -> "EntitySnapshot | None":
+        """
+        Get the cached snapshot of an entity
+
+        :param entity_id: id of the entity
+        :return: the snapshot or None if no running retrieval uses the entity
+        """
+        if entity_id is None:
+            return None
+        snapshot, _ = cls._cache.get(entity_id, (None, 0))
+        return snapshot
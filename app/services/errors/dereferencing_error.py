@@ -10,9 +10,15 @@ class DereferencingError(Exception):
     URI due to an external endpoint failure.
     """
 
-    def __init__(self, message: str) -> None:
-        """Initialize the exception."""
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """
+        Initialize the exception.
+
+        :param message: error message
+        :param status: HTTP status returned by the endpoint, if any
+        """
         super().__init__(message)
+        self.status = status
 
 
 def handle_concept_dereferencing_error(func):
@@ -29,7 +35,8 @@ def handle_concept_dereferencing_error(func):
         except aiohttp.ClientResponseError as e:
             raise DereferencingError(
                 f"HTTP error {e.status} while dereferencing "
-                f"{kwargs.get('concept_informations') or args[1]}"
+                f"{kwargs.get('concept_informations') or args[1]}",
+                status=e.status,
             ) from e
         except aiohttp.ClientConnectionError as e:
             raise DereferencingError(
@@ -54,7 +61,8 @@ def handle_concept_dereferencing_error(func):
         except Exception as e:
             raise DereferencingError(
                 f"Unexpected error while dereferencing "
-                f"{kwargs.get('concept_informations') or args[1]}: {str(e)}"
+                f"{kwargs.get('concept_informations') or args[1]}: {str(e)}",
+                status=getattr(e, "status", None),
             ) from e
 
     return wrapper
@@ -76,7 +84,8 @@ def handle_organization_dereferencing_error(platform: str):
             except aiohttp.ClientResponseError as e:
                 raise DereferencingError(
                     f"HTTP error {e.status} while dereferencing organization identifier "
-                    f"from {platform}: {org_info}"
+                    f"from {platform}: {org_info}",
+                    status=e.status,
                 ) from e
             except aiohttp.ClientConnectionError as e:
                 raise DereferencingError(
@@ -101,7 +110,8 @@ def handle_organization_dereferencing_error(platform: str):
             except Exception as e:
                 raise DereferencingError(
                     "Unexpected error while dereferencing organization identifier "
-                    f"from {platform}: {org_info}: {str(e)}"
+                    f"from {platform}: {org_info}: {str(e)}",
+                    status=getattr(e, "status", None),
                 ) from e
 
         return wrapper
@@ -1,5 +1,6 @@
-from rdflib import Graph
 import rdflib
+
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult
 from app.services.hash.asbtract_hash_generator import AbstractHashGenerator
 from app.services.hash.hash_key import HashKey
@@ -14,7 +15,7 @@ class RdfHashGenerator(AbstractHashGenerator):
         self, raw_data: RdfHarvesterRawResult, hash_keys: list[HashKey]
     ) -> str:
         uri: str = raw_data.source_identifier
-        pub_graph: Graph = raw_data.payload
+        pub_graph: RdfTripleIndex = raw_data.payload
         hash_string = ""
         for predicate in hash_keys:
             objects = self._get_objects(pub_graph, uri, predicate.value)
@@ -25,5 +26,5 @@ class RdfHashGenerator(AbstractHashGenerator):
 
         return str(hash_string)
 
-    def _get_objects(self, pub_graph: Graph, uri: str, predicate):
+    def _get_objects(self, pub_graph: RdfTripleIndex, uri: str, predicate):
         return pub_graph.objects(rdflib.term.URIRef(uri), predicate)
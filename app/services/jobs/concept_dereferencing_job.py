@@ -1,6 +1,13 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta
+
 from loguru import logger
 
+from app.config import get_app_settings
 from app.db.daos.concept_dao import ConceptDAO
+from app.db.daos.job_checkpoint_dao import JobCheckpointDAO
+from app.db.models.concept import Concept
 from app.db.session import async_session
 from app.services.concepts.concept_factory import ConceptFactory
 from app.services.concepts.concept_informations import ConceptInformations
@@ -11,35 +18,131 @@ from app.services.jobs.abstract_offline_job import AbstractOfflineJob
 class ConceptDereferencingJob(AbstractOfflineJob):
     """
     Job for dereferencing concepts.
+
+    Pages through the concepts that have never been dereferenced
+    or whose dereferencing has expired, in increasing id order.
+    The last processed id is checkpointed after each page,
+    so that an interrupted run resumes where it stopped.
     """
 
+    JOB_NAME = "concept_dereferencing"
+
+    def __init__(self):
+        settings = get_app_settings()
+        self.batch_size = settings.concept_dereferencing_batch_size
+        self.parallelism = settings.concept_dereferencing_parallelism
+        self.expiration_days = settings.concept_expiration_days
+
     async def run(self):
         """
-        Try to dereference all concepts that have not been dereferenced yet.
+        Dereference all concepts that have not been dereferenced yet
+        or whose last dereferencing is older than the expiration delay of their source.
         """
+        expired_before = self._expiration_dates()
         async with async_session() as session:
-            concept = await ConceptDAO(session).get_random_concept_not_dereferenced()
-            if concept is None:
-                return
+            cursor = await JobCheckpointDAO(session).get_checkpoint(self.JOB_NAME)
+        if cursor is not None:
+            logger.info(f"Resuming concept dereferencing job after concept {cursor}")
+        while True:
+            async with async_session() as session:
+                concepts = await ConceptDAO(session).get_concepts_to_dereference(
+                    after_id=cursor,
+                    limit=self.batch_size,
+                    expired_before=expired_before,
+                )
+            if not concepts:
+                break
+            dereferenced_concepts = await self._dereference_page(concepts)
+            cursor = concepts[-1].id
+            async with async_session() as session:
+                async with session.begin():
+                    await ConceptDAO(session).update_dereferenced_concepts(
+                        dereferenced_concepts
+                    )
+                    await JobCheckpointDAO(session).save_checkpoint(
+                        self.JOB_NAME, cursor
+                    )
+        async with async_session() as session:
+            async with session.begin():
+                await JobCheckpointDAO(session).delete_checkpoint(self.JOB_NAME)
 
-            already_seen = set()
+    def _expiration_dates(self) -> dict[str, datetime]:
+        """
+        Compute, for each source with an expiration delay, the date before which
+        a dereferenced concept is considered as expired.
+        Sources that are unknown or whose uris cannot be recognized are skipped.
 
-            while concept:
-                already_seen.add(concept.id)
+        :return: expiration date by uri pattern of the source
+        """
+        now = datetime.now()
+        uri_patterns = ConceptFactory.uri_patterns()
+        expiration_dates = {}
+        for source, days in self.expiration_days.items():
+            concept_source = ConceptInformations.ConceptSources.__members__.get(source)
+            if concept_source not in uri_patterns:
+                logger.warning(
+                    f"Ignoring the expiration delay of concept source {source} : "
+                    "unknown source or no uri pattern to recognize its concepts"
+                )
+                continue
+            expiration_dates[uri_patterns[concept_source].pattern] = now - timedelta(
+                days=days
+            )
+        return expiration_dates
+
+    async def _dereference_page(self, concepts: list) -> list[Concept]:
+        """
+        Dereference a page of concepts, concurrently for each source
+
+        :param concepts: list of (id, uri) rows
+        :return: successfully dereferenced concepts, with the id of the existing concept
+        """
+        concepts_by_source = defaultdict(list)
+        for concept_id, concept_uri in concepts:
+            concept_informations = ConceptInformations(uri=concept_uri)
+            try:
+                ConceptFactory.complete_information(concept_informations)
+            except DereferencingError as e:
+                logger.error(f"Error while dereferencing concept {concept_uri}: {e}")
+                continue
+            concepts_by_source[concept_informations.source].append(
+                (concept_id, concept_informations)
+            )
+        results = await asyncio.gather(
+            *[
+                self._dereference_source_concepts(source_concepts)
+                for source_concepts in concepts_by_source.values()
+            ]
+        )
+        return [
+            concept
+            for source_results in results
+            for concept in source_results
+            if concept is not None
+        ]
+
+    async def _dereference_source_concepts(
+        self, source_concepts: list[tuple[int, ConceptInformations]]
+    ) -> list[Concept | None]:
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def dereference(
+            concept_id: int, concept_informations: ConceptInformations
+        ) -> Concept | None:
+            async with semaphore:
                 try:
-                    concept_informations = ConceptInformations(uri=concept.uri)
-                    ConceptFactory.complete_information(concept_informations)
-                    concept_deferenced = await ConceptFactory.solve(
-                        concept_informations
-                    )
-                    concept_deferenced.id = concept.id
-                    await session.merge(concept_deferenced)
-                    await session.commit()
-                    concept = await ConceptDAO(
-                        session
-                    ).get_random_concept_not_dereferenced()
+                    concept = await ConceptFactory.solve(concept_informations)
                 except DereferencingError as e:
-                    logger.error(f"Error while dereferencing concept {concept}: {e}")
-                concept = await ConceptDAO(session).get_random_concept_not_dereferenced(
-                    exclude_ids=list(already_seen)
-                )
+                    logger.error(
+                        f"Error while dereferencing concept {concept_informations.uri}: {e}"
+                    )
+                    return None
+            concept.id = concept_id
+            return concept
+
+        return await asyncio.gather(
+            *[
+                dereference(concept_id, concept_informations)
+                for concept_id, concept_informations in source_concepts
+            ]
+        )
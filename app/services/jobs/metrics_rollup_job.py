@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from app.db.daos.metrics_rollup_dao import MetricsRollupDAO
+from app.db.session import async_session
+from app.services.jobs.abstract_offline_job import AbstractOfflineJob
+
+
+class MetricsRollupJob(AbstractOfflineJob):
+    """
+    Job for the pre-aggregation of the metrics.
+
+    Rolls up the reference events by day, harvester and event type
+    and the references by harvester, so that the metrics endpoints
+    only aggregate the records created since the last run.
+    """
+
+    JOB_NAME = "metrics_rollup"
+
+    async def run(self):
+        """
+        Roll up the reference events of the days before yesterday
+        and the references created since the previous run
+        """
+        # yesterday's harvestings may still be running after midnight,
+        # days are those of the harvesting timestamps, recorded in UTC
+        before_day = datetime.utcnow().date() - timedelta(days=1)
+        async with async_session() as session:
+            async with session.begin():
+                dao = MetricsRollupDAO(session)
+                await dao.roll_up_reference_events(before_day)
+                await dao.roll_up_references()
+        logger.info(f"Metrics rolled up until {before_day}")
@@ -5,6 +5,7 @@ from aiohttp import ClientTimeout
 from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.errors.dereferencing_error import (
     DereferencingError,
     handle_organization_dereferencing_error,
@@ -57,7 +58,7 @@ class HalOrganizationSolver(OrganizationSolver):
         """
         session = await AioHttpClientManager.get_session()
         request_timeout = ClientTimeout(total=float(self.timeout))
-        async with session.get(
+        async with HostScheduler.slot(self.URL), session.get(
             self.URL.format(organization_information.identifier),
             timeout=request_timeout,
         ) as response:
@@ -66,7 +67,8 @@ class HalOrganizationSolver(OrganizationSolver):
                 raise DereferencingError(
                     f"Endpoint returned status {response.status}"
                     f" while dereferencing HAL organization"
-                    f" {organization_information.identifier}"
+                    f" {organization_information.identifier}",
+                    status=response.status,
                 )
             data = await response.json()
             name = data["response"]["docs"][0].get("name_s", None)
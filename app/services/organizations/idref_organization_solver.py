@@ -9,6 +9,7 @@ from rdflib import OWL, Graph, term
 from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.errors.dereferencing_error import (
     DereferencingError,
     handle_organization_dereferencing_error,
@@ -88,14 +89,15 @@ class IdrefOrganizationSolver(OrganizationSolver):
         # Search for more identifiers
         idref_url, idref_uri = self._build_url_from_organization_id(idref_value)
         session = await AioHttpClientManager.get_session()
-        async with session.get(
+        async with HostScheduler.slot(idref_url), session.get(
             idref_url, timeout=(ClientTimeout(total=float(self.timeout)))
         ) as response:
             if not 200 <= response.status < 300:
                 await response.release()
                 raise DereferencingError(
                     f"Endpoint returned status {response.status}"
-                    f" while dereferencing {idref_url}"
+                    f" while dereferencing {idref_url}",
+                    status=response.status,
                 )
             xml = await response.text()
             concept_graph = Graph().parse(data=xml, format="xml")
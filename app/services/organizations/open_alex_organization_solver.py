@@ -5,6 +5,7 @@ from aiohttp import ClientTimeout
 from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.errors.dereferencing_error import (
     DereferencingError,
     handle_organization_dereferencing_error,
@@ -25,6 +26,9 @@ class OpenAlexOrganizationSolver(OrganizationSolver):
     """
 
     URL = "https://api.openalex.org/institutions/{}"
+    BATCH_URL = "https://api.openalex.org/institutions"
+    # maximum number of institutions per OpenAlex list request
+    BATCH_SIZE = 50
 
     # OpenAlex responses key -> OrganizationIdentifier.type
     IDENTIFIERS_TO_BE_DEREFERENCED = {
@@ -59,7 +63,7 @@ class OpenAlexOrganizationSolver(OrganizationSolver):
         """
         session = await AioHttpClientManager.get_session()
         request_timeout = ClientTimeout(total=float(self.timeout))
-        async with session.get(
+        async with HostScheduler.slot(self.URL), session.get(
             self.URL.format(organization_information.identifier.split("/")[-1]),
             timeout=request_timeout,
         ) as response:
@@ -68,61 +72,143 @@ class OpenAlexOrganizationSolver(OrganizationSolver):
                 raise DereferencingError(
                     f"Endpoint returned status {response.status}"
                     f" while dereferencing OpenAlex organization"
-                    f" {organization_information.identifier}"
+                    f" {organization_information.identifier}",
+                    status=response.status,
                 )
             data = await response.json()
-            name = data.get("display_name", "No OpenAlex organization name")
-            if not name:
+        return await self._build_organization(organization_information, data)
+
+    async def solve_many(
+        self, organization_informations: List[OrganizationInformations]
+    ) -> List[Organization | Exception]:
+        """
+        Solves a list of organizations, requesting OpenAlex
+        for up to BATCH_SIZE institutions at once
+
+        :param organization_informations: informations about the organizations
+        :return: the organizations or the errors raised while solving them,
+            in the same order as the informations
+        """
+        results: List[Organization | Exception] = []
+        for start in range(0, len(organization_informations), self.BATCH_SIZE):
+            batch = organization_informations[start : start + self.BATCH_SIZE]
+            try:
+                institutions = await self._fetch_institutions(batch)
+            except DereferencingError as error:
+                results.extend([error] * len(batch))
+                continue
+            for organization_information in batch:
+                data = institutions.get(
+                    organization_information.identifier.split("/")[-1]
+                )
+                if data is None:
+                    results.append(
+                        DereferencingError(
+                            "OpenAlex organization "
+                            f"{organization_information.identifier} not found"
+                        )
+                    )
+                    continue
+                try:
+                    results.append(
+                        await self._build_organization(organization_information, data)
+                    )
+                except DereferencingError as error:
+                    results.append(error)
+        return results
+
+    @handle_organization_dereferencing_error("openalex")
+    async def _fetch_institutions(
+        self, organization_informations: List[OrganizationInformations]
+    ) -> dict[str, dict]:
+        """
+        Fetch a batch of institutions from OpenAlex
+
+        :param organization_informations: informations about the organizations
+        :return: OpenAlex institutions by short OpenAlex id
+        """
+        short_ids = [
+            organization_information.identifier.split("/")[-1]
+            for organization_information in organization_informations
+        ]
+        session = await AioHttpClientManager.get_session()
+        request_timeout = ClientTimeout(total=float(self.timeout))
+        async with HostScheduler.slot(self.BATCH_URL), session.get(
+            self.BATCH_URL,
+            params={
+                "filter": f"ids.openalex:{'|'.join(short_ids)}",
+                "per-page": str(len(short_ids)),
+            },
+            timeout=request_timeout,
+        ) as response:
+            if not 200 <= response.status < 300:
+                await response.release()
                 raise DereferencingError(
-                    f"OpenAlex organization {organization_information.identifier}"
-                    " has no name"
+                    f"Endpoint returned status {response.status}"
+                    f" while dereferencing OpenAlex organizations {short_ids}",
+                    status=response.status,
                 )
-            org = Organization(
-                source=organization_information.source,
-                source_identifier=organization_information.identifier,
-                name=name,
-                type=self.TYPE_MAPPING[data.get("type")],
+            data = await response.json()
+        return {
+            institution["id"].split("/")[-1]: institution
+            for institution in data.get("results", [])
+            if institution.get("id")
+        }
+
+    @handle_organization_dereferencing_error("openalex")
+    async def _build_organization(
+        self, organization_information: OrganizationInformations, data: dict
+    ) -> Organization:
+        name = data.get("display_name", "No OpenAlex organization name")
+        if not name:
+            raise DereferencingError(
+                f"OpenAlex organization {organization_information.identifier}"
+                " has no name"
             )
-            org.identifiers.append(
-                OrganizationIdentifier(
-                    type=OrganizationIdentifier.IdentifierType.OPEN_ALEX.value,
-                    value=organization_information.identifier,
-                )
+        org = Organization(
+            source=organization_information.source,
+            source_identifier=organization_information.identifier,
+            name=name,
+            type=self.TYPE_MAPPING[data.get("type")],
+        )
+        org.identifiers.append(
+            OrganizationIdentifier(
+                type=OrganizationIdentifier.IdentifierType.OPEN_ALEX.value,
+                value=organization_information.identifier,
             )
-            seen = [OrganizationIdentifier.IdentifierType.OPEN_ALEX.value]
-            new_identifiers = []
-            for key, org_id_type in self.IDENTIFIERS_TO_BE_DEREFERENCED.items():
-                if (org_id_type not in seen) and (key in data.get("ids", {})):
-                    code = data.get("ids", {}).get(key, None)
-                    if not code:
-                        continue
-                    try:
-                        (
-                            identifiers,
-                            seen,
-                        ) = await organization_factory.OrganizationFactory.solve_identifier(
-                            OrganizationInformations(
-                                identifier=code, source=org_id_type
-                            ),
-                            seen,
-                        )
-                        new_identifiers.extend(identifiers)
-                    except (ValueError, DereferencingError):
-                        new_identifiers.append(
-                            OrganizationIdentifier(type=org_id_type, value=code)
-                        )
-                        seen.append(org_id_type)
-            for key, org_id_type in self.IDENTIFIERS_TO_BE_SAVED.items():
-                if (org_id_type not in seen) and (key in data.get("ids", {})):
-                    code = data.get("ids", {}).get(key, None)
-                    if not code:
-                        continue
+        )
+        seen = [OrganizationIdentifier.IdentifierType.OPEN_ALEX.value]
+        new_identifiers = []
+        for key, org_id_type in self.IDENTIFIERS_TO_BE_DEREFERENCED.items():
+            if (org_id_type not in seen) and (key in data.get("ids", {})):
+                code = data.get("ids", {}).get(key, None)
+                if not code:
+                    continue
+                try:
+                    (
+                        identifiers,
+                        seen,
+                    ) = await organization_factory.OrganizationFactory.solve_identifier(
+                        OrganizationInformations(identifier=code, source=org_id_type),
+                        seen,
+                    )
+                    new_identifiers.extend(identifiers)
+                except (ValueError, DereferencingError):
                     new_identifiers.append(
                         OrganizationIdentifier(type=org_id_type, value=code)
                     )
                     seen.append(org_id_type)
-            org.identifiers.extend(new_identifiers)
-            return org
+        for key, org_id_type in self.IDENTIFIERS_TO_BE_SAVED.items():
+            if (org_id_type not in seen) and (key in data.get("ids", {})):
+                code = data.get("ids", {}).get(key, None)
+                if not code:
+                    continue
+                new_identifiers.append(
+                    OrganizationIdentifier(type=org_id_type, value=code)
+                )
+                seen.append(org_id_type)
+        org.identifiers.extend(new_identifiers)
+        return org
 
     async def solve_identifier(
         self, organization_information: OrganizationInformations, seen
@@ -1,8 +1,13 @@
-from typing import List
+import asyncio
+import pickle
+from typing import Any, Awaitable, Callable, List
 
 from app.config import get_app_settings
 from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
+from app.services.cache.dereferencing_negative_cache import DereferencingNegativeCache
+from app.services.cache.third_api_cache import ThirdApiCache
+from app.services.errors.dereferencing_error import DereferencingError
 from app.services.organizations.dummy_organization_sover import DummyOrganizationSolver
 from app.services.organizations.hal_organization_solver import HalOrganizationSolver
 from app.services.organizations.idref_organization_solver import IdrefOrganizationSolver
@@ -22,8 +27,16 @@ from app.services.organizations.scopus_organization_solver import (
 class OrganizationFactory:
     """
     Solves an organization from an organization id and an source by calling the appropriate solver
+
+    Results are cached in the third party API cache, with a caching duration per source,
+    and concurrent lookups of the same organization share a single upstream request.
+    Organizations whose lookup returned 404 or 410 are remembered for a shorter time
+    by the negative cache.
     """
 
+    # serialized results of the lookups in progress, by cache key
+    _pending_lookups: dict[str, asyncio.Future] = {}
+
     @staticmethod
     async def solve(
         organization_information: OrganizationInformations,
@@ -38,10 +51,59 @@ class OrganizationFactory:
         solver: OrganizationSolver = OrganizationFactory._create_solver(
             organization_information.source
         )
-        organization = await solver.solve(organization_information)
-
+        if isinstance(solver, DummyOrganizationSolver):
+            return await solver.solve(organization_information)
+        [organization] = await OrganizationFactory._cached_lookup(
+            api_name=f"{organization_information.source}_organizations",
+            keys=[organization_information.identifier],
+            lookup=lambda _: asyncio.gather(
+                solver.solve(organization_information), return_exceptions=True
+            ),
+        )
+        if isinstance(organization, BaseException):
+            raise organization
         return organization
 
+    @staticmethod
+    async def solve_many(
+        organization_informations: List[OrganizationInformations],
+    ) -> List[Organization | Exception]:
+        """
+        Solves a list of organizations, grouping the upstream requests by source
+        so that solvers can batch them when their API allows it
+
+        :param organization_informations: informations about the organizations
+        :return: the organizations or the errors raised while solving them,
+            in the same order as the informations
+        """
+        informations_by_source: dict[str, List[OrganizationInformations]] = {}
+        for organization_information in organization_informations:
+            informations_by_source.setdefault(
+                organization_information.source, []
+            ).append(organization_information)
+        results: dict[OrganizationInformations, Organization | Exception] = {}
+        for source, source_informations in informations_by_source.items():
+            solver: OrganizationSolver = OrganizationFactory._create_solver(source)
+            if isinstance(solver, DummyOrganizationSolver):
+                source_results = await solver.solve_many(source_informations)
+            else:
+                informations_by_identifier = {
+                    information.identifier: information
+                    for information in source_informations
+                }
+                source_results = await OrganizationFactory._cached_lookup(
+                    api_name=f"{source}_organizations",
+                    keys=[
+                        information.identifier for information in source_informations
+                    ],
+                    # pylint: disable=cell-var-from-loop
+                    lookup=lambda identifiers: solver.solve_many(
+                        [informations_by_identifier[i] for i in identifiers]
+                    ),
+                )
+            results.update(zip(source_informations, source_results))
+        return [results[information] for information in organization_informations]
+
     @staticmethod
     async def solve_identifier(
         organization_information: OrganizationInformations,
@@ -59,10 +121,129 @@ class OrganizationFactory:
         solver: OrganizationSolver = OrganizationFactory._create_solver(
             organization_information.source
         )
-        organization, seen = await solver.solve_identifier(
-            organization_information, seen
+        if isinstance(solver, DummyOrganizationSolver):
+            return await solver.solve_identifier(organization_information, seen)
+        # the identifiers solved depend on the identifier types already seen
+        [result] = await OrganizationFactory._cached_lookup(
+            api_name=f"{organization_information.source}_organizations",
+            keys=[f"{organization_information.identifier}|{','.join(sorted(seen))}"],
+            lookup=lambda _: asyncio.gather(
+                solver.solve_identifier(organization_information, list(seen)),
+                return_exceptions=True,
+            ),
         )
-        return organization, seen
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    @classmethod
+    async def _cached_lookup(
+        cls,
+        api_name: str,
+        keys: List[str],
+        lookup: Callable[[List[str]], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """
+        Get results from the cache, from a pending lookup of the same key
+        or from the lookup function for the remaining keys.
+
+        Each caller gets its own copy of the results, as ORM objects
+        cannot be shared between database sessions.
+
+        :param api_name: name of the API, used as a prefix for the cache keys
+        :param keys: keys of the results to get
+        :param lookup: function returning results or exceptions for a list of keys
+        :return: results or exceptions, in the same order as the keys
+        """
+        futures = []
+        own_keys = []
+        for key in keys:
+            future = cls._pending_lookups.get(f"{api_name}:{key}")
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                cls._pending_lookups[f"{api_name}:{key}"] = future
+                own_keys.append(key)
+            futures.append(future)
+        if own_keys:
+            await cls._lookup_and_settle(api_name, own_keys, lookup)
+        results = []
+        for future in futures:
+            try:
+                results.append(pickle.loads(await future))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results.append(error)
+        return results
+
+    @classmethod
+    async def _lookup_and_settle(
+        cls,
+        api_name: str,
+        keys: List[str],
+        lookup: Callable[[List[str]], Awaitable[List[Any]]],
+    ) -> None:
+        try:
+            missing_keys = []
+            for key in keys:
+                value = await ThirdApiCache.get(api_name, key)
+                if value is None:
+                    missing_keys.append(key)
+                else:
+                    cls._settle(api_name, key, value)
+            if not missing_keys:
+                return
+            missing_keys = await cls._settle_known_missing(api_name, missing_keys)
+            if not missing_keys:
+                return
+            try:
+                values = await lookup(missing_keys)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                values = [error] * len(missing_keys)
+            for key, value in zip(missing_keys, values):
+                if isinstance(value, BaseException):
+                    await DereferencingNegativeCache.remember(
+                        f"{api_name}:{key}", value
+                    )
+                else:
+                    await ThirdApiCache.set(api_name, key, value)
+                cls._settle(api_name, key, value)
+        finally:
+            # never leave waiters of an unsettled lookup hanging
+            for key in keys:
+                cls._settle(
+                    api_name,
+                    key,
+                    DereferencingError(f"Lookup of {api_name}:{key} was interrupted"),
+                )
+
+    @classmethod
+    async def _settle_known_missing(cls, api_name: str, keys: List[str]) -> List[str]:
+        """
+        Settle the lookups of the organizations known to be missing
+        by the negative cache
+
+        :return: the keys of the other organizations
+        """
+        known_missing = await DereferencingNegativeCache.get_many(
+            [f"{api_name}:{key}" for key in keys]
+        )
+        remaining_keys = []
+        for key in keys:
+            error = known_missing.get(f"{api_name}:{key}")
+            if error is None:
+                remaining_keys.append(key)
+            else:
+                cls._settle(api_name, key, error)
+        return remaining_keys
+
+    @classmethod
+    def _settle(cls, api_name: str, key: str, value: Any) -> None:
+        future = cls._pending_lookups.pop(f"{api_name}:{key}", None)
+        if future is None or future.done():
+            return
+        if isinstance(value, BaseException):
+            future.set_exception(value)
+        else:
+            future.set_result(pickle.dumps(value))
 
     @classmethod
     def _create_solver(cls, organization_source) -> OrganizationSolver:
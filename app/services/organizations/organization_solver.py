@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -29,6 +30,27 @@ class OrganizationSolver(ABC):
         :return: organization
         """
 
+    async def solve_many(
+        self,
+        organization_informations: List[OrganizationInformations],
+    ) -> List[Organization | Exception]:
+        """
+        Solves a list of organizations.
+        Solvers whose API accepts multiple identifiers per request
+        should override this method to batch the requests.
+
+        :param organization_informations: informations about the organizations
+        :return: the organizations or the errors raised while solving them,
+            in the same order as the informations
+        """
+        return await asyncio.gather(
+            *[
+                self.solve(organization_information)
+                for organization_information in organization_informations
+            ],
+            return_exceptions=True,
+        )
+
     @abstractmethod
     async def solve_identifier(
         self,
@@ -7,6 +7,7 @@ from app.config import get_app_settings
 from app.db.models.organization import Organization
 from app.db.models.organization_identifier import OrganizationIdentifier
 from app.http.aio_http_client_manager import AioHttpClientManager
+from app.http.host_scheduler import HostScheduler
 from app.services.errors.dereferencing_error import (
     handle_organization_dereferencing_error,
     DereferencingError,
@@ -97,7 +98,7 @@ class RorOrganizationSolver(OrganizationSolver):
         if not ror_id:
             raise DereferencingError("ROR identifier is empty")
 
-        async with session.get(
+        async with HostScheduler.slot(self.URL), session.get(
             self.URL.format(ror_id),
             timeout=(ClientTimeout(total=float(self.timeout))),
             headers=headers or None,  # aiohttp accepts None
@@ -106,7 +107,8 @@ class RorOrganizationSolver(OrganizationSolver):
                 await response.release()
                 raise DereferencingError(
                     f"Endpoint returned status {response.status} while dereferencing "
-                    f"ROR organization {organization_information.identifier}"
+                    f"ROR organization {organization_information.identifier}",
+                    status=response.status,
                 )
             data = await response.json()
 
@@ -0,0 +1,127 @@
+import asyncio
+from asyncio import Queue
+from typing import Annotated, List, Optional, Type
+
+from fastapi import Body, Depends, HTTPException
+from loguru import logger
+from starlette.background import BackgroundTasks
+
+from app.api.dependencies.event_types import event_types_or_default
+from app.config import get_app_settings
+from app.db.conversions import EntityConverter
+from app.db.daos.retrieval_dao import RetrievalDAO
+from app.db.models.retrieval import Retrieval
+from app.db.session import async_session
+from app.models.entities import Entity as PydanticEntity
+from app.models.reference_events import ReferenceEvent
+from app.services.entities.entity_resolution_service import EntityResolutionService
+from app.services.retrieval.retrieval_progress import RetrievalProgress
+from app.services.retrieval.retrieval_service import RetrievalService
+
+
+class RetrievalBatchService:
+    """
+    Registers the retrievals of many entities at once and runs them
+    with a bounded parallelism (retrieval_batch_parallelism setting)
+
+    The identifiers of all the entities are resolved with a single query,
+    and the entities and retrievals are created in a single transaction.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self,
+        background_tasks: BackgroundTasks = None,
+        identifiers_safe_mode: Annotated[bool, Body()] = False,
+        harvesters: Annotated[
+            List[str],
+            Body(examples=[["hal", "idref", "scanr", "openalex"]]),
+        ] = None,
+        nullify: Annotated[List[str], Body(examples=[["idhals"]])] = None,
+        events: Annotated[
+            List[ReferenceEvent.Type], Depends(event_types_or_default)
+        ] = None,
+        fetch_enhancements: Annotated[bool, Body()] = True,
+        incremental: Annotated[bool, Body()] = False,
+    ):
+        """Init RetrievalBatchService class"""
+        self.background_tasks = background_tasks
+        self.services: List[RetrievalService] = []
+        self.retrievals: List[Retrieval] = []
+        self.options = {
+            "identifiers_safe_mode": identifiers_safe_mode,
+            "harvesters": harvesters,
+            "nullify": nullify,
+            "events": events,
+            "fetch_enhancements": fetch_enhancements,
+            "incremental": incremental,
+        }
+
+    async def register(self, entities: List[Type[PydanticEntity]]) -> List[Retrieval]:
+        """
+        Register a new retrieval for each entity
+
+        :param entities: entities to fetch references for
+        :return: the retrievals, in the same order as the entities
+        """
+        settings = get_app_settings()
+        if len(entities) > settings.retrieval_batch_max_size:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unprocessable Entity: more than "
+                f"{settings.retrieval_batch_max_size} entities in the batch",
+            )
+        self.services = [RetrievalService(**self.options) for _ in entities]
+        for service, entity in zip(self.services, entities):
+            service.prepare(entity)
+        async with async_session() as session:
+            async with session.begin():
+                resolved_entities = await EntityResolutionService(session).resolve_many(
+                    [EntityConverter(entity).to_db_model() for entity in entities],
+                    nullify=self.options["nullify"],
+                    identifiers_safe_mode=self.options["identifiers_safe_mode"],
+                )
+                self.retrievals = await RetrievalDAO(session).create_retrievals(
+                    resolved_entities, event_types=self.options["events"] or []
+                )
+        for service, entity, retrieval in zip(
+            self.services, resolved_entities, self.retrievals
+        ):
+            service.entity = entity
+            service.retrieval = retrieval
+        return self.retrievals
+
+    async def run(
+        self, result_queue: Queue = None, in_background: bool = False
+    ) -> None:
+        """
+        Run the registered retrievals
+
+        :param result_queue: The queue to push the results to
+        :param in_background: If True, the retrievals will be launched in background
+            (HTTP REST context only)
+        :return: None
+        """
+        assert self.retrievals, "Retrievals must be registered before running"
+        # let clients follow the retrievals waiting for their turn
+        for retrieval in self.retrievals:
+            RetrievalProgress.open(retrieval.id, downstream=result_queue)
+        if in_background:
+            self.background_tasks.add_task(self._run_retrievals, result_queue)
+        else:
+            await self._run_retrievals(result_queue)
+
+    async def _run_retrievals(self, result_queue: Optional[Queue]) -> None:
+        semaphore = asyncio.Semaphore(get_app_settings().retrieval_batch_parallelism)
+
+        async def run_retrieval(service: RetrievalService) -> None:
+            async with semaphore:
+                try:
+                    await service.run(result_queue=result_queue)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    # a failed retrieval must not stop the rest of the batch
+                    logger.error(
+                        f"Retrieval id={service.retrieval.id} of batch failed: {error}"
+                    )
+
+        await asyncio.gather(*[run_retrieval(service) for service in self.services])
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from asyncio import Queue
+from enum import Enum
+from typing import AsyncGenerator, Optional
+
+import orjson
+
+from app.config import get_app_settings
+
+
+class RetrievalProgress:
+    """
+    In-process log of the progress messages of a retrieval, fed by the harvesters
+    through the result queue, so that REST clients can follow a retrieval
+    as a stream of events instead of polling its complete result.
+
+    Events are numbered from 1 in their order of arrival : a reconnecting client
+    only gets the events following the last id it received.
+    The log of a finished retrieval is kept for retrieval_progress_retention seconds.
+    """
+
+    class StreamFormat(Enum):
+        """
+        Formats of the event streams
+        """
+
+        SSE = "sse"
+        NDJSON = "ndjson"
+
+    # progress logs of the retrievals run by this process, by retrieval id
+    _progresses: dict[int, "RetrievalProgress"] = {}
+
+    def __init__(self, retrieval_id: int, downstream: Optional[Queue] = None):
+        """
+        :param retrieval_id: id of the retrieval
+        :param downstream: queue to forward the messages to, e.g. the AMQP result queue
+        """
+        self.retrieval_id = retrieval_id
+        self.downstream = downstream
+        # harvester names by harvesting id
+        self.harvesters: dict[int, str] = {}
+        self.events: list[dict] = []
+        self.closed_at: float | None = None
+        self._new_events = asyncio.Event()
+
+    @classmethod
+    def open(
+        cls, retrieval_id: int, downstream: Optional[Queue] = None
+    ) -> "RetrievalProgress":
+        """
+        Open the progress log of a retrieval, or get it if it is already open,
+        forgetting the logs of the retrievals finished for too long
+
+        :param retrieval_id: id of the retrieval
+        :param downstream: queue to forward the messages to
+        :return: the progress log
+        """
+        cls._forget_expired()
+        progress = cls._progresses.get(retrieval_id)
+        if progress is not None and not progress.closed:
+            progress.downstream = downstream
+            return progress
+        progress = RetrievalProgress(retrieval_id, downstream)
+        cls._progresses[retrieval_id] = progress
+        return progress
+
+    @classmethod
+    def get(cls, retrieval_id: int) -> Optional["RetrievalProgress"]:
+        """
+        Get the progress log of a retrieval run by this process
+
+        :param retrieval_id: id of the retrieval
+        :return: the progress log, or None if unknown or expired
+        """
+        return cls._progresses.get(retrieval_id)
+
+    async def put(self, message: dict) -> None:
+        """
+        Record a message of a harvester and forward it downstream.
+        Same signature as asyncio.Queue.put, as the log replaces the result queue.
+
+        :param message: message put in the result queue by a harvester
+        :return: None
+        """
+        event = {key: value for key, value in message.items() if key != "entity_id"} | {
+            "event_id": len(self.events) + 1
+        }
+        if event.get("type") == "Harvesting" and event.get("id") in self.harvesters:
+            event["harvester"] = self.harvesters[event["id"]]
+        self._append(event)
+        if self.downstream is not None:
+            await self.downstream.put(message)
+
+    def close(self) -> None:
+        """
+        Record the end of the retrieval, ending the event streams,
+        and forget the logs of the retrievals finished for too long
+
+        :return: None
+        """
+        self._append(
+            {
+                "type": "Retrieval",
+                "id": self.retrieval_id,
+                "state": "completed",
+                "event_id": len(self.events) + 1,
+            }
+        )
+        self.closed_at = time.monotonic()
+        self._forget_expired()
+
+    @property
+    def closed(self) -> bool:
+        """
+        :return: True if the retrieval is finished
+        """
+        return self.closed_at is not None
+
+    async def events_after(
+        self, last_event_id: int, keepalive: float
+    ) -> AsyncGenerator[dict | None, None]:
+        """
+        Events following an event id, then the new events as they arrive,
+        until the end of the retrieval
+
+        :param last_event_id: id of the last event received by the client, 0 for all
+        :param keepalive: seconds after which None is yielded if no event arrived
+        :return: generator of events, None for keepalive
+        """
+        while True:
+            new_events = self._new_events
+            while last_event_id < len(self.events):
+                last_event_id += 1
+                yield self.events[last_event_id - 1]
+            if self.closed:
+                return
+            try:
+                await asyncio.wait_for(new_events.wait(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def stream(
+        self, last_event_id: int, stream_format: StreamFormat
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Serialize the events following an event id for an HTTP response
+
+        :param last_event_id: id of the last event received by the client, 0 for all
+        :param stream_format: server-sent events or newline delimited JSON
+        :return: generator of serialized events
+        """
+        keepalive = get_app_settings().retrieval_progress_keepalive
+        async for event in self.events_after(last_event_id, keepalive):
+            if event is None:
+                yield (
+                    b"\n"
+                    if stream_format == self.StreamFormat.NDJSON
+                    else b": keepalive\n\n"
+                )
+                continue
+            data = orjson.dumps(event, default=str)  # pylint: disable=no-member
+            if stream_format == self.StreamFormat.NDJSON:
+                yield data + b"\n"
+            else:
+                yield (
+                    f"id: {event['event_id']}\nevent: {event.get('type')}\n".encode()
+                    + b"data: "
+                    + data
+                    + b"\n\n"
+                )
+
+    @classmethod
+    def _forget_expired(cls) -> None:
+        retention = get_app_settings().retrieval_progress_retention
+        now = time.monotonic()
+        for expired_id in [
+            progress.retrieval_id
+            for progress in cls._progresses.values()
+            if progress.closed_at is not None and now - progress.closed_at > retention
+        ]:
+            del cls._progresses[expired_id]
+
+    def _append(self, event: dict) -> None:
+        self.events.append(event)
+        # wake up the streams waiting for new events
+        self._new_events.set()
+        self._new_events = asyncio.Event()
@@ -1,5 +1,6 @@
 import asyncio
 import importlib
+import time
 from asyncio import Queue
 from typing import Annotated, Optional, List, Type
 
@@ -10,6 +11,7 @@ from starlette.background import BackgroundTasks
 from app.api.dependencies.event_types import event_types_or_default
 from app.config import get_app_settings
 from app.db.conversions import EntityConverter
+from app.db.daos.entity_dao import EntityDAO
 from app.db.daos.harvesting_dao import HarvestingDAO
 from app.db.daos.retrieval_dao import RetrievalDAO
 from app.db.models.entity import Entity as DbEntity
@@ -18,9 +20,13 @@ from app.db.models.retrieval import Retrieval
 from app.db.session import async_session
 from app.harvesters.abstract_harvester import AbstractHarvester
 from app.harvesters.abstract_harvester_factory import AbstractHarvesterFactory
+from app.http.host_scheduler import request_flow
 from app.models.entities import Entity as PydanticEntity
 from app.models.reference_events import ReferenceEvent
+from app.monitoring.tracing import Tracer
 from app.services.entities.entity_resolution_service import EntityResolutionService
+from app.services.entities.entity_snapshot import EntitySnapshot
+from app.services.retrieval.retrieval_progress import RetrievalProgress
 
 
 # pylint: disable=too-many-instance-attributes
@@ -43,6 +49,7 @@ class RetrievalService:
             List[ReferenceEvent.Type], Depends(event_types_or_default)
         ] = None,
         fetch_enhancements: Annotated[bool, Body()] = True,
+        incremental: Annotated[bool, Body()] = False,
     ):
         """Init RetrievalService class"""
         self.background_tasks = background_tasks
@@ -54,6 +61,7 @@ class RetrievalService:
         self.nullify = nullify
         self.events = events
         self.fetch_enhancements = fetch_enhancements
+        self.incremental = incremental
 
     async def register(
         self,
@@ -61,9 +69,7 @@ class RetrievalService:
     ) -> Retrieval:
         """Register a new retrieval with the associated entity"""
 
-        self._check_entity_declaration_and_nullification(entity)
-
-        self._build_harvesters()
+        self.prepare(entity)
         # new entity is not saved to db yet
         new_entity: DbEntity = EntityConverter(entity).to_db_model()
         async with async_session() as session:
@@ -82,22 +88,39 @@ class RetrievalService:
                 )
         return self.retrieval
 
+    def prepare(self, entity: Type[PydanticEntity]) -> None:
+        """
+        Check the identifiers of the entity against the identifiers to nullify
+        and build the harvesters, before the retrieval of the entity is registered
+
+        :param entity: entity to fetch references for
+        :return: None
+        """
+        self._check_entity_declaration_and_nullification(entity)
+        self._build_harvesters()
+
     async def run(
         self, result_queue: Queue = None, in_background: bool = False
     ) -> None:
         """
         Run the retrieval process by launching the harvesters
 
+        The messages of the harvesters are recorded in the progress log
+        of the retrieval before being pushed to the result queue.
+
         :param result_queue: The queue to push the results to
         :param in_background: If True, the harvesting will be launched in background
             (HTTP REST context only)
         :return: None
         """
         assert self.retrieval is not None, "Retrieval must be registered before running"
+        # opened before the launch, so that clients can follow a background retrieval
+        # as soon as its id is returned
+        progress = RetrievalProgress.open(self.retrieval.id, downstream=result_queue)
         if in_background:
-            self.background_tasks.add_task(self._launch_harvesters, result_queue)
+            self.background_tasks.add_task(self._launch_harvesters, progress)
         else:
-            await self._launch_harvesters(result_queue)
+            await self._launch_harvesters(progress)
 
     def _build_harvesters(self):
         settings = get_app_settings()
@@ -122,41 +145,96 @@ class RetrievalService:
     ) -> AbstractHarvesterFactory:
         return getattr(importlib.import_module(harvester_module), harvester_class)
 
-    async def _launch_harvesters(self, result_queue: Queue = None):
+    async def _launch_harvesters(self, progress: RetrievalProgress):
+        # the requests of the harvesters are queued fairly with those of other retrievals
+        flow = request_flow.set(self.retrieval.id)
+        try:
+            # the spans of the harvesters are children of the retrieval span
+            with Tracer.span("retrieval", retrieval_id=self.retrieval.id):
+                await self._launch_and_wait_harvesters(progress)
+        finally:
+            request_flow.reset(flow)
+            progress.close()
+
+    async def _launch_and_wait_harvesters(self, progress: RetrievalProgress):
+        launch_time = time.monotonic()
+        first_request_times: list[float] = []
+
+        def record_first_request() -> None:
+            if not first_request_times:
+                first_request_times.append(time.monotonic())
+
+        # load the entity once for all harvesters, let each harvester select
+        # its identifier, then create all the harvestings in a single transaction
+        async with async_session() as session:
+            async with session.begin():
+                entity = EntitySnapshot.of(
+                    await EntityDAO(session).get_entity_by_id(self.retrieval.entity_id)
+                )
+                for harvester in self.harvesters.values():
+                    harvester.set_entity(entity)
+                harvesting_ids = await HarvestingDAO(session).create_harvestings(
+                    retrieval_id=self.retrieval.id,
+                    harvesters=list(self.harvesters),
+                    state=Harvesting.State.IDLE,
+                    identifiers_used={
+                        harvester_name: harvester.entity_identifier_used
+                        for harvester_name, harvester in self.harvesters.items()
+                    },
+                )
+        progress.harvesters = {
+            harvesting_id: harvester_name
+            for harvester_name, harvesting_id in harvesting_ids.items()
+        }
         pending_harvesters = []
         harvesting_tasks_index = {}
         for harvester_name, harvester in self.harvesters.items():
-            async with async_session() as session:
-                async with session.begin():
-                    harvesting = await HarvestingDAO(session).create_harvesting(
-                        retrieval=self.retrieval,
-                        harvester=harvester_name,
-                        state=Harvesting.State.IDLE,
-                    )
-            if result_queue is not None:
-                harvester.set_result_queue(result_queue)
+            harvesting_id = harvesting_ids[harvester_name]
+            harvester.set_result_queue(progress)
             harvester.set_event_types(self.retrieval.event_types)
             harvester.set_fetch_enhancements(self.fetch_enhancements)
-            harvester.set_harvesting_id(harvesting.id)
-            await harvester.set_entity_id(self.retrieval.entity_id)
-            action = (
-                harvester.run if harvester.is_relevant() else harvester.skip
-            )
+            harvester.set_incremental(self.incremental)
+            harvester.set_harvesting_id(harvesting_id)
+            harvester.set_first_request_callback(record_first_request)
+            action = harvester.run if harvester.is_relevant() else harvester.skip
             task = asyncio.create_task(
                 action(),
                 name=f"{harvester_name}_harvester_retrieval_{self.retrieval.id}",
             )
             pending_harvesters.append(task)
-            harvesting_tasks_index[harvesting.id] = task
+            harvesting_tasks_index[harvesting_id] = task
 
-        while pending_harvesters:
-            harvester, pending_harvesters = await asyncio.wait(
-                pending_harvesters, return_when=asyncio.FIRST_COMPLETED
-            )
-            logger.debug(
-                "Harvesting {} finished for entity id={}", harvester, self.entity.id
+        # share the entity snapshot with the message factories
+        # while the harvesters are running
+        EntitySnapshot.retain(entity)
+        try:
+            while pending_harvesters:
+                harvester, pending_harvesters = await asyncio.wait(
+                    pending_harvesters, return_when=asyncio.FIRST_COMPLETED
+                )
+                logger.debug(
+                    "Harvesting {} finished for entity id={}", harvester, entity.id
+                )
+        finally:
+            EntitySnapshot.release(entity.id)
+        if first_request_times:
+            await self._record_time_to_first_request(
+                first_request_times[0] - launch_time
             )
 
+    async def _record_time_to_first_request(self, time_to_first_request: float):
+        logger.info(
+            "Time to first request for retrieval id={} : {:.3f}s",
+            self.retrieval.id,
+            time_to_first_request,
+        )
+        self.retrieval.time_to_first_request = time_to_first_request
+        async with async_session() as session:
+            async with session.begin():
+                await RetrievalDAO(session).update_time_to_first_request(
+                    self.retrieval.id, time_to_first_request
+                )
+
     def _check_entity_declaration_and_nullification(self, entity):
         if self.nullify:
             identifiers_set = set(identifier.type for identifier in entity.identifiers)
@@ -1,34 +1,87 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncGenerator, Dict, List, Type
+
+from pydantic import BaseModel
+
+from app.config import get_app_settings
 from app.db.abstract_dao import AbstractDAO
 from app.models.people import Person
 from app.db.session import async_session
+from app.services.summary.summary_cursor import encode_cursor
 
 
+# pylint: disable=too-many-arguments, too-many-positional-arguments
 async def fetch_summary(
     dao_class: AbstractDAO,
     session: async_session,
     params: dict,
     entity: Person,
     extra_args: Dict[str, Any] = None,
-) -> List:
+    page: Dict[str, Any] = None,
+) -> tuple[List, str | None]:
     """
-    Fetch summary (retrieval or references) for a given entity
+    Fetch a page of summary (retrieval or references) for a given entity
     :param dao_class: dao class to use
     :param session: session to use
     :param params: parameters to fetch
     :param entity: entity to search
     :param extra_args: extra arguments to pass to the dao
-    :return: Summary
+    :param page: cursor and limit of the page
+    :return: Summary page and cursor of the next page, None if it is the last page
     """
-    dao_instance = dao_class(session)
-    method = getattr(
-        dao_instance,
-        (
-            "get_retrievals_summary"
-            if dao_class.__name__ == "RetrievalDAO"
-            else "get_references_summary"
-        ),
+    method = getattr(dao_class(session), f"get_{_summary_name(dao_class)}_summary")
+    args = _summary_arguments(params, entity, extra_args)
+    if page is None:
+        return await method(**args), None
+    limit = page["limit"]
+    # fetch one more row to know if there is a next page
+    rows = await method(**args, cursor=page["cursor"], limit=limit + 1)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(
+        rows[-1].timestamp,
+        rows[-1].id,
+        getattr(rows[-1], "rank", None),
+        getattr(rows[-1], "event_type", None),
     )
+
+
+async def stream_summary(
+    dao_class: AbstractDAO,
+    model: Type[BaseModel],
+    params: dict,
+    entity: Person,
+    extra_args: Dict[str, Any] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Stream the whole summary (retrieval or references) for a given entity
+    as newline delimited JSON, through a server-side cursor
+    :param dao_class: dao class to use
+    :param model: pydantic model of the summary rows
+    :param params: parameters to fetch
+    :param entity: entity to search
+    :param extra_args: extra arguments to pass to the dao
+    :return: generator of JSON lines
+    """
+    async with async_session() as session:
+        method = getattr(
+            dao_class(session), f"stream_{_summary_name(dao_class)}_summary"
+        )
+        result = await method(
+            **_summary_arguments(params, entity, extra_args),
+            batch_size=get_app_settings().summary_export_batch_size,
+        )
+        async for row in result:
+            yield model.model_validate(row._asdict()).model_dump_json() + "\n"
+
+
+def _summary_name(dao_class: AbstractDAO) -> str:
+    return "retrievals" if dao_class.__name__ == "RetrievalDAO" else "references"
+
+
+def _summary_arguments(
+    params: dict, entity: Person, extra_args: Dict[str, Any] = None
+) -> Dict[str, Any]:
     args = {
         "filter_harvester": {
             "event_types": params["events"],
@@ -40,5 +93,4 @@ async def fetch_summary(
     }
     if extra_args:
         args.update(extra_args)
-    result = await method(**args)
-    return result
+    return args
@@ -0,0 +1,59 @@
+import base64
+import datetime
+import json
+
+
+def encode_cursor(
+    timestamp: datetime.datetime,
+    row_id: int,
+    rank: float | None = None,
+    tiebreaker: str | None = None,
+) -> str:
+    """
+    Encode the position of the last row of a summary page
+    into an opaque cursor
+
+    :param timestamp: timestamp of the last row
+    :param row_id: id of the last row
+    :param rank: full-text search rank of the last row, for ranked searches
+    :param tiebreaker: last component of the sort key, for summaries whose rows
+        are not identified by their id alone
+    :return: cursor
+    """
+    position = {"timestamp": timestamp.isoformat(), "id": row_id}
+    if rank is not None:
+        position["rank"] = rank
+    if tiebreaker is not None:
+        position["tiebreaker"] = tiebreaker
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor
+
+    :param cursor: cursor
+    :return: timestamp and id of the last row of the previous page,
+        preceded by its rank for ranked searches and followed by its tiebreaker, if any
+    :raises ValueError: if the cursor is malformed
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if not isinstance(position, dict) or not set(position) <= {
+            "timestamp",
+            "id",
+            "rank",
+            "tiebreaker",
+        }:
+            raise ValueError("Unexpected cursor components")
+        key = (
+            datetime.datetime.fromisoformat(position["timestamp"]),
+            int(position["id"]),
+        )
+        if "rank" in position:
+            key = (float(position["rank"]), *key)
+        if "tiebreaker" in position:
+            key = (*key, str(position["tiebreaker"]))
+        return key
+    except (ValueError, KeyError, TypeError) as error:
+        raise ValueError(f"Malformed cursor {cursor}") from error
@@ -3,7 +3,7 @@ App settings base class
 """
 
 import os
-from typing import ClassVar, TextIO
+from typing import ClassVar, Literal, TextIO
 
 import yaml
 from pydantic_settings import BaseSettings
@@ -56,9 +56,23 @@ class AppSettings(BaseSettings):
     amqp_prefetch_count: int = 10
     amqp_consumer_ack_timeout: int = 43200000
     amqp_retrieval_routing_key: str = "task.entity.references.retrieval"
+    # queue and routing key of the retrievals processed before the bulk ones
+    amqp_interactive_queue_name: str = "svp-harvester.interactive"
+    amqp_interactive_retrieval_routing_key: str = (
+        "task.entity.references.retrieval.interactive"
+    )
+    # interactive messages processed for each bulk message when both are waiting
+    amqp_interactive_lane_weight: int = 4
+    # seconds before the retry of a failed message, doubled at each attempt
+    amqp_retry_base_delay: int = 30
+    # processing attempts of a message before it is parked in a dead letters queue
+    amqp_retry_max_attempts: int = 5
     amqp_reference_event_routing_key: str = "event.references.reference.*"
     amqp_harvesting_event_routing_key: str = "event.references.harvesting.state"
     amqp_retrieval_event_routing_key: str = "event.references.retrieval.state"
+    amqp_retrieval_batch_event_routing_key: str = (
+        "event.references.retrieval_batch.state"
+    )
 
     amqp_auto_reconnect: bool = True
 
@@ -83,6 +97,18 @@ class AppSettings(BaseSettings):
     http_client_limit: int = 100
     http_client_ttl_dns_cache: int = 300
     http_client_timeout_total: float = 7.0
+    # maximum number of simultaneous requests per upstream host
+    http_host_concurrency: int = 10
+    # maximum number of requests per second per upstream host, None for no limit
+    http_host_rate: float | None = None
+    # concurrency and rate of the upstream hosts known to throttle clients
+    http_host_quotas: dict = {
+        "www.sudoc.fr": {"concurrency": 5, "rate": 5.0},
+        "www.idref.fr": {"concurrency": 5, "rate": 10.0},
+        "data.idref.fr": {"concurrency": 5, "rate": 10.0},
+        "api.ror.org": {"concurrency": 5, "rate": 5.0},
+        "www.wikidata.org": {"concurrency": 5, "rate": 10.0},
+    }
 
     scanr_es_host: str = "https://host_name.com/"
     scanr_es_user: str = "johndoe"
@@ -95,6 +121,60 @@ class AppSettings(BaseSettings):
         "WIKIDATA": 30,
         "IDREF": 30,
     }
+    # number of concepts loaded per page by the concept dereferencing job
+    concept_dereferencing_batch_size: int = 100
+    # maximum number of simultaneous dereferencing requests per concept source
+    concept_dereferencing_parallelism: int = 5
+
+    # number of rows per page of the references and retrievals summaries
+    summary_page_size: int = 100
+    # maximum page size a client can request for the summaries
+    summary_max_page_size: int = 1000
+    # number of rows fetched at once from the database for summary exports
+    summary_export_batch_size: int = 1000
+
+    # seconds during which the progress events of a finished retrieval can still be streamed
+    retrieval_progress_retention: int = 600
+    # seconds of inactivity after which a keepalive is sent on retrieval progress streams
+    retrieval_progress_keepalive: float = 15.0
+    # number of results processed by a harvester between two checkpoints
+    harvesting_checkpoint_interval: int = 100
+    # seconds without checkpoint after which a running harvesting is considered
+    # interrupted, and resumed by the next harvesting of the same entity
+    harvesting_stale_after: int = 900
+    # seconds between two refreshes of the checkpoint timestamp of a running harvesting,
+    # whatever its number of results, to be kept well below harvesting_stale_after
+    harvesting_heartbeat_interval: int = 60
+
+    # seconds between two samples of the event loop lag, 0 to disable the monitor
+    event_loop_lag_sample_interval: float = 0.5
+    # seconds after which the event loop is considered blocked by the running code,
+    # whose task and stack are then recorded
+    event_loop_slow_callback_threshold: float = 0.1
+    # number of lag samples the lag percentiles are computed on
+    event_loop_lag_window: int = 1200
+    # expose the runtime internals (pools, queues, upstream requests and caches)
+    # to Prometheus, the instrumentation is idle when disabled
+    runtime_metrics_enabled: bool = False
+    # record the retrievals, harvestings, references and dereferencings as spans,
+    # a disabled span costs a single check
+    tracing_enabled: bool = False
+    # proportion of the retrievals whose spans are recorded, between 0 and 1
+    tracing_sample_rate: float = 1.0
+    # "memory" to keep the last spans for the admin GUI,
+    # "otlp" to send them to an OpenTelemetry collector
+    tracing_exporter: Literal["memory", "otlp"] = "memory"
+    # number of spans kept by the memory exporter
+    tracing_memory_capacity: int = 5000
+    # OTLP/HTTP traces endpoint of the OpenTelemetry collector
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    # seconds between two exports to the OpenTelemetry collector
+    tracing_otlp_export_interval: float = 5.0
+
+    # maximum number of entities in a batch of retrievals
+    retrieval_batch_max_size: int = 5000
+    # maximum number of retrievals of a batch running at the same time
+    retrieval_batch_parallelism: int = 10
 
     svp_jel_proxy_url: str | None = None
 
@@ -102,6 +182,9 @@ class AppSettings(BaseSettings):
     scopus_inst_token: str = "None"
 
     openalex_api_key: str | None = None
+    # the from_updated_date filter needed by the incremental OpenAlex harvesting
+    # is reserved to premium keys, full harvestings are run otherwise
+    openalex_premium_api_key: bool = False
 
     idref_sudoc_timeout: int = 10
     idref_science_plus_timeout: int = 10
@@ -128,6 +211,20 @@ class AppSettings(BaseSettings):
     open_edition_publications_caching_duration: int = 15 * 24 * 3600
     idref_concepts_publications_caching_duration: int = 90 * 24 * 3600
     wikidata_concepts_publications_caching_duration: int = 90 * 24 * 3600
+    hal_organizations_caching_duration: int = 30 * 24 * 3600
+    idref_organizations_caching_duration: int = 30 * 24 * 3600
+    scanr_organizations_caching_duration: int = 30 * 24 * 3600
+    ror_organizations_caching_duration: int = 30 * 24 * 3600
+    scopus_organizations_caching_duration: int = 30 * 24 * 3600
+    openalex_organizations_caching_duration: int = 30 * 24 * 3600
+    # 404 and 410 responses of the dereferencing endpoints are remembered
+    # for a short time, so that known missing concepts and organizations are skipped
+    dereferencing_negative_caching_duration: int = 3600
+
+    # consecutive failures of an external endpoint before its circuit breaker opens
+    circuit_breaker_failure_threshold: int = 5
+    # seconds before an open circuit breaker lets a trial request through
+    circuit_breaker_recovery_timeout: float = 30.0
 
     wikidata_user_agent: str = "CRISalid-Harvester/1.0 (dev instance)"
 
@@ -55,6 +55,8 @@ class TestAppSettings(AppSettings):
 
     third_api_caching_enabled: bool = False
 
+    http_host_quotas: dict = {}
+
     institution_name: str = "XYZ University • test"
 
     openalex_api_key: str = "test_openalex_api_key"
@@ -18,6 +18,8 @@ from app.db.session import async_session
 from app.gui.routes.gui import router as gui_router
 from app.http.aio_http_client_manager import AioHttpClientManager
 from app.models.custom_medatata import register_custom_metadata_schemas
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.tracing import Tracer
 from app.redis.redis_pool import RedisPool
 
 # from app.redis.fake_redis_pool import FakeRedisPool as RedisPool
@@ -72,13 +74,27 @@ class SvpHarvester(FastAPI):
         configure_logger()
 
         self.add_exception_handler(ValidationError, http422_error_handler)
+        self.add_event_handler("startup", self.start_event_loop_monitor)
+        self.add_event_handler("startup", Tracer.start)
         self.add_event_handler("startup", self.check_db_connexion)
         if settings.third_api_caching_enabled:
             self.add_event_handler("startup", self.check_redis_connexion)
         if settings.amqp_enabled:
             self.add_event_handler("startup", self.open_rabbitmq_connexion)
             self.add_event_handler("shutdown", self.close_rabbitmq_connexion)
+        self.add_event_handler("shutdown", Tracer.stop)
         self.add_event_handler("shutdown", self.close_http_client_session)
+        self.add_event_handler("shutdown", self.stop_event_loop_monitor)
+
+    @staticmethod
+    async def start_event_loop_monitor() -> None:
+        """Monitor the lag of the event loop the application runs on"""
+        EventLoopMonitor.start_monitoring()
+
+    @staticmethod
+    async def stop_event_loop_monitor() -> None:
+        """Stop monitoring the event loop before it closes"""
+        EventLoopMonitor.stop_monitoring()
 
     @staticmethod
     async def close_http_client_session() -> None:
@@ -17,17 +17,17 @@ class Client {
         return await this.axios.get(retrievalUrl);
     }
 
-    async getHistoryRetrieval(params) {
+    async getHistoryRetrieval(params, cursor = undefined) {
         return await this.axios.get(this.apiUrl() + "/retrievals/summary", {
-            params: params, paramsSerializer: params => {
+            params: cursor ? {...params, cursor: cursor} : params, paramsSerializer: params => {
                 return qs.stringify(params, {arrayFormat: 'repeat'})
             }
         });
     }
 
-    async getHistoryPublication(params) {
+    async getHistoryPublication(params, cursor = undefined) {
         return await this.axios.get(this.apiUrl() + "/references/summary", {
-            params: params, paramsSerializer: params => {
+            params: cursor ? {...params, cursor: cursor} : params, paramsSerializer: params => {
                 return qs.stringify(params, {arrayFormat: 'repeat'})
             }
         });
@@ -7,8 +7,12 @@ class Control {
         this.rootElement = rootElement;
         this.subPage = subPage
         this.client = client
+        this.params = {};
+        this.nextCursor = null;
+        this.loadingPage = false;
         this.addSubmitListener();
         this.addPageLoadedListener();
+        this.addNextPageListener();
     }
 
     addPageLoadedListener() {
@@ -52,33 +56,54 @@ class Control {
             date_start: dateRange[0],
             date_end: dateRange[1],
         }
+        if (this.subPage === "publication_history") {
+            params = {
+                ...params,
+                text_search: event.detail.textSearch
+            }
+        }
+        this.params = params;
+        this.nextCursor = null;
+        this.fetchPage().then(() => {
+            this.form.spinnerOff()
+        });
+    }
+
+    fetchPage(append = false) {
+        let request;
         switch (this.subPage) {
             case "collection_history":
-                this.client.getHistoryRetrieval(params).then((response) => {
-                    const retrieval = response.data
-                    this.historyTable.updateTable(retrieval);
-                    this.form.spinnerOff()
-                }).catch((error) => {
-                    console.log(error);
-                });
+                request = this.client.getHistoryRetrieval(this.params, this.nextCursor);
                 break;
             case "publication_history":
-                params = {
-                    ...params,
-                    text_search: event.detail.textSearch
-                }
-                this.client.getHistoryPublication(params).then((response) => {
-                    const retrieval = response.data
-                    this.historyTable.updateTable(retrieval);
-                    this.form.spinnerOff()
-                }).catch((error) => {
-                    console.log(error);
-                });
+                request = this.client.getHistoryPublication(this.params, this.nextCursor);
                 break;
             default:
                 throw new Error(`Unsupported subpage: ${this.subPage}`);
+        }
+        this.loadingPage = true;
+        return request.then((response) => {
+            // the cursor of the next page is absent on the last page
+            this.nextCursor = response.headers["x-next-cursor"] || null;
+            this.historyTable.updateTable(response.data, append);
+        }).catch((error) => {
+            console.log(error);
+        }).finally(() => {
+            this.loadingPage = false;
+        });
+    }
 
+    addNextPageListener() {
+        const sentinel = document.getElementById("history-next-page-sentinel");
+        if (!sentinel) {
+            return;
         }
+        const observer = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting) && this.nextCursor && !this.loadingPage) {
+                this.fetchPage(true);
+            }
+        });
+        observer.observe(sentinel);
     }
 
 }
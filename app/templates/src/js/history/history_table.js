@@ -410,13 +410,13 @@ class HistoryTable {
     return tabs;
   }
 
-  updateTable(history) {
+  updateTable(history, append = false) {
     switch (this.subpage) {
       case "collection_history":
-        this.updateCollectionHistoryTable(history);
+        this.updateCollectionHistoryTable(history, append);
         break;
       case "publication_history":
-        this.updatePublicationHistoryTable(history);
+        this.updatePublicationHistoryTable(history, append);
         break;
     }
     const tooltipTriggerList = document.querySelectorAll(
@@ -427,7 +427,7 @@ class HistoryTable {
     );
   }
 
-  updatePublicationHistoryTable(history) {
+  updatePublicationHistoryTable(history, append = false) {
     const data = [];
     for (const reference of history) {
       const row = [
@@ -442,12 +442,14 @@ class HistoryTable {
       ];
       data.push(row);
     }
-    this.dataTable.clear();
+    if (!append) {
+      this.dataTable.clear();
+    }
     this.dataTable.rows.add(data);
-    this.dataTable.draw();
+    this.dataTable.draw(!append);
   }
 
-  updateCollectionHistoryTable(history) {
+  updateCollectionHistoryTable(history, append = false) {
     const data = [];
     for (const retrieval of history) {
       const row = [
@@ -465,9 +467,11 @@ class HistoryTable {
       ];
       data.push(row);
     }
-    this.dataTable.clear();
+    if (!append) {
+      this.dataTable.clear();
+    }
     this.dataTable.rows.add(data);
-    this.dataTable.draw();
+    this.dataTable.draw(!append);
     const popoverTriggerList = this.rootElement.querySelectorAll(
       '[data-bs-toggle="popover"]'
     );
@@ -0,0 +1,91 @@
+"""
+Compare the parsing time and the memory footprint of the read-only triple index
+with those of an rdflib Graph, on the Sudoc RDF documents of the test data.
+
+Usage: python scripts/benchmark_rdf_triple_index.py [rounds]
+"""
+
+from __future__ import annotations
+
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from rdflib import Graph
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
+
+DOCUMENTS_PATH = Path("tests/data/sudoc_rdf")
+
+
+def _parse_with_graph(data: str) -> Graph:
+    return Graph().parse(data=data, format="xml")
+
+
+def _parse_with_index(data: str) -> RdfTripleIndex:
+    return RdfTripleIndex.parse(data)
+
+
+def _parsing_time(parse: Callable, documents: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for document in documents:
+            parse(document)
+    return (time.perf_counter() - start) / rounds
+
+
+def _retained_memory(parse: Callable, documents: list[str]) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    parsed = [parse(document) for document in documents]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return retained, peak
+
+
+def main() -> int:
+    """
+    Parse the Sudoc test documents with both implementations and print the results
+    :return: 0 on success, 2 on usage error
+    """
+    if len(sys.argv) > 2:
+        print("Usage: python scripts/benchmark_rdf_triple_index.py [rounds]")
+        return 2
+    rounds = int(sys.argv[1]) if len(sys.argv) == 2 else 20
+    documents = [
+        path.read_text(encoding="utf-8")
+        for path in sorted(DOCUMENTS_PATH.glob("*.rdf"))
+    ]
+    print(
+        f"{len(documents)} documents, "
+        f"{sum(len(document) for document in documents) // 1024} KiB, "
+        f"{rounds} rounds"
+    )
+    print(
+        f"{'':<16}{'parse (ms)':>12}{'retained (KiB)':>16}"
+        f"{'peak (KiB)':>12}{'pickled (KiB)':>15}"
+    )
+    for name, parse in (
+        ("rdflib Graph", _parse_with_graph),
+        ("RdfTripleIndex", _parse_with_index),
+    ):
+        parse_time = _parsing_time(parse, documents, rounds)
+        retained, peak = _retained_memory(parse, documents)
+        pickled = sum(len(pickle.dumps(parse(document))) for document in documents)
+        print(
+            f"{name:<16}{parse_time * 1000:>12.1f}{retained / 1024:>16.0f}"
+            f"{peak / 1024:>12.0f}{pickled / 1024:>15.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
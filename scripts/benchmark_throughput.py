@@ -0,0 +1,321 @@
+"""
+Measure the end-to-end throughput of the harvesters without hitting the upstream
+APIs : local stand-ins of HAL, OpenAlex, Scopus, ScanR, IdRef and SUDOC serve
+the test data scaled up synthetically, and the retrievals are run by RetrievalService
+against the database of the settings (APP_ENV, DEV by default), whose tables
+are created if missing.
+
+For each harvester, the report gives the references per second,
+the p50/p95 latency of the retrievals, the database queries per reference
+and the peak resident memory. It is written as JSON, to compare commits
+with --baseline.
+
+Usage: python scripts/benchmark_throughput.py [--harvesters hal,openalex]
+    [--entities 20] [--records 200] [--parallelism 1] [--latency 0.02]
+    [--error-rate 0.0] [--seed 0] [--keep-host-quotas]
+    [--output throughput.json] [--baseline previous.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import os
+import platform
+import pkgutil
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("APP_ENV", "DEV")
+
+# pylint: disable=wrong-import-position, wrong-import-order
+from app.api.dependencies.event_types import event_types_or_default
+from app.config import get_app_settings
+from app.db import models
+from app.db.session import Base, engine
+from app.harvesters.idref import idref_sparql_client
+from app.http.aio_http_client_manager import AioHttpClientManager
+from app.models.custom_medatata import register_custom_metadata_schemas
+from app.models.people import Person
+from app.services.retrieval.retrieval_service import RetrievalService
+from throughput_benchmark.probes import QueryCounter, RssSampler, percentile
+from throughput_benchmark.stand_ins import (
+    IdrefSparqlStandIn,
+    ScanrStandIn,
+    StandIns,
+)
+
+HARVESTERS = ["hal", "openalex", "scopus", "scanr", "idref"]
+
+# compared with the baseline, with True if higher is better
+COMPARED_MEASURES = {
+    "references_per_second": True,
+    "retrieval_latency_p95": False,
+    "db_queries_per_reference": False,
+    "peak_rss_mib": False,
+}
+
+
+class _EventCounter:
+    """
+    Downstream of the retrieval progress logs, counting the events
+    instead of queuing them
+    """
+
+    def __init__(self):
+        self.references = 0
+        self.failed_harvestings = 0
+
+    async def put(self, message: dict) -> None:
+        """
+        :param message: message of a harvester
+        :return: None
+        """
+        if message.get("type") == "ReferenceEvent":
+            self.references += 1
+        elif message.get("type") == "Harvesting" and "failed" in (
+            # errors are notified with a status
+            message.get("state"),
+            message.get("status"),
+        ):
+            self.failed_harvestings += 1
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument(
+        "--harvesters",
+        default=",".join(HARVESTERS),
+        help="comma separated harvesters to benchmark, one after the other",
+    )
+    parser.add_argument(
+        "--entities", type=int, default=20, help="retrievals per harvester"
+    )
+    parser.add_argument(
+        "--records", type=int, default=200, help="references per retrieval"
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=1,
+        help="retrievals running at once, sharing journals and contributors",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="average latency of the stand-ins, in seconds",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="proportion of the requests answered with a 503 error",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the latencies and errors"
+    )
+    parser.add_argument(
+        "--keep-host-quotas",
+        action="store_true",
+        help="keep the per host concurrency and rate quotas of the settings",
+    )
+    parser.add_argument(
+        "--output", default="throughput.json", help="path of the JSON report"
+    )
+    parser.add_argument("--baseline", help="JSON report to compare the results with")
+    arguments = parser.parse_args()
+    unknown = set(arguments.harvesters.split(",")) - set(HARVESTERS)
+    if unknown:
+        parser.error(f"unknown harvesters: {', '.join(sorted(unknown))}")
+    return arguments
+
+
+async def _redirect(stand_ins: StandIns, keep_host_quotas: bool) -> None:
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = False
+    settings.openalex_api_key = settings.openalex_api_key or "benchmark"
+    if not keep_host_quotas:
+        settings.http_host_quotas = {}
+        settings.http_host_rate = None
+    # clients that do not use the shared aiohttp session
+    settings.scanr_es_host = str(stand_ins[ScanrStandIn.HOST].url)
+    idref_sparql_client.DATA_IDREF_FR_URL = str(
+        stand_ins[IdrefSparqlStandIn.HOST].url / "sparql"
+    )
+    await AioHttpClientManager.set_middlewares([stand_ins.redirect])
+
+
+def _entities(run_id: str, count: int) -> list[Person]:
+    return [
+        Person(
+            name=f"Benchmark Person {rank}",
+            identifiers=[
+                {"type": identifier_type, "value": f"{run_id}{rank:05d}"}
+                for identifier_type in ("idref", "orcid", "idhals", "scopus")
+            ],
+        )
+        for rank in range(count)
+    ]
+
+
+async def _benchmark(
+    harvester: str, arguments: argparse.Namespace, stand_ins: StandIns
+) -> dict:
+    # new identifiers at each run, so that all the references are created
+    entities = _entities(str(uuid.uuid4().int % 10**8), arguments.entities)
+    events = _EventCounter()
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(arguments.parallelism)
+
+    async def retrieve(entity: Person) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            service = RetrievalService(
+                harvesters=[harvester], events=event_types_or_default()
+            )
+            await service.register(entity)
+            await service.run(result_queue=events)
+            latencies.append(time.perf_counter() - start)
+
+    upstream_before = stand_ins.snapshot()
+    gc.collect()
+    with QueryCounter(engine) as queries, RssSampler() as memory:
+        start = time.perf_counter()
+        await asyncio.gather(*(retrieve(entity) for entity in entities))
+        duration = time.perf_counter() - start
+    upstream_after = stand_ins.snapshot()
+    return {
+        "retrievals": len(latencies),
+        "references": events.references,
+        "failed_harvestings": events.failed_harvestings,
+        "duration": duration,
+        "references_per_second": events.references / duration,
+        "retrieval_latency_p50": percentile(latencies, 50),
+        "retrieval_latency_p95": percentile(latencies, 95),
+        "db_queries": queries.count,
+        "db_queries_per_reference": queries.count / max(events.references, 1),
+        "peak_rss_mib": memory.peak / 1024**2,
+        "upstream": {
+            host: {
+                name: value - upstream_before[host][name]
+                for name, value in counters.items()
+            }
+            for host, counters in upstream_after.items()
+            if counters != upstream_before[host]
+        },
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return get_app_settings().git_commit
+
+
+async def _run(arguments: argparse.Namespace) -> dict:
+    stand_ins = StandIns(
+        arguments.records, arguments.latency, arguments.error_rate, arguments.seed
+    )
+    await stand_ins.start()
+    register_custom_metadata_schemas()
+    try:
+        await _redirect(stand_ins, arguments.keep_host_quotas)
+        for module in pkgutil.iter_modules(models.__path__):
+            importlib.import_module(f"{models.__name__}.{module.name}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        results = {}
+        for harvester in arguments.harvesters.split(","):
+            print(f"Benchmarking {harvester}...", flush=True)
+            results[harvester] = await _benchmark(harvester, arguments, stand_ins)
+    finally:
+        await AioHttpClientManager.close()
+        await stand_ins.stop()
+        await engine.dispose()
+    return {
+        "commit": _git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {
+            name: value
+            for name, value in vars(arguments).items()
+            if name not in ("output", "baseline")
+        },
+        "harvesters": results,
+    }
+
+
+def _print_report(report: dict, baseline: dict | None) -> None:
+    print(
+        f"{'':<10}{'refs':>8}{'refs/s':>10}{'p50 (s)':>10}{'p95 (s)':>10}"
+        f"{'queries/ref':>13}{'peak RSS (MiB)':>16}{'failed':>8}"
+    )
+    for harvester, result in report["harvesters"].items():
+        print(
+            f"{harvester:<10}{result['references']:>8}"
+            f"{result['references_per_second']:>10.1f}"
+            f"{result['retrieval_latency_p50']:>10.2f}"
+            f"{result['retrieval_latency_p95']:>10.2f}"
+            f"{result['db_queries_per_reference']:>13.1f}"
+            f"{result['peak_rss_mib']:>16.0f}"
+            f"{result['failed_harvestings']:>8}"
+        )
+    if baseline is None:
+        return
+    print(f"Compared with {baseline['commit'][:12]}:")
+    for harvester, result in report["harvesters"].items():
+        previous = baseline["harvesters"].get(harvester)
+        if previous is None:
+            continue
+        changes = []
+        for measure, higher_is_better in COMPARED_MEASURES.items():
+            if not previous[measure]:
+                continue
+            change = result[measure] / previous[measure] - 1
+            if abs(change) < 0.005:
+                verdict = "unchanged"
+            else:
+                verdict = "better" if (change > 0) == higher_is_better else "worse"
+            changes.append(f"{measure} {change:+.1%} ({verdict})")
+        print(f"  {harvester}: {', '.join(changes)}")
+
+
+def main() -> int:
+    """
+    Run the benchmark of the selected harvesters and write the JSON report
+    :return: 0 on success
+    """
+    arguments = _parse_args()
+    # the logs of thousands of references would dominate the measures
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    report = asyncio.run(_run(arguments))
+    Path(arguments.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    baseline = None
+    if arguments.baseline:
+        baseline = json.loads(Path(arguments.baseline).read_text(encoding="utf-8"))
+    _print_report(report, baseline)
+    print(f"Report written to {arguments.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,9 @@ os.environ["APP_ENV"] = "DEV"
 from app.services.jobs.concept_dereferencing_job import (  # pylint: disable=wrong-import-position
     ConceptDereferencingJob,
 )
+from app.services.jobs.metrics_rollup_job import (  # pylint: disable=wrong-import-position
+    MetricsRollupJob,
+)
 
 
 def _parse_args():
@@ -30,6 +33,9 @@ async def _run_job(job_args):
     if job_name == "concept_dereferencing":
         print("Running concept_dereferencing job")
         await ConceptDereferencingJob().run()
+    elif job_name == "metrics_rollup":
+        print("Running metrics_rollup job")
+        await MetricsRollupJob().run()
 
 
 if __name__ == "__main__":
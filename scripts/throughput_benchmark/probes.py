@@ -0,0 +1,99 @@
+"""
+Measures taken while the harvesters run : database queries,
+resident memory and latency percentiles
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import resource
+import threading
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+STATM_PATH = Path("/proc/self/statm")
+
+
+class QueryCounter:
+    """
+    Count the statements sent to the database by an engine
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        """
+        :param engine: engine of the application sessions
+        """
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def __enter__(self) -> "QueryCounter":
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_) -> None:
+        self.count += 1
+
+
+class RssSampler:
+    """
+    Sample the resident memory of the process in a thread, to get its peak
+    during a run : the peak reported by the kernel only grows for the whole process.
+    Falls back on that peak where /proc is not available.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        """
+        :param interval: seconds between two samples
+        """
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = self.rss()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.rss())
+
+    @staticmethod
+    def rss() -> int:
+        """
+        :return: resident memory of the process in bytes
+        """
+        try:
+            pages = int(STATM_PATH.read_text(encoding="ascii").split()[1])
+            return pages * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self.rss())
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """
+    Percentile with the nearest rank method
+
+    :param values: measured values
+    :param rank: percentile rank, between 0 and 100
+    :return: the percentile, 0 if there are no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
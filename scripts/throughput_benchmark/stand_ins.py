@@ -0,0 +1,450 @@
+"""
+Local aiohttp servers standing in for the upstream hosts of the harvesters,
+serving the recorded payloads of the test data, scaled up synthetically.
+
+Each stand-in derives a key from the request, without its paging parameters,
+so that every entity gets its own set of records, identified by the key
+and the rank of the record : the references of two entities never collide,
+and the pages of a result set are consistent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import random
+import re
+import zlib
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlencode
+
+from aiohttp import web
+from yarl import URL
+
+DATA_PATH = Path(__file__).resolve().parent.parent.parent / "tests" / "data"
+
+
+class StandIn:  # pylint: disable=too-many-instance-attributes
+    """
+    Local server answering the requests sent to an upstream host,
+    after a latency, or with a 503 error at the configured rate
+    """
+
+    # host name of the upstream
+    HOST: str = ""
+
+    def __init__(self, records: int, latency: float, error_rate: float, seed: int):
+        """
+        :param records: number of records served per entity
+        :param latency: average latency of the responses, in seconds
+        :param error_rate: proportion of the requests answered with a 503 error
+        :param seed: seed of the latencies and errors, for reproducible runs
+        """
+        self.records = records
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.url: URL | None = None
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """
+        Start the server on a free local port
+
+        :return: None
+        """
+        app = web.Application(client_max_size=16 * 1024**2)
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = URL.build(scheme="http", host=host, port=port)
+
+    async def stop(self) -> None:
+        """
+        Stop the server
+
+        :return: None
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def snapshot(self) -> dict:
+        """
+        :return: number of requests served and of errors simulated
+        """
+        return {"requests": self.requests, "errors": self.errors}
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        """
+        Build the response to a request
+
+        :param request: request redirected to the stand-in
+        :return: the response
+        """
+        raise web.HTTPNotFound()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency * self.random.uniform(0.5, 1.5))
+        if self.random.random() < self.error_rate:
+            self.errors += 1
+            raise web.HTTPServiceUnavailable()
+        return await self.respond(request)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """
+        :param parts: parts of the request identifying the entity
+        :return: digits identifying the records of the entity
+        """
+        return str(zlib.crc32("\n".join(parts).encode("utf-8")))
+
+    @staticmethod
+    def query_without(request: web.Request, *names: str) -> str:
+        """
+        :param request: request redirected to the stand-in
+        :param names: names of the paging parameters
+        :return: query string of the request without the paging parameters
+        """
+        return urlencode(
+            [
+                (name, value)
+                for name, value in request.query.items()
+                if name not in names
+            ]
+        )
+
+    @staticmethod
+    def load_json(*paths: str) -> list[dict]:
+        """
+        :param paths: paths of json files relative to the test data directory
+        :return: the parsed files
+        """
+        return [
+            json.loads((DATA_PATH / path).read_text(encoding="utf-8")) for path in paths
+        ]
+
+
+class HalStandIn(StandIn):
+    """
+    HAL search API, with cursor pagination
+    """
+
+    HOST = "api.archives-ouvertes.fr"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.templates = [
+            doc
+            for payload in self.load_json(
+                "hal_api/docs_for_researcher.json",
+                "hal_api/docs_for_researcher_with_uris.json",
+                "hal_api/docs_with_contributor_identifiers.json",
+            )
+            for doc in payload["response"]["docs"]
+        ]
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        key = self.key(self.query_without(request, "cursorMark", "rows"))
+        cursor = request.query.get("cursorMark", "*")
+        start = 0 if cursor == "*" else int(cursor)
+        end = min(self.records, start + int(request.query.get("rows", 30)))
+        docs = []
+        for rank in range(start, end):
+            doc = copy.deepcopy(self.templates[rank % len(self.templates)])
+            doc["docid"] = int(f"{key}{rank:06d}")
+            doc["halId_s"] = f"hal-{key}-{rank}"
+            docs.append(doc)
+        return web.json_response(
+            {
+                "response": {
+                    "numFound": self.records,
+                    "start": start,
+                    "numFoundExact": True,
+                    "docs": docs,
+                },
+                "nextCursorMark": str(end) if end < self.records else cursor,
+            }
+        )
+
+
+class OpenAlexStandIn(StandIn):
+    """
+    OpenAlex works API, with page pagination
+    """
+
+    HOST = "api.openalex.org"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.templates = self.load_json(
+            "open_alex_api/open_alex_work_response.json",
+            "open_alex_api/open_alex_work_with_hal_locations.json",
+            "open_alex_api/open_alex_work_with_various_locations.json",
+        )
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        key = self.key(self.query_without(request, "page", "per_page"))
+        per_page = int(request.query.get("per_page", 25))
+        page = int(request.query.get("page", 1))
+        results = []
+        for rank in range((page - 1) * per_page, min(self.records, page * per_page)):
+            work = copy.deepcopy(self.templates[rank % len(self.templates)])
+            work["id"] = f"https://openalex.org/W{key}{rank:06d}"
+            work.setdefault("ids", {})["openalex"] = work["id"]
+            results.append(work)
+        return web.json_response(
+            {
+                "meta": {"count": self.records, "page": page, "per_page": per_page},
+                "results": results,
+            }
+        )
+
+
+class ScopusStandIn(StandIn):
+    """
+    Scopus search API, with pages of 25 entries
+    """
+
+    HOST = "api.elsevier.com"
+    PAGE_SIZE = 25
+    ENTRY = re.compile(r"<entry>.*?</entry>", re.DOTALL)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        documents = [
+            (DATA_PATH / "scopus_api" / name).read_text(encoding="utf-8")
+            for name in ("scopus_document.xml", "scopus_document_book.xml")
+        ]
+        self.header = documents[0][: self.ENTRY.search(documents[0]).start()]
+        self.templates = [
+            (entry, re.search(r"SCOPUS_ID:(\d+)", entry).group(1))
+            for document in documents
+            for entry in self.ENTRY.findall(document)
+        ]
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        key = self.key(self.query_without(request, "start"))
+        start = int(request.query.get("start", 0))
+        entries = []
+        for rank in range(start, min(self.records, start + self.PAGE_SIZE)):
+            entry, scopus_id = self.templates[rank % len(self.templates)]
+            entries.append(entry.replace(scopus_id, f"{key}{rank:06d}"))
+        header = re.sub(
+            r"<opensearch:totalResults>\d+</opensearch:totalResults>",
+            f"<opensearch:totalResults>{self.records}</opensearch:totalResults>",
+            self.header,
+        )
+        return web.Response(
+            text=header + "\n".join(entries) + "\n</search-results>",
+            content_type="application/xml",
+        )
+
+
+class ScanrStandIn(StandIn):
+    """
+    ScanR Elasticsearch cluster, with the persons and publications indexes
+    """
+
+    HOST = "scanr"
+    # product check of the elasticsearch client
+    HEADERS = {"X-Elastic-Product": "Elasticsearch"}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.person = self.load_json("scanr_api/scanr_api_person_doc.json")[0]
+        self.templates = [
+            hit
+            for payload in self.load_json(
+                "scanr_api/scanr_api_publication_doc.json",
+                "scanr_api/scanr_api_publication_doc_book.json",
+                "scanr_api/scanr_publication_doc_with_keywords_domains.json",
+            )
+            for hit in payload["hits"]["hits"]
+        ]
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        if request.path.strip("/") == "":
+            return web.json_response(
+                {
+                    "version": {"number": "7.17.13", "build_flavor": "default"},
+                    "tagline": "You Know, for Search",
+                },
+                headers=self.HEADERS,
+            )
+        key = self.key(await request.text())
+        if request.path.startswith("/scanr-persons/"):
+            person = copy.deepcopy(self.person)
+            person["_source"]["id"] = f"idref{key}"
+            return self._hits([person], total=1)
+        start = int(request.query.get("from", 0))
+        hits = []
+        for rank in range(
+            start, min(self.records, start + int(request.query.get("size", 10)))
+        ):
+            hit = copy.deepcopy(self.templates[rank % len(self.templates)])
+            hit["_id"] = f"{key}-{rank}"
+            hit["_source"]["id"] = f"bench{key}{rank:06d}"
+            hits.append(hit)
+        return self._hits(hits, total=self.records)
+
+    def _hits(self, hits: list[dict], total: int) -> web.Response:
+        return web.json_response(
+            {
+                "timed_out": False,
+                "hits": {"total": {"value": total, "relation": "eq"}, "hits": hits},
+            },
+            headers=self.HEADERS,
+        )
+
+
+class IdrefSparqlStandIn(StandIn):
+    """
+    data.idref.fr SPARQL endpoint, listing SUDOC publications
+    """
+
+    HOST = "data.idref.fr"
+    TEMPLATE_PUBLICATION = "http://www.sudoc.fr/193726130/id"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.template = self.load_json(
+            "idref_sparql_endpoint/idref_result_with_sudoc_reference.json"
+        )[0]
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        query = (await request.post()).get("query", "")
+        if "?pub" not in query:
+            # concept queries : no labels
+            return web.json_response(
+                {"head": {"vars": []}, "results": {"bindings": []}}
+            )
+        key = self.key(query)
+        bindings = []
+        for rank in range(self.records):
+            for binding in self.template["results"]["bindings"]:
+                binding = copy.deepcopy(binding)
+                binding["pub"]["value"] = f"http://www.sudoc.fr/{key}{rank:06d}/id"
+                bindings.append(binding)
+        return web.json_response(
+            {
+                "head": self.template["head"],
+                "results": {"distinct": False, "ordered": True, "bindings": bindings},
+            }
+        )
+
+
+class SudocStandIn(StandIn):
+    """
+    SUDOC RDF documents
+    """
+
+    HOST = "www.sudoc.fr"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.templates = []
+        for name in ("document.rdf", "document_book.rdf", "thesis.rdf"):
+            document = (DATA_PATH / "sudoc_rdf" / name).read_text(encoding="utf-8")
+            sudoc_id = re.search(r"http://www\.sudoc\.fr/(\w+)/id", document).group(1)
+            self.templates.append((document, sudoc_id))
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        sudoc_id = request.path.strip("/").removesuffix(".rdf")
+        document, template_id = self.templates[
+            zlib.crc32(sudoc_id.encode()) % len(self.templates)
+        ]
+        return web.Response(
+            text=document.replace(template_id, sudoc_id),
+            content_type="application/rdf+xml",
+        )
+
+
+class StandIns:
+    """
+    Stand-ins of all the upstream hosts, with a client middleware
+    redirecting the requests of the harvesters to them.
+    Requests to other hosts are answered with a 404 error by a fallback stand-in,
+    so that the benchmark never reaches the network.
+    """
+
+    CLASSES = [
+        HalStandIn,
+        OpenAlexStandIn,
+        ScopusStandIn,
+        ScanrStandIn,
+        IdrefSparqlStandIn,
+        SudocStandIn,
+    ]
+
+    def __init__(self, records: int, latency: float, error_rate: float, seed: int):
+        """
+        :param records: number of records served per entity
+        :param latency: average latency of the responses, in seconds
+        :param error_rate: proportion of the requests answered with a 503 error
+        :param seed: seed of the latencies and errors
+        """
+        self.by_host: dict[str, StandIn] = {
+            stand_in_class.HOST: stand_in_class(
+                records, latency, error_rate, seed + index
+            )
+            for index, stand_in_class in enumerate(self.CLASSES)
+        }
+        self.fallback = StandIn(records, 0, 0, seed)
+
+    def __iter__(self) -> Iterable[StandIn]:
+        return iter([*self.by_host.values(), self.fallback])
+
+    def __getitem__(self, host: str) -> StandIn:
+        return self.by_host[host]
+
+    async def start(self) -> None:
+        """
+        Start all the stand-ins
+
+        :return: None
+        """
+        for stand_in in self:
+            await stand_in.start()
+
+    async def stop(self) -> None:
+        """
+        Stop all the stand-ins
+
+        :return: None
+        """
+        for stand_in in self:
+            await stand_in.stop()
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        :return: requests and errors by upstream host, "other" for the unknown hosts
+        """
+        return {
+            host: stand_in.snapshot() for host, stand_in in self.by_host.items()
+        } | {"other": self.fallback.snapshot()}
+
+    async def redirect(self, request, handler):
+        """
+        aiohttp client middleware sending a request to the stand-in of its host
+
+        :param request: aiohttp ClientRequest
+        :param handler: next handler of the middleware chain
+        :return: the response of the stand-in
+        """
+        stand_in = self.by_host.get(request.url.host, self.fallback)
+        request.url = (
+            request.url.with_scheme("http")
+            .with_host(stand_in.url.host)
+            .with_port(stand_in.url.port)
+        )
+        return await handler(request)
@@ -11,7 +11,11 @@ from starlette.testclient import TestClient
 from loguru import logger
 from app.db.models.concept import Concept as DbConcept
 from app.db.session import engine, Base
+from app.http.circuit_breaker import CircuitBreakerRegistry
+from app.http.host_scheduler import HostScheduler
 from app.models.custom_medatata import register_custom_metadata_schemas
+from app.monitoring.runtime_metrics import RuntimeMetrics
+from app.monitoring.tracing import Tracer
 from app.services.concepts.abes_concept_solver import AbesConceptSolver
 from app.services.concepts.concept_informations import ConceptInformations
 from app.services.errors.dereferencing_error import DereferencingError
@@ -69,6 +73,38 @@ def fixture_custom_metadata_schema():
     register_custom_metadata_schemas()
 
 
+@pytest.fixture(autouse=True, name="circuit_breakers")
+def fixture_circuit_breakers():
+    """
+    Forget the circuit breakers opened by the failures simulated in previous tests
+    """
+    CircuitBreakerRegistry.reset()
+
+
+@pytest.fixture(autouse=True, name="host_scheduler")
+def fixture_host_scheduler():
+    """
+    Forget the host quotas bound to the event loops of previous tests
+    """
+    HostScheduler.reset()
+
+
+@pytest.fixture(autouse=True, name="runtime_metrics")
+def fixture_runtime_metrics():
+    """
+    Forget the runtime metrics recorded by previous tests
+    """
+    RuntimeMetrics.reset()
+
+
+@pytest.fixture(autouse=True, name="tracer")
+def fixture_tracer():
+    """
+    Disable the tracing enabled by previous tests
+    """
+    Tracer.configure(None)
+
+
 @pytest.fixture(autouse=True, name="event_loop")
 def fixture_event_loop():
     """Provide an event loop for all tests"""
@@ -1,7 +1,8 @@
 import pathlib
 
 import pytest
-from rdflib import Graph
+
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 
 
 @pytest.fixture(name="idref_rdf_result_for_person")
@@ -14,14 +15,14 @@ def fixture_idref_rdf_result_for_person(_base_path) -> str:
     return _idref_rdf_graph_from_file(_base_path, "idref_person")
 
 
-def _idref_rdf_graph_from_file(base_path, file_name) -> Graph:
+def _idref_rdf_graph_from_file(base_path, file_name) -> RdfTripleIndex:
     file_path = f"data/idref_people_rdf/{file_name}.rdf"
     return _rdf_graph_from_xml_file(base_path, file_path)
 
 
-def _rdf_graph_from_xml_file(base_path, file_path) -> Graph:
+def _rdf_graph_from_xml_file(base_path, file_path) -> RdfTripleIndex:
     input_data = _rdf_xml_file_content(base_path, file_path)
-    return Graph().parse(data=input_data, format="xml")
+    return RdfTripleIndex.parse(input_data)
 
 
 def _rdf_xml_file_content(base_path, file_path):
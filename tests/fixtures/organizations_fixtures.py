@@ -64,8 +64,16 @@ def fixture_mock_openalex_organization_solver():
     """
     Mock the openalex organization solver with fake organization solver
     """
-    with mock.patch.object(OpenAlexOrganizationSolver, "solve") as mock_solve:
+    with mock.patch.object(
+        OpenAlexOrganizationSolver, "solve"
+    ) as mock_solve, mock.patch.object(
+        OpenAlexOrganizationSolver, "solve_many"
+    ) as mock_solve_many:
         mock_solve.side_effect = fake_openalex_organization_solver
+        mock_solve_many.side_effect = lambda organization_informations: [
+            fake_openalex_organization_solver(organization_information.identifier)
+            for organization_information in organization_informations
+        ]
         yield mock_solve
 
 
@@ -1,9 +1,9 @@
 import pathlib
 
 import pytest
-from rdflib import Graph
 
 from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult
 
 
@@ -20,7 +20,7 @@ def fixture_persee_rdf_result_for_doc(
 
 
 @pytest.fixture(name="persee_rdf_graph_for_doc")
-def fixture_persee_rdf_graph_for_doc(_base_path) -> Graph:
+def fixture_persee_rdf_graph_for_doc(_base_path) -> RdfTripleIndex:
     """Rdf graph from persee rdf file"""
     return _persee_rdf_graph_from_file(_base_path, "persee_document")
 
@@ -40,7 +40,7 @@ def fixture_persee_rdf_result_for_doc_with_invalid_dateofpublication(
 @pytest.fixture(name="persee_rdf_graph_for_doc_with_invalid_dateofpublication")
 def fixture_persee_rdf_graph_for_doc_with_invalid_dateofpublication(
     _base_path,
-) -> Graph:
+) -> RdfTripleIndex:
     """Rdf graph from persee rdf file"""
     return _persee_rdf_graph_from_file(
         _base_path, "persee_document_with_invalid_dateofpublication"
@@ -62,7 +62,7 @@ def fixture_persee_rdf_result_for_doc_with_invalid_dateofprintpublication(
 @pytest.fixture(name="persee_rdf_graph_for_doc_with_invalid_dateofprintpublication")
 def fixture_persee_rdf_graph_for_doc_with_invalid_dateofprintpublication(
     _base_path,
-) -> Graph:
+) -> RdfTripleIndex:
     """Rdf graph from persee rdf file"""
     return _persee_rdf_graph_from_file(
         _base_path, "persee_document_with_invalid_dateofprintpublication"
@@ -70,19 +70,19 @@ def fixture_persee_rdf_graph_for_doc_with_invalid_dateofprintpublication(
 
 
 @pytest.fixture(name="persee_rdf_xml_for_hash_1")
-def fixture_persee_rdf_xml_for_hash_1(_base_path) -> Graph:
+def fixture_persee_rdf_xml_for_hash_1(_base_path) -> RdfTripleIndex:
     """Rdf graph from persee rdf file"""
     return _persee_rdf_graph_from_file(_base_path, "persee_document_for_hash_1")
 
 
 @pytest.fixture(name="persee_rdf_xml_for_hash_2")
-def fixture_persee_rdf_xml_for_hash_2(_base_path) -> Graph:
+def fixture_persee_rdf_xml_for_hash_2(_base_path) -> RdfTripleIndex:
     """Rdf graph from persee rdf file"""
     return _persee_rdf_graph_from_file(_base_path, "persee_document_for_hash_2")
 
 
 @pytest.fixture(name="persee_rdf_graph_for_person")
-def fixture_persee_rdf_graph_for_person(_base_path) -> Graph:
+def fixture_persee_rdf_graph_for_person(_base_path) -> RdfTripleIndex:
     """Rdf graph from persee Person rdf file"""
     return _persee_rdf_graph_from_file(_base_path, "persee_person")
 
@@ -95,19 +95,19 @@ def fixture_persee_rdf_xml_person_with_wrong_dates(_base_path) -> str:
 
 
 @pytest.fixture(name="persee_rdf_result_for_journal")
-def fixture_persee_rdf_result_for_journal(_base_path) -> Graph:
+def fixture_persee_rdf_result_for_journal(_base_path) -> RdfTripleIndex:
     """Rdf graph from persee Journal rdf file"""
     return _persee_rdf_graph_from_file(_base_path, "persee_journal")
 
 
-def _persee_rdf_graph_from_file(base_path, file_name) -> Graph:
+def _persee_rdf_graph_from_file(base_path, file_name) -> RdfTripleIndex:
     file_path = f"data/persee_rdf/{file_name}.rdf"
     return _rdf_graph_from_xml_file(base_path, file_path)
 
 
-def _rdf_graph_from_xml_file(base_path, file_path) -> Graph:
+def _rdf_graph_from_xml_file(base_path, file_path) -> RdfTripleIndex:
     input_data = _rdf_xml_file_content(base_path, file_path)
-    return Graph().parse(data=input_data, format="xml")
+    return RdfTripleIndex.parse(input_data)
 
 
 def _rdf_xml_file_content(base_path, file_path):
@@ -1,22 +1,24 @@
 from unittest import mock
 import pytest
-from rdflib import Graph
 
 from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.services.errors.dereferencing_error import DereferencingError
 
 
 @pytest.fixture(name="fake_rdf_resolver_fixture")
 def fixture_fake_rdf_resolver_fixture(
-    sudoc_rdf_graph_for_doc: Graph,
-    persee_rdf_graph_for_person: Graph,
-    sudoc_rdf_result_for_journal: Graph,
-    persee_rdf_result_for_journal: Graph,
-    science_plus_rdf_result_for_journal: Graph,
-    science_plus_rdf_result_for_issue: Graph,
-    idref_rdf_result_for_person: Graph,
+    sudoc_rdf_graph_for_doc: RdfTripleIndex,
+    persee_rdf_graph_for_person: RdfTripleIndex,
+    sudoc_rdf_result_for_journal: RdfTripleIndex,
+    persee_rdf_result_for_journal: RdfTripleIndex,
+    science_plus_rdf_result_for_journal: RdfTripleIndex,
+    science_plus_rdf_result_for_issue: RdfTripleIndex,
+    idref_rdf_result_for_person: RdfTripleIndex,
 ):
-    def fake_rdf_resolver(document_uri: str, output_format: str = "xml") -> Graph:
+    def fake_rdf_resolver(
+        document_uri: str, output_format: str = "xml"
+    ) -> RdfTripleIndex:
         """
         Fake rdf resolver fetch
         :param document_uri: document uri
@@ -20,6 +20,11 @@ def fixture_redis_cache_get_mock():
 def fixture_redis_cache_mock(redis_cache_get_mock):
     redis_instance = mock.AsyncMock(spec=redis.Redis)
     redis_instance.get.side_effect = redis_cache_get_mock
+
+    async def fake_redis_mget(keys: list[str]):
+        return [await redis_cache_get_mock(name) for name in keys]
+
+    redis_instance.mget.side_effect = fake_redis_mget
     redis_instance.set = mock.AsyncMock(return_value=None)
     redis_instance.expire.return_value = None
     redis_instance.ping.return_value = True
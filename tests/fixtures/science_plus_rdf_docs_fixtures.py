@@ -1,9 +1,10 @@
 import pathlib
 
 import pytest
-from rdflib import Graph, URIRef
+from rdflib import URIRef
 
 from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult as RdfResult
 
 
@@ -38,7 +39,7 @@ def fixture_science_plus_rdf_result_for_doc(
 
 
 @pytest.fixture(name="science_plus_rdf_graph_for_doc_without_title")
-def fixture_science_plus_rdf_graph_for_doc_without_title(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_doc_without_title(_base_path) -> RdfTripleIndex:
     """Rdf graph from science plus rdf file without title"""
     return _science_plus_rdf_graph_from_file(
         _base_path, "science_plus_document_without_title"
@@ -46,25 +47,25 @@ def fixture_science_plus_rdf_graph_for_doc_without_title(_base_path) -> Graph:
 
 
 @pytest.fixture(name="science_plus_rdf_graph_for_doc")
-def fixture_science_plus_rdf_graph_for_doc(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_doc(_base_path) -> RdfTripleIndex:
     """Rdf graph from science plus rdf file"""
     return _science_plus_rdf_graph_from_file(_base_path, "science_plus_document")
 
 
 @pytest.fixture(name="science_plus_rdf_result_for_journal")
-def fixture_science_plus_rdf_graph_for_journal(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_journal(_base_path) -> RdfTripleIndex:
     """Rdf result from science plus rdf journal file"""
     return _science_plus_rdf_graph_from_file(_base_path, "science_plus_journal")
 
 
 @pytest.fixture(name="science_plus_rdf_result_for_issue")
-def fixture_science_plus_rdf_graph_for_issue(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_issue(_base_path) -> RdfTripleIndex:
     """Rdf result from science plus rdf issue file"""
     return _science_plus_rdf_graph_from_file(_base_path, "science_plus_issue")
 
 
 @pytest.fixture(name="science_plus_rdf_graph_for_hash_1")
-def fixture_science_plus_rdf_graph_for_hash_1(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_hash_1(_base_path) -> RdfTripleIndex:
     """Rdf graph from science plus rdf file"""
     return _science_plus_rdf_graph_from_file(
         _base_path, "science_plus_document_for_hash_1"
@@ -72,7 +73,7 @@ def fixture_science_plus_rdf_graph_for_hash_1(_base_path) -> Graph:
 
 
 @pytest.fixture(name="science_plus_rdf_graph_for_hash_2")
-def fixture_science_plus_rdf_graph_for_hash_2(_base_path) -> Graph:
+def fixture_science_plus_rdf_graph_for_hash_2(_base_path) -> RdfTripleIndex:
     """Rdf graph from science plus rdf file"""
     return _science_plus_rdf_graph_from_file(
         _base_path, "science_plus_document_for_hash_2"
@@ -91,14 +92,14 @@ def fixture_science_plus_raw_result_for_concept(_base_path) -> str:
     return _abes_concepts_raw_rdf_from_file(_base_path, "science_plus_abes_concept")
 
 
-def _science_plus_rdf_graph_from_file(base_path, file_name) -> Graph:
+def _science_plus_rdf_graph_from_file(base_path, file_name) -> RdfTripleIndex:
     file_path = f"data/science_plus_rdf/{file_name}.rdf"
     return _rdf_graph_from_xml_file(base_path, file_path)
 
 
-def _rdf_graph_from_xml_file(base_path, file_path) -> Graph:
+def _rdf_graph_from_xml_file(base_path, file_path) -> RdfTripleIndex:
     input_data = _rdf_xml_file_content(base_path, file_path)
-    return Graph().parse(data=input_data, format="xml")
+    return RdfTripleIndex.parse(input_data)
 
 
 def _abes_concepts_raw_rdf_from_file(base_path, file_name) -> str:
@@ -1,9 +1,10 @@
 import pathlib
 
 import pytest
-from rdflib import Graph, URIRef
+from rdflib import URIRef
 
 from app.harvesters.idref.idref_harvester import IdrefHarvester
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.rdf_harvester_raw_result import RdfHarvesterRawResult as RdfResult
 
 
@@ -97,67 +98,69 @@ def fixture_sudoc_rdf_result_for_doc_without_title(
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_book")
-def fixture_sudoc_rdf_graph_for_book(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_book(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_book")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_doc_without_title")
-def fixture_sudoc_rdf_graph_for_doc_without_title(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_doc_without_title(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_without_title")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_doc")
-def fixture_sudoc_rdf_graph_for_doc(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_doc(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_doc_with_invalid_created")
-def fixture_sudoc_rdf_graph_for_doc_with_invalid_created(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_doc_with_invalid_created(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_with_invalid_created")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_doc_with_empty_issued")
-def fixture_sudoc_rdf_graph_for_doc_with_empty_issued(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_doc_with_empty_issued(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_with_empty_issued")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_doc_with_multiple_issued")
-def fixture_sudoc_rdf_graph_for_doc_with_multiple_issued(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_doc_with_multiple_issued(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_with_multiple_issued")
 
 
 @pytest.fixture(name="sudoc_rdf_result_for_journal")
-def fixture_sudoc_rdf_result_for_journal(_base_path) -> Graph:
+def fixture_sudoc_rdf_result_for_journal(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc journal rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "journal")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_hash_1")
-def fixture_sudoc_rdf_graph_for_hash_1(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_hash_1(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_for_hash_1")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_hash_2")
-def fixture_sudoc_rdf_graph_for_hash_2(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_hash_2(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "document_for_hash_2")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_thesis")
-def fixture_sudoc_rdf_graph_for_thesis(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_thesis(_base_path) -> RdfTripleIndex:
     """Rdf graph from sudoc rdf file"""
     return _sudoc_rdf_graph_from_file(_base_path, "thesis")
 
 
 @pytest.fixture(name="sudoc_rdf_graph_for_thesis_without_bibo_uri_thesesfr")
-def fixture_sudoc_rdf_graph_for_thesis_without_bibo_uri_thesesfr(_base_path) -> Graph:
+def fixture_sudoc_rdf_graph_for_thesis_without_bibo_uri_thesesfr(
+    _base_path,
+) -> RdfTripleIndex:
     return _sudoc_rdf_graph_from_file(_base_path, "thesis_without_bibo_uri_thesesfr")
 
 
@@ -174,14 +177,14 @@ def fixture_sudoc_rdf_xml_for_doc(_base_path) -> str:
     return _rdf_xml_file_content(_base_path, "document")
 
 
-def _sudoc_rdf_graph_from_file(base_path, file_name) -> Graph:
+def _sudoc_rdf_graph_from_file(base_path, file_name) -> RdfTripleIndex:
     file_path = f"data/sudoc_rdf/{file_name}.rdf"
     return _rdf_graph_from_xml_file(base_path, file_path)
 
 
-def _rdf_graph_from_xml_file(base_path, file_path) -> Graph:
+def _rdf_graph_from_xml_file(base_path, file_path) -> RdfTripleIndex:
     input_data = _rdf_xml_file_content(base_path, file_path)
-    return Graph().parse(data=input_data, format="xml")
+    return RdfTripleIndex.parse(input_data)
 
 
 def _rdf_xml_file_content(base_path, file_path):
@@ -0,0 +1,37 @@
+"""Test the admin API."""
+
+from fastapi.testclient import TestClient
+
+from app.auth.basic import require_basic_user
+
+
+def test_admin_tasks_require_authentication(test_client: TestClient):
+    """
+    GIVEN the basic authentication of the API disabled
+    WHEN the live tasks are requested without credentials
+    THEN the request is rejected
+    """
+    response = test_client.get("/api/v1/admin/tasks")
+    assert response.status_code == 401
+
+
+def test_admin_tasks_lists_live_tasks(test_client: TestClient):
+    """
+    GIVEN an authenticated user
+    WHEN the live tasks are requested
+    THEN the tasks of the event loop are described
+    """
+    test_client.app.dependency_overrides[require_basic_user] = lambda: "admin"
+    try:
+        response = test_client.get("/api/v1/admin/tasks")
+    finally:
+        test_client.app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert response.json()
+    assert set(response.json()[0]) == {
+        "name",
+        "coroutine",
+        "age",
+        "await_point",
+        "await_chain",
+    }
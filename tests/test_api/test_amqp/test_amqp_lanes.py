@@ -0,0 +1,64 @@
+"""Test the priority lanes of the AMQP messages."""
+
+from unittest.mock import MagicMock
+
+from app.amqp.amqp_lanes import AMQPLanes
+
+
+async def test_interactive_lane_is_served_first_without_starving_bulk_lane():
+    """
+    GIVEN bulk and interactive messages waiting, with an interactive weight of 2
+    WHEN the workers take the messages
+    THEN two interactive messages are taken for each bulk message
+    AND the remaining bulk messages are taken once the interactive lane is empty
+    """
+    lanes = AMQPLanes(maxsize=100, interactive_weight=2)
+    for index in range(3):
+        await lanes.put(AMQPLanes.Lane.BULK, MagicMock(body=f"bulk {index}"))
+    for index in range(4):
+        await lanes.put(
+            AMQPLanes.Lane.INTERACTIVE, MagicMock(body=f"interactive {index}")
+        )
+    taken = []
+    for _ in range(7):
+        lane, message = await lanes.get()
+        taken.append(message.body)
+        lanes.task_done(lane, 0.5)
+    assert taken == [
+        "interactive 0",
+        "interactive 1",
+        "bulk 0",
+        "interactive 2",
+        "interactive 3",
+        "bulk 1",
+        "bulk 2",
+    ]
+
+
+async def test_lanes_snapshot_reports_depth_and_latencies():
+    """
+    GIVEN messages waiting in the bulk lane
+    WHEN one of them is processed and another one is being processed
+    THEN the snapshot reports the depth, the messages in progress
+        and the latencies of the lane
+    """
+    lanes = AMQPLanes(maxsize=100, interactive_weight=2)
+    for index in range(3):
+        await lanes.put(AMQPLanes.Lane.BULK, MagicMock(body=f"bulk {index}"))
+    lane, _ = await lanes.get()
+    lanes.task_done(lane, 2.0)
+    await lanes.get()
+    snapshot = lanes.snapshot()
+    assert snapshot["interactive"] == {
+        "depth": 0,
+        "in_progress": 0,
+        "processed": 0,
+        "average_wait_time": 0.0,
+        "max_wait_time": 0.0,
+        "average_processing_time": 0.0,
+    }
+    assert snapshot["bulk"]["depth"] == 1
+    assert snapshot["bulk"]["in_progress"] == 1
+    assert snapshot["bulk"]["processed"] == 1
+    assert snapshot["bulk"]["average_processing_time"] == 2.0
+    assert snapshot["bulk"]["max_wait_time"] >= 0.0
@@ -1,4 +1,5 @@
 """Test the references API."""
+
 import asyncio
 from unittest import mock
 
@@ -8,6 +9,8 @@ from app.amqp.amqp_message_processor import AMQPMessageProcessor
 from app.amqp.amqp_message_publisher import AMQPMessagePublisher
 from app.config import get_app_settings
 from app.models.people import Person
+from app.harvesters.exceptions.invalid_entity_error import InvalidEntityError
+from app.services.retrieval.retrieval_batch_service import RetrievalBatchService
 from app.services.retrieval.retrieval_service import RetrievalService
 
 
@@ -105,3 +108,66 @@ async def test_amqp_message_runs_retrieval_service_with_parameters(
         assert init_args["identifiers_safe_mode"] is True
         assert init_args["nullify"] == ["orcid"]
         assert init_args["events"] == ["updated"]
+
+
+async def test_amqp_person_batch_message_runs_retrieval_batch_service(
+    message_processor: AMQPMessageProcessor,
+):
+    """
+    GIVEN a batch message with two valid persons and one without identifiers
+    WHEN the message is processed
+    THEN the retrievals of the valid persons are registered and run at once
+    AND the invalid person is reported without aborting the batch
+    AND a single reply lists the retrieval ids in the order of the persons
+    """
+    payload = (
+        '{"type": "person_batch", "reply": true, "events": ["created"], '
+        '"persons": ['
+        '{"name": "Doe, John", '
+        '"identifiers": [{"type": "orcid", "value": "0000-0002-1825-0097"}]}, '
+        '{"name": "Nobody"}, '
+        '{"name": "Doe, Jane", "identifiers": [{"type": "idref", "value": "123"}]}'
+        "]}"
+    )
+    with mock.patch.object(
+        RetrievalBatchService, "register", autospec=True
+    ) as mock_register, mock.patch.object(
+        RetrievalBatchService, "run", autospec=True
+    ) as mock_run:
+        mock_register.return_value = [mock.Mock(id=11), mock.Mock(id=12)]
+        # pylint: disable=protected-access
+        await message_processor._process_message(payload)
+        _, register_args = mock_register.call_args
+        assert [person.name for person in register_args["entities"]] == [
+            "Doe, John",
+            "Doe, Jane",
+        ]
+        mock_run.assert_called_once()
+        _, run_args = mock_run.call_args
+        assert run_args["result_queue"] is message_processor.result_queue
+    error = message_processor.result_queue.get_nowait()
+    assert error["error"] is True
+    assert error["parameters"] == {"name": "Nobody"}
+    assert message_processor.result_queue.get_nowait() == {
+        "type": "RetrievalBatch",
+        "ids": [11, None, 12],
+        "message": "Retrievals started",
+    }
+
+
+async def test_amqp_person_batch_message_without_valid_person(
+    message_processor: AMQPMessageProcessor,
+):
+    """
+    GIVEN a batch message without any valid person
+    WHEN the message is processed
+    THEN an InvalidEntityError is raised and no retrieval is registered
+    """
+    payload = '{"type": "person_batch", "persons": [{"name": "Nobody"}]}'
+    with mock.patch.object(
+        RetrievalBatchService, "register", autospec=True
+    ) as mock_register:
+        with pytest.raises(InvalidEntityError):
+            # pylint: disable=protected-access
+            await message_processor._process_message(payload)
+        mock_register.assert_not_called()
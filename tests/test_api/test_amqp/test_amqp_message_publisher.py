@@ -9,6 +9,7 @@ from aio_pika import Exchange, DeliveryMode
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.amqp.amqp_message_publisher import AMQPMessagePublisher
+from app.services.entities.entity_snapshot import EntitySnapshot
 
 
 @pytest.mark.asyncio
@@ -32,6 +33,7 @@ async def test_publish_harvesting_status(
         "state": "running",
         "identifier_used_type": None,
         "identifier_used_value": None,
+        "timings": None,
         "error": [],
         "entity": {
             "identifiers": [{"type": "idref", "value": "123456789"}],
@@ -148,6 +150,7 @@ async def test_publish_harvesting_status_with_identifier_used(
         "state": "running",
         "identifier_used_type": "idref",
         "identifier_used_value": "123456789",
+        "timings": None,
         "error": [],
         "entity": {
             "identifiers": [{"type": "idref", "value": "123456789"}],
@@ -286,3 +289,85 @@ async def test_publish_retrieval_error(
         message=mocked_message.return_value,
         routing_key=expected_sent_message_routing_key,
     )
+
+
+@pytest.mark.asyncio
+async def test_publish_harvesting_status_uses_entity_snapshot(
+    async_session: AsyncSession,
+    mocked_message: Mock,
+    mocked_exchange: Exchange,
+    harvesting_db_model_for_person_with_idref,
+):
+    """
+    Test that the entity snapshot of a running retrieval is used
+    for the harvesting status message instead of the database entity.
+    """
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    entity_id = harvesting_db_model_for_person_with_idref.retrieval.entity_id
+    snapshot = EntitySnapshot(
+        entity_id=entity_id,
+        class_name="Person",
+        name="John Doe (snapshot)",
+        identifiers=(("idref", "123456789"),),
+    )
+    amqp_message_publisher = AMQPMessagePublisher(mocked_exchange)
+    EntitySnapshot.retain(snapshot)
+    try:
+        await amqp_message_publisher.publish(
+            {
+                "type": "Harvesting",
+                "id": harvesting_db_model_for_person_with_idref.id,
+                "entity_id": entity_id,
+            }
+        )
+    finally:
+        EntitySnapshot.release(entity_id)
+    sent_payload = orjson.loads(mocked_message.call_args.args[0])
+    assert sent_payload["harvester"] == "idref"
+    assert sent_payload["entity"] == {
+        "identifiers": [{"type": "idref", "value": "123456789"}],
+        "name": "John Doe (snapshot)",
+    }
+
+
+@pytest.mark.asyncio
+async def test_publish_created_reference_uses_entity_snapshot(
+    test_app,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+    mocked_message: Mock,
+    mocked_exchange: Exchange,
+    reference_event_db_model,
+):
+    """
+    Test that the entity snapshot of a running retrieval is used
+    for the reference event message instead of the database entity.
+    """
+    async_session.add(reference_event_db_model)
+    await async_session.commit()
+    entity_id = reference_event_db_model.harvesting.retrieval.entity_id
+    snapshot = EntitySnapshot(
+        entity_id=entity_id,
+        class_name="Person",
+        name="John Doe (snapshot)",
+        identifiers=(("idref", "123456789"),),
+    )
+    amqp_message_publisher = AMQPMessagePublisher(mocked_exchange)
+    EntitySnapshot.retain(snapshot)
+    try:
+        await amqp_message_publisher.publish(
+            {
+                "type": "ReferenceEvent",
+                "id": reference_event_db_model.id,
+                "entity_id": entity_id,
+            }
+        )
+    finally:
+        EntitySnapshot.release(entity_id)
+    sent_payload = orjson.loads(mocked_message.call_args.args[0])
+    assert sent_payload["reference_event"]["type"] == "created"
+    assert sent_payload["entity"]["name"] == "John Doe (snapshot)"
+    assert sent_payload["harvesting"] == {
+        "identifier_used_type": None,
+        "identifier_used_value": None,
+    }
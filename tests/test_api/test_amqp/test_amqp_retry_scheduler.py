@@ -0,0 +1,136 @@
+"""Test the delayed retries of the failed AMQP messages."""
+
+import asyncio
+from unittest import mock
+from unittest.mock import AsyncMock, MagicMock
+
+from app.amqp.amqp_lanes import AMQPLanes
+from app.amqp.amqp_message_processor import AMQPMessageProcessor
+from app.amqp.amqp_retry_scheduler import AMQPRetryScheduler
+from app.config import get_app_settings
+
+
+def _channel() -> MagicMock:
+    channel = MagicMock()
+    channel.declare_queue = AsyncMock()
+    channel.default_exchange.publish = AsyncMock()
+    return channel
+
+
+def _message(attempt: int | None = None) -> MagicMock:
+    message = MagicMock()
+    message.body = b'{"type": "person"}'
+    message.message_id = "message-id"
+    message.content_type = "application/json"
+    message.headers = (
+        {} if attempt is None else {AMQPRetryScheduler.ATTEMPT_HEADER: attempt}
+    )
+    message.processed = False
+
+    async def ack():
+        message.processed = True
+
+    message.ack = AsyncMock(side_effect=ack)
+    message.nack = AsyncMock()
+    message.process = MagicMock()
+    message.process.return_value.__aenter__ = AsyncMock()
+    message.process.return_value.__aexit__ = AsyncMock(return_value=False)
+    return message
+
+
+async def test_retry_scheduler_declares_waiting_queues_with_exponential_delays(
+    monkeypatch,
+):
+    """
+    GIVEN a base delay of 10 seconds and 4 attempts
+    WHEN the retry queues of a queue are declared
+    THEN 3 waiting queues with doubling TTLs dead-letter to the queue
+    AND a dead letters queue is declared
+    """
+    monkeypatch.setattr(get_app_settings(), "amqp_retry_base_delay", 10)
+    monkeypatch.setattr(get_app_settings(), "amqp_retry_max_attempts", 4)
+    channel = _channel()
+    await AMQPRetryScheduler(channel, get_app_settings()).declare("svp-harvester")
+    declared = {
+        call.args[0]: call.kwargs.get("arguments")
+        for call in channel.declare_queue.call_args_list
+    }
+    assert declared == {
+        "svp-harvester.retry.10s": {
+            "x-message-ttl": 10000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "svp-harvester",
+        },
+        "svp-harvester.retry.20s": {
+            "x-message-ttl": 20000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "svp-harvester",
+        },
+        "svp-harvester.retry.40s": {
+            "x-message-ttl": 40000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "svp-harvester",
+        },
+        "svp-harvester.dead": None,
+    }
+
+
+async def test_retry_scheduler_parks_message_after_max_attempts(monkeypatch):
+    """
+    GIVEN a message at its second attempt, with a base delay of 10 seconds
+    WHEN it fails
+    THEN it is published to the 20 seconds waiting queue with an incremented attempt
+    AND when it fails at its last attempt, it is parked in the dead letters queue
+    """
+    monkeypatch.setattr(get_app_settings(), "amqp_retry_base_delay", 10)
+    monkeypatch.setattr(get_app_settings(), "amqp_retry_max_attempts", 3)
+    channel = _channel()
+    scheduler = AMQPRetryScheduler(channel, get_app_settings())
+    with mock.patch("app.amqp.amqp_retry_scheduler.aio_pika.Message") as message_class:
+        assert await scheduler.retry(_message(attempt=2), "svp-harvester")
+        assert message_class.call_args.kwargs["headers"] == {
+            AMQPRetryScheduler.ATTEMPT_HEADER: 3
+        }
+        assert (
+            channel.default_exchange.publish.call_args.kwargs["routing_key"]
+            == "svp-harvester.retry.20s"
+        )
+        assert not await scheduler.retry(_message(attempt=3), "svp-harvester")
+        assert (
+            channel.default_exchange.publish.call_args.kwargs["routing_key"]
+            == "svp-harvester.dead"
+        )
+
+
+async def test_failed_message_is_retried_on_its_queue_instead_of_requeued():
+    """
+    GIVEN a message of the interactive lane whose processing fails unexpectedly
+    WHEN a worker processes it
+    THEN a delayed retry is scheduled on the interactive queue
+    AND the message is acknowledged instead of being requeued
+    """
+    lanes = AMQPLanes(maxsize=10, interactive_weight=2)
+    retry_scheduler = MagicMock()
+    retry_scheduler.retry = AsyncMock(return_value=True)
+    processor = AMQPMessageProcessor(
+        task_queue=lanes,
+        result_queue=asyncio.Queue(),
+        settings=get_app_settings(),
+        retry_scheduler=retry_scheduler,
+    )
+    message = _message()
+    await lanes.put(AMQPLanes.Lane.INTERACTIVE, message)
+    with mock.patch.object(
+        AMQPMessageProcessor,
+        "_process_message",
+        AsyncMock(side_effect=RuntimeError("database is gone")),
+    ):
+        worker = asyncio.create_task(processor.wait_for_message(0))
+        await asyncio.wait_for(lanes.join(), timeout=5)
+        worker.cancel()
+    retry_scheduler.retry.assert_awaited_once_with(
+        message, get_app_settings().amqp_interactive_queue_name
+    )
+    message.ack.assert_awaited_once()
+    message.nack.assert_not_called()
+    assert lanes.snapshot()["interactive"]["processed"] == 1
@@ -1,11 +1,16 @@
 """Test the references API."""
+import asyncio
 from datetime import datetime
 from datetime import timedelta
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.amqp.amqp_lanes import AMQPLanes
+from app.config import get_app_settings
+from app.monitoring.event_loop_monitor import EventLoopMonitor
 from app.db.models.harvesting import Harvesting
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
@@ -92,3 +97,128 @@ async def test_get_reference_events_by_day_and_type(
 
     recent_date_str = recent_date.strftime("%d-%m-%Y")
     assert data == {recent_date_str: {"created": 4, "deleted": 2, "updated": 6}}
+
+
+async def test_get_harvesting_timings_by_harvester(
+    test_client: TestClient,
+    async_session: AsyncSession,
+    retrieval_db_model_for_person_with_idref,
+):
+    """
+    Given two recent harvestings with timings, an old one and one without timings
+    When I request the harvesting timings by harvester
+    Then I should get the sums and averages of the recent harvestings timings
+    """
+
+    def timings(total: float, fetch: float, created: int) -> dict:
+        return {
+            "total": total,
+            "phases": {"fetch": fetch},
+            "counters": {"created": created},
+        }
+
+    for timestamp, harvesting_timings in [
+        (datetime.utcnow() - timedelta(days=1), timings(4.0, 3.0, 10)),
+        (datetime.utcnow() - timedelta(days=2), timings(2.0, 1.0, 20)),
+        (datetime.utcnow() - timedelta(days=30), timings(8.0, 8.0, 80)),
+        (datetime.utcnow(), None),
+    ]:
+        async_session.add(
+            Harvesting(
+                harvester="hal",
+                retrieval=retrieval_db_model_for_person_with_idref,
+                state=Harvesting.State.COMPLETED.value,
+                timestamp=timestamp,
+                timings=harvesting_timings,
+            )
+        )
+    await async_session.commit()
+    response = test_client.get("/api/v1/metrics/harvestings/timings_by_harvester")
+    assert response.status_code == 200
+    assert response.json() == {
+        "hal": {
+            "harvestings": 2,
+            "total": {"sum": 6.0, "average": 3.0},
+            "phases": {"fetch": {"sum": 4.0, "average": 2.0}},
+            "counters": {"created": {"sum": 30.0, "average": 15.0}},
+        }
+    }
+
+
+async def test_get_amqp_lanes(
+    test_client: TestClient,
+    async_session: AsyncSession,  # pylint: disable=unused-argument
+):
+    """
+    Given an AMQP interface with messages waiting in the bulk lane
+    When I request the AMQP lanes metrics
+    Then I should get the depth and latencies of each lane
+    """
+    lanes = AMQPLanes(maxsize=10, interactive_weight=2)
+    test_client.app.amqp_interface = MagicMock(task_queue=lanes)
+    try:
+        await lanes.put(AMQPLanes.Lane.BULK, MagicMock())
+        response = test_client.get("/api/v1/metrics/amqp/lanes")
+    finally:
+        test_client.app.amqp_interface = None
+    assert response.status_code == 200
+    assert response.json()["bulk"]["depth"] == 1
+    assert response.json()["interactive"]["depth"] == 0
+
+
+async def test_get_event_loop_lag(test_client: TestClient, monkeypatch):
+    """
+    Given an event loop monitor with a few lag samples
+    When I request the event loop lag metrics
+    Then I should get the lag percentiles
+    """
+    monitor = EventLoopMonitor(
+        MagicMock(), interval=0.5, slow_callback_threshold=0.1, window=100
+    )
+    monitor.lags.extend([0.001 * i for i in range(1, 101)])
+    monkeypatch.setattr(EventLoopMonitor, "_running", monitor)
+    response = test_client.get("/api/v1/metrics/event_loop/lag")
+    assert response.status_code == 200
+    assert response.json() == {
+        "samples": 100,
+        "p50": 0.05,
+        "p95": 0.095,
+        "p99": 0.099,
+        "max": 0.1,
+        "slow_callbacks": 0,
+        "slow_callback_threshold": 0.1,
+    }
+
+
+def test_get_runtime_metrics_disabled(test_client: TestClient, monkeypatch):
+    """
+    Given the runtime metrics disabled
+    When I request the runtime metrics
+    Then I should get a 404 error
+    """
+    monkeypatch.setattr(get_app_settings(), "runtime_metrics_enabled", False)
+    response = test_client.get("/api/v1/metrics/runtime")
+    assert response.status_code == 404
+
+
+async def test_get_runtime_metrics(test_client: TestClient, monkeypatch):
+    """
+    Given the runtime metrics enabled and an AMQP message waiting in the bulk lane
+    When I request the runtime metrics
+    Then I should get them in the Prometheus text format
+    """
+    monkeypatch.setattr(get_app_settings(), "runtime_metrics_enabled", True)
+    lanes = AMQPLanes(maxsize=10, interactive_weight=2)
+    test_client.app.amqp_interface = MagicMock(
+        task_queue=lanes, result_queue=asyncio.Queue()
+    )
+    try:
+        await lanes.put(AMQPLanes.Lane.BULK, MagicMock())
+        response = test_client.get("/api/v1/metrics/runtime")
+    finally:
+        test_client.app.amqp_interface = None
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE svp_http_client_request_duration_seconds histogram" in response.text
+    assert 'svp_amqp_task_queue_depth{lane="bulk"} 1' in response.text
+    assert "svp_amqp_result_queue_depth 0" in response.text
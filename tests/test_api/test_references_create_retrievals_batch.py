@@ -0,0 +1,77 @@
+"""Test that the batch references API creates the retrievals in database."""
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_app_settings
+from app.db.models.retrieval import Retrieval
+from app.services.retrieval.retrieval_service import RetrievalService
+
+pytestmark = pytest.mark.integration
+
+REFERENCES_RETRIEVALS_BATCH_API_PATH = "/api/v1/references/retrievals:batch"
+
+
+@pytest.mark.asyncio
+async def test_create_retrievals_for_entities(
+    test_client: TestClient,
+    person_with_name_and_idref_json,
+    person_with_name_and_orcid_json,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN two persons
+    WHEN they are submitted to the batch endpoint
+    THEN one retrieval is created and run for each of them
+    """
+    with mock.patch.object(RetrievalService, "run", autospec=True) as mock_run:
+        response = test_client.post(
+            REFERENCES_RETRIEVALS_BATCH_API_PATH,
+            json={
+                "persons": [
+                    person_with_name_and_idref_json,
+                    person_with_name_and_orcid_json,
+                ],
+                "events": ["created"],
+            },
+        )
+    assert response.status_code == 200
+    retrievals = response.json()["retrievals"]
+    assert len(retrievals) == 2
+    assert mock_run.call_count == 2
+    retrieval_ids = [int(retrieval["retrieval_id"]) for retrieval in retrievals]
+    db_retrievals = (
+        (
+            await async_session.execute(
+                select(Retrieval).filter(Retrieval.id.in_(retrieval_ids))
+            )
+        )
+        .unique()
+        .scalars()
+        .all()
+    )
+    assert len(db_retrievals) == 2
+    assert len({retrieval.entity_id for retrieval in db_retrievals}) == 2
+    assert all(retrieval.event_types == ["created"] for retrieval in db_retrievals)
+
+
+def test_create_retrievals_for_too_many_entities(
+    test_client: TestClient, person_with_name_and_idref_json, monkeypatch
+):
+    """
+    GIVEN a batch larger than the retrieval_batch_max_size setting
+    WHEN it is submitted to the batch endpoint
+    THEN it is rejected
+    """
+    monkeypatch.setattr(get_app_settings(), "retrieval_batch_max_size", 1)
+    response = test_client.post(
+        REFERENCES_RETRIEVALS_BATCH_API_PATH,
+        json={
+            "persons": [person_with_name_and_idref_json] * 2,
+        },
+    )
+    assert response.status_code == 422
@@ -0,0 +1,75 @@
+"""Test the retrieval progress events API."""
+
+from fastapi.testclient import TestClient
+
+from app.services.retrieval.retrieval_progress import RetrievalProgress
+
+RETRIEVAL_EVENTS_API_PATH = "/api/v1/references/retrieval/{}/events"
+
+
+async def _finished_retrieval_progress(retrieval_id: int) -> RetrievalProgress:
+    progress = RetrievalProgress.open(retrieval_id)
+    progress.harvesters = {7: "hal"}
+    await progress.put({"type": "Harvesting", "id": 7, "state": "running"})
+    await progress.put({"type": "ReferenceEvent", "id": 42, "change": "created"})
+    await progress.put({"type": "Harvesting", "id": 7, "state": "completed"})
+    progress.close()
+    return progress
+
+
+async def test_retrieval_events_as_server_sent_events(test_client: TestClient):
+    """
+    GIVEN a finished retrieval with 3 progress events
+    WHEN a client reconnects to its event stream with the Last-Event-ID header
+    THEN it receives the events following this id as server-sent events
+    """
+    await _finished_retrieval_progress(1001)
+
+    response = test_client.get(
+        RETRIEVAL_EVENTS_API_PATH.format(1001), headers={"Last-Event-ID": "2"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        "id: 3\n"
+        "event: Harvesting\n"
+        'data: {"type":"Harvesting","id":7,"state":"completed",'
+        '"event_id":3,"harvester":"hal"}\n\n'
+        "id: 4\n"
+        "event: Retrieval\n"
+        'data: {"type":"Retrieval","id":1001,"state":"completed","event_id":4}\n\n'
+    )
+
+
+async def test_retrieval_events_as_ndjson(test_client: TestClient):
+    """
+    GIVEN a finished retrieval with 3 progress events
+    WHEN a client requests its events since the first one as NDJSON
+    THEN it receives one JSON object per line for the following events
+    """
+    await _finished_retrieval_progress(1002)
+
+    response = test_client.get(
+        RETRIEVAL_EVENTS_API_PATH.format(1002),
+        params={"since": 1, "format": "ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines() == [
+        '{"type":"ReferenceEvent","id":42,"change":"created","event_id":2}',
+        '{"type":"Harvesting","id":7,"state":"completed","event_id":3,"harvester":"hal"}',
+        '{"type":"Retrieval","id":1002,"state":"completed","event_id":4}',
+    ]
+
+
+def test_retrieval_events_of_unknown_retrieval(test_client: TestClient):
+    """
+    GIVEN a retrieval that was not run by this instance
+    WHEN a client requests its events
+    THEN a 404 error is returned
+    """
+    response = test_client.get(RETRIEVAL_EVENTS_API_PATH.format(999999))
+
+    assert response.status_code == 404
@@ -0,0 +1,190 @@
+"""Test keyset pagination and export of the references and retrievals summaries."""
+
+import json
+from unittest import mock
+
+import aiohttp
+import pytest
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.integration
+
+REFERENCES_RETRIEVAL_API_PATH = "/api/v1/references/retrieval"
+REFERENCES_SUMMARY_API_PATH = "/api/v1/references/summary"
+RETRIEVALS_SUMMARY_API_PATH = "/api/v1/retrievals/summary"
+
+
+@pytest.fixture(name="three_hal_references_retrieved")
+def fixture_three_hal_references_retrieved(
+    test_client: TestClient,
+    person_with_name_and_id_hal_i_json,
+    hal_api_docs_for_researcher_version_1,
+):
+    """
+    Launch a retrieval that creates 3 references in the database
+    """
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value.__aenter__.return_value.status = 200
+        aiohttp_client_session_get.return_value.__aenter__.return_value.json.return_value = (
+            hal_api_docs_for_researcher_version_1
+        )
+        response = test_client.post(
+            REFERENCES_RETRIEVAL_API_PATH,
+            json={
+                "person": person_with_name_and_id_hal_i_json,
+                "harvesters": ["hal"],
+            },
+        )
+        assert response.status_code == 200
+        response = test_client.get(response.json()["retrieval_url"])
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_references_summary_is_paginated(
+    test_client: TestClient,
+    three_hal_references_retrieved,  # pylint: disable=unused-argument
+):
+    """
+    GIVEN 3 references created by a retrieval
+    WHEN requesting the references summary by pages of 2
+    THEN the first page holds 2 references and the cursor of the next page
+    AND the second page holds the last reference without next cursor
+    """
+    params = {"harvester": "hal", "events": "created", "limit": 2}
+    response = test_client.get(REFERENCES_SUMMARY_API_PATH, params=params)
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 2
+    next_cursor = response.headers["X-Next-Cursor"]
+
+    response = test_client.get(
+        REFERENCES_SUMMARY_API_PATH, params=params | {"cursor": next_cursor}
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+    pages = first_page + second_page
+    assert len({reference["id"] for reference in pages}) == 3
+    keys = [(reference["timestamp"], reference["id"]) for reference in pages]
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_references_summary_rejects_malformed_cursor(
+    test_client: TestClient,
+):
+    """
+    GIVEN a malformed cursor
+    WHEN requesting the references summary
+    THEN a 422 error is returned
+    """
+    response = test_client.get(
+        REFERENCES_SUMMARY_API_PATH, params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_references_summary_export_streams_ndjson(
+    test_client: TestClient,
+    three_hal_references_retrieved,  # pylint: disable=unused-argument
+):
+    """
+    GIVEN 3 references created by a retrieval
+    WHEN exporting the references summary
+    THEN the 3 references are returned as newline delimited JSON
+    """
+    response = test_client.get(
+        f"{REFERENCES_SUMMARY_API_PATH}/export",
+        params={"harvester": "hal", "events": "created"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    references = [json.loads(line) for line in response.text.splitlines()]
+    assert len(references) == 3
+    assert all(reference["event_type"] == "created" for reference in references)
+
+
+@pytest.mark.asyncio
+async def test_retrievals_summary_is_paginated_and_exported(
+    test_client: TestClient,
+    three_hal_references_retrieved,  # pylint: disable=unused-argument
+):
+    """
+    GIVEN a retrieval that created references
+    WHEN requesting the retrievals summary and its export
+    THEN the retrieval is returned in both
+    """
+    params = {"harvester": "hal", "events": "created", "limit": 1}
+    response = test_client.get(RETRIEVALS_SUMMARY_API_PATH, params=params)
+    assert response.status_code == 200
+    retrievals = response.json()
+    assert len(retrievals) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+    response = test_client.get(f"{RETRIEVALS_SUMMARY_API_PATH}/export", params=params)
+    assert response.status_code == 200
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [retrieval["id"] for retrieval in exported] == [retrievals[0]["id"]]
+
+
+@pytest.mark.asyncio
+async def test_references_summary_ranked_search(
+    test_client: TestClient,
+    three_hal_references_retrieved,  # pylint: disable=unused-argument
+):
+    """
+    GIVEN 3 references created by a retrieval
+    WHEN searching the references summary in ranked mode by pages of 1
+    THEN only the references whose titles match the query are returned
+    AND each of them carries its rank
+    """
+    params = {
+        "harvester": "hal",
+        "events": "created",
+        "text_search": "latin or antiquity",
+        "search_mode": "ranked",
+        "limit": 1,
+    }
+    response = test_client.get(REFERENCES_SUMMARY_API_PATH, params=params)
+    assert response.status_code == 200
+    first_page = response.json()
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = test_client.get(
+        REFERENCES_SUMMARY_API_PATH, params=params | {"cursor": next_cursor}
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert "X-Next-Cursor" not in response.headers
+
+    references = first_page + second_page
+    assert len({reference["id"] for reference in references}) == 2
+    assert all(reference["rank"] > 0 for reference in references)
+    assert references[0]["rank"] >= references[1]["rank"]
+    assert {reference["titles"][0][0] for reference in references} >= {
+        "The metaphorical structuring of kinship in Latin"
+    }
+
+
+@pytest.mark.asyncio
+async def test_references_summary_rejects_cursor_of_other_search_mode(
+    test_client: TestClient,
+    three_hal_references_retrieved,  # pylint: disable=unused-argument
+):
+    """
+    GIVEN the cursor of a page of the references summary in substring mode
+    WHEN requesting the next page in ranked mode
+    THEN a 422 error is returned
+    """
+    params = {"harvester": "hal", "events": "created", "limit": 1}
+    response = test_client.get(REFERENCES_SUMMARY_API_PATH, params=params)
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = test_client.get(
+        REFERENCES_SUMMARY_API_PATH,
+        params=params
+        | {"cursor": next_cursor, "text_search": "latin", "search_mode": "ranked"},
+    )
+    assert response.status_code == 422
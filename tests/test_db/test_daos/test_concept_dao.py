@@ -6,61 +6,26 @@ from app.db.models.concept import Concept
 
 
 @pytest.mark.asyncio
-async def test_random_concept_not_derefenced(async_session: AsyncSession):
+async def test_get_concepts_to_dereference_pages_by_id(async_session: AsyncSession):
     """
-    Test that we can get a random concept that has not been dereferenced yet.
+    Test that concepts to dereference are returned in id order, after the cursor,
+    and that concepts without uri or already dereferenced are ignored.
     :param async_session: async session fixture
     :return: None
     """
-    concept = Concept(uri="http://example.com/concept", dereferenced=False)
-    async_session.add(concept)
+    concepts = [
+        Concept(uri=f"http://www.idref.fr/{i}/id", dereferenced=False) for i in range(3)
+    ]
+    async_session.add_all(concepts)
+    async_session.add(Concept(uri=None, dereferenced=False))
+    async_session.add(Concept(uri="http://www.idref.fr/4/id", dereferenced=True))
     await async_session.commit()
 
     dao = ConceptDAO(async_session)
-    concept_from_db = await dao.get_random_concept_not_dereferenced()
-
-    assert concept_from_db is not None
-    assert isinstance(concept_from_db, Concept)
-    assert concept_from_db.uri == "http://example.com/concept"
-
-
-@pytest.mark.asyncio
-async def test_random_concept_already_derenfenced(async_session: AsyncSession):
-    """
-    Test that if there are no concepts to dereference, the method returns None.
-    """
-    concept = Concept(uri="http://example.com/concept", dereferenced=True)
-    async_session.add(concept)
-    await async_session.commit()
-
-    dao = ConceptDAO(async_session)
-    concept_from_db = await dao.get_random_concept_not_dereferenced()
-
-    assert concept_from_db is None
-
-
-@pytest.mark.asyncio
-async def test_random_concept_with_exclude_id(async_session: AsyncSession):
-    """
-    Test that if we provide a list of ids to exclude, the method does not return
-    any of these concepts.
-    """
-    concept1 = Concept(uri="http://example.com/concept1", dereferenced=False)
-    concept2 = Concept(uri="http://example.com/concept2", dereferenced=False)
-    async_session.add(concept1)
-    async_session.add(concept2)
-    await async_session.commit()
-
-    dao = ConceptDAO(async_session)
-    concept_from_db = await dao.get_random_concept_not_dereferenced(
-        exclude_ids=[concept1.id]
-    )
-
-    assert concept_from_db is not None
-    assert concept_from_db.uri == "http://example.com/concept2"
-
-    concept_from_db = await dao.get_random_concept_not_dereferenced(
-        exclude_ids=[concept1.id, concept2.id]
+    first_page = await dao.get_concepts_to_dereference(after_id=None, limit=2)
+    second_page = await dao.get_concepts_to_dereference(
+        after_id=first_page[-1].id, limit=2
     )
 
-    assert concept_from_db is None
+    assert [row.id for row in first_page] == [concepts[0].id, concepts[1].id]
+    assert [row.uri for row in second_page] == ["http://www.idref.fr/2/id"]
@@ -1,4 +1,6 @@
 """Tests for the harvesting dao."""
+from datetime import datetime, timedelta
+
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,3 +86,116 @@ async def test_update_harvesting_state(
     await dao.update_harvesting_state(harvesting.id, Harvesting.State.COMPLETED)
     harvesting_from_db = await dao.get_harvesting_by_id(harvesting.id)
     assert harvesting_from_db.state == Harvesting.State.COMPLETED.value
+
+
+@pytest.mark.asyncio
+async def test_create_harvestings(
+    async_session: AsyncSession, retrieval_db_model_for_person_with_idref
+):
+    """
+    Test that the harvestings of a retrieval are created in a single statement
+    and that their ids are returned by harvester.
+    :param async_session: async session fixture
+    :param retrieval_db_model_for_person_with_idref: retrieval fixture
+    :return: None
+    """
+    async_session.add(retrieval_db_model_for_person_with_idref)
+    await async_session.flush()
+    dao = HarvestingDAO(async_session)
+    harvesting_ids = await dao.create_harvestings(
+        retrieval_id=retrieval_db_model_for_person_with_idref.id,
+        harvesters=["idref", "hal"],
+        state=Harvesting.State.IDLE,
+    )
+    await async_session.commit()
+    assert set(harvesting_ids) == {"idref", "hal"}
+    for harvester, harvesting_id in harvesting_ids.items():
+        harvesting_from_db = await _fetch_harvesting_by_id(async_session, harvesting_id)
+        assert harvesting_from_db.harvester == harvester
+        assert harvesting_from_db.state == Harvesting.State.IDLE.value
+        assert (
+            harvesting_from_db.retrieval_id
+            == retrieval_db_model_for_person_with_idref.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_harvesting_state_returns_stored_state(
+    async_session: AsyncSession, retrieval_db_model_for_person_with_idref
+):
+    """
+    Test that updating the state of a harvesting returns the stored state.
+    :param async_session: async session fixture
+    :param retrieval_db_model_for_person_with_idref: retrieval fixture
+    :return: None
+    """
+    async_session.add(retrieval_db_model_for_person_with_idref)
+    await async_session.flush()
+    dao = HarvestingDAO(async_session)
+    harvesting_ids = await dao.create_harvestings(
+        retrieval_id=retrieval_db_model_for_person_with_idref.id,
+        harvesters=["idref"],
+        state=Harvesting.State.IDLE,
+    )
+    await async_session.commit()
+    state = await dao.update_harvesting_state(
+        harvesting_ids["idref"], Harvesting.State.RUNNING
+    )
+    assert state == Harvesting.State.RUNNING.value
+    assert await dao.update_harvesting_state(-1, Harvesting.State.RUNNING) is None
+
+
+@pytest.mark.asyncio
+async def test_resumed_harvesting_is_no_longer_updated(
+    async_session: AsyncSession, retrieval_db_model_for_person_with_idref
+):
+    """
+    GIVEN a running harvesting started long ago
+    WHEN its checkpoint timestamp is refreshed
+    THEN it is not considered interrupted
+    AND once it is taken over by another harvesting,
+        its checkpoint and state are no longer updated
+    :param async_session: async session fixture
+    :param retrieval_db_model_for_person_with_idref: retrieval fixture
+    :return: None
+    """
+    retrieval = retrieval_db_model_for_person_with_idref
+    async_session.add(retrieval)
+    await async_session.flush()
+    dao = HarvestingDAO(async_session)
+    harvesting_ids = await dao.create_harvestings(
+        retrieval_id=retrieval.id,
+        harvesters=["idref", "hal"],
+        state=Harvesting.State.RUNNING,
+    )
+    harvesting_id, resuming_id = harvesting_ids["idref"], harvesting_ids["hal"]
+    (await dao.get_harvesting_by_id(harvesting_id)).timestamp = datetime(2024, 3, 1)
+    await async_session.commit()
+
+    async def take_over(stale_before: datetime):
+        return await dao.take_over_stale_harvesting(
+            entity_id=retrieval.entity_id,
+            harvester="idref",
+            identifier_used=None,
+            event_types=retrieval.event_types,
+            stale_before=stale_before,
+            harvesting_id=resuming_id,
+        )
+
+    assert await dao.refresh_harvesting_checkpoint_timestamp(harvesting_id)
+    assert await take_over(datetime.utcnow() - timedelta(minutes=15)) is None
+    assert await take_over(datetime.utcnow() + timedelta(minutes=1)) == (
+        harvesting_id,
+        None,
+    )
+    assert not await dao.refresh_harvesting_checkpoint_timestamp(harvesting_id)
+    assert not await dao.update_harvesting_checkpoint(harvesting_id, {"processed": {}})
+    assert (
+        await dao.update_harvesting_state(harvesting_id, Harvesting.State.COMPLETED)
+        is None
+    )
+    await async_session.commit()
+    harvesting_from_db = await _fetch_harvesting_by_id(async_session, harvesting_id)
+    assert harvesting_from_db.state == Harvesting.State.FAILED.value
+    assert harvesting_from_db.resumed_by_id == resuming_id
+    assert harvesting_from_db.checkpoint is None
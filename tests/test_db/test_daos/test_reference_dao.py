@@ -1,4 +1,5 @@
 """Tests for entity dao."""
+from datetime import datetime
 from typing import List
 
 import pytest
@@ -313,3 +314,70 @@ async def test_get_complete_reference_by_harvester_source_identifier_version(
 
     assert reference_returned == reference
     assert reference_returned.titles[0].value == "title"
+
+
+@pytest.mark.asyncio
+async def test_references_summary_pages_rows_sharing_timestamp_and_reference(
+    async_session: AsyncSession,
+    three_completed_harvestings_db_models_for_same_person: List[Harvesting],
+):
+    """
+    GIVEN a reference updated then deleted by two harvestings with the same timestamp
+    WHEN the references summary is paginated by pages of a single row
+    THEN each event of the reference is returned exactly once
+    """
+    (
+        _,
+        harvesting_db_model_2,
+        harvesting_db_model_3,
+    ) = three_completed_harvestings_db_models_for_same_person
+    harvesting_db_model_2.timestamp = datetime(2024, 3, 1, 12, 30)
+    harvesting_db_model_3.timestamp = harvesting_db_model_2.timestamp
+    reference = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester=harvesting_db_model_2.harvester,
+        hash="hash1",
+        version=0,
+        titles=[Title(value="title", language="fr")],
+    )
+    async_session.add_all(
+        [
+            reference,
+            ReferenceEvent(
+                type=ReferenceEvent.Type.UPDATED.value,
+                reference=reference,
+                harvesting=harvesting_db_model_2,
+            ),
+            ReferenceEvent(
+                type=ReferenceEvent.Type.DELETED.value,
+                reference=reference,
+                harvesting=harvesting_db_model_3,
+            ),
+        ]
+    )
+    await async_session.commit()
+    dao = ReferenceDAO(async_session)
+
+    rows, cursor = [], None
+    while True:
+        page = await dao.get_references_summary(
+            text_search="",
+            filter_harvester={
+                "event_types": ["updated", "deleted"],
+                "nullify": [],
+                "harvester": [reference.harvester],
+            },
+            date_interval=(None, None),
+            entity=None,
+            cursor=cursor,
+            limit=1,
+        )
+        if not page:
+            break
+        rows.extend(page)
+        cursor = (page[-1].timestamp, page[-1].id, page[-1].event_type)
+
+    assert [(row.id, row.event_type) for row in rows] == [
+        (reference.id, "updated"),
+        (reference.id, "deleted"),
+    ]
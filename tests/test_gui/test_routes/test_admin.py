@@ -3,6 +3,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.config import get_app_settings
+from app.monitoring.tracing import MemorySpanExporter, Tracer
 
 
 def test_admin_page(test_client: TestClient):
@@ -48,3 +49,32 @@ def test_admin_pages_contain_institution_name_in_title(
     assert response.status_code == 200
     institution_name = get_app_settings().institution_name
     assert institution_name in response.text
+
+
+def test_admin_traces_page_when_tracing_disabled(test_client: TestClient):
+    """
+    GIVEN the tracing disabled
+    WHEN the traces page is requested
+    THEN the page is rendered without traces
+    """
+    response = test_client.get("/admin/traces")
+    assert response.status_code == 200
+    assert "<table" not in response.text
+
+
+def test_admin_traces_page_shows_the_spans_of_the_memory_exporter(
+    test_client: TestClient,
+):
+    """
+    GIVEN the tracing enabled with the memory exporter and a recorded trace
+    WHEN the traces page is requested
+    THEN the spans of the trace are listed with their attributes
+    """
+    Tracer.configure(MemorySpanExporter(10))
+    with Tracer.span("retrieval", retrieval_id=42):
+        with Tracer.span("harvesting", harvester="hal"):
+            pass
+    response = test_client.get("/admin/traces")
+    assert response.status_code == 200
+    assert "retrieval_id=42" in response.text
+    assert "harvester=hal" in response.text
@@ -1,5 +1,6 @@
-""" Test for the hal api query builder"""
+"""Test for the hal api query builder"""
 
+from datetime import datetime
 from urllib.parse import parse_qs
 
 import pytest
@@ -106,3 +107,20 @@ def test_build_query__without_set_query_set(hal_query_builder):
     """Test if the build function raise an error if the set_query is not set"""
     with pytest.raises(AssertionError):
         hal_query_builder.build()
+
+
+def test_build_query_for_documents_modified_since(hal_query_builder):
+    """
+    GIVEN a HalApiQueryBuilder instance
+    WHEN the build function is called with a modification date
+    THEN the filter query restricts the documents to the ones modified since this date
+    """
+    hal_query_builder.set_query(hal_query_builder.QueryParameters.AUTH_ID_HAL_I, "1")
+    hal_query_builder.set_modified_since(datetime(2024, 3, 1, 12, 30, 5))
+
+    result_dict = parse_qs(hal_query_builder.build())
+
+    assert result_dict["fq"] == [
+        "docType_s:(ART OR OUV OR COUV)"
+        " AND modifiedDate_tdate:[2024-03-01T12:30:05Z TO *]"
+    ]
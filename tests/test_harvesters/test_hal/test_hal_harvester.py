@@ -1,15 +1,19 @@
 """Tests for the Person model."""
 
+import asyncio
 import urllib
+from datetime import datetime
 from unittest import mock
 
 import aiohttp
 import pytest
 from semver import VersionInfo
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.config import get_app_settings
+from app.db.daos.harvesting_dao import HarvestingDAO
 from app.db.models.concept import Concept
 from app.db.models.contributor_identifier import ContributorIdentifier
 from app.db.models.document_type import DocumentType
@@ -18,7 +22,9 @@ from app.db.models.label import Label
 from app.db.models.person import Person as DbPerson
 from app.db.models.reference import Reference
 from app.db.models.reference_event import ReferenceEvent
+from app.db.models.retrieval import Retrieval
 from app.db.references.references_recorder import ReferencesRecorder
+from app.db.session import async_session as app_async_session
 from app.harvesters.hal.hal_harvester import HalHarvester
 from app.harvesters.hal.hal_references_converter import HalReferencesConverter
 
@@ -69,9 +75,9 @@ async def test_hal_harvester_relevant_for_person_with_idhal_i(
 ):
     """Test that the harvester is relevant after set_entity_id selects an idhali identifier."""
     with mock.patch.object(
-        HalHarvester, "_get_entity", new=mock.AsyncMock(
-            return_value=person_with_name_and_id_hal_i_db_model
-        )
+        HalHarvester,
+        "_get_entity",
+        new=mock.AsyncMock(return_value=person_with_name_and_id_hal_i_db_model),
     ):
         await hal_harvester.set_entity_id(1)
     assert hal_harvester.is_relevant() is True
@@ -88,9 +94,9 @@ async def test_hal_harvester_relevant_for_person_with_idhal_s(
 ):
     """Test that the harvester is relevant after set_entity_id selects an idhals identifier."""
     with mock.patch.object(
-        HalHarvester, "_get_entity", new=mock.AsyncMock(
-            return_value=person_with_name_and_id_hal_s_db_model
-        )
+        HalHarvester,
+        "_get_entity",
+        new=mock.AsyncMock(return_value=person_with_name_and_id_hal_s_db_model),
     ):
         await hal_harvester.set_entity_id(1)
     assert hal_harvester.is_relevant() is True
@@ -106,9 +112,9 @@ async def test_hal_harvester_relevant_for_person_with_orcid(
 ):
     """Test that the harvester is relevant after set_entity_id selects an orcid identifier."""
     with mock.patch.object(
-        HalHarvester, "_get_entity", new=mock.AsyncMock(
-            return_value=person_with_name_and_orcid_db_model
-        )
+        HalHarvester,
+        "_get_entity",
+        new=mock.AsyncMock(return_value=person_with_name_and_orcid_db_model),
     ):
         await hal_harvester.set_entity_id(1)
     assert hal_harvester.is_relevant() is True
@@ -124,9 +130,9 @@ async def test_hal_harvester_not_relevant_for_person_with_idref_only(
 ):
     """Test that the harvester is not relevant when entity has only an idref identifier."""
     with mock.patch.object(
-        HalHarvester, "_get_entity", new=mock.AsyncMock(
-            return_value=person_with_name_and_idref_db_model
-        )
+        HalHarvester,
+        "_get_entity",
+        new=mock.AsyncMock(return_value=person_with_name_and_idref_db_model),
     ):
         await hal_harvester.set_entity_id(1)
     assert hal_harvester.is_relevant() is False
@@ -143,7 +149,9 @@ async def test_hal_harvester_persists_identifier_used(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     assert hal_harvester.entity_identifier_used == (
         ContributorIdentifier.IdentifierType.IDHAL_I.value,
         "123456789",
@@ -169,7 +177,9 @@ async def test_hal_harvester_sets_identifier_used_to_hal_i_when_both_present(
     async_session.add(hal_harvesting_db_model_id_hal_i_s)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i_s.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i_s.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i_s.retrieval.entity_id
+    )
     assert hal_harvester.entity_identifier_used[0] == (
         ContributorIdentifier.IdentifierType.IDHAL_I.value
     )
@@ -188,7 +198,9 @@ async def test_hal_harvester_finds_doc(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
     reference_recorder_register_mock.assert_called_once()
@@ -216,7 +228,9 @@ async def test_hal_harvester_calls_hal_api_with_id_hal_s(
     async_session.add(hal_harvesting_db_model_id_hal_s)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_s.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_s.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_s.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
     args, _ = hal_api_client_mock.call_args
@@ -252,7 +266,9 @@ async def test_hal_harvester_calls_hal_api_with_id_hal_i_s(
     async_session.add(hal_harvesting_db_model_id_hal_i_s)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i_s.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i_s.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i_s.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
     args, _ = hal_api_client_mock.call_args
@@ -279,7 +295,9 @@ async def test_hal_harvester_registers_docs_in_db(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
     stmt = (
@@ -320,7 +338,9 @@ async def test_hal_harvester_registers_one_kw_for_two_occurences(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock_same_kw_twice.assert_called_once()
     stmt = (
@@ -372,7 +392,9 @@ async def test_hal_harvester_registers_abstract(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     await hal_harvester.run()
     stmt = (
         select(Reference)
@@ -400,7 +422,9 @@ async def test_hal_harvester_register_document_type_in_db(
     async_session.add(hal_harvesting_db_model_id_hal_i)
     await async_session.commit()
     hal_harvester.set_harvesting_id(hal_harvesting_db_model_id_hal_i.id)
-    await hal_harvester.set_entity_id(hal_harvesting_db_model_id_hal_i.retrieval.entity_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
     await hal_harvester.run()
     hal_api_client_mock.assert_called_once()
     stmt = select(DocumentType.uri)
@@ -471,3 +495,508 @@ async def test_harvester_version_number_increased(
         assert reference_event.enhanced is True
         assert reference2.version == reference1.version + 1
         assert reference2.titles[0].value == reference1.titles[0].value
+
+
+@pytest.fixture(name="hal_api_client_mock_with_listing")
+def fixture_hal_api_client_mock_with_listing(hal_api_docs_for_researcher: dict):
+    """
+    Hal API mock returning the modified documents, then the listing of all the documents
+    """
+    listing = {
+        "response": {
+            "docs": [
+                {"halId_s": doc["halId_s"]}
+                for doc in hal_api_docs_for_researcher["response"]["docs"]
+            ]
+            + [{"halId_s": "hal-unmodified"}]
+        }
+    }
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value.__aenter__.return_value.status = 200
+        aiohttp_client_session_get.return_value.__aenter__.return_value.json.side_effect = [
+            hal_api_docs_for_researcher,
+            listing,
+        ]
+        yield aiohttp_client_session_get
+
+
+@pytest.fixture(name="previous_hal_harvesting_id_hal_i")
+async def fixture_previous_hal_harvesting_id_hal_i(
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    async_session: AsyncSession,
+) -> Harvesting:
+    """
+    A completed Hal harvesting of the same person with the same identifier,
+    that discovered two references
+    """
+    retrieval = hal_harvesting_db_model_id_hal_i.retrieval
+    harvesting = Harvesting(
+        harvester="hal",
+        state=Harvesting.State.COMPLETED.value,
+        retrieval=retrieval,
+        identifier_used_type=ContributorIdentifier.IdentifierType.IDHAL_I.value,
+        identifier_used_value=retrieval.entity.get_identifier(
+            ContributorIdentifier.IdentifierType.IDHAL_I.value
+        ),
+        timestamp=datetime(2024, 3, 1, 12, 30, 5),
+    )
+    for source_identifier in ["hal-unmodified", "hal-deleted"]:
+        async_session.add(
+            ReferenceEvent(
+                type=ReferenceEvent.Type.CREATED.value,
+                harvesting=harvesting,
+                reference=Reference(
+                    source_identifier=source_identifier,
+                    harvester="hal",
+                    harvester_version="2.2.0",
+                    hash="hash",
+                    version=0,
+                ),
+            )
+        )
+    await async_session.commit()
+    return harvesting
+
+
+async def _run_incremental_hal_harvesting(
+    hal_harvester: HalHarvester,
+    harvesting: Harvesting,
+    event_types: list[str] = None,
+    incremental: bool = True,
+) -> None:
+    hal_harvester.set_harvesting_id(harvesting.id)
+    hal_harvester.set_event_types(
+        event_types
+        or [
+            ReferenceEvent.Type.CREATED.value,
+            ReferenceEvent.Type.UPDATED.value,
+            ReferenceEvent.Type.DELETED.value,
+        ]
+    )
+    hal_harvester.set_incremental(incremental)
+    await hal_harvester.set_entity_id(harvesting.retrieval.entity_id)
+    await hal_harvester.run()
+
+
+async def _harvesting_events(
+    async_session: AsyncSession, harvesting: Harvesting
+) -> set[tuple[str, str]]:
+    return set(
+        (
+            await async_session.execute(
+                select(Reference.source_identifier, ReferenceEvent.type)
+                .join(ReferenceEvent)
+                .where(ReferenceEvent.harvesting_id == harvesting.id)
+            )
+        ).all()
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_hal_harvester_fetches_modified_docs_and_lists_all_docs(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    previous_hal_harvesting_id_hal_i: Harvesting,
+    hal_api_client_mock_with_listing,
+    hal_api_docs_for_researcher: dict,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a completed Hal harvesting that discovered two references
+    WHEN running an incremental Hal harvesting for the same person
+    THEN only the documents modified since the previous harvesting are fetched
+    AND the identifiers of all the documents are listed
+    AND only the reference missing from the listing is deleted
+    """
+    await _run_incremental_hal_harvesting(
+        hal_harvester, hal_harvesting_db_model_id_hal_i
+    )
+
+    assert hal_harvester.modified_since == previous_hal_harvesting_id_hal_i.timestamp
+    fetch_call, listing_call = hal_api_client_mock_with_listing.call_args_list
+    fetch_query = dict(
+        urllib.parse.parse_qsl(urllib.parse.urlsplit(fetch_call.args[0]).query)
+    )
+    assert fetch_query["fq"].endswith(
+        "AND modifiedDate_tdate:[2024-03-01T12:30:05Z TO *]"
+    )
+    listing_query = dict(
+        urllib.parse.parse_qsl(urllib.parse.urlsplit(listing_call.args[0]).query)
+    )
+    assert listing_query["fl"] == "halId_s"
+    assert listing_query["sort"] == "docid asc"
+    assert listing_query["rows"] == "10000"
+    assert listing_query["cursorMark"] == "*"
+    assert "modifiedDate_tdate" not in listing_query["fq"]
+    assert await _harvesting_events(
+        async_session, hal_harvesting_db_model_id_hal_i
+    ) == {
+        (
+            hal_api_docs_for_researcher["response"]["docs"][0]["halId_s"],
+            ReferenceEvent.Type.CREATED.value,
+        ),
+        ("hal-deleted", ReferenceEvent.Type.DELETED.value),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "event_types",
+    [
+        [ReferenceEvent.Type.DELETED.value],
+        [ReferenceEvent.Type.CREATED.value, ReferenceEvent.Type.DELETED.value],
+    ],
+)
+async def test_incremental_hal_harvester_ignores_harvestings_without_updates(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    previous_hal_harvesting_id_hal_i: Harvesting,
+    hal_api_client_mock_with_listing,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+    event_types: list[str],
+):
+    """
+    GIVEN a completed Hal harvesting that discovered two references
+    AND a later completed Hal harvesting that did not record the updates,
+        such as a harvesting detecting deleted references only
+    WHEN running an incremental Hal harvesting for the same person
+    THEN the documents modified since the first harvesting are fetched
+    """
+    retrieval = hal_harvesting_db_model_id_hal_i.retrieval
+    async_session.add(
+        Harvesting(
+            harvester="hal",
+            state=Harvesting.State.COMPLETED.value,
+            retrieval=Retrieval(entity=retrieval.entity, event_types=event_types),
+            identifier_used_type=ContributorIdentifier.IdentifierType.IDHAL_I.value,
+            identifier_used_value=retrieval.entity.get_identifier(
+                ContributorIdentifier.IdentifierType.IDHAL_I.value
+            ),
+            timestamp=datetime(2024, 4, 1, 8, 0, 0),
+        )
+    )
+    await async_session.commit()
+
+    await _run_incremental_hal_harvesting(
+        hal_harvester, hal_harvesting_db_model_id_hal_i
+    )
+
+    assert hal_harvester.modified_since == previous_hal_harvesting_id_hal_i.timestamp
+
+
+@pytest.mark.asyncio
+async def test_incremental_hal_harvester_without_previous_harvesting(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    hal_api_client_mock,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN no previous completed Hal harvesting for a person
+    WHEN running an incremental Hal harvesting
+    THEN all the documents are fetched, without listing them
+    """
+    async_session.add(hal_harvesting_db_model_id_hal_i)
+    await async_session.commit()
+
+    await _run_incremental_hal_harvesting(
+        hal_harvester, hal_harvesting_db_model_id_hal_i
+    )
+
+    assert hal_harvester.modified_since is None
+    hal_api_client_mock.assert_called_once()
+    args, _ = hal_api_client_mock.call_args
+    query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(args[0]).query))
+    assert "modifiedDate_tdate" not in query["fq"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("previous_hal_harvesting_id_hal_i")
+async def test_incremental_hal_harvester_confirms_unmodified_docs_as_unchanged(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    hal_api_client_mock_with_listing,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a completed Hal harvesting that discovered two references
+    WHEN running an incremental Hal harvesting requesting unchanged and deleted events
+    THEN the listed reference that was not modified is reported as unchanged
+    AND the reference missing from the listing is deleted
+    """
+    await _run_incremental_hal_harvesting(
+        hal_harvester,
+        hal_harvesting_db_model_id_hal_i,
+        event_types=[
+            ReferenceEvent.Type.UNCHANGED.value,
+            ReferenceEvent.Type.DELETED.value,
+        ],
+    )
+
+    assert hal_api_client_mock_with_listing.call_count == 2
+    assert await _harvesting_events(
+        async_session, hal_harvesting_db_model_id_hal_i
+    ) == {
+        ("hal-unmodified", ReferenceEvent.Type.UNCHANGED.value),
+        ("hal-deleted", ReferenceEvent.Type.DELETED.value),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("previous_hal_harvesting_id_hal_i")
+async def test_hal_harvester_detects_deleted_references_from_listing_only(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a completed Hal harvesting that discovered two references
+    WHEN running a Hal harvesting requesting only deleted events
+    THEN the documents are not fetched, only their identifiers are listed page by page
+    AND the reference missing from the listing is deleted
+    """
+    pages = [
+        {"response": {"docs": [{"halId_s": "hal-other"}]}, "nextCursorMark": "AoE1"},
+        {
+            "response": {"docs": [{"halId_s": "hal-unmodified"}]},
+            "nextCursorMark": "AoE2",
+        },
+        {"response": {"docs": []}, "nextCursorMark": "AoE2"},
+    ]
+    with mock.patch.object(aiohttp.ClientSession, "get") as aiohttp_client_session_get:
+        aiohttp_client_session_get.return_value.__aenter__.return_value.status = 200
+        aiohttp_client_session_get.return_value.__aenter__.return_value.json.side_effect = (
+            pages
+        )
+        await _run_incremental_hal_harvesting(
+            hal_harvester,
+            hal_harvesting_db_model_id_hal_i,
+            event_types=[ReferenceEvent.Type.DELETED.value],
+            incremental=False,
+        )
+
+    cursor_marks = []
+    for call in aiohttp_client_session_get.call_args_list:
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(call.args[0]).query))
+        assert query["fl"] == "halId_s"
+        cursor_marks.append(query["cursorMark"])
+    assert cursor_marks == ["*", "AoE1", "AoE2"]
+    assert await _harvesting_events(
+        async_session, hal_harvesting_db_model_id_hal_i
+    ) == {
+        ("hal-deleted", ReferenceEvent.Type.DELETED.value),
+    }
+
+
+@pytest.mark.asyncio
+async def test_hal_harvester_resumes_interrupted_harvesting(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    hal_api_client_mock,  # pylint: disable=unused-argument
+    hal_api_docs_for_researcher: dict,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a Hal harvesting of the same person interrupted while running,
+        after having processed the only document of the person
+    WHEN running a new Hal harvesting for the same person
+    THEN the interrupted harvesting is marked as failed
+    AND the processed document is neither converted again nor deleted
+    AND the checkpoint of the new harvesting is cleared when it completes
+    """
+    event_types = [
+        ReferenceEvent.Type.CREATED.value,
+        ReferenceEvent.Type.DELETED.value,
+    ]
+    hal_id = hal_api_docs_for_researcher["response"]["docs"][0]["halId_s"]
+    retrieval = hal_harvesting_db_model_id_hal_i.retrieval
+    interrupted = Harvesting(
+        harvester="hal",
+        state=Harvesting.State.RUNNING.value,
+        retrieval=Retrieval(entity=retrieval.entity, event_types=event_types),
+        identifier_used_type=ContributorIdentifier.IdentifierType.IDHAL_I.value,
+        identifier_used_value=retrieval.entity.get_identifier(
+            ContributorIdentifier.IdentifierType.IDHAL_I.value
+        ),
+        timestamp=datetime(2024, 3, 1, 12, 30, 5),
+        checkpoint={"processed": {hal_id: hal_id}},
+        checkpoint_timestamp=datetime(2024, 3, 1, 12, 35, 0),
+    )
+    async_session.add(
+        ReferenceEvent(
+            type=ReferenceEvent.Type.CREATED.value,
+            harvesting=interrupted,
+            reference=Reference(
+                source_identifier=hal_id,
+                harvester="hal",
+                harvester_version="2.2.0",
+                hash="hash",
+                version=0,
+            ),
+        )
+    )
+    await async_session.commit()
+
+    with mock.patch.object(
+        hal_harvester.converter, "convert"
+    ) as converter_convert_mock:
+        await _run_incremental_hal_harvesting(
+            hal_harvester,
+            hal_harvesting_db_model_id_hal_i,
+            event_types=event_types,
+            incremental=False,
+        )
+        converter_convert_mock.assert_not_called()
+
+    assert not await _harvesting_events(async_session, hal_harvesting_db_model_id_hal_i)
+    interrupted_id = interrupted.id
+    resumed_id = hal_harvesting_db_model_id_hal_i.id
+    async_session.expire_all()
+    interrupted = await HarvestingDAO(async_session).get_harvesting_extended_info_by_id(
+        interrupted_id, with_entity=False
+    )
+    assert interrupted.state == Harvesting.State.FAILED.value
+    assert [error.name for error in interrupted.error] == ["HarvestingInterruptedError"]
+    resumed = await HarvestingDAO(async_session).get_harvesting_extended_info_by_id(
+        resumed_id, with_entity=False
+    )
+    assert resumed.state == Harvesting.State.COMPLETED.value
+    assert resumed.checkpoint is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_hal_harvester_persists_timings(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i,
+    hal_api_client_mock,
+    async_session: AsyncSession,
+):
+    """
+    GIVEN a Hal harvesting of a person with one document
+    WHEN the harvesting completes
+    THEN its timings by phase and its counters are stored with the harvesting
+    """
+    async_session.add(hal_harvesting_db_model_id_hal_i)
+    await async_session.commit()
+    harvesting_id = hal_harvesting_db_model_id_hal_i.id
+    hal_harvester.set_harvesting_id(harvesting_id)
+    await hal_harvester.set_entity_id(
+        hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    )
+    await hal_harvester.run()
+    async_session.expire_all()
+    harvesting = await HarvestingDAO(async_session).get_harvesting_extended_info_by_id(
+        harvesting_id, with_entity=False
+    )
+    assert harvesting.state == Harvesting.State.COMPLETED.value
+    assert harvesting.timings["counters"] == {
+        "results": 1,
+        "created": 1,
+        "updated": 0,
+        "unchanged": 0,
+        "deleted": 0,
+    }
+    assert set(harvesting.timings["phases"]) == {
+        "fetch",
+        "convert",
+        "dereference",
+        "db",
+        "queue",
+    }
+    assert harvesting.timings["phases"]["db"] > 0
+    assert harvesting.timings["total"] >= sum(harvesting.timings["phases"].values())
+
+
+async def _resume_by_another_harvesting(harvesting_id: int) -> None:
+    async with app_async_session() as session:
+        async with session.begin():
+            await session.execute(
+                update(Harvesting)
+                .where(Harvesting.id == harvesting_id)
+                .values(
+                    state=Harvesting.State.FAILED.value,
+                    resumed_by_id=harvesting_id + 1,
+                )
+            )
+
+
+@pytest.mark.asyncio
+async def test_hal_harvester_stops_when_resumed_by_another_harvesting(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    hal_api_client_mock,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+    monkeypatch,
+):
+    """
+    GIVEN a running Hal harvesting checkpointed after each result
+    WHEN another harvesting resumes it while it converts its first document
+    THEN it stops when saving its checkpoint, without recording its completion
+    AND it notifies its failure
+    """
+    monkeypatch.setattr(get_app_settings(), "harvesting_checkpoint_interval", 1)
+    await async_session.commit()
+    harvesting_id = hal_harvesting_db_model_id_hal_i.id
+    entity_id = hal_harvesting_db_model_id_hal_i.retrieval.entity_id
+    result_queue = asyncio.Queue()
+    hal_harvester.set_result_queue(result_queue)
+
+    async def convert(**_):
+        await _resume_by_another_harvesting(harvesting_id)
+
+    with mock.patch.object(hal_harvester.converter, "convert", side_effect=convert):
+        await _run_incremental_hal_harvesting(
+            hal_harvester, hal_harvesting_db_model_id_hal_i, incremental=False
+        )
+
+    async_session.expire_all()
+    harvesting = await HarvestingDAO(async_session).get_harvesting_extended_info_by_id(
+        harvesting_id, with_entity=False
+    )
+    assert harvesting.state == Harvesting.State.FAILED.value
+    assert harvesting.resumed_by_id == harvesting_id + 1
+    assert harvesting.timings is None
+    assert not harvesting.error
+    messages = []
+    while not result_queue.empty():
+        messages.append(result_queue.get_nowait())
+    assert messages[-1] == {
+        "type": "Harvesting",
+        "id": harvesting_id,
+        "state": Harvesting.State.FAILED.value,
+        "entity_id": entity_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_hal_harvester_heartbeat_detects_resumption(
+    hal_harvester: HalHarvester,
+    hal_harvesting_db_model_id_hal_i: Harvesting,
+    async_session: AsyncSession,
+    monkeypatch,
+):
+    """
+    GIVEN a running Hal harvesting waiting for its results
+    WHEN its heartbeat refreshes its checkpoint timestamp
+    THEN the timestamp is refreshed while the harvesting is not resumed
+    AND the heartbeat stops and flags the harvesting once it is resumed
+    """
+    monkeypatch.setattr(get_app_settings(), "harvesting_heartbeat_interval", 0)
+    await async_session.commit()
+    harvesting_id = hal_harvesting_db_model_id_hal_i.id
+    hal_harvester.set_harvesting_id(harvesting_id)
+
+    heartbeat = asyncio.create_task(
+        hal_harvester._heartbeat()  # pylint: disable=protected-access
+    )
+    checkpoint_timestamp = select(Harvesting.checkpoint_timestamp).where(
+        Harvesting.id == harvesting_id
+    )
+    while await async_session.scalar(checkpoint_timestamp) is None:
+        await asyncio.sleep(0.01)
+    assert not heartbeat.done()
+
+    await _resume_by_another_harvesting(harvesting_id)
+    await asyncio.wait_for(heartbeat, timeout=5)
+    assert hal_harvester.taken_over
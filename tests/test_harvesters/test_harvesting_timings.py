@@ -0,0 +1,92 @@
+"""
+Test the timings of the harvestings by phase.
+"""
+
+import asyncio
+import time
+
+from app.harvesters.harvesting_timings import (
+    HarvestingTimings,
+    current_timings,
+    timed,
+)
+
+
+def test_nested_phase_is_excluded_from_enclosing_phase(monkeypatch):
+    """
+    GIVEN harvesting timings and a clock advanced by hand
+    WHEN a dereferencing phase is nested in a conversion phase
+    THEN the time of the dereferencing is only counted in its own phase
+    """
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    timings = HarvestingTimings()
+    with timings.measure(HarvestingTimings.Phase.CONVERT):
+        clock[0] += 1
+        with timings.measure(HarvestingTimings.Phase.DEREFERENCE):
+            clock[0] += 3
+        clock[0] += 2
+    assert timings.to_dict() == {
+        "total": 6.0,
+        "phases": {
+            "fetch": 0.0,
+            "convert": 3.0,
+            "dereference": 3.0,
+            "db": 0.0,
+            "queue": 0.0,
+        },
+        "counters": {
+            "results": 0,
+            "created": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "deleted": 0,
+        },
+    }
+
+
+async def test_timed_adds_concurrent_tasks_to_current_timings():
+    """
+    GIVEN harvesting timings set as the current ones
+    WHEN concurrent tasks run timed dereferencing phases during a conversion phase
+    THEN the dereferencing time is measured
+    AND the conversion time is not negative
+    """
+    timings = HarvestingTimings()
+    token = current_timings.set(timings)
+
+    async def dereference():
+        with timed(HarvestingTimings.Phase.DEREFERENCE):
+            await asyncio.sleep(0.01)
+
+    try:
+        with timings.measure(HarvestingTimings.Phase.CONVERT):
+            await asyncio.gather(dereference(), dereference())
+    finally:
+        current_timings.reset(token)
+    assert timings.phases[HarvestingTimings.Phase.DEREFERENCE] >= 0.02
+    assert timings.phases[HarvestingTimings.Phase.CONVERT] == 0.0
+
+
+def test_timed_without_current_timings_is_a_no_op():
+    """
+    GIVEN no current harvesting timings
+    WHEN a block is timed
+    THEN it runs without error
+    """
+    with timed(HarvestingTimings.Phase.DB):
+        result = 1
+    assert result == 1
+
+
+def test_count_increments_counters():
+    """
+    GIVEN harvesting timings
+    WHEN results and created references are counted
+    THEN the counters are incremented
+    """
+    timings = HarvestingTimings()
+    timings.count(HarvestingTimings.Counter.RESULTS, 3)
+    timings.count(HarvestingTimings.Counter.CREATED)
+    assert timings.to_dict()["counters"]["results"] == 3
+    assert timings.to_dict()["counters"]["created"] == 1
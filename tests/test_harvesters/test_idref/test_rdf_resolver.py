@@ -3,12 +3,13 @@ from unittest import mock
 
 import pytest
 import rdflib.term
-from rdflib import Graph, DC
+from rdflib import DC
 
 from app.harvesters.exceptions.unexpected_format_exception import (
     UnexpectedFormatException,
 )
 from app.harvesters.idref.rdf_resolver import RdfResolver
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
 from app.harvesters.idref.resolver_http_client import ResolverHTTPClient
 
 
@@ -38,14 +39,14 @@ async def test_fetch(resolver_http_client_mock):  # pylint: disable=unused-argum
     """
     GIVEN a RdfResolver instance and a Sudoc RDF XML with an empty dcterms:date and an empty dc:date
     WHEN the fetch method is called
-    THEN it should return a Graph instance without triples with empty date values
+    THEN it should return a triple index without triples with empty date values
     """
 
     resolver = RdfResolver()
 
     graph = await resolver.fetch("https://www.sudoc.fr/test_url.rdf")
 
-    assert isinstance(graph, Graph)
+    assert isinstance(graph, RdfTripleIndex)
 
     dc_identifier_predicate = rdflib.term.URIRef("http://purl.org/dc/terms/identifier")
     dc_identifier_triples = list(graph.triples((None, dc_identifier_predicate, None)))
@@ -120,7 +121,7 @@ async def test_fetch_should_not_emit_invalid_isoformat_errors(
     caplog.set_level(logging.WARNING)
 
     graph = await resolver.fetch("https://data.persee.fr/authority/385736.rdf")
-    assert isinstance(graph, Graph)
+    assert isinstance(graph, RdfTripleIndex)
 
     # Some rdflib versions log the conversion failure...
     logged = "\n".join(r.getMessage() for r in caplog.records)
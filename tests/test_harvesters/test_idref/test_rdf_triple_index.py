@@ -0,0 +1,58 @@
+import pathlib
+import pickle
+
+import pytest
+from rdflib import DCTERMS, FOAF, RDF, BNode, Graph, URIRef
+
+from app.harvesters.idref.rdf_triple_index import RdfTripleIndex
+
+SUDOC_RDF_PATH = pathlib.Path(__file__).parent.parent.parent / "data" / "sudoc_rdf"
+SUDOC_RDF_FILES = sorted(SUDOC_RDF_PATH.glob("*.rdf"))
+
+
+def _without_blank_nodes(triples) -> set:
+    return {
+        triple
+        for triple in triples
+        if not any(isinstance(term, BNode) for term in triple)
+    }
+
+
+@pytest.mark.parametrize("rdf_file", SUDOC_RDF_FILES, ids=lambda path: path.name)
+def test_triple_index_has_the_triples_of_the_rdflib_graph(rdf_file: pathlib.Path):
+    """
+    GIVEN a Sudoc RDF/XML document
+    WHEN building a triple index and an rdflib graph from it
+    THEN they contain the same triples
+    AND the objects of each subject and predicate come in the same order
+    """
+    data = rdf_file.read_text(encoding="utf-8")
+    graph = Graph().parse(data=data, format="xml")
+    index = RdfTripleIndex.parse(data)
+
+    assert len(index) == len(graph)
+    assert _without_blank_nodes(index) == _without_blank_nodes(graph)
+    for subject, predicate in {(s, p) for s, p, _ in graph if not isinstance(s, BNode)}:
+        assert list(index.objects(subject, predicate)) == list(
+            graph.objects(subject, predicate)
+        )
+
+
+def test_triple_index_lookups():
+    """
+    GIVEN a Sudoc RDF/XML document
+    WHEN building a triple index from it
+    THEN subjects, objects and triple membership can be looked up
+    AND the index survives pickling, as done by the third party API cache
+    """
+    index = RdfTripleIndex.parse(
+        (SUDOC_RDF_PATH / "document.rdf").read_text(encoding="utf-8")
+    )
+    document = URIRef("http://www.sudoc.fr/193726130/id")
+    persons = list(index.subjects(RDF.type, FOAF.Person, unique=True))
+
+    assert persons
+    assert all((person, RDF.type, FOAF.Person) in index for person in persons)
+    assert (document, RDF.type, FOAF.Person) not in index
+    assert not list(index.objects(URIRef("http://example.org/unknown"), DCTERMS.title))
+    assert list(pickle.loads(pickle.dumps(index))) == list(index)
@@ -1,9 +1,12 @@
+from datetime import datetime
 from unittest import mock
 import aiohttp
 import pytest
 
+from app.config import get_app_settings
 from app.db.models.contributor_identifier import ContributorIdentifier
 from app.db.models.person import Person
+from app.harvesters.abstract_harvester import AbstractHarvester
 from app.harvesters.open_alex.open_alex_harvester import OpenAlexHarvester
 from app.harvesters.open_alex.open_alex_references_converter import (
     OpenAlexReferencesConverter,
@@ -56,3 +59,30 @@ async def test_open_alex_not_relevant_for_person(
         await open_alex_harvester.set_entity_id(1)
     assert open_alex_harvester.is_relevant() is False
     assert open_alex_harvester.entity_identifier_used is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "premium_api_key, expected_modified_since",
+    [(False, None), (True, datetime(2024, 3, 1, 12, 30))],
+)
+async def test_open_alex_incremental_harvesting_requires_premium_api_key(
+    open_alex_harvester, monkeypatch, premium_api_key, expected_modified_since
+):
+    """
+    GIVEN an incremental OpenAlex harvesting following a completed one
+    WHEN the OpenAlex API key is, or is not, a premium one
+    THEN the records modified since the previous harvesting are fetched
+        with a premium key, and all the records otherwise
+    """
+    monkeypatch.setattr(get_app_settings(), "openalex_premium_api_key", premium_api_key)
+    open_alex_harvester.set_incremental(True)
+    with mock.patch.object(
+        AbstractHarvester,
+        "_get_modified_since",
+        new=mock.AsyncMock(return_value=datetime(2024, 3, 1, 12, 30)),
+    ):
+        assert (
+            await open_alex_harvester._get_modified_since()  # pylint: disable=protected-access
+            == expected_modified_since
+        )
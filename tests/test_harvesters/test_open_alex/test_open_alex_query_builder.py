@@ -1,4 +1,6 @@
+from datetime import datetime
 from urllib.parse import parse_qs
+
 import pytest
 
 from app.harvesters.open_alex.open_alex_api_query_builder import OpenAlexQueryBuilder
@@ -90,3 +92,27 @@ def test_build_query_without_set_query(open_alex_query_builder):
     """Test if the build function raise an error if the query is not set"""
     with pytest.raises(AssertionError):
         open_alex_query_builder.build()
+
+
+def test_build_query_for_works_updated_since(open_alex_query_builder):
+    """
+    GIVEN a OpenAlexQueryBuilder instance
+    WHEN the build function is called with an update date and selected fields
+    THEN the query filters the works updated since this day
+    AND only selects the requested fields
+    """
+    test_orcid = "0000-0002-1825-0097"
+    open_alex_query_builder.set_query(
+        open_alex_query_builder.QueryParameters.AUTH_ORCID, test_orcid
+    )
+    open_alex_query_builder.set_subject_type(open_alex_query_builder.SubjectType.PERSON)
+    open_alex_query_builder.set_modified_since(datetime(2024, 3, 1, 12, 30))
+    open_alex_query_builder.set_fields(["id"])
+
+    result_dict = parse_qs(open_alex_query_builder.build())
+
+    assert result_dict == {
+        "api_key": ["test_openalex_api_key"],
+        "filter": [f"author.orcid:{test_orcid},from_updated_date:2024-03-01"],
+        "select": ["id"],
+    }
@@ -371,3 +371,70 @@ async def test_add_reference_identifiers_normalizes_openalex_key(
 
     assert all(i.type != "mag" for i in ref.identifiers)
     assert all(i.type != "weird_id" for i in ref.identifiers)
+
+
+def _converted_fields(reference) -> dict:
+    return {
+        "hash": reference.hash,
+        "titles": [title.value for title in reference.titles],
+        "abstracts": [abstract.value for abstract in reference.abstracts],
+        "document_type": [
+            document_type.uri for document_type in reference.document_type
+        ],
+        "subjects": [subject.uri for subject in reference.subjects],
+        "identifiers": sorted((i.type, i.value) for i in reference.identifiers),
+        "manifestations": [m.page for m in reference.manifestations],
+        "contributions": [
+            (
+                contribution.rank,
+                contribution.contributor.name,
+                sorted(org.name for org in contribution.affiliations),
+            )
+            for contribution in reference.contributions
+        ],
+        "issue": reference.issue.source_identifier if reference.issue else None,
+        "page": reference.page,
+        "issued": reference.issued,
+        "created": reference.created,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "work_fixture", ["open_alex_api_work", "open_alex_work_with_various_locations"]
+)
+async def test_consumed_fields_projection(request, work_fixture: str):
+    """
+    GIVEN an OpenAlex work
+    WHEN converting the work restricted to the fields consumed by the converter
+    THEN the hashed fields are part of the projection
+    AND the reference is the same as the one converted from the complete work
+    """
+    work = request.getfixturevalue(work_fixture)
+    projected_work = {
+        key: value
+        for key, value in work.items()
+        if key in OpenAlexReferencesConverter.CONSUMED_FIELDS
+    }
+    assert {
+        hash_key.value
+        for hash_key in OpenAlexReferencesConverter(name="openalex").hash_keys(
+            OpenAlexHarvester.VERSION
+        )
+    } <= set(OpenAlexReferencesConverter.CONSUMED_FIELDS)
+
+    converted = []
+    for payload in [work, projected_work]:
+        converter = OpenAlexReferencesConverter(name="openalex")
+        result = JsonHarvesterRawResult(
+            source_identifier=payload["id"],
+            payload=payload,
+            formatter_name=OpenAlexHarvester.FORMATTER_NAME,
+        )
+        reference = converter.build(
+            raw_data=result, harvester_version=OpenAlexHarvester.VERSION
+        )
+        await converter.convert(raw_data=result, new_ref=reference)
+        converted.append(_converted_fields(reference))
+
+    assert converted[0] == converted[1]
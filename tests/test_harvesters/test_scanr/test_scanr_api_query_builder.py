@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 
 from app.harvesters.scanr.scanr_api_query_builder import ScanRApiQueryBuilder
@@ -135,3 +137,30 @@ def test_build_publication_query_with_idref(scanr_query_builder):
     }
 
     assert query == expected_result
+
+
+def test_build_publication_query_for_publications_updated_since(scanr_query_builder):
+    """
+    GIVEN a ScanRApiQueryBuilder instance
+    WHEN the build function is called with an update date and selected fields
+    THEN the query filters the publications updated since this day
+        or without update date
+    AND only returns the requested fields
+    """
+    scanr_query_builder.set_publication_query("idref2556")
+    scanr_query_builder.set_modified_since(datetime(2024, 3, 1, 12, 30))
+    scanr_query_builder.set_publications_fields(["id"])
+    query = scanr_query_builder.build()
+
+    assert query["_source"] == ["id"]
+    assert query["query"]["bool"]["filter"] == [
+        {
+            "bool": {
+                "should": [
+                    {"range": {"lastUpdated": {"gte": "2024-03-01"}}},
+                    {"bool": {"must_not": {"exists": {"field": "lastUpdated"}}}},
+                ],
+                "minimum_should_match": 1,
+            }
+        }
+    ]
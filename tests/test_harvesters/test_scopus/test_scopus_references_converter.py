@@ -1,4 +1,6 @@
+import copy
 import datetime
+from xml.etree.ElementTree import Element
 
 import pytest
 from semver import VersionInfo
@@ -8,6 +10,7 @@ from app.db.models.contribution import Contribution
 from app.db.models.contributor_identifier import ContributorIdentifier
 from app.db.session import async_session
 from app.harvesters.scopus.scopus_client import ScopusClient
+from app.harvesters.scopus.scopus_harvester import ScopusHarvester
 from app.harvesters.scopus.scopus_references_converter import ScopusReferencesConverter
 from app.harvesters.xml_harvester_raw_result import XMLHarvesterRawResult
 
@@ -171,3 +174,85 @@ async def test_convert_with_invalid_date_format(scopus_xml_raw_result_for_doc, c
         "Scopus reference converter cannot create issued date from coverDate"
         in caplog.text
     )
+
+
+def _field_name(tag: str) -> str:
+    # "{namespace}local-name" XML tag to the name of the Scopus Search API field
+    namespace, local_name = tag[1:].split("}")
+    for prefix in ["prism", "dc"]:
+        if namespace == str(ScopusClient.NAMESPACE[prefix]):
+            return f"{prefix}:{local_name}"
+    return local_name
+
+
+def _project(element: Element) -> None:
+    for child in list(element):
+        if _field_name(child.tag) not in ScopusReferencesConverter.CONSUMED_FIELDS:
+            element.remove(child)
+        else:
+            _project(child)
+
+
+def _converted_fields(reference) -> dict:
+    return {
+        "hash": reference.hash,
+        "titles": [title.value for title in reference.titles],
+        "abstracts": [abstract.value for abstract in reference.abstracts],
+        "document_type": [
+            document_type.uri for document_type in reference.document_type
+        ],
+        "subjects": [subject.id for subject in reference.subjects],
+        "identifiers": sorted((i.type, i.value) for i in reference.identifiers),
+        "contributions": [
+            (
+                contribution.rank,
+                contribution.contributor.name,
+                sorted(org.name for org in contribution.affiliations),
+            )
+            for contribution in reference.contributions
+        ],
+        "issue": reference.issue.source_identifier if reference.issue else None,
+        "book": reference.book.title if reference.book else None,
+        "page": reference.page,
+        "issued": reference.issued,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "entry_fixture",
+    ["scopus_xml_raw_result_for_doc", "scopus_xml_raw_result_for_doc_book"],
+)
+async def test_consumed_fields_projection(request, entry_fixture: str):
+    """
+    GIVEN a Scopus entry
+    WHEN converting the entry restricted to the fields consumed by the converter
+    THEN the hashed fields are part of the projection
+    AND the reference is the same as the one converted from the complete entry
+    """
+    raw_result = request.getfixturevalue(entry_fixture)
+    projected_entry = copy.deepcopy(raw_result.payload)
+    _project(projected_entry)
+    assert {
+        hash_key.value.removeprefix("default:")
+        for hash_key in ScopusReferencesConverter(name="scopus").hash_keys(
+            ScopusHarvester.VERSION
+        )
+    } <= set(ScopusReferencesConverter.CONSUMED_FIELDS)
+
+    converted = []
+    for entry in [raw_result.payload, projected_entry]:
+        converter = ScopusReferencesConverter(name="scopus")
+        result = XMLHarvesterRawResult(
+            payload=entry,
+            source_identifier=raw_result.source_identifier,
+            formatter_name=ScopusHarvester.FORMATTER_NAME,
+        )
+        reference = converter.build(
+            raw_data=result, harvester_version=ScopusHarvester.VERSION
+        )
+        await converter.convert(raw_data=result, new_ref=reference)
+        converted.append(_converted_fields(reference))
+
+    assert len(projected_entry) < len(raw_result.payload)
+    assert converted[0] == converted[1]
@@ -0,0 +1,36 @@
+from aiohttp import web
+
+from app.http.aio_http_client_manager import AioHttpClientManager
+
+
+async def test_middlewares_apply_to_the_shared_session():
+    """
+    GIVEN a local server and a middleware redirecting all requests to it
+    WHEN the middleware is set on the client manager and a remote url is requested
+    THEN the request is answered by the local server with its original path
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"path": request.path_qs})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    async def redirect(request, next_handler):
+        request.url = request.url.with_scheme("http").with_host("127.0.0.1")
+        request.url = request.url.with_port(port)
+        return await next_handler(request)
+
+    try:
+        await AioHttpClientManager.set_middlewares([redirect])
+        session = await AioHttpClientManager.get_session()
+        async with session.get("https://upstream.invalid/search?q=test") as resp:
+            assert await resp.json() == {"path": "/search?q=test"}
+    finally:
+        await AioHttpClientManager.set_middlewares([])
+        await runner.cleanup()
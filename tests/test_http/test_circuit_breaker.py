@@ -0,0 +1,181 @@
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.harvesters.exceptions.external_endpoint_failure import (
+    ExternalEndpointFailure,
+    handle_external_endpoint_failure,
+)
+from app.harvesters.exceptions.unexpected_format_exception import (
+    UnexpectedFormatException,
+)
+from app.http.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+
+class FakeClient:
+    """
+    Client of a fake external endpoint
+    """
+
+    def __init__(self, status: int | None = None):
+        self.status = status
+        self.calls = 0
+
+    @handle_external_endpoint_failure("fake")
+    async def fetch(self) -> str:
+        """
+        Fail with the configured status, or with a connection error if None
+        """
+        self.calls += 1
+        if self.status == 200:
+            return "ok"
+        if self.status is None:
+            raise ConnectionError("Connection refused")
+        raise ExternalEndpointFailure("Error code", status=self.status)
+
+    @handle_external_endpoint_failure("fake")
+    async def fetch_all(self):
+        """
+        Yield a result, then fail to parse the next one
+        """
+        self.calls += 1
+        yield "ok"
+        raise UnexpectedFormatException("Unexpected result format")
+
+    @handle_external_endpoint_failure("fake resolver", by_host=True)
+    async def get(self, url: str) -> str:
+        """
+        Fail for any url
+        """
+        self.calls += 1
+        raise ConnectionError(f"Connection refused by {url}")
+
+
+def test_circuit_breaker_opens_after_threshold_and_recovers():
+    """
+    GIVEN a closed circuit breaker with a threshold of 3 failures
+    WHEN the endpoint fails 3 times in a row
+    THEN the circuit opens and refuses requests
+    AND after the recovery timeout, a single trial request is let through
+    AND the success of the trial request closes the circuit
+    """
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=30)
+    with mock.patch("app.http.circuit_breaker.time.monotonic", return_value=1000):
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.State.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.State.OPEN
+        assert not breaker.allow_request()
+    with mock.patch("app.http.circuit_breaker.time.monotonic", return_value=1031):
+        assert breaker.state == CircuitBreaker.State.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.State.CLOSED
+        assert breaker.allow_request()
+    assert breaker.snapshot() == {"state": "closed", "consecutive_failures": 0}
+
+
+def test_circuit_breaker_reopens_when_trial_request_fails():
+    """
+    GIVEN an open circuit breaker
+    WHEN the trial request sent after the recovery timeout fails
+    THEN the circuit opens again for a full recovery timeout
+    """
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30)
+    with mock.patch("app.http.circuit_breaker.time.monotonic", return_value=1000):
+        breaker.record_failure()
+    with mock.patch("app.http.circuit_breaker.time.monotonic", return_value=1031):
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.State.OPEN
+    with mock.patch("app.http.circuit_breaker.time.monotonic", return_value=1060):
+        assert not breaker.allow_request()
+
+
+async def test_open_circuit_fails_calls_without_reaching_endpoint():
+    """
+    GIVEN an external endpoint refusing connections
+    WHEN it is called more times than the circuit breaker threshold
+    THEN the next calls fail immediately without reaching the endpoint
+    """
+    client = FakeClient()
+    for _ in range(5):
+        with pytest.raises(ExternalEndpointFailure):
+            await client.fetch()
+    assert client.calls == 5
+    with pytest.raises(ExternalEndpointFailure, match="circuit breaker of fake"):
+        await client.fetch()
+    assert client.calls == 5
+    assert CircuitBreakerRegistry.snapshot()["fake"]["state"] == "open"
+
+
+async def test_client_errors_do_not_open_circuit():
+    """
+    GIVEN an external endpoint answering 404
+    WHEN it is called more times than the circuit breaker threshold
+    THEN the circuit stays closed, as the endpoint is up
+    AND the status is kept on the raised exception
+    """
+    client = FakeClient(status=404)
+    for _ in range(10):
+        with pytest.raises(ExternalEndpointFailure) as exc_info:
+            await client.fetch()
+        assert exc_info.value.status == 404
+    assert client.calls == 10
+    assert CircuitBreakerRegistry.get("fake").state == CircuitBreaker.State.CLOSED
+
+
+async def test_unexpected_formats_are_raised_unchanged():
+    """
+    GIVEN an external endpoint answering with a result that cannot be parsed
+    WHEN it is called more times than the circuit breaker threshold
+    THEN the UnexpectedFormatException is raised unchanged
+    AND the circuit stays closed, as the endpoint is up
+    """
+    client = FakeClient()
+    for _ in range(10):
+        with pytest.raises(UnexpectedFormatException, match="Unexpected result"):
+            async for _ in client.fetch_all():
+                pass
+    assert client.calls == 10
+    assert CircuitBreakerRegistry.get("fake").state == CircuitBreaker.State.CLOSED
+
+
+async def test_circuit_breakers_by_host():
+    """
+    GIVEN a client of several hosts with one circuit breaker per host
+    WHEN one of the hosts is down
+    THEN only the circuit breaker of this host opens
+    """
+    client = FakeClient()
+    for _ in range(5):
+        with pytest.raises(ExternalEndpointFailure):
+            await client.get("https://www.sudoc.fr/123.rdf")
+    with pytest.raises(ExternalEndpointFailure):
+        await client.get("https://www.persee.fr/doc/abc.rdf")
+    assert client.calls == 6
+    assert CircuitBreakerRegistry.snapshot() == {
+        "fake resolver:www.persee.fr": {"state": "closed", "consecutive_failures": 1},
+        "fake resolver:www.sudoc.fr": {"state": "open", "consecutive_failures": 5},
+    }
+
+
+async def test_health_reports_circuit_breakers(test_client: TestClient):
+    """
+    GIVEN an external endpoint whose circuit breaker is open
+    WHEN the health endpoint is requested
+    THEN the state of the circuit breaker is reported
+    """
+    client = FakeClient()
+    for _ in range(5):
+        with pytest.raises(ExternalEndpointFailure):
+            await client.fetch()
+    response = test_client.get("/health/")
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "OK",
+        "circuit_breakers": {"fake": {"state": "open", "consecutive_failures": 5}},
+    }
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from unittest import mock
+
+import aiohttp
+
+from app.config import get_app_settings
+from app.harvesters.open_alex.open_alex_client import OpenAlexClient
+from app.harvesters.scopus.scopus_client import ScopusClient
+from app.http.host_scheduler import HostQuota, HostScheduler, request_flow
+
+
+async def _request(quota: HostQuota, flow: str, served: list, duration: float = 0):
+    await quota.acquire(flow)
+    try:
+        served.append(flow)
+        await asyncio.sleep(duration)
+    finally:
+        quota.release()
+
+
+async def test_concurrency_quota_limits_simultaneous_requests():
+    """
+    GIVEN a host quota of 2 simultaneous requests
+    WHEN 6 requests are sent at once
+    THEN no more than 2 of them run at the same time
+    """
+    quota = HostQuota("example.org", concurrency=2)
+    running = []
+    max_running = 0
+
+    async def request():
+        nonlocal max_running
+        await quota.acquire()
+        running.append(1)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        quota.release()
+
+    await asyncio.gather(*[request() for _ in range(6)])
+    assert max_running == 2
+    assert quota.snapshot() == {"in_flight": 0, "waiting": 0}
+
+
+async def test_waiting_requests_are_served_round_robin_across_flows():
+    """
+    GIVEN a host quota of 1 simultaneous request
+    WHEN a flow sends 4 requests, then another flow sends 2 requests
+    THEN the requests of the two flows are served alternately
+    """
+    quota = HostQuota("example.org", concurrency=1)
+    served = []
+    tasks = [
+        asyncio.create_task(_request(quota, "big", served, 0.01)) for _ in range(4)
+    ]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(_request(quota, "small", served, 0.01)) for _ in range(2)
+    ]
+    await asyncio.gather(*tasks)
+    assert served == ["big", "big", "small", "big", "small", "big"]
+
+
+async def test_token_bucket_limits_request_rate():
+    """
+    GIVEN a host quota of 20 requests per second
+    WHEN 30 requests are sent at once
+    THEN the first 20 start immediately and the others wait for new tokens
+    """
+    quota = HostQuota("example.org", concurrency=100, rate=20.0)
+    served = []
+    start = time.monotonic()
+    await asyncio.gather(*[_request(quota, "flow", served) for _ in range(30)])
+    assert len(served) == 30
+    assert time.monotonic() - start >= 0.45
+
+
+async def test_cancelled_waiting_request_does_not_hold_the_quota():
+    """
+    GIVEN a host quota of 1 simultaneous request, used by a running request
+    WHEN a waiting request is cancelled
+    THEN the next waiting request gets the quota when the running one ends
+    """
+    quota = HostQuota("example.org", concurrency=1)
+    served = []
+    running = asyncio.create_task(_request(quota, "a", served, 0.01))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_request(quota, "b", served))
+    waiting = asyncio.create_task(_request(quota, "c", served))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(running, waiting)
+    assert served == ["a", "c"]
+    assert quota.snapshot() == {"in_flight": 0, "waiting": 0}
+
+
+async def test_host_scheduler_applies_host_quotas_to_request_flows(monkeypatch):
+    """
+    GIVEN a quota of 1 simultaneous request configured for a host
+    WHEN two retrievals send requests to urls of this host
+    THEN the requests share the quota of the host, queued by retrieval
+    """
+    monkeypatch.setattr(
+        get_app_settings(), "http_host_quotas", {"www.sudoc.fr": {"concurrency": 1}}
+    )
+    served = []
+
+    async def retrieval(retrieval_id: int, count: int):
+        request_flow.set(retrieval_id)
+        for index in range(count):
+            async with HostScheduler.slot(f"https://www.sudoc.fr/{index}.rdf"):
+                served.append(retrieval_id)
+                await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(retrieval(1, 3))
+    await asyncio.sleep(0)
+    assert HostScheduler.snapshot() == {"www.sudoc.fr": {"in_flight": 1, "waiting": 0}}
+    await asyncio.gather(first, retrieval(2, 3))
+    assert served == [1, 2, 1, 2, 1, 2]
+    assert HostScheduler.quota("www.sudoc.fr").concurrency == 1
+    assert (
+        HostScheduler.quota("api.archives-ouvertes.fr").concurrency
+        == get_app_settings().http_host_concurrency
+    )
+
+
+def _paginated_responses(mocked_get, bodies: list, method: str) -> None:
+    responses = []
+    for body in bodies:
+        response = mock.MagicMock()
+        response.__aenter__.return_value.status = 200
+        setattr(
+            response.__aenter__.return_value, method, mock.AsyncMock(return_value=body)
+        )
+        responses.append(response)
+    mocked_get.side_effect = responses
+
+
+async def _consume_with_request_to_same_host(results, host: str) -> list:
+    consumed = []
+    async for result in results:
+        assert HostScheduler.snapshot()[host]["in_flight"] == 0
+        # e.g. the organization solver querying the same API during the conversion
+        async with asyncio.timeout(1), HostScheduler.slot(f"https://{host}/"):
+            consumed.append(result)
+    return consumed
+
+
+async def test_open_alex_slot_is_released_before_results_are_consumed(monkeypatch):
+    """
+    GIVEN a quota of 1 simultaneous request for the OpenAlex API
+    WHEN the results of a paginated OpenAlex query are consumed
+        by code sending requests to the same API
+    THEN the slot of the query is released before each page is consumed
+    """
+    monkeypatch.setattr(
+        get_app_settings(), "http_host_quotas", {"api.openalex.org": {"concurrency": 1}}
+    )
+    with mock.patch.object(aiohttp.ClientSession, "get") as mocked_get:
+        _paginated_responses(
+            mocked_get,
+            [
+                {"results": [{"id": "W1"}], "meta": {"count": 3, "per_page": 2}},
+                {"results": [{"id": "W2"}], "meta": {"count": 3, "per_page": 2}},
+            ],
+            "json",
+        )
+        consumed = await _consume_with_request_to_same_host(
+            OpenAlexClient().fetch("filter=author.orcid:0000"), "api.openalex.org"
+        )
+    assert consumed == [{"id": "W1"}, {"id": "W2"}]
+
+
+async def test_scopus_slot_is_released_before_next_page_is_fetched(monkeypatch):
+    """
+    GIVEN a quota of 1 simultaneous request for the Scopus API
+    WHEN the entries of a Scopus query of 2 pages are consumed
+        by code sending requests to the same API
+    THEN the slot of the query is released before each page is consumed
+        and before the next page is fetched
+    """
+    monkeypatch.setattr(
+        get_app_settings(),
+        "http_host_quotas",
+        {"api.elsevier.com": {"concurrency": 1}},
+    )
+    pages = [
+        '<feed xmlns="http://www.w3.org/2005/Atom"'
+        ' xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        "<opensearch:totalResults>26</opensearch:totalResults>"
+        f"<entry><id>{identifier}</id></entry></feed>"
+        for identifier in ("1", "2")
+    ]
+    with mock.patch.object(aiohttp.ClientSession, "get") as mocked_get:
+        _paginated_responses(mocked_get, pages, "text")
+        consumed = await _consume_with_request_to_same_host(
+            ScopusClient().fetch("query=AU-ID(1)"), "api.elsevier.com"
+        )
+    assert [
+        entry.find("default:id", ScopusClient.NAMESPACE).text for entry in consumed
+    ] == ["1", "2"]
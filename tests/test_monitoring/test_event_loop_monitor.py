@@ -0,0 +1,57 @@
+"""
+Test the event loop monitor.
+"""
+
+import asyncio
+import time
+
+from app.config import get_app_settings
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+
+
+async def test_monitor_records_code_blocking_the_loop():
+    """
+    GIVEN an event loop monitor with a slow callback threshold of 50 ms
+    WHEN a task blocks the loop for 300 ms
+    THEN the lag is measured
+    AND the task, its coroutine and the blocking line are recorded
+    """
+
+    async def blocking_harvester():
+        time.sleep(0.3)
+
+    monitor = EventLoopMonitor(
+        asyncio.get_running_loop(),
+        interval=0.01,
+        slow_callback_threshold=0.05,
+        window=100,
+    )
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(blocking_harvester(), name="blocking_task")
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+    assert monitor.slow_callbacks_count == 1
+    slow_callback = monitor.slow_callbacks[0]
+    assert slow_callback["task"] == "blocking_task"
+    assert slow_callback["coroutine"].endswith("blocking_harvester")
+    assert "time.sleep(0.3)" in slow_callback["stack"][-1]
+    assert slow_callback["duration"] >= 0.2
+    snapshot = monitor.snapshot()
+    assert snapshot["samples"] > 1
+    assert snapshot["max"] >= 0.2
+    assert snapshot["p50"] < 0.05
+    assert snapshot["slow_callbacks"] == 1
+
+
+async def test_monitor_is_not_started_if_disabled(monkeypatch):
+    """
+    GIVEN a lag sample interval of 0
+    WHEN the monitoring is started
+    THEN no monitor runs
+    """
+    monkeypatch.setattr(get_app_settings(), "event_loop_lag_sample_interval", 0)
+    assert EventLoopMonitor.start_monitoring() is None
+    assert EventLoopMonitor.running() is None
@@ -0,0 +1,97 @@
+"""
+Test the runtime metrics and their Prometheus text exposition.
+"""
+
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp import web
+
+from app.config import get_app_settings
+from app.db.timed_queue_pool import TimedQueuePool
+from app.monitoring.runtime_metrics import Counter, Histogram, RuntimeMetrics
+
+
+def test_render_histograms_and_counters():
+    """
+    GIVEN a histogram and a counter with labels
+    WHEN values are recorded and the metrics rendered
+    THEN the buckets are cumulative and the label values escaped
+    """
+    histogram = Histogram("test_duration_seconds", "Durations", ("host",), (0.1, 1))
+    histogram.observe("a.org", value=0.05)
+    histogram.observe("a.org", value=0.1)
+    histogram.observe("a.org", value=3)
+    counter = Counter("test_errors_total", "Errors\nby host", ("host",))
+    counter.inc('b"org')
+    assert RuntimeMetrics.render(lambda: [histogram, counter]).endswith(
+        "# HELP test_duration_seconds Durations\n"
+        "# TYPE test_duration_seconds histogram\n"
+        'test_duration_seconds_bucket{host="a.org",le="0.1"} 2\n'
+        'test_duration_seconds_bucket{host="a.org",le="1"} 2\n'
+        'test_duration_seconds_bucket{host="a.org",le="+Inf"} 3\n'
+        'test_duration_seconds_sum{host="a.org"} 3.15\n'
+        'test_duration_seconds_count{host="a.org"} 3\n'
+        "# HELP test_errors_total Errors\\nby host\n"
+        "# TYPE test_errors_total counter\n"
+        'test_errors_total{host="b\\"org"} 1\n'
+    )
+
+
+async def test_http_trace_config_measures_requests():
+    """
+    GIVEN a local server answering 200 on /ok and 404 elsewhere
+    WHEN a session traced by the runtime metrics requests both
+    THEN the durations are observed by host, the 404 counted as an error
+    AND no request remains in flight
+    """
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/ok", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    try:
+        async with aiohttp.ClientSession(
+            trace_configs=[RuntimeMetrics.http_trace_config()]
+        ) as session:
+            for path in ("/ok", "/missing"):
+                async with session.get(f"{url}{path}") as response:
+                    await response.read()
+    finally:
+        await runner.cleanup()
+    counts, _ = RuntimeMetrics.HTTP_CLIENT_REQUEST_DURATION.observations[("127.0.0.1",)]
+    assert sum(counts) == 2
+    assert RuntimeMetrics.HTTP_CLIENT_REQUEST_ERRORS.values == {("127.0.0.1", "404"): 1}
+    assert RuntimeMetrics.HTTP_CLIENT_REQUESTS_IN_FLIGHT.values == {("127.0.0.1",): 0}
+
+
+def test_cache_lookups_are_counted_only_if_enabled(monkeypatch):
+    """
+    GIVEN the runtime metrics disabled, then enabled
+    WHEN cache lookups are counted
+    THEN only the lookups made while enabled are recorded
+    """
+    monkeypatch.setattr(get_app_settings(), "runtime_metrics_enabled", False)
+    RuntimeMetrics.count_cache_lookups("sudoc_publications", hits=3, misses=1)
+    monkeypatch.setattr(get_app_settings(), "runtime_metrics_enabled", True)
+    RuntimeMetrics.count_cache_lookups("sudoc_publications", hits=2, misses=0)
+    assert RuntimeMetrics.CACHE_LOOKUPS.values == {("sudoc_publications", "hit"): 2}
+
+
+def test_timed_queue_pool_measures_connection_wait(monkeypatch):
+    """
+    GIVEN the runtime metrics enabled
+    WHEN a connection is taken from the timed pool
+    THEN the wait is observed
+    """
+    monkeypatch.setattr(get_app_settings(), "runtime_metrics_enabled", True)
+    pool = TimedQueuePool(creator=MagicMock, pool_size=1)
+    pool.connect().close()
+    counts, _ = RuntimeMetrics.DB_POOL_WAIT.observations[()]
+    assert sum(counts) == 1
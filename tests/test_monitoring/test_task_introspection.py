@@ -0,0 +1,44 @@
+"""
+Test the description of the live asyncio tasks.
+"""
+
+import asyncio
+
+from app.monitoring.event_loop_monitor import EventLoopMonitor
+from app.monitoring.task_introspection import live_tasks
+
+
+async def test_live_tasks_describes_age_and_await_point(monkeypatch):
+    """
+    GIVEN a running event loop monitor
+    WHEN a harvester task waits in a nested coroutine
+    THEN the task is described with its age and the nested await point
+    """
+
+    async def fetch_results(ready: asyncio.Event):
+        await ready.wait()
+
+    async def run(ready: asyncio.Event):
+        await fetch_results(ready)
+
+    monitor = EventLoopMonitor(
+        asyncio.get_running_loop(), interval=1, slow_callback_threshold=1, window=10
+    )
+    monkeypatch.setattr(EventLoopMonitor, "_running", monitor)
+    monitor.start()
+    ready = asyncio.Event()
+    try:
+        task = asyncio.create_task(run(ready), name="hal_harvester_retrieval_1")
+        await asyncio.sleep(0.01)
+        tasks = live_tasks("hal_harvester_retrieval_")
+    finally:
+        ready.set()
+        await task
+        monitor.stop()
+    assert len(tasks) == 1
+    assert tasks[0]["name"] == "hal_harvester_retrieval_1"
+    assert tasks[0]["coroutine"].endswith("run")
+    assert tasks[0]["age"] >= 0.01
+    assert tasks[0]["await_chain"][0].endswith("in run")
+    assert "in fetch_results" in tasks[0]["await_chain"][1]
+    assert tasks[0]["await_point"] == tasks[0]["await_chain"][-1]
@@ -0,0 +1,207 @@
+"""
+Test the tracing spans, their sampling and their exporters.
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from app.monitoring.tracing import (
+    MemorySpanExporter,
+    OtlpSpanExporter,
+    Tracer,
+    traced,
+)
+
+
+@traced("dereference")
+async def _dereference(uri: str) -> str:
+    await asyncio.sleep(0)
+    return uri
+
+
+@traced()
+def _convert(value: int) -> int:
+    return value * 2
+
+
+async def test_disabled_spans_record_nothing():
+    """
+    GIVEN a memory exporter, and the tracing disabled
+    WHEN spans are opened and traced functions called
+    THEN the functions return their results and no span is recorded
+    """
+    exporter = MemorySpanExporter(10)
+    Tracer.configure(exporter)
+    Tracer.configure(None)
+    with Tracer.span("retrieval") as span:
+        assert span is None
+        assert await _dereference("http://example.org/1") == "http://example.org/1"
+        assert _convert(2) == 4
+    assert Tracer.start_span("reference") is None
+    assert not exporter.spans
+
+
+async def test_spans_are_children_of_the_span_current_in_the_task_creator():
+    """
+    GIVEN the tracing enabled with a memory exporter
+    WHEN a retrieval span creates tasks opening spans and calling traced functions
+    THEN the spans of the tasks are children of the retrieval span in the same trace
+    AND the traces list them from the root with their depth
+    """
+    exporter = MemorySpanExporter(10)
+    Tracer.configure(exporter)
+
+    async def harvest(harvester: str) -> None:
+        with Tracer.span("harvesting", harvester=harvester):
+            reference = Tracer.start_span("reference", source_identifier="1")
+            await _dereference("http://example.org/1")
+            _convert(1)
+            Tracer.end_span(reference)
+
+    with Tracer.span("retrieval", retrieval_id=1) as retrieval:
+        await asyncio.gather(
+            asyncio.create_task(harvest("hal")), asyncio.create_task(harvest("idref"))
+        )
+    spans = {span.span_id: span for span in exporter.spans}
+    assert len(spans) == 9
+    assert {span.trace_id for span in spans.values()} == {retrieval.trace_id}
+    for span in spans.values():
+        if span.name == "harvesting":
+            assert span.parent_id == retrieval.span_id
+        elif span.name == "reference":
+            assert spans[span.parent_id].name == "harvesting"
+        elif span.name in ("dereference", "_convert"):
+            assert spans[span.parent_id].name == "reference"
+        assert span.duration >= 0
+    assert len(exporter.traces()) == 1
+    trace = exporter.traces()[0]
+    assert trace[0] == (0, retrieval)
+    assert sorted(
+        (depth, span.name) for depth, span in trace if span.name != "_convert"
+    ) == [
+        (0, "retrieval"),
+        (1, "harvesting"),
+        (1, "harvesting"),
+        (2, "reference"),
+        (2, "reference"),
+        (3, "dereference"),
+        (3, "dereference"),
+    ]
+
+
+async def test_sampling_is_decided_by_the_root_span():
+    """
+    GIVEN the tracing enabled with a sample rate of 0
+    WHEN a root span with children ends, then the sample rate is raised to 1
+    THEN no span of the first trace is recorded
+    AND the next root span is sampled again
+    """
+    exporter = MemorySpanExporter(10)
+    Tracer.configure(exporter, sample_rate=0.0)
+    with Tracer.span("retrieval") as retrieval:
+        assert retrieval.sampled is False
+        with Tracer.span("harvesting") as harvesting:
+            assert harvesting is None
+            await _dereference("http://example.org/1")
+    assert not exporter.spans
+    Tracer.sample_rate = 1.0
+    with Tracer.span("retrieval") as retrieval:
+        assert retrieval.parent_id is None
+    assert list(exporter.spans) == [retrieval]
+
+
+async def test_errors_are_recorded_on_the_spans():
+    """
+    GIVEN the tracing enabled
+    WHEN a traced coroutine raises an exception
+    THEN the exception is propagated and recorded on its span
+    """
+    exporter = MemorySpanExporter(10)
+    Tracer.configure(exporter)
+
+    @traced()
+    async def fail() -> None:
+        raise ValueError("unexpected format")
+
+    with pytest.raises(ValueError):
+        await fail()
+    [span] = exporter.spans
+    assert span.error == "ValueError: unexpected format"
+
+
+def test_memory_exporter_forgets_the_oldest_spans():
+    """
+    GIVEN a memory exporter keeping 2 spans
+    WHEN a trace of 3 nested spans is recorded
+    THEN the innermost span, ended first, is forgotten
+    """
+    exporter = MemorySpanExporter(2)
+    Tracer.configure(exporter)
+    with Tracer.span("retrieval") as retrieval:
+        with Tracer.span("harvesting") as harvesting:
+            _convert(1)
+    assert list(exporter.spans) == [harvesting, retrieval]
+    assert exporter.traces() == [[(0, retrieval), (1, harvesting)]]
+
+
+async def test_otlp_exporter_sends_the_spans_to_the_collector():
+    """
+    GIVEN a local OpenTelemetry collector and the tracing enabled with the OTLP exporter
+    WHEN spans are recorded and the tracing stopped
+    THEN the spans are sent in the OTLP JSON encoding, with their parent span id
+    """
+    received = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(json.loads(await request.read()))
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_post("/v1/traces", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        exporter = OtlpSpanExporter(
+            f"http://127.0.0.1:{runner.addresses[0][1]}/v1/traces", interval=60
+        )
+        Tracer.configure(exporter)
+        await exporter.start()
+        with Tracer.span("retrieval", retrieval_id=1) as retrieval:
+            _convert(1)
+        await Tracer.stop()
+    finally:
+        await runner.cleanup()
+    assert len(received) == 1
+    payload = received[0]
+    [resource_spans] = payload["resourceSpans"]
+    [scope_spans] = resource_spans["scopeSpans"]
+    child, root = scope_spans["spans"]
+    assert root["name"] == "retrieval"
+    assert root["traceId"] == f"{retrieval.trace_id:032x}"
+    assert root["parentSpanId"] == ""
+    assert root["attributes"] == [
+        {"key": "retrieval_id", "value": {"stringValue": "1"}}
+    ]
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    assert child["name"] == "_convert"
+    assert child["parentSpanId"] == root["spanId"]
+    assert Tracer.enabled is False
+
+
+def test_async_generators_cannot_be_traced():
+    """
+    GIVEN an async generator function
+    WHEN it is decorated to be traced
+    THEN a TypeError is raised, as its span would end before its first item
+    """
+
+    async def generate():
+        yield 1
+
+    with pytest.raises(TypeError):
+        traced()(generate)
@@ -1,6 +1,7 @@
 """Tests for the Person model."""
 
 import pickle
+from copy import deepcopy
 from unittest import mock
 
 import aiosparql
@@ -57,6 +58,48 @@ async def test_third_party_cache():
     assert len(list(value.subjects())) == 57
 
 
+@pytest.fixture(
+    name="idref_sparql_endpoint_client_mock_with_sudoc_cached_and_not_cached_pubs"
+)
+def fixture_idref_sparql_endpoint_client_mock_with_sudoc_cached_and_not_cached_pubs(
+    idref_sparql_endpoint_results_with_sudoc_pub: dict,
+    idref_sparql_endpoint_results_with_sudoc_cached_pub: dict,
+):
+    """Idref SPARQL endpoint mock listing a not cached then a cached Sudoc publication"""
+    results = deepcopy(idref_sparql_endpoint_results_with_sudoc_pub)
+    results["results"]["bindings"].extend(
+        idref_sparql_endpoint_results_with_sudoc_cached_pub["results"]["bindings"]
+    )
+    with mock.patch.object(
+        aiosparql.client.SPARQLClient, "query"
+    ) as aiosparql_client_query:
+        aiosparql_client_query.return_value = results
+        yield aiosparql_client_query
+
+
+async def test_third_party_cache_get_many(redis_cache_mock):
+    """
+    GIVEN a cache with one of two requested keys
+    WHEN getting both keys at once
+    THEN the cache is queried once with MGET
+    AND only the value found in the cache is returned
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+    cached_key = "https://www.sudoc.fr/070266875.rdf"
+    missing_key = "https://www.sudoc.fr/193726130.rdf"
+
+    values = await ThirdApiCache.get_many(
+        "sudoc_publications", [cached_key, missing_key, cached_key]
+    )
+
+    assert list(values) == [cached_key]
+    assert len(list(values[cached_key].subjects())) == 57
+    redis_cache_mock.mget.assert_called_once_with(
+        [f"sudoc_publications:{cached_key}", f"sudoc_publications:{missing_key}"]
+    )
+
+
 @pytest.fixture(name="reference_recorder_register_mock")
 def fixture_reference_recorder_register_mock():
     """Reference recorder mock to detect register method calls."""
@@ -120,9 +163,9 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
     """
     GIVEN an Idref harvester that finds a sudoc publication whose URI is not in cache
     WHEN the harvester runs
-    THEN the get method of ThirdApiCache is called and returns None,
+    THEN the cache is queried once with MGET and returns None,
     the Sudoc RDF endpoint is called and returns a graph,
-    the set method of ThirdApiCache is called with the URI and the graph
+    the graph is stored in the cache with the URI
 
     :param harvesting_db_model_for_person_with_idref:
     :param reference_recorder_register_mock:
@@ -147,7 +190,7 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
     idref_sparql_endpoint_client_mock_with_sudoc_not_cached_pub.assert_called_once()
     rdf_resolver_mock.assert_called()
     reference_recorder_register_mock.assert_called_once()
-    redis_cache_mock.get.assert_called_once()
+    redis_cache_mock.mget.assert_called_once()
     redis_cache_mock.set.assert_called_once()
     _, arg = redis_cache_mock.set.call_args
     assert arg["name"] == "sudoc_publications:https://www.sudoc.fr/193726130.rdf"
@@ -161,3 +204,91 @@ async def test_idref_harvester_puts_sudoc_reponse_in_cache(
         reference.titles[0].value
         == "Agriculture des métropoles  : voie d'avenir ou cache-misère ?"
     )
+
+
+@pytest.mark.asyncio
+async def test_idref_harvester_prefetches_sudoc_docs_from_cache(
+    harvesting_db_model_for_person_with_idref,
+    reference_recorder_register_mock,
+    rdf_resolver_mock,
+    redis_cache_mock,
+    idref_sparql_endpoint_client_mock_with_sudoc_cached_and_not_cached_pubs,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+):
+    """
+    GIVEN an Idref harvester that finds a not cached then a cached sudoc publication
+    WHEN the harvester runs
+    THEN the cache is queried once for both publications
+    AND the cached publication is yielded first, without calling the Sudoc endpoint
+    AND only the not cached publication is fetched, then stored in the cache
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter(name="idref"))
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    harvester.set_harvesting_id(harvesting_db_model_for_person_with_idref.id)
+    await harvester.set_entity_id(
+        harvesting_db_model_for_person_with_idref.retrieval.entity_id
+    )
+    results = [result async for result in harvester.fetch_results()]
+
+    assert [str(result.source_identifier) for result in results] == [
+        "http://www.sudoc.fr/070266875/id",
+        "http://www.sudoc.fr/193726130/id",
+    ]
+    redis_cache_mock.mget.assert_called_once_with(
+        [
+            "sudoc_publications:https://www.sudoc.fr/193726130.rdf",
+            "sudoc_publications:https://www.sudoc.fr/070266875.rdf",
+        ]
+    )
+    rdf_resolver_mock.assert_called_once_with(
+        "https://www.sudoc.fr/193726130.rdf", output_format="xml"
+    )
+    redis_cache_mock.set.assert_called_once()
+    assert (
+        redis_cache_mock.set.call_args.kwargs["name"]
+        == "sudoc_publications:https://www.sudoc.fr/193726130.rdf"
+    )
+    reference_recorder_register_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_idref_harvester_caches_sudoc_doc_as_soon_as_fetched(
+    harvesting_db_model_for_person_with_idref,
+    rdf_resolver_mock,
+    redis_cache_mock,
+    idref_sparql_endpoint_client_mock_with_sudoc_cached_and_not_cached_pubs,  # pylint: disable=unused-argument
+    async_session: AsyncSession,
+):
+    """
+    GIVEN an Idref harvester that finds a not cached then a cached sudoc publication
+    WHEN the harvesting is interrupted right after the not cached publication is yielded
+    THEN the fetched publication is already stored in the cache
+    """
+    settings = get_app_settings()
+    settings.third_api_caching_enabled = True
+
+    harvester = IdrefHarvester(converter=IdrefReferencesConverter(name="idref"))
+    async_session.add(harvesting_db_model_for_person_with_idref)
+    await async_session.commit()
+    harvester.set_harvesting_id(harvesting_db_model_for_person_with_idref.id)
+    await harvester.set_entity_id(
+        harvesting_db_model_for_person_with_idref.retrieval.entity_id
+    )
+    results = harvester.fetch_results()
+    cached_result = await anext(results)
+    redis_cache_mock.set.assert_not_called()
+    fetched_result = await anext(results)
+    await results.aclose()
+
+    assert str(cached_result.source_identifier) == "http://www.sudoc.fr/070266875/id"
+    assert str(fetched_result.source_identifier) == "http://www.sudoc.fr/193726130/id"
+    rdf_resolver_mock.assert_called_once()
+    redis_cache_mock.set.assert_called_once()
+    assert (
+        redis_cache_mock.set.call_args.kwargs["name"]
+        == "sudoc_publications:https://www.sudoc.fr/193726130.rdf"
+    )
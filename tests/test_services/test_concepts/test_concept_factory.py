@@ -10,6 +10,7 @@ from app.services.concepts.skosmos_jel_concept_solver import SkosmosJelConceptSo
 from app.services.concepts.sparql_jel_concept_solver import SparqlJelConceptSolver
 from app.services.concepts.unknown_authority_exception import UnknownAuthorityException
 from app.services.concepts.wikidata_concept_solver import WikidataConceptSolver
+from app.services.errors.dereferencing_error import DereferencingError
 
 
 @pytest.fixture(name="mock_idref_concept_solver_solve")
@@ -236,3 +237,59 @@ async def test_concept_factory_unknown_authority_exception():
     concept_uri = "http://www.fake.fr/033265077"
     with pytest.raises(UnknownAuthorityException):
         await ConceptFactory.solve(ConceptInformations(uri=concept_uri))
+
+
+async def test_concept_factory_remembers_missing_concepts(
+    mock_idref_concept_solver_solve, redis_cache_mock, monkeypatch
+):
+    """
+    GIVEN an idref concept URI returning 404
+    WHEN solving it twice through the concept factory
+    THEN the 404 is stored in the negative cache after the first call
+    AND the second call fails without calling the solver
+    """
+    concept_uri = "http://www.idref.fr/033265077/id"
+    monkeypatch.setattr(get_app_settings(), "third_api_caching_enabled", True)
+    negative_cache = {}
+
+    async def fake_redis_get(name: str):
+        return negative_cache.get(name)
+
+    async def fake_redis_set(name: str, value: bytes, ex: int):
+        negative_cache[name] = value
+        assert ex == get_app_settings().dereferencing_negative_caching_duration
+
+    redis_cache_mock.get.side_effect = fake_redis_get
+    redis_cache_mock.set.side_effect = fake_redis_set
+    mock_idref_concept_solver_solve.side_effect = DereferencingError(
+        "Endpoint returned status 404", status=404
+    )
+
+    for _ in range(2):
+        with pytest.raises(DereferencingError) as exc_info:
+            await ConceptFactory.solve(ConceptInformations(uri=concept_uri))
+        assert exc_info.value.status == 404
+
+    mock_idref_concept_solver_solve.assert_called_once()
+    assert list(negative_cache) == [f"dereferencing_negative:{concept_uri}"]
+
+
+async def test_concept_factory_does_not_remember_unavailable_endpoints(
+    mock_idref_concept_solver_solve, redis_cache_mock, monkeypatch
+):
+    """
+    GIVEN an idref concept URI whose endpoint returns 503
+    WHEN solving it through the concept factory
+    THEN nothing is stored in the negative cache
+    """
+    monkeypatch.setattr(get_app_settings(), "third_api_caching_enabled", True)
+    mock_idref_concept_solver_solve.side_effect = DereferencingError(
+        "Endpoint returned status 503", status=503
+    )
+
+    with pytest.raises(DereferencingError):
+        await ConceptFactory.solve(
+            ConceptInformations(uri="http://www.idref.fr/033265077/id")
+        )
+
+    redis_cache_mock.set.assert_not_awaited()
@@ -1,4 +1,5 @@
 """Test the entity resolution API."""
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -567,3 +568,59 @@ async def test_resolution_service_does_not_update_identifiers_in_safe_mode(
     assert existing_entity.has_identifier_of_type_and_value(
         ContributorIdentifier.IdentifierType.ORCID.value, "1"
     )
+
+
+@pytest.mark.asyncio
+async def test_resolution_service_resolves_many_entities(async_session: AsyncSession):
+    """
+    GIVEN an entity with an IDREF already in the database
+    WHEN a batch is submitted with an entity with the same IDREF,
+        a new entity and another new entity sharing its ORCID
+    THEN the first entity is resolved to the existing one
+    AND the entities sharing an identifier are resolved to the same new entity
+    """
+    existing = Person(
+        name="John Doe",
+        identifiers=[
+            Identifier(
+                type=ContributorIdentifier.IdentifierType.IDREF.value, value="123456789"
+            )
+        ],
+    )
+    async_session.add(existing)
+    await async_session.flush()
+    batch = [
+        Person(
+            name="Johnny DoeVariant",
+            identifiers=[
+                Identifier(
+                    type=ContributorIdentifier.IdentifierType.IDREF.value,
+                    value="123456789",
+                )
+            ],
+        ),
+        Person(
+            name="Jane Doe",
+            identifiers=[
+                Identifier(
+                    type=ContributorIdentifier.IdentifierType.ORCID.value,
+                    value="0000-0002-1825-0097",
+                )
+            ],
+        ),
+        Person(
+            name="Jane Doe Variant",
+            identifiers=[
+                Identifier(
+                    type=ContributorIdentifier.IdentifierType.ORCID.value,
+                    value="0000-0002-1825-0097",
+                )
+            ],
+        ),
+    ]
+    resolved = await EntityResolutionService(async_session).resolve_many(batch)
+    assert resolved[0] is existing
+    assert existing.name == "Johnny DoeVariant"
+    assert resolved[1] is batch[1]
+    assert resolved[2] is batch[1]
+    assert resolved[2].name == "Jane Doe Variant"
@@ -0,0 +1,48 @@
+"""Tests for the entity snapshot shared by the harvesters of a retrieval."""
+
+import pytest
+
+from app.db.models.person import Person as DbPerson
+from app.services.entities.entity_snapshot import EntitySnapshot
+
+
+def test_entity_snapshot_from_db_model(
+    person_with_name_and_idref_db_model: DbPerson,
+):
+    """
+    GIVEN a person loaded from the database
+    WHEN building a snapshot of it
+    THEN the snapshot exposes its class name, name and identifiers
+    AND cannot be modified
+    """
+    snapshot = EntitySnapshot.of(person_with_name_and_idref_db_model)
+    assert snapshot.class_name == "Person"
+    assert snapshot.name == "John Doe"
+    assert snapshot.get_identifier("idref") == "123456789"
+    assert snapshot.get_identifier("orcid") is None
+    assert snapshot.to_dict() == {
+        "identifiers": [{"type": "idref", "value": "123456789"}],
+        "name": "John Doe",
+    }
+    assert EntitySnapshot.of(snapshot) is snapshot
+    with pytest.raises(AttributeError):
+        snapshot.name = "Jane Doe"
+
+
+def test_entity_snapshot_is_cached_while_retained():
+    """
+    GIVEN a snapshot retained by two retrievals
+    WHEN the retrievals release it one after the other
+    THEN it stays cached until the last release
+    """
+    snapshot = EntitySnapshot(
+        entity_id=42, class_name="Person", name="John Doe", identifiers=()
+    )
+    EntitySnapshot.retain(snapshot)
+    EntitySnapshot.retain(snapshot)
+    assert EntitySnapshot.cached(42) is snapshot
+    EntitySnapshot.release(42)
+    assert EntitySnapshot.cached(42) is snapshot
+    EntitySnapshot.release(42)
+    assert EntitySnapshot.cached(42) is None
+    assert EntitySnapshot.cached(None) is None
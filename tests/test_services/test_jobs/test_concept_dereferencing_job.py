@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.daos.job_checkpoint_dao import JobCheckpointDAO
 from app.db.models.concept import Concept
+from app.db.models.label import Label
 from app.services.concepts.unknown_authority_exception import UnknownAuthorityException
 from app.services.jobs.concept_dereferencing_job import ConceptDereferencingJob
 
@@ -36,3 +40,79 @@ async def test_derefence_job_unknown_id(async_session: AsyncSession):
     job = ConceptDereferencingJob()
     with pytest.raises(UnknownAuthorityException):
         await job.run()
+
+
+@pytest.mark.asyncio
+async def test_dereference_job_refreshes_expired_concepts(async_session: AsyncSession):
+    """
+    Test that concepts whose dereferencing is older than the expiration delay
+    of their source are dereferenced again, and that fresh ones are left untouched.
+    """
+    expired_concept = Concept(
+        uri="http://www.idref.fr/123456789X/id",
+        dereferenced=True,
+        last_dereferencing_date_time=datetime.now() - timedelta(days=60),
+        labels=[Label(value="Outdated label", language="fr")],
+    )
+    fresh_concept = Concept(
+        uri="http://www.idref.fr/987654321X/id",
+        dereferenced=True,
+        last_dereferencing_date_time=datetime.now(),
+        labels=[Label(value="Fresh label", language="fr")],
+    )
+    async_session.add_all([expired_concept, fresh_concept])
+    await async_session.commit()
+
+    await ConceptDereferencingJob().run()
+
+    await async_session.refresh(expired_concept)
+    await async_session.refresh(fresh_concept)
+
+    assert expired_concept.last_dereferencing_date_time > datetime.now() - timedelta(
+        days=1
+    )
+    labels = [label.value for label in expired_concept.labels]
+    assert "Idref concept allowed for test" in labels
+    assert "Outdated label" not in labels
+    assert [label.value for label in fresh_concept.labels] == ["Fresh label"]
+
+
+@pytest.mark.asyncio
+async def test_dereference_job_resumes_from_checkpoint(async_session: AsyncSession):
+    """
+    Test that the job resumes after the checkpointed concept and removes
+    the checkpoint once the backlog has been processed.
+    """
+    skipped_concept = Concept(
+        uri="http://www.idref.fr/123456789X/id", dereferenced=False
+    )
+    async_session.add(skipped_concept)
+    await async_session.commit()
+    await JobCheckpointDAO(async_session).save_checkpoint(
+        ConceptDereferencingJob.JOB_NAME, skipped_concept.id
+    )
+    await async_session.commit()
+
+    await ConceptDereferencingJob().run()
+
+    await async_session.refresh(skipped_concept)
+    assert skipped_concept.dereferenced is False
+    assert (
+        await JobCheckpointDAO(async_session).get_checkpoint(
+            ConceptDereferencingJob.JOB_NAME
+        )
+        is None
+    )
+
+
+def test_dereference_job_ignores_unknown_expiration_sources():
+    """
+    Test that an expiration delay configured for an unknown concept source
+    is ignored instead of preventing the job from running.
+    """
+    job = ConceptDereferencingJob()
+    job.expiration_days = {"IDREF": 30, "UNKNOWN_SOURCE": 10}
+
+    expiration_dates = job._expiration_dates()  # pylint: disable=protected-access
+
+    assert list(expiration_dates) == [r"^https?://www\.idref\.fr"]
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.metrics_rollup_dao import MetricsRollupDAO
+from app.db.models.harvesting import Harvesting
+from app.db.models.reference import Reference
+from app.db.models.reference_event import ReferenceEvent
+from app.db.models.reference_events_rollup import ReferenceEventsRollup
+from app.db.models.references_rollup import ReferencesRollup
+from app.db.models.retrieval import Retrieval
+from app.db.models.title import Title
+from app.db.session import async_session as app_async_session
+from app.services.jobs.metrics_rollup_job import MetricsRollupJob
+
+
+def _reference(harvester: str, index: int) -> Reference:
+    return Reference(
+        source_identifier=f"{harvester}_source_identifier_{index}",
+        harvester=harvester,
+        hash="hash",
+        version=0,
+        titles=[Title(value="Fake scientific article", language="en")],
+    )
+
+
+def _add_events(
+    async_session: AsyncSession,
+    harvesting: Harvesting,
+    events: dict[str, int],
+) -> None:
+    index = 0
+    for event_type, count in events.items():
+        for _ in range(count):
+            index += 1
+            async_session.add(
+                ReferenceEvent(
+                    type=event_type,
+                    harvesting=harvesting,
+                    reference=_reference(harvesting.harvester, index),
+                )
+            )
+
+
+async def _events_by_day_and_type(past_days: int = 7) -> dict:
+    async with app_async_session() as session:
+        rows = await MetricsRollupDAO(session).get_reference_events_by_day_and_type(
+            past_days
+        )
+        return {(day, event_type): count for day, event_type, count in rows}
+
+
+async def _references_by_harvester() -> dict:
+    async with app_async_session() as session:
+        return dict(list(await MetricsRollupDAO(session).get_references_by_harvester()))
+
+
+@pytest.mark.asyncio
+async def test_metrics_rollup_job_rolls_up_past_days_reference_events(
+    async_session: AsyncSession,
+    retrieval_db_model_for_person_with_idref: Retrieval,
+):
+    """
+    GIVEN reference events of a harvesting 3 days ago and of a harvesting today
+    WHEN running the metrics rollup job twice
+    THEN only the events of 3 days ago are rolled up, counted once
+    AND the metrics still count the events of both days
+    """
+    three_days_ago = datetime.utcnow() - timedelta(days=3)
+    past_harvesting = Harvesting(
+        harvester="idref",
+        state=Harvesting.State.COMPLETED.value,
+        retrieval=retrieval_db_model_for_person_with_idref,
+        timestamp=three_days_ago,
+    )
+    today_harvesting = Harvesting(
+        harvester="hal",
+        state=Harvesting.State.RUNNING.value,
+        retrieval=retrieval_db_model_for_person_with_idref,
+    )
+    _add_events(async_session, past_harvesting, {"created": 2, "updated": 1})
+    _add_events(async_session, today_harvesting, {"created": 3})
+    await async_session.commit()
+
+    await MetricsRollupJob().run()
+    await MetricsRollupJob().run()
+
+    rollups = (await async_session.execute(select(ReferenceEventsRollup))).scalars()
+    assert {
+        (rollup.day, rollup.harvester, rollup.event_type, rollup.count)
+        for rollup in rollups
+    } == {
+        (three_days_ago.date(), "idref", "created", 2),
+        (three_days_ago.date(), "idref", "updated", 1),
+    }
+    assert await _events_by_day_and_type() == {
+        (three_days_ago.date(), "created"): 2,
+        (three_days_ago.date(), "updated"): 1,
+        (datetime.utcnow().date(), "created"): 3,
+    }
+    assert await _events_by_day_and_type(past_days=2) == {
+        (datetime.utcnow().date(), "created"): 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_rollup_job_rolls_up_references_seen_by_previous_run(
+    async_session: AsyncSession,
+):
+    """
+    GIVEN 3 references in the database
+    WHEN running the metrics rollup job once, then again after 2 new references
+    THEN the first run only records the last reference id
+    AND the second run rolls up the 3 first references
+    AND the metrics count the 5 references at each step
+    """
+    for index in range(3):
+        async_session.add(_reference("hal", index))
+    await async_session.commit()
+
+    await MetricsRollupJob().run()
+    assert not (await async_session.execute(select(ReferencesRollup))).all()
+    assert await _references_by_harvester() == {"hal": 3}
+
+    async_session.add(_reference("hal", 3))
+    async_session.add(_reference("scopus", 0))
+    await async_session.commit()
+    assert await _references_by_harvester() == {"hal": 4, "scopus": 1}
+
+    await MetricsRollupJob().run()
+    rollups = (await async_session.execute(select(ReferencesRollup))).scalars()
+    assert {(rollup.harvester, rollup.count) for rollup in rollups} == {("hal", 3)}
+    assert await _references_by_harvester() == {"hal": 4, "scopus": 1}
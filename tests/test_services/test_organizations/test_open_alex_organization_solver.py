@@ -287,3 +287,56 @@ async def test_openalex_solver_should_save_ids_openalex_and_ror(
 
     # the "save ids" loop SHOULD add ror too (after fixing mapping)
     assert (OrganizationIdentifier.IdentifierType.ROR.value, "00bhwwh42") in got
+
+
+@pytest.mark.asyncio
+async def test_openalex_solver_solve_many_batches_requests(
+    monkeypatch, openalex_payload
+):
+    """
+    GIVEN two OpenAlex institutions, one of which is unknown from OpenAlex
+    WHEN solve_many() is called
+    THEN a single list request is sent with both ids
+         and an error is returned for the missing institution
+    """
+    response = _FakeResponse(status=200, payload={"results": [openalex_payload]})
+    fake_session = _FakeSession(response)
+
+    from app.http.aio_http_client_manager import AioHttpClientManager
+
+    monkeypatch.setattr(
+        AioHttpClientManager, "get_session", AsyncMock(return_value=fake_session)
+    )
+
+    from app.services.organizations import organization_factory
+
+    monkeypatch.setattr(
+        organization_factory.OrganizationFactory,
+        "solve_identifier",
+        AsyncMock(
+            return_value=([], [OrganizationIdentifier.IdentifierType.OPEN_ALEX.value])
+        ),
+    )
+
+    solver = OpenAlexOrganizationSolver(timeout=1)
+    found, missing = await solver.solve_many(
+        [
+            OrganizationInformations(
+                identifier="https://openalex.org/I4210091016", source="openalex"
+            ),
+            OrganizationInformations(
+                identifier="https://openalex.org/I0000000000", source="openalex"
+            ),
+        ]
+    )
+
+    assert found.source_identifier == "https://openalex.org/I4210091016"
+    assert found.name == "Sociétés, Acteurs, Gouvernement en Europe"
+    assert isinstance(missing, DereferencingError)
+
+    assert fake_session.get.call_count == 1
+    assert fake_session.get.call_args.args[0] == OpenAlexOrganizationSolver.BATCH_URL
+    assert (
+        fake_session.get.call_args.kwargs["params"]["filter"]
+        == "ids.openalex:I4210091016|I0000000000"
+    )
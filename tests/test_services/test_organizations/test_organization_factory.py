@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from app.config import get_app_settings
+from app.db.models.organization import Organization
+from app.services.errors.dereferencing_error import DereferencingError
+from app.services.organizations.organization_factory import OrganizationFactory
+from app.services.organizations.organization_informations import (
+    OrganizationInformations,
+)
+
+
+async def test_concurrent_organization_lookups_are_coalesced(
+    mock_hal_organization_solver,
+):
+    """
+    GIVEN several concurrent requests for the same HAL organization
+    WHEN they are solved through the organization factory
+    THEN the HAL solver is called only once
+    AND each caller receives its own copy of the organization
+    """
+
+    async def slow_solver(organization_information):
+        await asyncio.sleep(0.05)
+        return Organization(
+            source="hal",
+            source_identifier=organization_information.identifier,
+            name="Organization Test",
+        )
+
+    mock_hal_organization_solver.side_effect = slow_solver
+
+    organizations = await asyncio.gather(
+        *[
+            OrganizationFactory.solve(
+                OrganizationInformations(identifier="123456", source="hal")
+            )
+            for _ in range(3)
+        ]
+    )
+
+    assert mock_hal_organization_solver.call_count == 1
+    assert all(
+        organization.source_identifier == "123456" for organization in organizations
+    )
+    assert len({id(organization) for organization in organizations}) == 3
+
+
+async def test_solve_many_groups_organizations_by_source(
+    mock_hal_organization_solver,
+):
+    """
+    GIVEN organizations from two sources
+    WHEN they are solved in a single batch
+    THEN the results are returned in the order of the request
+    """
+    results = await OrganizationFactory.solve_many(
+        [
+            OrganizationInformations(
+                identifier="https://openalex.org/I114027177", source="openalex"
+            ),
+            OrganizationInformations(identifier="000000", source="hal"),
+        ]
+    )
+
+    assert [result.source for result in results] == ["openalex", "hal"]
+    assert mock_hal_organization_solver.call_count == 1
+
+
+async def test_missing_organizations_are_remembered(
+    mock_hal_organization_solver, redis_cache_mock, monkeypatch
+):
+    """
+    GIVEN a HAL organization returning 410
+    WHEN solving it twice through the organization factory
+    THEN the 410 is stored in the negative cache after the first call
+    AND the second call fails without calling the HAL solver
+    """
+    monkeypatch.setattr(get_app_settings(), "third_api_caching_enabled", True)
+    negative_cache = {}
+
+    async def fake_redis_mget(keys: list[str]):
+        return [negative_cache.get(key) for key in keys]
+
+    async def fake_redis_set(name: str, value: bytes, ex: int):
+        negative_cache[name] = value
+
+    redis_cache_mock.mget.side_effect = fake_redis_mget
+    redis_cache_mock.set.side_effect = fake_redis_set
+    mock_hal_organization_solver.side_effect = DereferencingError(
+        "Endpoint returned status 410", status=410
+    )
+
+    for _ in range(2):
+        with pytest.raises(DereferencingError) as exc_info:
+            await OrganizationFactory.solve(
+                OrganizationInformations(identifier="123456", source="hal")
+            )
+        assert exc_info.value.status == 410
+
+    assert mock_hal_organization_solver.call_count == 1
+    assert list(negative_cache) == ["dereferencing_negative:hal_organizations:123456"]
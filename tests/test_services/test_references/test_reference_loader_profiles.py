@@ -0,0 +1,151 @@
+"""Test the loader profiles of references."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.daos.reference_dao import ReferenceDAO
+from app.db.models.reference import Reference as DbReference
+from app.db.models.reference_identifier import ReferenceIdentifier
+from app.db.models.reference_manifestation import ReferenceManifestation
+from app.db.models.title import Title
+from app.db.references.reference_loader_profiles import ReferenceLoaderProfile
+from app.db.session import async_session as app_async_session, engine
+
+# relationships loaded by "SELECT ... IN" queries in the complete profiles
+COMPLETE_PROFILE_COLLECTIONS = 8
+# tables of the collections that would multiply the rows of the references
+COLLECTION_TABLES = ["titles", "reference_identifiers", "reference_manifestations"]
+
+
+@contextmanager
+def _recorded_statements():
+    """
+    Record the SQL statements executed through the engine
+    """
+    statements = []
+
+    def before_cursor_execute(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        _conn, _cursor, statement, _parameters, _context, _executemany
+    ):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _joins_collections(statement: str) -> bool:
+    return any(f"JOIN {table} " in statement for table in COLLECTION_TABLES)
+
+
+@pytest.fixture(name="reference_with_many_collections")
+async def fixture_reference_with_many_collections(
+    async_session: AsyncSession,
+) -> DbReference:
+    """
+    A reference with 5 titles, 20 identifiers and 10 manifestations
+    """
+    reference = DbReference(
+        source_identifier="source_identifier_1234",
+        harvester="hal",
+        hash="hash",
+        version=0,
+        titles=[Title(value=f"title {i}", language="en") for i in range(5)],
+        identifiers=[
+            ReferenceIdentifier(type="uri", value=f"http://example.org/{i}")
+            for i in range(20)
+        ],
+        manifestations=[
+            ReferenceManifestation(page=f"http://example.org/page/{i}")
+            for i in range(10)
+        ],
+    )
+    async_session.add(reference)
+    await async_session.commit()
+    return reference
+
+
+@pytest.mark.parametrize(
+    "profile, expected_statements",
+    [
+        (ReferenceLoaderProfile.MINIMAL, 1),
+        (ReferenceLoaderProfile.CHANGE_DETECTION, 1),
+        (ReferenceLoaderProfile.PUBLISH, 1 + COMPLETE_PROFILE_COLLECTIONS),
+        (ReferenceLoaderProfile.DISPLAY, 1 + COMPLETE_PROFILE_COLLECTIONS),
+    ],
+)
+async def test_loader_profile_does_not_join_collections(
+    reference_with_many_collections: DbReference,
+    profile: ReferenceLoaderProfile,
+    expected_statements: int,
+):
+    """
+    GIVEN a reference with 5 titles, 20 identifiers and 10 manifestations
+    WHEN loading it with a loader profile
+    THEN the reference is fetched without joining its collections
+    AND each collection of the complete profiles is loaded by its own query
+    """
+    async with app_async_session() as session:
+        with _recorded_statements() as statements:
+            reference = (
+                await session.execute(
+                    select(DbReference)
+                    .options(*profile.options())
+                    .where(DbReference.id == reference_with_many_collections.id)
+                )
+            ).scalar_one()
+    assert len(statements) == expected_statements
+    assert not _joins_collections(statements[0])
+    if profile in (ReferenceLoaderProfile.PUBLISH, ReferenceLoaderProfile.DISPLAY):
+        assert len(reference.titles) == 5
+        assert len(reference.identifiers) == 20
+        assert len(reference.manifestations) == 10
+    else:
+        with pytest.raises(InvalidRequestError):
+            _ = reference.titles
+
+
+async def test_plain_select_does_not_join_collections(
+    reference_with_many_collections: DbReference,
+):
+    """
+    GIVEN a reference with 5 titles, 20 identifiers and 10 manifestations
+    WHEN loading it without loader options
+    THEN the reference is fetched without joining its collections
+    """
+    async with app_async_session() as session:
+        with _recorded_statements() as statements:
+            reference = await session.get(
+                DbReference, reference_with_many_collections.id
+            )
+    assert not _joins_collections(statements[0])
+    assert len(reference.identifiers) == 20
+
+
+async def test_change_detection_profile_loads_comparison_columns(
+    reference_with_many_collections: DbReference,
+):
+    """
+    GIVEN a reference in database
+    WHEN loading the last version of the reference for change detection
+    THEN the columns used to compare it with a harvested reference are loaded
+    """
+    async with app_async_session() as session:
+        with _recorded_statements() as statements:
+            reference = await ReferenceDAO(
+                session
+            ).get_last_reference_by_source_identifier(
+                reference_with_many_collections.source_identifier,
+                reference_with_many_collections.harvester,
+            )
+    assert len(statements) == 1
+    assert "custom_metadata" not in statements[0]
+    assert reference.id == reference_with_many_collections.id
+    assert reference.hash == "hash"
+    assert reference.version == 0
@@ -0,0 +1,105 @@
+import asyncio
+from unittest import mock
+
+from app.services.retrieval.retrieval_progress import RetrievalProgress
+
+
+async def test_progress_events_resume_after_last_event_id():
+    """
+    GIVEN a progress log with 3 events
+    WHEN reading the events following the event 2
+    THEN only the third event is returned, then the end of the retrieval
+    """
+    progress = RetrievalProgress.open(1)
+    for reference_event_id in range(3):
+        await progress.put(
+            {
+                "type": "ReferenceEvent",
+                "id": reference_event_id,
+                "change": "created",
+                "entity_id": 1,
+            }
+        )
+    progress.close()
+
+    events = [event async for event in progress.events_after(2, keepalive=1)]
+
+    assert events == [
+        {"type": "ReferenceEvent", "id": 2, "change": "created", "event_id": 3},
+        {"type": "Retrieval", "id": 1, "state": "completed", "event_id": 4},
+    ]
+
+
+async def test_progress_events_are_streamed_as_they_arrive():
+    """
+    GIVEN a progress log of a running retrieval
+    WHEN a client follows the events
+    THEN it receives the events put afterwards and keepalives while waiting
+    AND the stream ends with the retrieval
+    """
+    progress = RetrievalProgress.open(2)
+    downstream = asyncio.Queue()
+    progress.downstream = downstream
+    progress.harvesters = {10: "hal"}
+
+    async def harvest():
+        await asyncio.sleep(0.05)
+        await progress.put({"type": "Harvesting", "id": 10, "state": "running"})
+        progress.close()
+
+    received = []
+    harvesting = asyncio.create_task(harvest())
+    async for event in progress.events_after(0, keepalive=0.01):
+        received.append(event)
+    await harvesting
+
+    assert None in received
+    assert [event for event in received if event is not None] == [
+        {"type": "Harvesting", "id": 10, "state": "running", "event_id": 1}
+        | {"harvester": "hal"},
+        {"type": "Retrieval", "id": 2, "state": "completed", "event_id": 2},
+    ]
+    assert downstream.get_nowait() == {
+        "type": "Harvesting",
+        "id": 10,
+        "state": "running",
+    }
+
+
+def test_finished_progress_logs_expire():
+    """
+    GIVEN the progress log of a retrieval finished for longer than the retention
+    WHEN the progress log of another retrieval is opened
+    THEN the finished progress log is forgotten
+    """
+    with mock.patch(
+        "app.services.retrieval.retrieval_progress.time.monotonic", return_value=1000
+    ):
+        RetrievalProgress.open(3).close()
+        RetrievalProgress.open(4)
+    assert RetrievalProgress.get(3) is not None
+    with mock.patch(
+        "app.services.retrieval.retrieval_progress.time.monotonic", return_value=5000
+    ):
+        RetrievalProgress.open(5)
+    assert RetrievalProgress.get(3) is None
+    assert RetrievalProgress.get(4) is not None
+
+
+def test_finished_progress_logs_expire_when_another_retrieval_finishes():
+    """
+    GIVEN the progress log of a retrieval finished for longer than the retention
+    WHEN another retrieval finishes, without any new retrieval opened
+    THEN the expired progress log is forgotten
+    """
+    with mock.patch(
+        "app.services.retrieval.retrieval_progress.time.monotonic", return_value=1000
+    ):
+        RetrievalProgress.open(6).close()
+        progress = RetrievalProgress.open(7)
+    with mock.patch(
+        "app.services.retrieval.retrieval_progress.time.monotonic", return_value=5000
+    ):
+        progress.close()
+    assert RetrievalProgress.get(6) is None
+    assert RetrievalProgress.get(7) is progress
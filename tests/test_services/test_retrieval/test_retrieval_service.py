@@ -1,16 +1,23 @@
 """Test the references API."""
+
+import asyncio
 from unittest import mock
 from fastapi import HTTPException
 import pytest
+from sqlalchemy import select
 
+from app.db.daos.retrieval_dao import RetrievalDAO
 from app.db.models.contributor_identifier import ContributorIdentifier
+from app.db.models.harvesting import Harvesting
 from app.db.models.retrieval import Retrieval
+from app.db.session import async_session
 from app.harvesters.hal.hal_harvester import HalHarvester
 from app.harvesters.idref.idref_harvester import IdrefHarvester
 from app.harvesters.scanr.scanr_harvester import ScanrHarvester
 from app.harvesters.open_alex.open_alex_harvester import OpenAlexHarvester
 from app.models.identifiers import Identifier
 from app.models.people import Person
+from app.services.retrieval.retrieval_progress import RetrievalProgress
 from app.services.retrieval.retrieval_service import RetrievalService
 
 
@@ -129,3 +136,81 @@ async def test_retrieval_service_registers_identifiers_matches_nullify(
         exc_info.value.detail
         == "Unprocessable Entity: idhals cannot be declared and nullified at same time"
     )
+
+
+@pytest.mark.asyncio
+async def test_retrieval_service_prepares_harvesters_and_records_first_request(
+    person_with_name_and_id_hal_s: Person,
+):
+    """
+    GIVEN a retrieval service limited to the hal harvester
+    WHEN running the retrieval for a person with an idhal_s identifier
+    THEN the harvesting is created with the identifier selected by the harvester
+    AND the time to first request is recorded on the retrieval
+    """
+
+    async def no_results(_):
+        for result in []:
+            yield result
+
+    service = RetrievalService(harvesters=["hal"])
+    await service.register(person_with_name_and_id_hal_s)
+    with mock.patch.object(HalHarvester, "fetch_results", no_results):
+        await service.run()
+
+    async with async_session() as session:
+        retrieval = await RetrievalDAO(session).get_retrieval_by_id(
+            service.retrieval.id
+        )
+        harvestings = (
+            (
+                await session.execute(
+                    select(Harvesting).where(Harvesting.retrieval_id == retrieval.id)
+                )
+            )
+            .unique()
+            .scalars()
+            .all()
+        )
+    assert retrieval.time_to_first_request is not None
+    assert retrieval.time_to_first_request >= 0
+    assert len(harvestings) == 1
+    assert harvestings[0].harvester == "hal"
+    assert harvestings[0].identifier_used_type == "idhals"
+    assert harvestings[0].state == Harvesting.State.COMPLETED.value
+
+
+@pytest.mark.asyncio
+async def test_retrieval_service_records_progress_and_feeds_result_queue(
+    person_with_name_and_id_hal_s: Person,
+):
+    """
+    GIVEN a retrieval service limited to the hal harvester
+    WHEN running the retrieval with a result queue
+    THEN the harvesting states are recorded in the progress log of the retrieval
+    AND pushed to the result queue
+    AND the progress log ends with the completion of the retrieval
+    """
+
+    async def no_results(_):
+        for result in []:
+            yield result
+
+    result_queue = asyncio.Queue()
+    service = RetrievalService(harvesters=["hal"])
+    await service.register(person_with_name_and_id_hal_s)
+    with mock.patch.object(HalHarvester, "fetch_results", no_results):
+        await service.run(result_queue=result_queue)
+
+    progress = RetrievalProgress.get(service.retrieval.id)
+    assert [
+        (event["event_id"], event["type"], event.get("harvester"), event["state"])
+        for event in progress.events
+    ] == [
+        (1, "Harvesting", "hal", Harvesting.State.RUNNING.value),
+        (2, "Harvesting", "hal", Harvesting.State.COMPLETED.value),
+        (3, "Retrieval", None, "completed"),
+    ]
+    assert progress.closed
+    assert result_queue.qsize() == 2
+    assert "entity_id" in result_queue.get_nowait()
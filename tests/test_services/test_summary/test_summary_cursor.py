@@ -0,0 +1,54 @@
+"""Test the summary pages cursors."""
+
+import datetime
+
+import pytest
+
+from app.services.summary.summary_cursor import decode_cursor, encode_cursor
+
+TIMESTAMP = datetime.datetime(2024, 1, 15, 10, 30, 12, 123456)
+
+
+def test_cursor_round_trip():
+    """
+    GIVEN the timestamp and id of the last row of a page
+    WHEN encoding then decoding the cursor
+    THEN the timestamp and id are restored
+    """
+    assert decode_cursor(encode_cursor(TIMESTAMP, 42)) == (TIMESTAMP, 42)
+
+
+def test_ranked_cursor_round_trip():
+    """
+    GIVEN the rank, timestamp and id of the last row of a ranked search page
+    WHEN encoding then decoding the cursor
+    THEN the rank is restored exactly, before the timestamp and id
+    """
+    rank = 0.0607927106320858
+    assert decode_cursor(encode_cursor(TIMESTAMP, 42, rank)) == (rank, TIMESTAMP, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "MjAyNHwxfDJ8Mw=="])
+def test_malformed_cursor(cursor):
+    """
+    GIVEN a cursor that was not produced by encode_cursor
+    WHEN decoding it
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_cursor_with_tiebreaker_round_trip():
+    """
+    GIVEN the rank, timestamp, id and event type of the last row of a page
+    WHEN encoding then decoding the cursor
+    THEN the event type is restored after the timestamp and id
+    """
+    rank = 0.0607927106320858
+    assert decode_cursor(encode_cursor(TIMESTAMP, 42, rank, "updated")) == (
+        rank,
+        TIMESTAMP,
+        42,
+        "updated",
+    )